@@ -27,6 +27,15 @@ Kullanim:
     from core.language.construction import Construction, ConstructionLevel
 """
 
+from .analysis import (
+    AnalyzedText,
+    Lexicon,
+    Token,
+    analyze,
+    register_lexicon,
+    get_lexicon,
+)
+
 from .context import (
     ContextBuilder,
     ContextConfig,
@@ -49,6 +58,8 @@ from .llm_adapter import (
     reset_llm_adapter,
 )
 
+from .post_turn import PostTurnConfig, PostTurnQueue
+
 from .chat_agent import (
     ChatConfig,
     ChatResponse,
@@ -108,6 +119,14 @@ from .pipeline import (
 )
 
 __all__ = [
+    # Analysis
+    "AnalyzedText",
+    "Lexicon",
+    "Token",
+    "analyze",
+    "register_lexicon",
+    "get_lexicon",
+
     # Context
     "ContextBuilder",
     "ContextConfig",
@@ -135,6 +154,8 @@ __all__ = [
     "get_chat_agent",
     "create_chat_agent",
     "reset_chat_agent",
+    "PostTurnConfig",
+    "PostTurnQueue",
 
     # Faz 4 - Dialogue
     "DialogueAct",
@@ -0,0 +1,364 @@
+"""
+core/language/analysis.py
+
+AnalyzedText - Mesaj başına tek seferlik metin analizi.
+
+Dil modülleri (IntentRecognizer, SituationBuilder, RiskScorer, SelfCritique,
+ConversationManager, UEMChatAgent) aynı mesaj için ayrı ayrı normalize edip
+kendi anahtar kelime listelerini taramak yerine tek bir AnalyzedText okur:
+
+- normalized: normalize_turkish(text)
+- lowered: text.lower() (Türkçe karakterler korunur)
+- tokens: normalized metindeki kelimeler (offset'li)
+- hits(lexicon): kayıtlı bir Lexicon için eşleşen anahtar kelimeler (lazy, cache'li)
+
+Lexicon'lar modül yüklenirken bir kez derlenir (bigram ve kelime indeksi);
+eşleşme anlamı modüllerin eski davranışıyla aynıdır:
+    match="substring": keyword in text
+    match="word":      tek kelimelik keyword'ler kelime sınırıyla (\\b...\\b),
+                       çok kelimeliler substring olarak aranır
+
+Kullanım:
+    from core.language.analysis import analyze, register_lexicon
+
+    EMOTION = register_lexicon("demo.emotion", {
+        "positive": ["mutlu", "harika"],
+        "negative": ["uzgun", "kotu"],
+    })
+
+    text = analyze("Bugün çok mutluyum")
+    text.hits(EMOTION)               # {"positive": ["mutlu"]}
+    text.count(EMOTION, "negative")  # 0
+
+UEM v2 - Language analysis katmanı.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+from core.utils.text import normalize_turkish
+
+_WORD_RE = re.compile(r"\w+")
+
+MATCH_SUBSTRING = "substring"
+MATCH_WORD = "word"
+
+# analyze() cache boyutu (aynı mesaj pipeline boyunca tekrar analiz edilmez)
+ANALYSIS_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Token:
+    """Normalize edilmiş metindeki bir kelime."""
+    text: str
+    start: int
+    end: int
+
+
+class Lexicon:
+    """
+    Etiketli anahtar kelime listesi.
+
+    entries: {label: [keyword, ...]} - etiket ve keyword sırası korunur,
+    hits() sonuçları bu sırayla döner.
+
+    Args:
+        name: Lexicon adı
+        entries: Etiket -> keyword listesi
+        match: "substring" veya "word"
+        normalize: True ise normalized, False ise lowered metinde aranır
+    """
+
+    def __init__(
+        self,
+        name: str,
+        entries: Mapping[str, Sequence[str]],
+        match: str = MATCH_SUBSTRING,
+        normalize: bool = True,
+    ):
+        if match not in (MATCH_SUBSTRING, MATCH_WORD):
+            raise ValueError(f"Unknown match mode: {match}")
+
+        self.name = name
+        self.match = match
+        self.normalize = normalize
+        self.labels: Tuple[str, ...] = tuple(entries)
+        self.keywords: Tuple[Tuple[str, str], ...] = tuple(
+            (label, keyword)
+            for label, keywords in entries.items()
+            for keyword in keywords
+        )
+
+        # Derlenmiş indeksler: keyword sırası (index) listeleri
+        self._by_bigram: Dict[str, List[int]] = {}
+        self._by_word: Dict[str, List[int]] = {}
+        self._always: List[int] = []     # 0-1 karakterlik substring keyword'ler
+        self._regex: List[Tuple[int, "re.Pattern[str]"]] = []
+
+        for index, (_, keyword) in enumerate(self.keywords):
+            if match == MATCH_WORD and " " not in keyword:
+                if _WORD_RE.fullmatch(keyword):
+                    self._by_word.setdefault(keyword, []).append(index)
+                else:
+                    self._regex.append(
+                        (index, re.compile(r"\b" + re.escape(keyword) + r"\b"))
+                    )
+            elif len(keyword) < 2:
+                self._always.append(index)
+            else:
+                self._by_bigram.setdefault(keyword[:2], []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"Lexicon({self.name!r}, {len(self.keywords)} keywords, match={self.match})"
+
+    def scan(self, analysis: "AnalyzedText") -> Dict[str, List[str]]:
+        """Metni tara: {label: [eşleşen keyword, ...]} (sadece eşleşen etiketler)."""
+        text = analysis.normalized if self.normalize else analysis.lowered
+
+        matched = [
+            index for index in self._always
+            if self.keywords[index][1] in text
+        ]
+
+        bigrams = analysis.bigrams(self.normalize)
+        if len(bigrams) <= len(self._by_bigram):
+            candidate_lists = (self._by_bigram.get(b) for b in bigrams)
+        else:
+            candidate_lists = (
+                indices for key, indices in self._by_bigram.items() if key in bigrams
+            )
+        for indices in candidate_lists:
+            if indices:
+                matched.extend(i for i in indices if self.keywords[i][1] in text)
+
+        if self._by_word:
+            words = analysis.words(self.normalize)
+            for word in words:
+                indices = self._by_word.get(word)
+                if indices:
+                    matched.extend(indices)
+
+        matched.extend(index for index, regex in self._regex if regex.search(text))
+
+        hits: Dict[str, List[str]] = {}
+        for index in sorted(set(matched)):
+            label, keyword = self.keywords[index]
+            hits.setdefault(label, []).append(keyword)
+
+        # Etiket sırasını lexicon sırasına getir
+        return {label: hits[label] for label in self.labels if label in hits}
+
+
+class AnalyzedText:
+    """
+    Tek bir mesajın analizi.
+
+    Tüm alanlar lazy hesaplanır ve nesne ömrü boyunca cache'lenir.
+    Aynı mesajı işleyen modüller aynı nesneyi paylaşmalıdır (bkz. analyze).
+    """
+
+    __slots__ = (
+        "raw", "_normalized", "_lowered", "_tokens",
+        "_bigrams", "_words", "_hits",
+    )
+
+    def __init__(self, raw: str):
+        self.raw = raw or ""
+        self._normalized: Optional[str] = None
+        self._lowered: Optional[str] = None
+        self._tokens: Optional[List[Token]] = None
+        self._bigrams: Dict[bool, FrozenSet[str]] = {}
+        self._words: Dict[bool, FrozenSet[str]] = {}
+        self._hits: Dict[int, Tuple[Lexicon, Dict[str, List[str]]]] = {}
+
+    def __repr__(self) -> str:
+        preview = self.raw if len(self.raw) <= 40 else self.raw[:37] + "..."
+        return f"AnalyzedText({preview!r})"
+
+    @property
+    def normalized(self) -> str:
+        """normalize_turkish(raw) - ASCII lowercase."""
+        if self._normalized is None:
+            self._normalized = normalize_turkish(self.raw)
+        return self._normalized
+
+    @property
+    def lowered(self) -> str:
+        """raw.lower() - Türkçe karakterler korunur."""
+        if self._lowered is None:
+            self._lowered = self.raw.lower()
+        return self._lowered
+
+    @property
+    def tokens(self) -> List[Token]:
+        """Normalize edilmiş metindeki kelimeler (\\w+), offset'leri normalized'a göre."""
+        if self._tokens is None:
+            self._tokens = [
+                Token(m.group(), m.start(), m.end())
+                for m in _WORD_RE.finditer(self.normalized)
+            ]
+        return self._tokens
+
+    @property
+    def word_count(self) -> int:
+        """Boşlukla ayrılmış parça sayısı (len(normalized.split()))."""
+        return len(self.normalized.split())
+
+    def text(self, normalize: bool = True) -> str:
+        return self.normalized if normalize else self.lowered
+
+    def bigrams(self, normalize: bool = True) -> FrozenSet[str]:
+        """Metindeki tüm 2-karakterlik dilimler (substring ön-filtresi)."""
+        cached = self._bigrams.get(normalize)
+        if cached is None:
+            text = self.text(normalize)
+            cached = frozenset(text[i:i + 2] for i in range(len(text) - 1))
+            self._bigrams[normalize] = cached
+        return cached
+
+    def words(self, normalize: bool = True) -> FrozenSet[str]:
+        """Metindeki farklı kelimeler."""
+        cached = self._words.get(normalize)
+        if cached is None:
+            if normalize:
+                cached = frozenset(token.text for token in self.tokens)
+            else:
+                cached = frozenset(_WORD_RE.findall(self.lowered))
+            self._words[normalize] = cached
+        return cached
+
+    def find_word(self, word: str) -> int:
+        """Kelimenin normalized metindeki ilk konumu (kelime sınırıyla), yoksa -1."""
+        if word not in self.words(True):
+            return -1
+        for token in self.tokens:
+            if token.text == word:
+                return token.start
+        return -1
+
+    # ------------------------------------------------------------------
+    # Lexicon hits
+    # ------------------------------------------------------------------
+
+    def hits(self, lexicon: Union[Lexicon, str]) -> Dict[str, List[str]]:
+        """Lexicon eşleşmeleri: {label: [keyword, ...]} (ilk çağrıda hesaplanır)."""
+        if isinstance(lexicon, str):
+            lexicon = get_lexicon(lexicon)
+        cached = self._hits.get(id(lexicon))
+        if cached is None or cached[0] is not lexicon:
+            cached = (lexicon, lexicon.scan(self))
+            self._hits[id(lexicon)] = cached
+        return cached[1]
+
+    def has(self, lexicon: Union[Lexicon, str], label: Optional[str] = None) -> bool:
+        hits = self.hits(lexicon)
+        return bool(hits) if label is None else label in hits
+
+    def count(self, lexicon: Union[Lexicon, str], label: str) -> int:
+        """Etiket için eşleşen farklı keyword sayısı."""
+        return len(self.hits(lexicon).get(label, ()))
+
+    def first(self, lexicon: Union[Lexicon, str], label: str) -> Optional[str]:
+        """Etiketin (lexicon sırasına göre) ilk eşleşen keyword'ü."""
+        matched = self.hits(lexicon).get(label)
+        return matched[0] if matched else None
+
+    def first_label(self, lexicon: Union[Lexicon, str]) -> Optional[str]:
+        """Eşleşmesi olan ilk etiket (lexicon sırasına göre)."""
+        return next(iter(self.hits(lexicon)), None)
+
+    def all_hits(self) -> Dict[str, Dict[str, List[str]]]:
+        """Kayıtlı tüm lexicon'lar için eşleşmeler (boşlar dahil edilmez)."""
+        result = {}
+        for name, lexicon in registered_lexicons().items():
+            hits = self.hits(lexicon)
+            if hits:
+                result[name] = hits
+        return result
+
+
+# ============================================================================
+# LEXICON REGISTRY
+# ============================================================================
+
+_LEXICONS: Dict[str, Lexicon] = {}
+_LEXICON_LOCK = threading.Lock()
+
+
+def register_lexicon(
+    name: str,
+    entries: Mapping[str, Sequence[str]],
+    match: str = MATCH_SUBSTRING,
+    normalize: bool = True,
+) -> Lexicon:
+    """
+    Lexicon derle ve kaydet (aynı isimle tekrar kayıt öncekinin yerine geçer).
+
+    Returns:
+        Derlenmiş Lexicon
+    """
+    lexicon = Lexicon(name, entries, match=match, normalize=normalize)
+    with _LEXICON_LOCK:
+        _LEXICONS[name] = lexicon
+    return lexicon
+
+
+def get_lexicon(name: str) -> Lexicon:
+    """Kayıtlı lexicon'u getir (yoksa KeyError)."""
+    return _LEXICONS[name]
+
+
+def registered_lexicons() -> Dict[str, Lexicon]:
+    """Kayıtlı lexicon'ların kopyası."""
+    with _LEXICON_LOCK:
+        return dict(_LEXICONS)
+
+
+# ============================================================================
+# ANALYSIS CACHE
+# ============================================================================
+
+_CACHE: "OrderedDict[str, AnalyzedText]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def analyze(text: str) -> AnalyzedText:
+    """
+    Metin için AnalyzedText döndür.
+
+    Son ANALYSIS_CACHE_SIZE metin cache'lenir; böylece aynı mesajı ayrı
+    ayrı alan modüller (ör. chat agent -> pipeline -> conversation manager)
+    aynı analiz nesnesini paylaşır.
+    """
+    text = text or ""
+    with _CACHE_LOCK:
+        analysis = _CACHE.get(text)
+        if analysis is not None:
+            _CACHE.move_to_end(text)
+            return analysis
+
+    analysis = AnalyzedText(text)
+    with _CACHE_LOCK:
+        _CACHE[text] = analysis
+        if len(_CACHE) > ANALYSIS_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return analysis
+
+
+def as_analyzed(value: Union[str, AnalyzedText, None]) -> AnalyzedText:
+    """str veya AnalyzedText kabul eden API'ler için."""
+    if isinstance(value, AnalyzedText):
+        return value
+    return analyze(value or "")
+
+
+def clear_analysis_cache() -> None:
+    """analyze() cache'ini temizle."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -14,13 +14,15 @@ Ozellikler:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 import logging
 import re
 
+from .analysis import AnalyzedText, analyze, as_analyzed, register_lexicon
 from .context import ContextBuilder, ContextConfig
 from .llm_adapter import LLMAdapter, LLMConfig, LLMResponse, MockLLMAdapter
+from .post_turn import PostTurnConfig, PostTurnQueue
 
 # Pipeline imports - graceful
 try:
@@ -76,6 +78,29 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Keyword lexicons (lowercased text, Turkish characters kept)
+INTENT_LEXICON = register_lexicon(
+    "chat.intent",
+    {
+        "question": ["mi", "mı", "mu", "mü", "ne", "nasıl", "neden", "nerede", "kim", "what", "how", "why", "where", "who", "when"],
+        "greeting": ["merhaba", "selam", "hey", "hello", "hi", "günaydın", "iyi günler"],
+        "farewell": ["hoşçakal", "görüşürüz", "bye", "goodbye", "iyi geceler"],
+        "thanks": ["teşekkür", "sağol", "thanks", "thank you", "eyvallah"],
+        "request": ["lütfen", "please", "yap", "et", "ver", "göster", "anlat"],
+    },
+    normalize=False,
+)
+
+EMOTION_LEXICON = register_lexicon(
+    "chat.emotion",
+    {
+        "positive": ["mutlu", "sevinc", "harika", "guzel", "tesekkur", "sevindim", "memnun", "super", "happy", "great", "wonderful", "thanks"],
+        "negative": ["uzgun", "kotu", "maalesef", "sorry", "sad", "bad", "unfortunately", "sikinti", "problem"],
+        "high_arousal": ["heyecan", "saskin", "inanil", "wow", "excited", "amazing", "incredible"],
+    },
+    normalize=False,
+)
+
 
 @dataclass
 class ChatConfig:
@@ -92,6 +117,10 @@ class ChatConfig:
     # Pipeline (Faz 4) ayarlari
     use_pipeline: bool = False  # True ise LLM yerine pipeline kullan
     pipeline_config: Optional[Any] = None  # PipelineConfig (opsiyonel)
+    # Post-turn isleri (bellek yazimi, pattern kaydi, episode log) arka planda
+    # False = senkron, eski davranis; True ise ChatResponse.turn_id None olabilir
+    async_post_turn: bool = False
+    post_turn_config: Optional[PostTurnConfig] = None
 
 
 @dataclass
@@ -188,6 +217,12 @@ class UEMChatAgent:
         self._last_interaction_id: Optional[str] = None
         self._last_pattern_id: Optional[str] = None
 
+        # Post-turn kuyrugu (async_post_turn=False ise gorevler senkron calisir)
+        self._post_turn = PostTurnQueue(self.config.post_turn_config)
+        if self.config.async_post_turn:
+            self._post_turn.start()
+            self._attach_post_turn_queue()
+
         # Stats
         self._stats = {
             "total_sessions": 0,
@@ -244,6 +279,9 @@ class UEMChatAgent:
         """
         user_id = user_id or self._current_user_id
 
+        # Bekleyen tur yazimlari kapanmadan once tamamlanmali
+        self._post_turn.flush(self._current_session_id)
+
         if self.memory is not None and hasattr(self.memory, 'conversation'):
             # End conversation
             if self._current_session_id:
@@ -278,9 +316,8 @@ class UEMChatAgent:
         1. If pipeline mode: use Thought-to-Speech Pipeline
         2. Else try to get learned response
         3. If no learned response, get from LLM
-        4. Save to memory
-        5. Learn from interaction
-        6. Return response
+        4. Save to memory and learn from interaction (post-turn queue)
+        5. Return response
 
         Args:
             user_message: User's message
@@ -300,8 +337,14 @@ class UEMChatAgent:
         interaction_id = f"int_{uuid.uuid4().hex[:12]}"
         self._last_interaction_id = interaction_id
 
+        # Onceki turun yazimlari bu turun okumalarindan once bitmeli
+        self._post_turn.flush(self._current_session_id)
+
+        # Analyze once; pipeline modules reuse the same AnalyzedText (analyze cache)
+        analysis = analyze(user_message)
+
         # Detect intent early
-        intent = self._detect_intent(user_message)
+        intent = self._detect_intent(analysis)
 
         # Pipeline mode check
         if self._use_pipeline and self._pipeline is not None:
@@ -323,6 +366,7 @@ class UEMChatAgent:
                 logger.debug(f"Using learned response for: {user_message[:50]}...")
 
         # 2. If no learned response, use LLM
+        context = None
         if response_content is None:
             context = self._build_context(user_message)
             llm_response = self.llm.generate(
@@ -339,43 +383,18 @@ class UEMChatAgent:
             if emotion:
                 self._session_emotions.append(emotion)
 
-        # 4. Save to memory
-        turn_id = None
-        if self.memory is not None and hasattr(self.memory, 'conversation'):
-            # Save user turn
-            user_turn = DialogueTurn(
-                role="user",
-                content=user_message,
-                intent=intent,
-            )
-            self.memory.conversation.add_turn(
-                self._current_session_id,
-                user_turn.role,
-                user_turn.content,
-            )
-
-            # Save agent turn
-            agent_turn = DialogueTurn(
-                role="agent",
-                content=response_content,
-                emotional_valence=emotion.pleasure if emotion else 0.0,
-            )
-            turn_id = self.memory.conversation.add_turn(
-                self._current_session_id,
-                agent_turn.role,
-                agent_turn.content,
-            )
-
-        # 5. Store response as pattern for learning (if from LLM)
+        # 4-5. Memory writes and pattern storage run after the reply
         self._last_pattern_id = None
-        if self.learning is not None and response_source == "llm":
-            from core.learning import PatternType
-            pattern = self.learning.pattern_storage.store(
-                content=response_content,
-                pattern_type=PatternType.RESPONSE,
-                extra_data={"context": user_message, "interaction_id": interaction_id}
-            )
-            self._last_pattern_id = pattern.id
+        future = self._post_turn.submit(
+            self._current_session_id,
+            self._record_turn,
+            self._current_session_id,
+            user_message,
+            response_content,
+            response_source,
+            interaction_id,
+        )
+        turn_id = future.result() if future.done() else None
 
         self._turn_count += 1
         self._stats["total_turns"] += 1
@@ -385,12 +404,83 @@ class UEMChatAgent:
             emotion=emotion,
             intent=intent,
             llm_response=llm_response,
-            context_used=self._build_context(user_message) if llm_response else None,
+            context_used=context if llm_response else None,
             turn_id=turn_id,
             source=response_source,
             interaction_id=interaction_id,
         )
 
+    def _record_turn(
+        self,
+        session_id: Optional[str],
+        user_message: str,
+        response_content: str,
+        response_source: str,
+        interaction_id: str,
+    ) -> Optional[Any]:
+        """
+        Post-turn task: save both turns and store the LLM response as pattern.
+
+        Runs on the post-turn queue (or inline when it is not started).
+
+        Args:
+            session_id: Session the turn belongs to
+            user_message: User's message
+            response_content: Agent reply
+            response_source: "llm", "learned" or "pipeline"
+            interaction_id: Interaction ID
+
+        Returns:
+            Agent turn returned by conversation memory (or None)
+        """
+        turn_id = None
+        if self.memory is not None and hasattr(self.memory, 'conversation'):
+            self.memory.conversation.add_turn(session_id, "user", user_message)
+            turn_id = self.memory.conversation.add_turn(session_id, "agent", response_content)
+
+        # Store response as pattern for learning (if from LLM)
+        if self.learning is not None and response_source == "llm":
+            from core.learning import PatternType
+            pattern = self.learning.pattern_storage.store(
+                content=response_content,
+                pattern_type=PatternType.RESPONSE,
+                extra_data={"context": user_message, "interaction_id": interaction_id}
+            )
+            if interaction_id == self._last_interaction_id:
+                self._last_pattern_id = pattern.id
+
+        return turn_id
+
+    def flush_post_turn(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until queued post-turn tasks are done.
+
+        Args:
+            timeout: Max wait in seconds (None = no limit)
+
+        Returns:
+            True if the queue drained in time
+        """
+        return self._post_turn.flush(timeout=timeout)
+
+    def get_post_turn_stats(self) -> Dict[str, Any]:
+        """
+        Post-turn queue metrics (depth, lag, counters).
+
+        Returns:
+            Stats dict from PostTurnQueue.get_stats()
+        """
+        return self._post_turn.get_stats()
+
+    def shutdown(self) -> None:
+        """Run pending post-turn tasks and stop the worker threads."""
+        self._post_turn.stop()
+
+    def _attach_post_turn_queue(self) -> None:
+        """Let the pipeline defer its episode log writes to the same queue."""
+        if self._pipeline is not None and hasattr(self._pipeline, "post_turn_queue"):
+            self._pipeline.post_turn_queue = self._post_turn
+
     # ===================================================================
     # MEMORY INTEGRATION
     # ===================================================================
@@ -409,6 +499,7 @@ class UEMChatAgent:
         if self.memory is None or not hasattr(self.memory, 'semantic'):
             return []
 
+        self._post_turn.flush(self._current_session_id)
         self._stats["total_recalls"] += 1
         return self.memory.semantic.search(query, k=k)
 
@@ -428,6 +519,7 @@ class UEMChatAgent:
         if self._current_session_id is None:
             return []
 
+        self._post_turn.flush(self._current_session_id)
         return self.memory.conversation.get_context(
             self._current_session_id,
             max_turns=n,
@@ -456,6 +548,9 @@ class UEMChatAgent:
             logger.warning("No last interaction to provide feedback for")
             return False
 
+        # _last_pattern_id post-turn gorevinde atanir
+        self._post_turn.flush(self._current_session_id)
+
         # Record explicit feedback
         feedback_type = FeedbackType.POSITIVE if positive else FeedbackType.NEGATIVE
         value = 1.0 if positive else -1.0
@@ -487,6 +582,7 @@ class UEMChatAgent:
         """
         if self.learning is None:
             return 0
+        self._post_turn.flush()
         return self.learning.pattern_storage.count()
 
     def get_learning_stats(self) -> Dict[str, Any]:
@@ -498,6 +594,7 @@ class UEMChatAgent:
         """
         if self.learning is None:
             return {}
+        self._post_turn.flush()
         return self.learning.stats()
 
     # ===================================================================
@@ -640,27 +737,20 @@ class UEMChatAgent:
         Returns:
             PADState or None
         """
-        text_lower = text.lower()
-
-        # Simple keyword matching
-        positive_words = ["mutlu", "sevinc", "harika", "guzel", "tesekkur", "sevindim", "memnun", "super", "happy", "great", "wonderful", "thanks"]
-        negative_words = ["uzgun", "kotu", "maalesef", "sorry", "sad", "bad", "unfortunately", "sikinti", "problem"]
-        high_arousal_words = ["heyecan", "saskin", "inanil", "wow", "excited", "amazing", "incredible"]
+        # Simple keyword matching (agent response, not cached)
+        analysis = AnalyzedText(text)
 
         pleasure = 0.0
         arousal = 0.5
 
-        for word in positive_words:
-            if word in text_lower:
-                pleasure += 0.3
+        for _ in range(analysis.count(EMOTION_LEXICON, "positive")):
+            pleasure += 0.3
 
-        for word in negative_words:
-            if word in text_lower:
-                pleasure -= 0.3
+        for _ in range(analysis.count(EMOTION_LEXICON, "negative")):
+            pleasure -= 0.3
 
-        for word in high_arousal_words:
-            if word in text_lower:
-                arousal += 0.2
+        for _ in range(analysis.count(EMOTION_LEXICON, "high_arousal")):
+            arousal += 0.2
 
         # Clamp values
         pleasure = max(-1.0, min(1.0, pleasure))
@@ -698,7 +788,7 @@ class UEMChatAgent:
             return False
         return True
 
-    def _detect_intent(self, text: str) -> str:
+    def _detect_intent(self, text: Union[str, AnalyzedText]) -> str:
         """
         Detect intent from user message.
 
@@ -706,34 +796,19 @@ class UEMChatAgent:
         For production, use a proper intent classifier.
 
         Args:
-            text: User message
+            text: User message (or its AnalyzedText)
 
         Returns:
             Intent string
         """
-        text_lower = text.lower().strip()
+        analysis = as_analyzed(text)
 
         # Question detection
-        if text_lower.endswith("?") or any(q in text_lower for q in ["mi", "mı", "mu", "mü", "ne", "nasıl", "neden", "nerede", "kim", "what", "how", "why", "where", "who", "when"]):
+        if analysis.lowered.strip().endswith("?"):
             return "question"
 
-        # Greeting detection
-        if any(g in text_lower for g in ["merhaba", "selam", "hey", "hello", "hi", "günaydın", "iyi günler"]):
-            return "greeting"
-
-        # Farewell detection
-        if any(f in text_lower for f in ["hoşçakal", "görüşürüz", "bye", "goodbye", "iyi geceler"]):
-            return "farewell"
-
-        # Thanks detection
-        if any(t in text_lower for t in ["teşekkür", "sağol", "thanks", "thank you", "eyvallah"]):
-            return "thanks"
-
-        # Request detection
-        if any(r in text_lower for r in ["lütfen", "please", "yap", "et", "ver", "göster", "anlat"]):
-            return "request"
-
-        return "statement"
+        # Question / greeting / farewell / thanks / request, in that priority
+        return analysis.first_label(INTENT_LEXICON) or "statement"
 
     # ===================================================================
     # PIPELINE (FAZ 4)
@@ -784,22 +859,17 @@ class UEMChatAgent:
                 if emotion:
                     self._session_emotions.append(emotion)
 
-        # Save to memory
-        turn_id = None
-        if self.memory is not None and hasattr(self.memory, 'conversation'):
-            # Save user turn
-            self.memory.conversation.add_turn(
-                self._current_session_id,
-                "user",
-                user_message,
-            )
-
-            # Save agent turn
-            turn_id = self.memory.conversation.add_turn(
-                self._current_session_id,
-                "agent",
-                response_content,
-            )
+        # Save to memory (post-turn queue)
+        future = self._post_turn.submit(
+            self._current_session_id,
+            self._record_turn,
+            self._current_session_id,
+            user_message,
+            response_content,
+            "pipeline",
+            interaction_id,
+        )
+        turn_id = future.result() if future.done() else None
 
         self._turn_count += 1
         self._stats["total_turns"] += 1
@@ -858,6 +928,8 @@ class UEMChatAgent:
             # Create pipeline
             pipeline_config = self.config.pipeline_config
             self._pipeline = ThoughtToSpeechPipeline(config=pipeline_config)
+            if self.config.async_post_turn:
+                self._attach_post_turn_queue()
             logger.info("Pipeline created")
 
         self._use_pipeline = enabled
@@ -28,6 +28,7 @@ from .types import (
     SlotType,
     Slot,
     MorphologyRule,
+    CompiledTemplate,
     ConstructionForm,
     ConstructionMeaning,
     Construction,
@@ -68,6 +69,7 @@ __all__ = [
     # Dataclasses - Types
     "Slot",
     "MorphologyRule",
+    "CompiledTemplate",
     "ConstructionForm",
     "ConstructionMeaning",
     "Construction",
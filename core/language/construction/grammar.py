@@ -102,6 +102,9 @@ class ConstructionGrammar:
         if len(self._constructions[level]) >= self.config.max_constructions_per_level:
             return False
 
+        # Template'i bir kez derle (realizer tekrar taramaz)
+        construction.form.compile()
+
         # Add to level storage
         self._constructions[level][construction.id] = construction
 
@@ -150,9 +153,11 @@ class ConstructionGrammar:
         Returns:
             Construction veya None
         """
-        for level in ConstructionLevel:
-            if construction_id in self._constructions[level]:
-                return self._constructions[level][construction_id]
+        # Katman sözlükleri DEEP → MIDDLE → SURFACE sırasıyla kurulur
+        for by_id in self._constructions.values():
+            construction = by_id.get(construction_id)
+            if construction is not None:
+                return construction
         return None
 
     def get_by_level(self, level: ConstructionLevel) -> List[Construction]:
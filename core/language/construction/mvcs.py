@@ -19,9 +19,10 @@ Bu set, sistemin en temel iletisim ihtiyaclarini karsilar.
 Yeni construction'lar ogrenildikce bu set genisler.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from .types import (
@@ -104,6 +105,14 @@ class MVCSLoader:
         self._cache: Dict[MVCSCategory, List[Construction]] = {}
         self._all_constructions: Optional[List[Construction]] = None
 
+        # load_all() sirasinda bir kez kurulan degismez indeksler
+        self._by_dialogue_act: Dict[str, Tuple[Construction, ...]] = {}
+        self._by_tone: Dict[str, Tuple[Construction, ...]] = {}
+        self._by_name: Dict[str, Construction] = {}
+        # Formaliteye gore sirali (formality, yukleme sirasi) anahtarlari
+        self._formality_keys: List[float] = []
+        self._formality_entries: Tuple[Tuple[int, Construction], ...] = ()
+
     def load_all(self) -> List[Construction]:
         """
         Tum MVCS construction'larini yukle.
@@ -156,11 +165,52 @@ class MVCSLoader:
         # 13. ACKNOWLEDGE_DISAGREEMENT - İtiraz/yanlış anlama yanıtı
         constructions.extend(self._create_acknowledge_disagreement_constructions())
 
+        # Template'leri bir kez derle (realizer tekrar taramaz)
+        for construction in constructions:
+            construction.form.compile()
+
+        self._build_indexes(constructions)
         self._all_constructions = constructions
         logger.info(f"MVCS loaded: {len(constructions)} constructions")
 
         return constructions
 
+    def _build_indexes(self, constructions: List[Construction]) -> None:
+        """
+        Act, ton, isim ve formalite indekslerini kur.
+
+        Indeks listeleri yukleme sirasini korur; boylece sorgular eski
+        liste filtrelemesiyle ayni sirada sonuc dondurur.
+
+        Args:
+            constructions: load_all() ile olusturulan construction'lar
+        """
+        by_act: Dict[str, List[Construction]] = {}
+        by_tone: Dict[str, List[Construction]] = {}
+        by_name: Dict[str, Construction] = {}
+        formality: List[Tuple[float, int, Construction]] = []
+
+        for position, construction in enumerate(constructions):
+            by_act.setdefault(construction.meaning.dialogue_act, []).append(construction)
+            tone = construction.extra_data.get("tone")
+            if tone is not None:
+                by_tone.setdefault(tone, []).append(construction)
+            name = construction.extra_data.get("mvcs_name")
+            if name is not None:
+                # Ilk eslesme kazanir (eski dogrusal arama ile ayni)
+                by_name.setdefault(name, construction)
+            formality.append(
+                (construction.extra_data.get("formality", 0.5), position, construction)
+            )
+
+        formality.sort(key=lambda entry: (entry[0], entry[1]))
+
+        self._by_dialogue_act = {act: tuple(items) for act, items in by_act.items()}
+        self._by_tone = {tone: tuple(items) for tone, items in by_tone.items()}
+        self._by_name = by_name
+        self._formality_keys = [entry[0] for entry in formality]
+        self._formality_entries = tuple((entry[1], entry[2]) for entry in formality)
+
     def get_by_category(self, category: MVCSCategory) -> List[Construction]:
         """
         Kategoriye gore construction'lari getir.
@@ -218,13 +268,8 @@ class MVCSLoader:
         Returns:
             Bulunan construction veya None
         """
-        all_constructions = self.load_all()
-
-        for construction in all_constructions:
-            if construction.extra_data.get("mvcs_name") == name:
-                return construction
-
-        return None
+        self.load_all()
+        return self._by_name.get(name)
 
     def get_greet_constructions(self) -> List[Construction]:
         """Selamlama construction'larini getir."""
@@ -1075,6 +1120,11 @@ class MVCSLoader:
         """Onbellegi temizle."""
         self._cache.clear()
         self._all_constructions = None
+        self._by_dialogue_act = {}
+        self._by_tone = {}
+        self._by_name = {}
+        self._formality_keys = []
+        self._formality_entries = ()
 
     def get_constructions_by_dialogue_act(self, dialogue_act: str) -> List[Construction]:
         """
@@ -1086,11 +1136,8 @@ class MVCSLoader:
         Returns:
             Uygun construction'lar
         """
-        all_constructions = self.load_all()
-        return [
-            c for c in all_constructions
-            if c.meaning.dialogue_act == dialogue_act
-        ]
+        self.load_all()
+        return list(self._by_dialogue_act.get(dialogue_act, ()))
 
     def get_constructions_by_tone(self, tone: str) -> List[Construction]:
         """
@@ -1102,11 +1149,8 @@ class MVCSLoader:
         Returns:
             Uygun construction'lar
         """
-        all_constructions = self.load_all()
-        return [
-            c for c in all_constructions
-            if c.extra_data.get("tone") == tone
-        ]
+        self.load_all()
+        return list(self._by_tone.get(tone, ()))
 
     def get_constructions_by_formality(
         self,
@@ -1123,8 +1167,10 @@ class MVCSLoader:
         Returns:
             Uygun construction'lar
         """
-        all_constructions = self.load_all()
-        return [
-            c for c in all_constructions
-            if min_formality <= c.extra_data.get("formality", 0.5) <= max_formality
-        ]
+        self.load_all()
+        # Sirali dizide bisect ile aralik; sonuc yukleme sirasina dondurulur
+        lo = bisect_left(self._formality_keys, min_formality)
+        hi = bisect_right(self._formality_keys, max_formality)
+        if lo >= hi:
+            return []
+        return [c for _, c in sorted(self._formality_entries[lo:hi], key=lambda e: e[0])]
@@ -10,10 +10,11 @@ UEM v2 - Thought-to-Speech Pipeline bileşeni.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import re
 
 from .types import (
+    CompiledTemplate,
     Construction,
     ConstructionForm,
     Slot,
@@ -81,6 +82,9 @@ class ConstructionRealizer:
             print(result.text)  # "Python programlama dilidir."
     """
 
+    # Yüzey formu cache'inin üst sınırı (dolunca en eski kayıt çıkarılır)
+    SURFACE_CACHE_SIZE = 2048
+
     def __init__(self, config: Optional[ConstructionRealizerConfig] = None):
         """
         ConstructionRealizer oluştur.
@@ -97,6 +101,19 @@ class ConstructionRealizer:
         self._rounded_vowels = set("oöuü")
         self._unrounded_vowels = set("aeıi")
 
+        # Morfoloji hook'ları: kural tipi -> uygulayıcı
+        self._morphology_hooks: Dict[str, Callable[[str], str]] = {
+            "vowel_harmony": self._apply_vowel_harmony,
+            "consonant_softening": self._apply_consonant_softening,
+            "buffer_consonant": self._apply_buffer_consonant,
+        }
+        # Genel Türkçe kuralları (construction kurallarından sonra)
+        self._general_morphology: Tuple[str, ...] = ("vowel_harmony", "buffer_consonant")
+        # Derlenmiş kural tipi dizisi -> hook zinciri
+        self._hook_chains: Dict[Tuple[str, ...], Tuple[Callable[[str], str], ...]] = {}
+        # (template, doldurulmuş metin, ...) -> morfoloji + post-processing sonucu
+        self._surface_cache: Dict[Tuple, Tuple[CompiledTemplate, str]] = {}
+
     def realize(
         self,
         construction: Construction,
@@ -126,8 +143,11 @@ class ConstructionRealizer:
                 errors=errors
             )
 
-        # 2. Template'i doldur
-        text, filled, unfilled_required = self._fill_template(construction, slot_values)
+        # 2. Template'i doldur (derlenmiş form: ConstructionForm.compile)
+        compiled = construction.form.compile()
+        text, filled, unfilled_required = self._fill_template(
+            construction, slot_values, compiled
+        )
 
         # Zorunlu slot doldurulamadıysa: strict modda başarısız, non-strict'te warning
         if unfilled_required:
@@ -159,12 +179,8 @@ class ConstructionRealizer:
                 errors=errors + ["Empty text after template filling"]
             )
 
-        # 3. Morfoloji uygula
-        if self.config.apply_morphology:
-            text = self._apply_morphology(text, construction)
-
-        # 4. Post-processing
-        text = self._post_process(text, construction)
+        # 3-4. Morfoloji + post-processing (aynı doldurulmuş metin için cache'li)
+        text = self._surface(text, construction, compiled)
 
         return RealizationResult(
             success=True,
@@ -216,7 +232,8 @@ class ConstructionRealizer:
     def _fill_template(
         self,
         construction: Construction,
-        slot_values: Dict[str, str]
+        slot_values: Dict[str, str],
+        compiled: Optional[CompiledTemplate] = None
     ) -> Tuple[str, Dict[str, str], List[str]]:
         """
         Template'i slot değerleriyle doldur.
@@ -224,43 +241,41 @@ class ConstructionRealizer:
         Args:
             construction: Construction
             slot_values: Slot değerleri
+            compiled: Derlenmiş template (yoksa form'dan alınır)
 
         Returns:
             Tuple[filled_text, filled_slots, unfilled_required]
         """
-        template = construction.form.template
+        compiled = compiled or construction.form.compile()
+        slots = construction.form.slots
         filled_slots = {}
         unfilled_required = []
 
-        for slot_name, slot in construction.form.slots.items():
+        for slot_name in compiled.slot_names:
+            slot = slots[slot_name]
             value = slot_values.get(slot_name)
 
             # Varsayılan değer kullan
             if not value and self.config.use_defaults:
                 value = slot.default
 
-            pattern = f"{{{slot_name}}}"
-
             if value:
-                # {slot_name} formatını değiştir
-                template = template.replace(pattern, value)
                 filled_slots[slot_name] = value
-            else:
+            elif slot.required:
                 # Slot doldurulamadı
-                if slot.required:
-                    unfilled_required.append(slot_name)
-                # Placeholder'ı temizle (boş string ile değiştir)
-                template = template.replace(pattern, "")
+                unfilled_required.append(slot_name)
 
-        # Fazla boşlukları temizle
-        template = " ".join(template.split())
+        # Tek geçişte birleştir (doldurulmayan placeholder'lar boş kalır),
+        # fazla boşlukları temizle
+        text = " ".join(compiled.join(filled_slots).split())
 
-        return template, filled_slots, unfilled_required
+        return text, filled_slots, unfilled_required
 
     def _apply_morphology(
         self,
         text: str,
-        construction: Construction
+        construction: Construction,
+        compiled: Optional[CompiledTemplate] = None
     ) -> str:
         """
         Basit Türkçe morfoloji kurallarını uygula.
@@ -268,20 +283,82 @@ class ConstructionRealizer:
         Args:
             text: İşlenecek metin
             construction: Construction (kuralları içerir)
+            compiled: Derlenmiş template (yoksa form'dan alınır)
 
         Returns:
             İşlenmiş metin
         """
-        # Construction'daki morfoloji kurallarını uygula
-        for rule in sorted(construction.form.morphology_rules, key=lambda r: -r.priority):
-            text = self._apply_rule(text, rule)
+        # Construction kuralları (öncelik sırasıyla) + genel Türkçe kuralları;
+        # her hook bir kez uygulanır
+        compiled = compiled or construction.form.compile()
+        for hook in self._hook_chain(compiled):
+            text = hook(text)
+
+        return text
+
+    def _surface(
+        self,
+        text: str,
+        construction: Construction,
+        compiled: CompiledTemplate
+    ) -> str:
+        """
+        Doldurulmuş metne morfoloji ve post-processing uygula.
 
-        # Genel Türkçe kuralları
-        text = self._apply_vowel_harmony(text)
-        text = self._apply_buffer_consonant(text)
+        Sonuç yalnızca derlenmiş template'e, doldurulmuş metne, tonlama,
+        dialogue act ve config bayraklarına bağlıdır; bu yüzden cache'lenir
+        (slot'suz template'ler bir kez işlenir).
 
+        Args:
+            text: Doldurulmuş metin
+            construction: Construction
+            compiled: Derlenmiş template
+
+        Returns:
+            Son metin
+        """
+        config = self.config
+        key = (
+            id(compiled), text,
+            construction.form.intonation, construction.meaning.dialogue_act,
+            config.apply_morphology, config.capitalize_first, config.add_punctuation,
+        )
+        cached = self._surface_cache.get(key)
+        if cached is not None and cached[0] is compiled:
+            return cached[1]
+
+        if config.apply_morphology:
+            text = self._apply_morphology(text, construction, compiled)
+        text = self._post_process(text, construction)
+
+        if len(self._surface_cache) >= self.SURFACE_CACHE_SIZE:
+            self._surface_cache.pop(next(iter(self._surface_cache)))
+        self._surface_cache[key] = (compiled, text)
         return text
 
+    def _hook_chain(self, compiled: CompiledTemplate) -> Tuple[Callable[[str], str], ...]:
+        """
+        Derlenmiş template için morfoloji hook zinciri (cache'li).
+
+        Args:
+            compiled: Derlenmiş template
+
+        Returns:
+            Sırayla uygulanacak hook'lar
+        """
+        chain = self._hook_chains.get(compiled.morphology)
+        if chain is None:
+            rule_types = list(compiled.morphology)
+            rule_types.extend(
+                t for t in self._general_morphology if t not in compiled.morphology
+            )
+            chain = tuple(
+                self._morphology_hooks[t] for t in rule_types
+                if t in self._morphology_hooks
+            )
+            self._hook_chains[compiled.morphology] = chain
+        return chain
+
     def _apply_rule(self, text: str, rule: MorphologyRule) -> str:
         """
         Tek bir morfoloji kuralını uygula.
@@ -293,14 +370,8 @@ class ConstructionRealizer:
         Returns:
             İşlenmiş metin
         """
-        if rule.rule_type == "vowel_harmony":
-            return self._apply_vowel_harmony(text)
-        elif rule.rule_type == "consonant_softening":
-            return self._apply_consonant_softening(text)
-        elif rule.rule_type == "buffer_consonant":
-            return self._apply_buffer_consonant(text)
-
-        return text
+        hook = self._morphology_hooks.get(rule.rule_type)
+        return hook(text) if hook else text
 
     def _apply_vowel_harmony(self, text: str) -> str:
         """
@@ -434,6 +505,9 @@ class ConstructionRealizer:
         """
         Birden fazla construction'ı birleştirerek gerçekleştir.
 
+        Her construction'ın derlenmiş template'i (ConstructionForm.compile)
+        tekrar kullanılır; template'ler yeniden taranmaz.
+
         Args:
             constructions: Construction listesi
             slot_values: Ortak slot değerleri
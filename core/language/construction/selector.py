@@ -116,6 +116,9 @@ class ConstructionSelector:
             print(f"{score.construction.form.template}: {score.total_score}")
     """
 
+    # (construction, act, ton) statik skor memo'sunun üst sınırı
+    STATIC_SCORE_CACHE_SIZE = 4096
+
     def __init__(
         self,
         grammar: ConstructionGrammar,
@@ -140,6 +143,16 @@ class ConstructionSelector:
         # Intent → MVCS Category mapping
         self._intent_mvcs_map = self._build_intent_mvcs_map()
 
+        # (id(construction), act, tone) -> (construction, act_score, tone_score)
+        # Mesajdan bağımsız bileşenler; güven skoru değişebildiği için canlı okunur
+        self._static_scores: Dict[
+            Tuple[int, str, Optional[str]], Tuple[Construction, float, float]
+        ] = {}
+        # (id(construction), kısıtlar) -> (construction, constraint_score)
+        self._constraint_scores: Dict[
+            Tuple[int, Tuple[str, ...]], Tuple[Construction, float]
+        ] = {}
+
         if feedback_store:
             logger.info(f"ConstructionSelector: Feedback re-ranking enabled with {len(feedback_store)} construction stats")
 
@@ -199,11 +212,9 @@ class ConstructionSelector:
         unique_selected = self._apply_feedback_rerank(unique_selected)
 
         # Level counts
-        level_counts = {}
-        for level in ConstructionLevel:
-            level_counts[level] = sum(
-                1 for s in unique_selected if s.construction.level == level
-            )
+        level_counts = dict.fromkeys(ConstructionLevel, 0)
+        for score in unique_selected:
+            level_counts[score.construction.level] += 1
 
         return SelectionResult(
             selected=unique_selected,
@@ -234,18 +245,16 @@ class ConstructionSelector:
         """
         reasons = []
 
-        # 1. DialogueAct eşleşmesi
-        act_score = self._match_dialogue_act(construction, dialogue_act)
+        # 1-2. DialogueAct eşleşmesi ve ton uyumu (memo'lu statik bileşen)
+        act_score, tone_score = self._static_score(construction, dialogue_act, tone)
         if act_score > 0:
             reasons.append(f"DialogueAct match: {dialogue_act}")
 
-        # 2. Ton uyumu
-        tone_score = self._match_tone(construction, tone) if tone else 0.5
         if tone and tone_score > 0.5:
             reasons.append(f"Tone match: {tone}")
 
         # 3. Kısıt uyumu
-        constraint_score = self._match_constraints(construction, constraints) if constraints else 0.5
+        constraint_score = self._constraint_score(construction, constraints) if constraints else 0.5
         if constraints and constraint_score > 0.5:
             reasons.append("Constraint match")
 
@@ -289,6 +298,71 @@ class ConstructionSelector:
             reasons=reasons
         )
 
+    def _static_score(
+        self,
+        construction: Construction,
+        dialogue_act: str,
+        tone: Optional[str]
+    ) -> Tuple[float, float]:
+        """
+        Mesajdan bağımsız (act, ton) skorlarını memo'dan getir.
+
+        Anahtar construction nesnesinin kimliğidir; aynı id ile yeniden
+        eklenen bir construction memo'yu kullanmaz.
+
+        Args:
+            construction: Construction
+            dialogue_act: Hedef act
+            tone: İstenen ton
+
+        Returns:
+            (act_score, tone_score)
+        """
+        key = (id(construction), dialogue_act, tone)
+        cached = self._static_scores.get(key)
+        if cached is not None and cached[0] is construction:
+            return cached[1], cached[2]
+
+        act_score = self._match_dialogue_act(construction, dialogue_act)
+        tone_score = self._match_tone(construction, tone) if tone else 0.5
+
+        if len(self._static_scores) >= self.STATIC_SCORE_CACHE_SIZE:
+            self._static_scores.pop(next(iter(self._static_scores)))
+        self._static_scores[key] = (construction, act_score, tone_score)
+        return act_score, tone_score
+
+    def _constraint_score(
+        self,
+        construction: Construction,
+        constraints: List[str]
+    ) -> float:
+        """
+        Kısıt uyum skorunu memo'dan getir.
+
+        Args:
+            construction: Construction
+            constraints: Kısıtlar
+
+        Returns:
+            Uyum skoru (0.0-1.0)
+        """
+        key = (id(construction), tuple(constraints))
+        cached = self._constraint_scores.get(key)
+        if cached is not None and cached[0] is construction:
+            return cached[1]
+
+        score = self._match_constraints(construction, constraints)
+
+        if len(self._constraint_scores) >= self.STATIC_SCORE_CACHE_SIZE:
+            self._constraint_scores.pop(next(iter(self._constraint_scores)))
+        self._constraint_scores[key] = (construction, score)
+        return score
+
+    def clear_score_cache(self) -> None:
+        """Statik skor memo'larını temizle (construction ton/act değişirse)."""
+        self._static_scores.clear()
+        self._constraint_scores.clear()
+
     def _match_dialogue_act(
         self,
         construction: Construction,
@@ -35,9 +35,13 @@ Construction Grammar Katmanları:
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import re
 import uuid
 
+# Template placeholder: {slot_name}
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
 
 class ConstructionLevel(str, Enum):
     """
@@ -177,6 +181,54 @@ class MorphologyRule:
     examples: List[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    Derlenmiş template - realizasyon sırasında tekrar taranmaz.
+
+    Template, literal parçalar ve slot referansları olarak saklanır:
+    segments[0] + value(slot_refs[0]) + segments[1] + ... + segments[-1]
+    (len(segments) == len(slot_refs) + 1). Form'da tanımlı olmayan
+    {placeholder}'lar literal olarak kalır.
+
+    Attributes:
+        template: Kaynak template (bayatlık kontrolü için)
+        segments: Literal parçalar
+        slot_refs: Parçalar arasındaki slot isimleri
+        slot_names: Form'daki slot sırası
+        morphology: Öncelik sırasına göre kural tipleri (tekrarsız)
+        rules: Derlemede kullanılan kural nesneleri (bayatlık kontrolü için)
+    """
+    template: str
+    segments: Tuple[str, ...]
+    slot_refs: Tuple[str, ...]
+    slot_names: Tuple[str, ...]
+    morphology: Tuple[str, ...]
+    rules: Tuple["MorphologyRule", ...] = ()
+
+    def matches(self, form: "ConstructionForm") -> bool:
+        """Form derlemeden sonra değişmedi mi?"""
+        slots = form.slots
+        rules = form.morphology_rules
+        return (
+            self.template == form.template
+            and len(self.slot_names) == len(slots)
+            and all(name in slots for name in self.slot_names)
+            and len(self.rules) == len(rules)
+            and all(a is b for a, b in zip(self.rules, rules))
+        )
+
+    def join(self, values: Dict[str, str]) -> str:
+        """Slot değerlerini tek geçişte yerleştir (eksik slot -> "")."""
+        if not self.slot_refs:
+            return self.segments[0]
+        parts = [self.segments[0]]
+        for name, segment in zip(self.slot_refs, self.segments[1:]):
+            parts.append(values.get(name) or "")
+            parts.append(segment)
+        return "".join(parts)
+
+
 @dataclass
 class ConstructionForm:
     """
@@ -196,6 +248,45 @@ class ConstructionForm:
     morphology_rules: List[MorphologyRule] = field(default_factory=list)
     word_order: Optional[str] = None    # "SOV", "SVO", "free"
     intonation: Optional[str] = None    # "rising", "falling", "neutral"
+    compiled: Optional[CompiledTemplate] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compile(self) -> CompiledTemplate:
+        """
+        Template'i derle (sonuç cache'lenir, form değişirse yeniden derlenir).
+
+        Returns:
+            CompiledTemplate
+        """
+        if self.compiled is not None and self.compiled.matches(self):
+            return self.compiled
+
+        segments: List[str] = []
+        slot_refs: List[str] = []
+        literal_start = 0
+        for match in _PLACEHOLDER_RE.finditer(self.template):
+            if match.group(1) not in self.slots:
+                continue
+            segments.append(self.template[literal_start:match.start()])
+            slot_refs.append(match.group(1))
+            literal_start = match.end()
+        segments.append(self.template[literal_start:])
+
+        morphology: List[str] = []
+        for rule in sorted(self.morphology_rules, key=lambda r: -r.priority):
+            if rule.rule_type not in morphology:
+                morphology.append(rule.rule_type)
+
+        self.compiled = CompiledTemplate(
+            template=self.template,
+            segments=tuple(segments),
+            slot_refs=tuple(slot_refs),
+            slot_names=tuple(self.slots),
+            morphology=tuple(morphology),
+            rules=tuple(self.morphology_rules),
+        )
+        return self.compiled
 
     def get_slot_names(self) -> List[str]:
         """Template'deki slot isimlerini getir."""
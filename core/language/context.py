@@ -9,14 +9,22 @@ Ozellikler:
 - Token sayimi ve truncation
 - Priority siralama (dusuk = onemli)
 - Conversation, memory, state entegrasyonu
+
+Token sayimlari metin bazinda cache'lenir. Conversation section'i oturum
+basina artimli tutulur: ayni oturumun bir sonraki build'inde sadece yeni
+turlar formatlanir ve token sayisi satir toplamlarindan hesaplanir.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+TOKEN_CACHE_SIZE = 4096           # count_tokens memo boyutu (metin sayisi)
+CONVERSATION_CACHE_SIZE = 256     # Artimli tutulan oturum penceresi sayisi
+
 
 @dataclass
 class ContextConfig:
@@ -40,6 +48,41 @@ class ContextSection:
     token_count: int
 
 
+class _ConversationWindow:
+    """
+    Bir oturumun son max_turns turunun formatlanmis satirlari.
+
+    Her satir icin (metin, kelime, karakter) tutulur; section token sayisi
+    bu toplamlardan hesaplanir, metin yeniden bolunmez.
+    """
+
+    def __init__(self, max_turns: int):
+        self.max_turns = max_turns
+        # Desteklenmeyen turlar None satir olarak yer tutar (pencere tur sayar)
+        self.lines: Deque[Tuple[Optional[str], int, int]] = deque()
+        self.line_count = 0
+        self.words = 0
+        self.chars = 0
+        self.seen = 0                   # Islenen tur sayisi
+        self.last_turn: Any = None      # Son islenen tur (degisiklik tespiti)
+
+    def push(self, line: Optional[str]) -> None:
+        if line is None:
+            self.lines.append((None, 0, 0))
+        else:
+            words = len(line.split())
+            self.lines.append((line, words, len(line)))
+            self.line_count += 1
+            self.words += words
+            self.chars += len(line)
+        if len(self.lines) > self.max_turns:
+            old_line, old_words, old_chars = self.lines.popleft()
+            if old_line is not None:
+                self.line_count -= 1
+                self.words -= old_words
+                self.chars -= old_chars
+
+
 class ContextBuilder:
     """
     Context Builder - Memory + State -> LLM Context.
@@ -68,11 +111,16 @@ class ContextBuilder:
         """
         self.config = config or ContextConfig()
 
+        # Cache'ler
+        self._token_cache: Dict[str, int] = {}
+        self._conversation_windows: Dict[Any, _ConversationWindow] = {}
+
         # Stats
         self._stats = {
             "total_builds": 0,
             "total_sections": 0,
             "total_truncations": 0,
+            "incremental_conversation_builds": 0,
         }
 
         logger.info(
@@ -338,6 +386,9 @@ class ContextBuilder:
         """
         Build conversation history section.
 
+        session_id'si olan conversation'lar icin pencere cache'lenir;
+        turlar sadece eklendiyse yalnizca yeni turlar formatlanir.
+
         Args:
             conversation: Conversation object
             max_turns: Maximum number of turns to include
@@ -345,8 +396,6 @@ class ContextBuilder:
         Returns:
             ContextSection with conversation history
         """
-        lines = ["[Conversation History]"]
-
         # Get turns from conversation
         if hasattr(conversation, "turns"):
             turns = conversation.turns
@@ -357,31 +406,71 @@ class ContextBuilder:
         else:
             turns = []
 
-        # Limit turns
-        recent_turns = turns[-max_turns:] if len(turns) > max_turns else turns
-
-        for turn in recent_turns:
-            # Handle DialogueTurn or dict
-            if hasattr(turn, "role"):
-                role = turn.role
-                content = turn.content if hasattr(turn, "content") else ""
-            elif isinstance(turn, dict):
-                role = turn.get("role", "unknown")
-                content = turn.get("content", "")
+        if max_turns <= 0:
+            # turns[-0:] tum turlar demektir; bu durumda cache kullanilmaz
+            key = None
+            window = _ConversationWindow(max(len(turns), 1))
+            new_turns = turns[-max_turns:] if len(turns) > max_turns else turns
+        else:
+            key = getattr(conversation, "session_id", None) if hasattr(conversation, "turns") else None
+            window = self._conversation_windows.get(key) if key is not None else None
+
+            if (
+                window is not None
+                and window.max_turns == max_turns
+                and window.seen <= len(turns)
+                and (window.seen == 0 or turns[window.seen - 1] is window.last_turn)
+            ):
+                new_turns = turns[window.seen:]
+                self._stats["incremental_conversation_builds"] += 1
             else:
-                continue
-
-            role_label = "User" if role == "user" else "Agent" if role in ["agent", "assistant"] else role.title()
-            lines.append(f"{role_label}: {content}")
-
+                window = _ConversationWindow(max_turns)
+                new_turns = turns
+                if key is not None:
+                    if len(self._conversation_windows) >= CONVERSATION_CACHE_SIZE:
+                        self._conversation_windows.pop(next(iter(self._conversation_windows)))
+                    self._conversation_windows[key] = window
+
+            # Sadece pencerede kalacak yeni turlari formatla
+            if len(new_turns) > max_turns:
+                new_turns = new_turns[-max_turns:]
+
+        for turn in new_turns:
+            window.push(self._format_turn(turn))
+        if turns:
+            window.seen = len(turns)
+            window.last_turn = turns[-1]
+
+        header = "[Conversation History]"
+        lines = [header]
+        lines.extend(line for line, _, _ in window.lines if line is not None)
         content = "\n".join(lines)
+
+        # Token sayisi satir toplamlarindan (newline'lar kelime ayiricidir)
+        words = len(header.split()) + window.words
+        chars = len(header) + window.chars + window.line_count
         return ContextSection(
             name="conversation",
             content=content,
             priority=5,
-            token_count=self.count_tokens(content),
+            token_count=self._estimate_tokens(words, chars),
         )
 
+    def _format_turn(self, turn: Any) -> Optional[str]:
+        """Tek turu "Role: content" satirina cevir (desteklenmeyen tur: None)."""
+        # Handle DialogueTurn or dict
+        if hasattr(turn, "role"):
+            role = turn.role
+            content = turn.content if hasattr(turn, "content") else ""
+        elif isinstance(turn, dict):
+            role = turn.get("role", "unknown")
+            content = turn.get("content", "")
+        else:
+            return None
+
+        role_label = "User" if role == "user" else "Agent" if role in ["agent", "assistant"] else role.title()
+        return f"{role_label}: {content}"
+
     def _build_user_message_section(self, message: str) -> ContextSection:
         """
         Build current user message section.
@@ -420,10 +509,23 @@ class ContextBuilder:
         if not text:
             return 0
 
+        cached = self._token_cache.get(text)
+        if cached is not None:
+            return cached
+
         # Simple word-based estimation
-        words = len(text.split())
+        tokens = self._estimate_tokens(len(text.split()), len(text))
+
+        if len(self._token_cache) >= TOKEN_CACHE_SIZE:
+            self._token_cache.pop(next(iter(self._token_cache)))
+        self._token_cache[text] = tokens
+        return tokens
+
+    @staticmethod
+    def _estimate_tokens(words: int, chars: int) -> int:
+        """Kelime ve karakter sayisindan token tahmini (count_tokens formulu)."""
         # Turkish and special chars need more tokens
-        char_factor = len(text) / max(words, 1) / 5  # Average 5 chars per word
+        char_factor = chars / max(words, 1) / 5  # Average 5 chars per word
         adjustment = max(1.0, char_factor)
 
         return int(words * 1.3 * adjustment)
@@ -561,11 +663,18 @@ class ContextBuilder:
         else:
             return "very low"
 
+    def clear_cache(self) -> None:
+        """Token ve conversation penceresi cache'lerini temizle."""
+        self._token_cache.clear()
+        self._conversation_windows.clear()
+
     @property
     def stats(self) -> Dict[str, Any]:
         """Get builder statistics."""
         return {
             **self._stats,
+            "token_cache_size": len(self._token_cache),
+            "cached_conversations": len(self._conversation_windows),
             "config_max_tokens": self.config.max_tokens,
             "config_recent_turns": self.config.recent_turns_count,
         }
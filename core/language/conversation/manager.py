@@ -13,11 +13,46 @@ from typing import Optional, List, Dict
 from datetime import datetime
 
 from .types import Message, ConversationContext, ContextConfig
+from ..analysis import AnalyzedText, as_analyzed, register_lexicon
 from ..intent.types import IntentCategory
 from ..dialogue.types import DialogueAct
 
 logger = logging.getLogger(__name__)
 
+# Pozitif/negatif kelimeler
+SENTIMENT_LEXICON = register_lexicon(
+    "conversation.sentiment",
+    {
+        "positive": ["iyi", "harika", "mutlu", "tesekkur", "seviyorum", "super", "guzel"],
+        "negative": ["kotu", "uzgun", "sinirli", "berbat", "nefret", "mutsuz"],
+    },
+)
+
+# Topic pattern'leri (basit)
+TOPIC_LEXICON = register_lexicon(
+    "conversation.topic",
+    {
+        "technology": ["bilgisayar", "yazilim", "kod", "program", "internet"],
+        "health": ["saglik", "hastalik", "doktor", "ilac", "agri"],
+        "relationships": ["iliski", "aile", "arkadas", "sevgili"],
+        "education": ["okul", "ders", "sinav", "ogren", "egitim"],
+        "work": ["is", "kariyer", "maas", "patron", "calisma"],
+        "emotions": ["hissediyorum", "duygu", "mutlu", "uzgun"],
+    },
+)
+
+# Bağlamsal referans göstergeleri
+FOLLOWUP_LEXICON = register_lexicon(
+    "conversation.followup",
+    {
+        "followup": [
+            "peki", "ya", "o zaman", "ee", "tamam ama",
+            "bunun", "onun", "bu", "o",
+            "daha", "baska", "ayrica"
+        ]
+    },
+)
+
 
 class ContextManager:
     """
@@ -60,7 +95,8 @@ class ContextManager:
         self,
         content: str,
         intent: Optional[IntentCategory] = None,
-        metadata: Optional[dict] = None
+        metadata: Optional[dict] = None,
+        analysis: Optional[AnalyzedText] = None
     ) -> Message:
         """
         Kullanıcı mesajı ekle.
@@ -69,6 +105,7 @@ class ContextManager:
             content: Mesaj içeriği
             intent: Algılanan intent (opsiyonel)
             metadata: Ek bilgiler
+            analysis: Mesajın paylaşılan analizi (opsiyonel)
 
         Returns:
             Eklenen mesaj
@@ -89,11 +126,11 @@ class ContextManager:
 
         # Sentiment güncelle
         if self.config.enable_sentiment_tracking:
-            self._update_sentiment(message)
+            self._update_sentiment(message, analysis)
 
         # Topic güncelle
         if self.config.enable_topic_tracking:
-            self._update_topic(message)
+            self._update_topic(message, analysis)
 
         # Followup check - calculate before incrementing turn_count
         self.context.is_followup = self.is_followup_question()
@@ -151,7 +188,11 @@ class ContextManager:
             removed = self.context.messages.pop(0)
             logger.debug(f"Removed oldest message from context: {removed.content[:30]}...")
 
-    def _update_sentiment(self, message: Message) -> None:
+    def _update_sentiment(
+        self,
+        message: Message,
+        analysis: Optional[AnalyzedText] = None
+    ) -> None:
         """
         Kullanıcı duygu ortalamasını güncelle.
 
@@ -159,20 +200,15 @@ class ContextManager:
 
         Args:
             message: Kullanıcı mesajı
+            analysis: Mesajın paylaşılan analizi (opsiyonel)
         """
         if not message.is_user():
             return
 
         # Basit sentiment hesaplama
-        from core.utils.text import normalize_turkish
-        content_normalized = normalize_turkish(message.content)
-
-        # Pozitif/negatif kelimeler
-        positive_words = ["iyi", "harika", "mutlu", "tesekkur", "seviyorum", "super", "guzel"]
-        negative_words = ["kotu", "uzgun", "sinirli", "berbat", "nefret", "mutsuz"]
-
-        positive_count = sum(1 for word in positive_words if word in content_normalized)
-        negative_count = sum(1 for word in negative_words if word in content_normalized)
+        text = analysis or as_analyzed(message.content)
+        positive_count = text.count(SENTIMENT_LEXICON, "positive")
+        negative_count = text.count(SENTIMENT_LEXICON, "negative")
 
         # Sentiment skoru (-1 to 1)
         if positive_count > 0 or negative_count > 0:
@@ -208,7 +244,11 @@ class ContextManager:
         # Save current sentiment for next comparison
         self._previous_sentiment = self.context.user_sentiment
 
-    def _update_topic(self, message: Message) -> None:
+    def _update_topic(
+        self,
+        message: Message,
+        analysis: Optional[AnalyzedText] = None
+    ) -> None:
         """
         Mevcut konuyu güncelle.
 
@@ -216,28 +256,13 @@ class ContextManager:
 
         Args:
             message: Kullanıcı mesajı
+            analysis: Mesajın paylaşılan analizi (opsiyonel)
         """
         if not message.is_user():
             return
 
-        from core.utils.text import normalize_turkish
-        content_normalized = normalize_turkish(message.content)
-
-        # Topic pattern'leri (basit)
-        topic_patterns = {
-            "technology": ["bilgisayar", "yazilim", "kod", "program", "internet"],
-            "health": ["saglik", "hastalik", "doktor", "ilac", "agri"],
-            "relationships": ["iliski", "aile", "arkadas", "sevgili"],
-            "education": ["okul", "ders", "sinav", "ogren", "egitim"],
-            "work": ["is", "kariyer", "maas", "patron", "calisma"],
-            "emotions": ["hissediyorum", "duygu", "mutlu", "uzgun"],
-        }
-
-        detected_topic = None
-        for topic, patterns in topic_patterns.items():
-            if any(pattern in content_normalized for pattern in patterns):
-                detected_topic = topic
-                break
+        text = analysis or as_analyzed(message.content)
+        detected_topic = text.first_label(TOPIC_LEXICON)
 
         # Konu değişti mi?
         if detected_topic and detected_topic != self.context.current_topic:
@@ -305,19 +330,11 @@ class ContextManager:
         if not last_msg:
             return False
 
-        from core.utils.text import normalize_turkish
-        content = normalize_turkish(last_msg.content)
-
-        # Bağlamsal referans göstergeleri
-        followup_indicators = [
-            "peki", "ya", "o zaman", "ee", "tamam ama",
-            "bunun", "onun", "bu", "o",
-            "daha", "baska", "ayrica"
-        ]
+        text = as_analyzed(last_msg.content)
 
         # Kısa soru (<10 kelime) + gösterge
-        word_count = len(content.split())
-        has_indicator = any(indicator in content for indicator in followup_indicators)
+        word_count = text.word_count
+        has_indicator = text.has(FOLLOWUP_LEXICON)
 
         return word_count < 10 and has_indicator
 
@@ -14,10 +14,10 @@ UEM v2 - Thought-to-Speech Pipeline bileşeni.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
-from core.utils.text import normalize_turkish
+from core.language.analysis import AnalyzedText, as_analyzed, register_lexicon
 from core.language.intent import IntentRecognizer, IntentCategory
 
 from .types import (
@@ -30,6 +30,62 @@ from .types import (
 )
 
 
+# Keyword lexicon'ları (normalized, substring eşleşme)
+THIRD_PARTY_INDICATORS = [
+    "arkadasim", "annem", "babam", "kardesim", "esim",
+    "mudurum", "ogretmenim", "doktorum", "komsum",
+    "o ", "onlar", "onun", "ona"
+]
+THIRD_PARTY_LEXICON = register_lexicon(
+    "situation.third_party",
+    {indicator: [indicator] for indicator in THIRD_PARTY_INDICATORS},
+)
+
+FOLLOWUP_LEXICON = register_lexicon(
+    "situation.followup",
+    {"followup": ["peki", "ya", "o zaman", "ee", "bunun", "onun"]},
+)
+
+RISK_LEVELS = {
+    "safety": 0.9,
+    "emotional": 0.7,
+    "ethical": 0.8,
+    "relational": 0.5,
+}
+RISK_LEXICON = register_lexicon(
+    "situation.risk",
+    {
+        "safety": ["intihar", "kendine zarar", "olmek", "yaralanma", "kaza"],
+        "emotional": ["depresyon", "anksiyete", "panik", "cok kotu", "dayanamiyorum"],
+        "ethical": ["yasadisi", "hile", "dolandir", "cal", "hackle"],
+        "relational": ["ayrilik", "bosanma", "kavga", "terk"],
+    },
+)
+
+EMOTION_LEXICON = register_lexicon(
+    "situation.emotion",
+    {
+        "positive": ["mutlu", "harika", "guzel", "tesekkur", "seviyorum", "super"],
+        "negative": ["uzgun", "kotu", "sinirli", "kizgin", "nefret", "berbat"],
+        "high_arousal": ["heyecan", "panik", "acil", "cok", "asiri"],
+        "low_arousal": ["sakin", "huzur", "rahat", "yavas"],
+    },
+)
+
+TOPIC_LEXICON = register_lexicon(
+    "situation.topic",
+    {
+        "technology": ["bilgisayar", "yazilim", "kod", "program", "internet"],
+        "health": ["saglik", "hastalik", "doktor", "ilac", "agri"],
+        "relationships": ["iliski", "aile", "arkadas", "sevgili"],
+        "education": ["okul", "ders", "sinav", "ogren", "egitim"],  # Before work to prioritize
+        "work": ["is", "kariyer", "maas", "patron", "calisma"],
+        "emotions": ["hissediyorum", "duygu", "mutlu", "uzgun"],
+        "help": ["yardim", "nasil", "ne yapmali"]
+    },
+)
+
+
 def _generate_intention_id() -> str:
     """Generate unique intention ID."""
     return f"int_{uuid.uuid4().hex[:12]}"
@@ -109,7 +165,8 @@ class SituationBuilder:
         self,
         user_message: str,
         conversation_context: Optional[List[Dict[str, str]]] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        analysis: Optional[AnalyzedText] = None
     ) -> SituationModel:
         """
         Ana build metodu - SituationModel oluştur.
@@ -118,30 +175,32 @@ class SituationBuilder:
             user_message: Kullanıcı mesajı
             conversation_context: Konuşma geçmişi [{"role": "user", "content": "..."}]
             metadata: Ek metadata
+            analysis: Mesajın paylaşılan analizi (yoksa oluşturulur)
 
         Returns:
             SituationModel: Durum modeli
         """
         situation_id = generate_situation_id()
+        text = analysis or as_analyzed(user_message)
 
         # 1. Aktörleri çıkar
-        actors = self._extract_actors(user_message, conversation_context)
+        actors = self._extract_actors(text, conversation_context)
 
         # 2. Niyetleri çıkar (context-aware)
-        intentions = self._extract_intentions(user_message, actors, conversation_context)
+        intentions = self._extract_intentions(text, actors, conversation_context)
 
         # 3. Riskleri değerlendir
         risks: List[Risk] = []
         if self.config.enable_risk_detection:
-            risks = self._detect_risks(user_message, intentions)
+            risks = self._detect_risks(text, intentions)
 
         # 4. Duygusal durumu algıla
         emotional_state: Optional[EmotionalState] = None
         if self.config.enable_emotion_detection:
-            emotional_state = self._detect_emotion(user_message)
+            emotional_state = self._detect_emotion(text)
 
         # 5. Konu alanını belirle
-        topic_domain = self._determine_topic(user_message)
+        topic_domain = self._determine_topic(text)
 
         # 6. Bağlam özeti oluştur
         context_summary = self._summarize_context(user_message, conversation_context)
@@ -170,7 +229,7 @@ class SituationBuilder:
 
     def _extract_actors(
         self,
-        message: str,
+        message: Union[str, AnalyzedText],
         context: Optional[List[Dict[str, str]]] = None
     ) -> List[Actor]:
         """
@@ -206,16 +265,10 @@ class SituationBuilder:
 
         # Mesajda 3. kişiler var mı?
         # Basit heuristik: isim, "o", "onlar", "arkadaşım" vs.
-        third_party_indicators = [
-            "arkadasim", "annem", "babam", "kardesim", "esim",
-            "mudurum", "ogretmenim", "doktorum", "komsum",
-            "o ", "onlar", "onun", "ona"
-        ]
-
-        message_normalized = normalize_turkish(message)
+        hits = as_analyzed(message).hits(THIRD_PARTY_LEXICON)
         found_count = 0
-        for i, indicator in enumerate(third_party_indicators):
-            if indicator in message_normalized:
+        for i, indicator in enumerate(THIRD_PARTY_INDICATORS):
+            if indicator in hits:
                 actors.append(Actor(
                     id=f"third_party_{i}",
                     role="third_party",
@@ -231,7 +284,7 @@ class SituationBuilder:
 
     def _extract_intentions(
         self,
-        message: str,
+        message: Union[str, AnalyzedText],
         actors: List[Actor],
         conversation_context: Optional[List[Dict[str, str]]] = None
     ) -> List[Intention]:
@@ -266,10 +319,7 @@ class SituationBuilder:
         # Eğer önceki mesajlarla ilişkiliyse confidence artır
         if conversation_context and len(conversation_context) >= 2:
             # Basit followup detection
-            from core.utils.text import normalize_turkish
-            msg_normalized = normalize_turkish(message)
-            followup_indicators = ["peki", "ya", "o zaman", "ee", "bunun", "onun"]
-            is_followup = any(ind in msg_normalized for ind in followup_indicators)
+            is_followup = as_analyzed(message).has(FOLLOWUP_LEXICON)
 
             if is_followup:
                 # Followup ise confidence'ı hafifçe artır
@@ -329,7 +379,7 @@ class SituationBuilder:
 
     def _detect_risks(
         self,
-        message: str,
+        message: Union[str, AnalyzedText],
         intentions: List[Intention]
     ) -> List[Risk]:
         """
@@ -343,39 +393,17 @@ class SituationBuilder:
             List[Risk]: Risk listesi
         """
         risks = []
-        message_normalized = normalize_turkish(message)
-
-        # Risk pattern'leri - normalized keywords
-        risk_patterns = {
-            "safety": {
-                "keywords": ["intihar", "kendine zarar", "olmek", "yaralanma", "kaza"],
-                "level": 0.9
-            },
-            "emotional": {
-                "keywords": ["depresyon", "anksiyete", "panik", "cok kotu", "dayanamiyorum"],
-                "level": 0.7
-            },
-            "ethical": {
-                "keywords": ["yasadisi", "hile", "dolandir", "cal", "hackle"],
-                "level": 0.8
-            },
-            "relational": {
-                "keywords": ["ayrilik", "bosanma", "kavga", "terk"],
-                "level": 0.5
-            }
-        }
 
-        for risk_type, config in risk_patterns.items():
-            for keyword in config["keywords"]:
-                if keyword in message_normalized:
-                    mitigations = self._get_risk_mitigations(risk_type)
-                    risks.append(Risk(
-                        category=risk_type,
-                        level=config["level"],
-                        description=f"'{keyword}' ifadesi algılandı",
-                        mitigation=mitigations[0] if mitigations else None
-                    ))
-                    break
+        # Risk tipi başına ilk eşleşen keyword (RISK_LEXICON sırası)
+        for risk_type, keywords in as_analyzed(message).hits(RISK_LEXICON).items():
+            keyword = keywords[0]
+            mitigations = self._get_risk_mitigations(risk_type)
+            risks.append(Risk(
+                category=risk_type,
+                level=RISK_LEVELS[risk_type],
+                description=f"'{keyword}' ifadesi algılandı",
+                mitigation=mitigations[0] if mitigations else None
+            ))
 
         return risks[:self.config.max_risks]
 
@@ -397,7 +425,7 @@ class SituationBuilder:
         }
         return mitigations.get(risk_type, ["Dikkatli ol"])
 
-    def _detect_emotion(self, message: str) -> EmotionalState:
+    def _detect_emotion(self, message: Union[str, AnalyzedText]) -> EmotionalState:
         """
         Mesajdan duygusal durumu algıla.
 
@@ -409,35 +437,26 @@ class SituationBuilder:
         Returns:
             EmotionalState: Duygusal durum
         """
-        message_normalized = normalize_turkish(message)
+        text = as_analyzed(message)
 
-        # Basit duygu pattern'leri - normalized words
+        # Basit duygu pattern'leri - normalized words (EMOTION_LEXICON)
         valence = 0.0
         arousal = 0.0
         primary_emotion: Optional[str] = None
 
-        positive_words = ["mutlu", "harika", "guzel", "tesekkur", "seviyorum", "super"]
-        negative_words = ["uzgun", "kotu", "sinirli", "kizgin", "nefret", "berbat"]
-        high_arousal_words = ["heyecan", "panik", "acil", "cok", "asiri"]
-        low_arousal_words = ["sakin", "huzur", "rahat", "yavas"]
-
-        for word in positive_words:
-            if word in message_normalized:
-                valence += 0.3
-                primary_emotion = primary_emotion or "positive"
+        for _ in range(text.count(EMOTION_LEXICON, "positive")):
+            valence += 0.3
+            primary_emotion = primary_emotion or "positive"
 
-        for word in negative_words:
-            if word in message_normalized:
-                valence -= 0.3
-                primary_emotion = primary_emotion or "negative"
+        for _ in range(text.count(EMOTION_LEXICON, "negative")):
+            valence -= 0.3
+            primary_emotion = primary_emotion or "negative"
 
-        for word in high_arousal_words:
-            if word in message_normalized:
-                arousal += 0.2
+        for _ in range(text.count(EMOTION_LEXICON, "high_arousal")):
+            arousal += 0.2
 
-        for word in low_arousal_words:
-            if word in message_normalized:
-                arousal -= 0.2
+        for _ in range(text.count(EMOTION_LEXICON, "low_arousal")):
+            arousal -= 0.2
 
         # Sınırla
         valence = max(-1.0, min(1.0, valence))
@@ -452,7 +471,7 @@ class SituationBuilder:
             confidence=0.5
         )
 
-    def _determine_topic(self, message: str) -> str:
+    def _determine_topic(self, message: Union[str, AnalyzedText]) -> str:
         """
         Mesajın konu alanını belirle.
 
@@ -462,24 +481,7 @@ class SituationBuilder:
         Returns:
             str: Konu alanı
         """
-        message_normalized = normalize_turkish(message)
-
-        topic_patterns = {
-            "technology": ["bilgisayar", "yazilim", "kod", "program", "internet"],
-            "health": ["saglik", "hastalik", "doktor", "ilac", "agri"],
-            "relationships": ["iliski", "aile", "arkadas", "sevgili"],
-            "education": ["okul", "ders", "sinav", "ogren", "egitim"],  # Before work to prioritize
-            "work": ["is", "kariyer", "maas", "patron", "calisma"],
-            "emotions": ["hissediyorum", "duygu", "mutlu", "uzgun"],
-            "help": ["yardim", "nasil", "ne yapmali"]
-        }
-
-        for topic, patterns in topic_patterns.items():
-            for pattern in patterns:
-                if pattern in message_normalized:
-                    return topic
-
-        return "general"
+        return as_analyzed(message).first_label(TOPIC_LEXICON) or "general"
 
     def _summarize_context(
         self,
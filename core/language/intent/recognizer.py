@@ -11,15 +11,28 @@ UEM v2 - Intent Recognition sistemi.
 
 import re
 import logging
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union
 from dataclasses import dataclass
 
 from core.utils.text import normalize_turkish
+from core.language.analysis import (
+    AnalyzedText,
+    MATCH_WORD,
+    as_analyzed,
+    register_lexicon,
+)
 from .types import IntentCategory, IntentMatch, IntentResult
 from .patterns import INTENT_PATTERNS, get_pattern_weight, get_pattern_id
 
 logger = logging.getLogger(__name__)
 
+# Tüm intent pattern'leri tek lexicon (tek kelimelikler kelime sınırıyla)
+INTENT_LEXICON = register_lexicon(
+    "intent.patterns",
+    {category.value: patterns for category, patterns in INTENT_PATTERNS.items()},
+    match=MATCH_WORD,
+)
+
 
 @dataclass
 class IntentRecognizerConfig:
@@ -78,16 +91,21 @@ class IntentRecognizer:
             self._pattern_cache[category] = patterns
         logger.debug(f"Pattern cache built: {len(self._pattern_cache)} categories")
 
-    def recognize(self, message: str) -> IntentResult:
+    def recognize(self, message: Union[str, AnalyzedText]) -> IntentResult:
         """
         Ana intent tanıma metodu.
 
         Args:
-            message: Kullanıcı mesajı
+            message: Kullanıcı mesajı (veya paylaşılan AnalyzedText)
 
         Returns:
             IntentResult: Tanıma sonucu
         """
+        if isinstance(message, AnalyzedText):
+            analysis, message = message, message.raw
+        else:
+            analysis = None
+
         if not message or not message.strip():
             return IntentResult(
                 primary=IntentCategory.UNKNOWN,
@@ -97,11 +115,8 @@ class IntentRecognizer:
                 is_compound=False
             )
 
-        # 1. Metni normalize et
-        normalized_text = self._normalize(message) if self.config.normalize_enabled else message.lower()
-
-        # 2. Tüm eşleşmeleri bul
-        all_matches = self._match_patterns(normalized_text)
+        # 1-2. Metni normalize et ve tüm eşleşmeleri bul
+        all_matches = self._find_matches(analysis or message)
 
         # 3. Eşleşme yoksa UNKNOWN
         if not all_matches:
@@ -158,19 +173,59 @@ class IntentRecognizer:
             all_matches=valid_matches[:self.config.max_intents_per_message]
         )
 
-    def get_all_matches(self, message: str) -> List[IntentMatch]:
+    def get_all_matches(self, message: Union[str, AnalyzedText]) -> List[IntentMatch]:
         """
         Mesajdaki tüm intent eşleşmelerini döndür.
 
         Args:
-            message: Kullanıcı mesajı
+            message: Kullanıcı mesajı (veya paylaşılan AnalyzedText)
 
         Returns:
             Tüm eşleşmeler (sıralı, confidence'a göre)
         """
-        normalized_text = self._normalize(message) if self.config.normalize_enabled else message.lower()
-        all_matches = self._match_patterns(normalized_text)
-        return all_matches
+        return self._find_matches(message)
+
+    def _find_matches(self, message: Union[str, AnalyzedText]) -> List[IntentMatch]:
+        """Normalizasyon ayarına göre eşleşmeleri bul."""
+        if not self.config.normalize_enabled:
+            raw = message.raw if isinstance(message, AnalyzedText) else message
+            return self._match_patterns(raw.lower())
+        return self._match_analysis(as_analyzed(message))
+
+    def _match_analysis(self, analysis: AnalyzedText) -> List[IntentMatch]:
+        """
+        AnalyzedText'teki önceden hesaplanmış INTENT_LEXICON eşleşmelerinden
+        IntentMatch listesi oluştur (_match_patterns ile aynı sonuç).
+        """
+        normalized_text = analysis.normalized.strip()
+        lead = len(analysis.normalized) - len(analysis.normalized.lstrip())
+        hits = analysis.hits(INTENT_LEXICON)
+        matches: List[IntentMatch] = []
+
+        for category in self._pattern_cache:
+            matched = hits.get(category.value)
+            if not matched:
+                continue
+
+            # Kategorinin ilk eşleşen pattern'i (pattern sırası korunur)
+            pattern = matched[0]
+            if " " not in pattern and re.fullmatch(r"\w+", pattern):
+                position = analysis.find_word(pattern)
+                position = position - lead if position >= 0 else -1
+            else:
+                position = self._get_pattern_position(pattern, normalized_text)
+
+            matches.append(IntentMatch(
+                category=category,
+                confidence=self._calculate_confidence(
+                    pattern, normalized_text, category, position
+                ),
+                matched_pattern=pattern,
+                normalized_text=normalized_text
+            ))
+
+        matches.sort(key=lambda m: m.confidence, reverse=True)
+        return matches
 
     def _normalize(self, text: str) -> str:
         """
@@ -23,6 +23,7 @@ from ..dialogue.types import (
     DialogueAct,
 )
 from .config import SelfCritiqueConfig
+from ..analysis import AnalyzedText, Lexicon
 
 
 @dataclass
@@ -119,6 +120,9 @@ class SelfCritique:
 
         # Problematik pattern'ler
         self._problematic_patterns = self._build_problematic_patterns()
+        self._problematic_lexicon = Lexicon(
+            "critique.problematic", self._problematic_patterns, normalize=False
+        )
 
     def critique(
         self,
@@ -370,16 +374,13 @@ class SelfCritique:
         Returns:
             Sorun listesi
         """
-        issues = []
-        output_lower = output.lower()
-
-        for category, patterns in self._problematic_patterns.items():
-            for pattern in patterns:
-                if pattern in output_lower:
-                    issues.append(f"Problematik ifade ({category}): '{pattern}'")
-                    break  # Kategori basina bir
+        hits = AnalyzedText(output).hits(self._problematic_lexicon)
 
-        return issues
+        # Kategori basina bir (ilk eslesen pattern)
+        return [
+            f"Problematik ifade ({category}): '{patterns[0]}'"
+            for category, patterns in hits.items()
+        ]
 
     def _check_length(
         self,
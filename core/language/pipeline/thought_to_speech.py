@@ -23,6 +23,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 import uuid
 
+from ..analysis import AnalyzedText, analyze
 from ..dialogue.types import (
     SituationModel,
     MessagePlan,
@@ -57,6 +58,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from core.learning.episode_logger import EpisodeLogger
     from core.learning.feedback_store import FeedbackStore
+    from ..post_turn import PostTurnQueue
 
 
 def generate_pipeline_result_id() -> str:
@@ -243,6 +245,9 @@ class ThoughtToSpeechPipeline:
         # Episode logger (opsiyonel - Faz 5 için)
         self.episode_logger = episode_logger
 
+        # PostTurnQueue (opsiyonel) - verilirse episode kaydı arka planda yazılır
+        self.post_turn_queue: Optional["PostTurnQueue"] = None
+
     def _try_load_feedback_store(self) -> Optional["FeedbackStore"]:
         """
         FeedbackStore'u otomatik yüklemeyi dene.
@@ -291,13 +296,14 @@ class ThoughtToSpeechPipeline:
         result_id = generate_pipeline_result_id()
         result_metadata = {"id": result_id, **(metadata or {})}
 
+        # Mesaj bir kez analiz edilir; alt modüller aynı AnalyzedText'i okur
+        analysis = analyze(user_message)
+
         # Episode logging başlat (Faz 5)
         start_time = time.time()
         episode_id = None
         if self.episode_logger:
-            from core.utils.text import normalize_turkish
-            normalized_message = normalize_turkish(user_message)
-            episode_id = self.episode_logger.start_episode(user_message, normalized_message)
+            episode_id = self.episode_logger.start_episode(user_message, analysis.normalized)
             result_metadata["episode_id"] = episode_id
 
         try:
@@ -306,7 +312,7 @@ class ThoughtToSpeechPipeline:
                 self.context_manager.from_legacy_format(context)
 
             # 1. SituationModel olustur
-            situation = self._build_situation(user_message, context)
+            situation = self._build_situation(user_message, context, analysis)
             result_metadata["situation_id"] = situation.id
 
             # Episode logging: Intent update (Faz 5)
@@ -327,7 +333,9 @@ class ThoughtToSpeechPipeline:
                     intent_enum = IntentCategory(primary_intent) if primary_intent else None
                 except (ValueError, AttributeError):
                     intent_enum = None
-                self.context_manager.add_user_message(user_message, intent_enum)
+                self.context_manager.add_user_message(
+                    user_message, intent_enum, analysis=analysis
+                )
 
             # Episode logging: Context update (Faz 5)
             if self.episode_logger:
@@ -452,8 +460,7 @@ class ThoughtToSpeechPipeline:
 
             # Episode logging: Finalize (Faz 5)
             if self.episode_logger:
-                processing_time_ms = int((time.time() - start_time) * 1000)
-                self.episode_logger.finalize_episode(processing_time_ms)
+                self._finalize_episode(start_time)
 
             return PipelineResult(
                 success=True,
@@ -471,19 +478,36 @@ class ThoughtToSpeechPipeline:
         except Exception as e:
             # Episode logging: Finalize with error (Faz 5)
             if self.episode_logger and self.episode_logger.current_episode:
-                processing_time_ms = int((time.time() - start_time) * 1000)
                 # Partial data with error - still valuable for debugging
-                self.episode_logger.finalize_episode(processing_time_ms)
+                self._finalize_episode(start_time)
 
             return PipelineResult.failure(
                 error=str(e),
                 fallback_output=self.config.fallback_response
             )
 
+    def _finalize_episode(self, start_time: float) -> None:
+        """
+        Episode'u tamamla; kuyruk varsa store yazımını ona bırak.
+
+        Args:
+            start_time: process() başlangıç zamanı (time.time())
+        """
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        if self.post_turn_queue is None:
+            self.episode_logger.finalize_episode(processing_time_ms)
+            return
+
+        episode = self.episode_logger.finalize_episode(processing_time_ms, save=False)
+        self.post_turn_queue.submit(
+            episode.session_id, self.episode_logger.store.save, episode
+        )
+
     def _build_situation(
         self,
         message: str,
-        context: Optional[List[Dict[str, str]]] = None
+        context: Optional[List[Dict[str, str]]] = None,
+        analysis: Optional[AnalyzedText] = None
     ) -> SituationModel:
         """
         SituationModel olustur.
@@ -491,11 +515,12 @@ class ThoughtToSpeechPipeline:
         Args:
             message: Kullanici mesaji
             context: Konusma gecmisi
+            analysis: Mesajin paylasilan analizi
 
         Returns:
             SituationModel
         """
-        return self.situation_builder.build(message, context)
+        return self.situation_builder.build(message, context, analysis=analysis)
 
     def _select_acts(self, situation: SituationModel) -> ActSelectionResult:
         """
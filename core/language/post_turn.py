@@ -0,0 +1,278 @@
+"""
+core/language/post_turn.py
+
+Post-turn task kuyrugu - yanit uretildikten sonra yapilan isler.
+
+Bellek yazimlari, pattern kaydi (embedding dahil) ve episode loglama
+yanitin kritik yolundan cikarilir. Gorevler oturum anahtarina gore
+shard'lara dagitilir; her shard tek bir worker thread ile FIFO calisir,
+bu yuzden ayni oturumun gorevleri gonderildigi sirada yurutulur.
+
+Okuma tarafi flush(session_id) ile kendi yazimlarini gorur
+(read-your-writes). Kuyruk calismiyorsa gorevler submit() icinde senkron
+yurutulur; cagiran kod iki modda da ayni yolu kullanir.
+
+Kullanim:
+    queue = PostTurnQueue(PostTurnConfig(workers=2))
+    queue.start()
+
+    future = queue.submit(session_id, memory.add_turn, session_id, "user", text)
+    queue.flush(session_id)      # okumadan once
+    turn = future.result()
+
+    queue.stop()                 # bekleyenleri yurutur
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import queue
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostTurnConfig:
+    """Post-turn kuyruk yapilandirmasi."""
+    workers: int = 1                 # Shard (worker thread) sayisi
+    queue_size: int = 1000           # Shard basina bekleyen gorev limiti
+    stop_timeout_s: float = 5.0      # stop() icin bekleme suresi
+    lag_warning_ms: float = 1000.0   # Bu gecikmenin ustu uyari olarak loglanir
+
+
+class _Shard:
+    """Tek worker thread'li FIFO kuyruk."""
+
+    def __init__(self, index: int, queue_size: int):
+        self.index = index
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.thread: Optional[threading.Thread] = None
+        self.pending = 0
+        self.idle = threading.Condition()
+
+
+class PostTurnQueue:
+    """
+    Oturum bazli sirali arka plan gorev kuyrugu.
+
+    submit() gorevi oturumun shard'ina koyar ve bir Future dondurur.
+    Kuyruk doluysa submit() yer acilana kadar bekler (geri basinc);
+    gorev dusurulmez ve sira bozulmaz. Gorev hatalari loglanir, sayaca
+    islenir ve Future'a yazilir; worker calismaya devam eder.
+    """
+
+    _STOP = object()
+
+    def __init__(self, config: Optional[PostTurnConfig] = None, name: str = "uem-post-turn"):
+        self.config = config or PostTurnConfig()
+        self._name = name
+        self._shards: List[_Shard] = [
+            _Shard(i, self.config.queue_size) for i in range(max(1, self.config.workers))
+        ]
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "inline": 0,
+            "backpressure_waits": 0,
+            "max_queue_depth": 0,
+        }
+        self._lag_total_ms = 0.0
+        self._lag_max_ms = 0.0
+        self._lag_last_ms = 0.0
+        self._run_total_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return any(s.thread is not None and s.thread.is_alive() for s in self._shards)
+
+    def start(self) -> None:
+        """Worker thread'lerini baslat."""
+        for shard in self._shards:
+            if shard.thread is not None and shard.thread.is_alive():
+                continue
+            shard.thread = threading.Thread(
+                target=self._run,
+                args=(shard,),
+                name=f"{self._name}-{shard.index}",
+                daemon=True,
+            )
+            shard.thread.start()
+
+    def stop(self) -> None:
+        """Bekleyen gorevleri yurut ve thread'leri durdur."""
+        for shard in self._shards:
+            if shard.thread is not None and shard.thread.is_alive():
+                shard.queue.put(self._STOP)
+        for shard in self._shards:
+            if shard.thread is None:
+                continue
+            shard.thread.join(timeout=self.config.stop_timeout_s)
+            if shard.thread.is_alive():
+                logger.warning(f"Post-turn worker {shard.index} did not stop in time")
+                continue
+            shard.thread = None
+            # STOP'tan sonra kuyruga giren gorevleri senkron yurut
+            self._drain(shard)
+
+    def submit(
+        self,
+        session_id: Optional[str],
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Gorevi oturumun shard'ina ekle.
+
+        Args:
+            session_id: Sira anahtari (ayni anahtar = ayni worker, FIFO)
+            func: Yurutulecek fonksiyon
+            *args, **kwargs: func argumanlari
+
+        Returns:
+            Future: Gorev sonucu (senkron modda zaten tamamlanmis)
+        """
+        future: Future = Future()
+        shard = self._shard_for(session_id)
+
+        with self._lock:
+            self._stats["submitted"] += 1
+
+        if shard.thread is None or not shard.thread.is_alive():
+            with self._lock:
+                self._stats["inline"] += 1
+            self._execute(func, args, kwargs, future, time.monotonic())
+            return future
+
+        with shard.idle:
+            shard.pending += 1
+        item = (func, args, kwargs, future, time.monotonic())
+        try:
+            shard.queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._stats["backpressure_waits"] += 1
+            shard.queue.put(item)
+
+        depth = self.queue_depth()
+        with self._lock:
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+        return future
+
+    def flush(self, session_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Bekleyen gorevlerin bitmesini bekle.
+
+        Args:
+            session_id: Sadece bu oturumun shard'i (None = tum shard'lar)
+            timeout: Maksimum bekleme (saniye, None = sinirsiz)
+
+        Returns:
+            Sure dolmadan bosaldi mi
+        """
+        shards = self._shards if session_id is None else [self._shard_for(session_id)]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        current = threading.current_thread()
+
+        for shard in shards:
+            # Worker kendi shard'ini bekleyemez (kilitlenme)
+            if shard.thread is current:
+                continue
+            with shard.idle:
+                while shard.pending > 0:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    shard.idle.wait(remaining)
+        return True
+
+    def queue_depth(self) -> int:
+        """Bekleyen (henuz bitmemis) gorev sayisi."""
+        return sum(shard.pending for shard in self._shards)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Kuyruk metrikleri.
+
+        Returns:
+            submitted/completed/failed/inline sayaclari, queue_depth,
+            max_queue_depth ve enqueue -> baslama gecikmesi (lag_*_ms)
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            executed = stats["completed"] + stats["failed"]
+            stats["lag_avg_ms"] = self._lag_total_ms / executed if executed else 0.0
+            stats["lag_max_ms"] = self._lag_max_ms
+            stats["lag_last_ms"] = self._lag_last_ms
+            stats["run_avg_ms"] = self._run_total_ms / executed if executed else 0.0
+        stats["queue_depth"] = self.queue_depth()
+        stats["workers"] = len(self._shards)
+        stats["running"] = self.running
+        return stats
+
+    def _shard_for(self, session_id: Optional[str]) -> _Shard:
+        if len(self._shards) == 1:
+            return self._shards[0]
+        key = (session_id or "").encode("utf-8")
+        return self._shards[zlib.crc32(key) % len(self._shards)]
+
+    def _execute(
+        self,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any],
+        future: Future,
+        enqueued_at: float,
+    ) -> None:
+        started = time.monotonic()
+        lag_ms = (started - enqueued_at) * 1000
+        failed = False
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            failed = True
+            logger.error(f"Post-turn task {getattr(func, '__name__', func)} failed: {e}")
+            future.set_exception(e)
+        run_ms = (time.monotonic() - started) * 1000
+
+        if lag_ms > self.config.lag_warning_ms:
+            logger.warning(f"Post-turn queue lag {lag_ms:.0f}ms")
+
+        with self._lock:
+            self._stats["failed" if failed else "completed"] += 1
+            self._lag_total_ms += lag_ms
+            self._lag_last_ms = lag_ms
+            if lag_ms > self._lag_max_ms:
+                self._lag_max_ms = lag_ms
+            self._run_total_ms += run_ms
+
+    def _run(self, shard: _Shard) -> None:
+        while True:
+            item = shard.queue.get()
+            if item is self._STOP:
+                break
+            self._run_item(shard, item)
+
+    def _drain(self, shard: _Shard) -> None:
+        while True:
+            try:
+                item = shard.queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not self._STOP:
+                self._run_item(shard, item)
+
+    def _run_item(self, shard: _Shard, item: tuple) -> None:
+        func, args, kwargs, future, enqueued_at = item
+        self._execute(func, args, kwargs, future, enqueued_at)
+        with shard.idle:
+            shard.pending -= 1
+            if shard.pending == 0:
+                shard.idle.notify_all()
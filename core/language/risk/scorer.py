@@ -12,8 +12,7 @@ UEM v2 - Thought-to-Speech Pipeline kontrol bileşeni.
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from core.utils.text import normalize_turkish
-
+from ..analysis import AnalyzedText, register_lexicon
 from .types import (
     RiskLevel,
     RiskCategory,
@@ -29,6 +28,12 @@ from ..dialogue.types import (
     ToneType,
 )
 
+# Acil durum belirteçleri (normalized)
+EMERGENCY_LEXICON = register_lexicon(
+    "risk.emergency",
+    {"emergency": ["intihar", "kendine zarar", "olmek", "acil"]},
+)
+
 
 @dataclass
 class RiskScorerConfig:
@@ -322,25 +327,22 @@ class RiskScorer:
                     source="situation"
                 ))
 
-        # 2. Acil durum belirteçleri - context'te arama (normalized)
-        emergency_keywords = ["intihar", "kendine zarar", "olmek", "acil"]
-        context_text = normalize_turkish(str(situation.context))
-
-        # Key entities'te de ara
-        entities_text = normalize_turkish(" ".join(situation.key_entities))
-        search_text = context_text + " " + entities_text
-
-        for keyword in emergency_keywords:
-            if keyword in search_text:
-                score += 0.5
-                factors.append(RiskFactor(
-                    id=generate_risk_factor_id(),
-                    category=RiskCategory.SAFETY,
-                    description=f"Acil durum belirteci: {keyword}",
-                    score=0.8,
-                    source="situation"
-                ))
-                break
+        # 2. Acil durum belirteçleri - context'te ve key entities'te arama.
+        # Metin mesaj değil situation context'i olduğundan analyze() cache'ine
+        # konmaz; eşleşme yine derlenmiş lexicon üzerinden yapılır.
+        search_text = AnalyzedText(
+            str(situation.context) + " " + " ".join(situation.key_entities)
+        )
+        keyword = search_text.first(EMERGENCY_LEXICON, "emergency")
+        if keyword:
+            score += 0.5
+            factors.append(RiskFactor(
+                id=generate_risk_factor_id(),
+                category=RiskCategory.SAFETY,
+                description=f"Acil durum belirteci: {keyword}",
+                score=0.8,
+                source="situation"
+            ))
 
         return min(1.0, score), factors
 
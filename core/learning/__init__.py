@@ -103,7 +103,7 @@ from .pattern_analyzer import PatternAnalyzer, create_analyzer
 # Faz 5 - Feedback-Driven Learning
 from .feedback_stats import ConstructionStats
 from .feedback_store import FeedbackStore
-from .feedback_aggregator import FeedbackAggregator
+from .feedback_aggregator import FeedbackAggregator, CheckpointedFeedbackAggregator
 from .feedback_scorer import (
     compute_wins_losses,
     compute_feedback_mean,
@@ -173,6 +173,7 @@ __all__ = [
     "ConstructionStats",
     "FeedbackStore",
     "FeedbackAggregator",
+    "CheckpointedFeedbackAggregator",
     "compute_wins_losses",
     "compute_feedback_mean",
     "compute_influence",
@@ -226,12 +226,13 @@ class EpisodeLogger:
         self.current_episode.approval_status = approval_status
         self.current_episode.approval_reasons = approval_reasons or []
 
-    def finalize_episode(self, processing_time_ms: int = 0) -> EpisodeLog:
+    def finalize_episode(self, processing_time_ms: int = 0, save: bool = True) -> EpisodeLog:
         """
         Episode'u tamamla ve store'a kaydet.
 
         Args:
             processing_time_ms: Total processing time in milliseconds
+            save: False ise kaydı çağıran yapar (ör. post-turn kuyruğu)
 
         Returns:
             EpisodeLog: Finalized episode
@@ -245,7 +246,8 @@ class EpisodeLogger:
         self.current_episode.processing_time_ms = processing_time_ms
 
         # Store'a kaydet
-        self.store.save(self.current_episode)
+        if save:
+            self.store.save(self.current_episode)
 
         # Reference'ı sakla ve temizle
         finalized = self.current_episode
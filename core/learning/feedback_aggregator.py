@@ -6,16 +6,25 @@ FeedbackAggregator - Episode loglarından construction stats hesaplar.
 Episode'lardaki explicit ve implicit feedback'leri toplar,
 her construction için istatistikler oluşturur.
 
+CheckpointedFeedbackAggregator episodes.jsonl'in son işlenen byte
+offset'ini saklar; her çalışmada sadece yeni satırları okuyup
+FeedbackStore'daki stats'ları yerinde günceller (tail modu ile daemon).
+
 UEM v2 - Faz 5 Feedback-Driven Learning.
 """
 
+import json
 import logging
+import os
+import threading
 from datetime import datetime
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
 
 from .episode_types import EpisodeLog, ImplicitFeedback
 from .feedback_stats import ConstructionStats
 from .feedback_scorer import compute_feedback_mean, compute_wins_losses
+from .feedback_store import FeedbackStore
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +55,34 @@ class FeedbackAggregator:
             {construction_id: ConstructionStats} sözlüğü
         """
         stats_by_id: Dict[str, ConstructionStats] = {}
+        self.apply(stats_by_id, episodes)
+
+        logger.info(
+            f"FeedbackAggregator: Processed {len(episodes)} episodes, "
+            f"generated stats for {len(stats_by_id)} constructions"
+        )
+
+        return stats_by_id
+
+    def apply(
+        self,
+        stats_by_id: Dict[str, ConstructionStats],
+        episodes: Iterable[EpisodeLog],
+    ) -> Set[str]:
+        """
+        Episode'ları stats sözlüğüne yerinde uygula.
+
+        Sadece etkilenen construction'ların cached score'u yeniden
+        hesaplanır.
+
+        Args:
+            stats_by_id: Güncellenecek {construction_id: ConstructionStats}
+            episodes: Uygulanacak episode'lar
+
+        Returns:
+            Güncellenen construction ID'leri
+        """
+        touched: Set[str] = set()
 
         for episode in episodes:
             cid = episode.construction_id
@@ -56,10 +93,10 @@ class FeedbackAggregator:
                 continue
 
             # Stats al veya oluştur
-            if cid not in stats_by_id:
-                stats_by_id[cid] = ConstructionStats(construction_id=cid)
+            stats = stats_by_id.get(cid)
+            if stats is None:
+                stats = stats_by_id[cid] = ConstructionStats(construction_id=cid)
 
-            stats = stats_by_id[cid]
             stats.total_uses += 1
 
             # Explicit feedback
@@ -68,16 +105,13 @@ class FeedbackAggregator:
             # Implicit feedback
             self._process_implicit_feedback(stats, episode)
 
-        # Cached score'ları hesapla
-        for stats in stats_by_id.values():
-            self._update_cached_score(stats)
+            touched.add(cid)
 
-        logger.info(
-            f"FeedbackAggregator: Processed {len(episodes)} episodes, "
-            f"generated stats for {len(stats_by_id)} constructions"
-        )
+        # Cached score'ları hesapla
+        for cid in touched:
+            self._update_cached_score(stats_by_id[cid])
 
-        return stats_by_id
+        return touched
 
     def _process_explicit_feedback(self, stats: ConstructionStats, episode: EpisodeLog) -> None:
         """
@@ -154,21 +188,7 @@ class FeedbackAggregator:
         stats_by_id = {cid: ConstructionStats.from_dict(s.to_dict())
                        for cid, s in existing_stats.items()}
 
-        for episode in new_episodes:
-            cid = episode.construction_id
-
-            if not cid:
-                continue
-
-            # Stats al veya oluştur
-            if cid not in stats_by_id:
-                stats_by_id[cid] = ConstructionStats(construction_id=cid)
-
-            stats = stats_by_id[cid]
-            stats.total_uses += 1
-
-            self._process_explicit_feedback(stats, episode)
-            self._process_implicit_feedback(stats, episode)
+        self.apply(stats_by_id, new_episodes)
 
         # Cached score'ları güncelle
         for stats in stats_by_id.values():
@@ -211,3 +231,222 @@ class FeedbackAggregator:
             "implicit_negative": total_implicit_neg,
             "average_score": sum(s.cached_score for s in stats.values()) / len(stats) if stats else 0.5,
         }
+
+
+class CheckpointedFeedbackAggregator:
+    """
+    episodes.jsonl üzerinde checkpoint'li artımlı aggregator.
+
+    Son işlenen byte offset'i checkpoint dosyasında tutulur. run_once()
+    sadece offset'ten sonraki tam satırları okur (yarım son satır bir
+    sonraki çalışmaya kalır), etkilenen construction'ları FeedbackStore'da
+    yerinde günceller ve checkpoint'i atomik olarak ilerletir.
+
+    Dosya küçülmüş veya değiştirilmişse (clear, rotate) stats baştan
+    oluşturulur. Checkpoint yokken store boş değilse (checkpoint'siz
+    yazılmış eski stats) de baştan oluşturulur; aksi halde ilk run_once
+    tüm log'u mevcut sayıların üstüne ekler. Tam aggregation isteyen
+    yollar rebuild() kullanır, böylece checkpoint her zaman log sonuna
+    yazılır.
+
+    Not: Store güncellemesi checkpoint'ten önce yazılır; ikisi arasında
+    çökme olursa son parti bir kez daha sayılabilir (at-least-once).
+
+    Kullanım:
+        aggregator = CheckpointedFeedbackAggregator(
+            "data/episodes.jsonl", FeedbackStore()
+        )
+        aggregator.rebuild()         # Tam tarama (store sıfırlanır)
+        aggregator.run_once()        # Sadece yeni episode'lar
+        aggregator.tail(poll_interval_s=2.0, stop_event=stop)  # Daemon
+    """
+
+    CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+    def __init__(
+        self,
+        episodes_path,
+        feedback_store: FeedbackStore,
+        checkpoint_path: Optional[Path] = None,
+        aggregator: Optional[FeedbackAggregator] = None,
+    ):
+        """
+        Args:
+            episodes_path: Episode JSONL dosya yolu
+            feedback_store: Güncellenecek FeedbackStore
+            checkpoint_path: Checkpoint dosyası (default: store yolu + .checkpoint.json)
+            aggregator: Feedback kuralları (default: FeedbackAggregator())
+        """
+        self.episodes_path = Path(episodes_path)
+        self.store = feedback_store
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else (
+            feedback_store.path.with_name(feedback_store.path.name + self.CHECKPOINT_SUFFIX)
+        )
+        self.aggregator = aggregator or FeedbackAggregator()
+
+        self.offset = 0
+        self.inode: Optional[int] = None
+        self.episodes_processed = 0
+        self.invalid_lines = 0
+        self.has_checkpoint = False
+        self._load_checkpoint()
+
+    # ===================================================================
+    # CHECKPOINT
+    # ===================================================================
+
+    def _load_checkpoint(self) -> None:
+        if not self.checkpoint_path.exists():
+            return
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"FeedbackAggregator: Ignoring bad checkpoint {self.checkpoint_path}: {e}")
+            return
+
+        if data.get("episodes_path") != str(self.episodes_path.resolve()):
+            logger.info("FeedbackAggregator: Checkpoint belongs to another episodes file, ignoring")
+            return
+
+        self.offset = data.get("offset", 0)
+        self.inode = data.get("inode")
+        self.episodes_processed = data.get("episodes_processed", 0)
+        self.has_checkpoint = True
+
+    def _save_checkpoint(self) -> None:
+        data = {
+            "episodes_path": str(self.episodes_path.resolve()),
+            "offset": self.offset,
+            "inode": self.inode,
+            "episodes_processed": self.episodes_processed,
+            "updated_at": datetime.now().isoformat(),
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.checkpoint_path)
+        self.has_checkpoint = True
+
+    def reset(self) -> None:
+        """Stats'ları ve checkpoint'i sıfırla (sonraki run tam tarama yapar)."""
+        self.store.clear()
+        self.offset = 0
+        self.inode = None
+        self.episodes_processed = 0
+        self._save_checkpoint()
+
+    # ===================================================================
+    # PROCESSING
+    # ===================================================================
+
+    def rebuild(self) -> int:
+        """
+        Stats'ları tüm log'dan baştan oluştur ve checkpoint'i log sonuna yaz.
+
+        Returns:
+            İşlenen episode sayısı
+        """
+        self.reset()
+        return self.run_once()
+
+    def run_once(self) -> int:
+        """
+        Checkpoint'ten sonraki yeni episode'ları işle.
+
+        Returns:
+            İşlenen episode sayısı
+        """
+        if not self.episodes_path.exists():
+            return 0
+
+        if not self.has_checkpoint and self.store.count() > 0:
+            logger.warning(
+                f"FeedbackAggregator: {self.store.path} has stats but no checkpoint, rebuilding stats"
+            )
+            self.reset()
+
+        st = os.stat(self.episodes_path)
+        if st.st_size < self.offset or (self.inode is not None and st.st_ino != self.inode):
+            logger.warning(
+                f"FeedbackAggregator: {self.episodes_path} was truncated or replaced, rebuilding stats"
+            )
+            self.reset()
+        self.inode = st.st_ino
+
+        if st.st_size == self.offset:
+            return 0
+
+        episodes: List[EpisodeLog] = []
+        with open(self.episodes_path, "rb") as f:
+            f.seek(self.offset)
+            offset = self.offset
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Yazımı süren son satır
+                offset += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    episodes.append(EpisodeLog.from_dict(json.loads(line)))
+                except (ValueError, KeyError, TypeError) as e:
+                    self.invalid_lines += 1
+                    logger.warning(f"FeedbackAggregator: Skipping invalid episode line: {e}")
+
+        if offset == self.offset:
+            return 0
+
+        # Sadece bu partide geçen construction'lar yüklenir
+        stats_by_id: Dict[str, ConstructionStats] = {}
+        for episode in episodes:
+            cid = episode.construction_id
+            if cid and cid not in stats_by_id:
+                existing = self.store.get_stats(cid)
+                if existing is not None:
+                    stats_by_id[cid] = existing
+        touched = self.aggregator.apply(stats_by_id, episodes)
+        for cid in touched:
+            self.store.update_stats(stats_by_id[cid])
+        self.store.flush()
+
+        self.offset = offset
+        self.episodes_processed += len(episodes)
+        self._save_checkpoint()
+
+        logger.info(
+            f"FeedbackAggregator: Processed {len(episodes)} new episodes, "
+            f"updated {len(touched)} constructions (offset={self.offset})"
+        )
+        return len(episodes)
+
+    def tail(
+        self,
+        poll_interval_s: float = 1.0,
+        stop_event: Optional[threading.Event] = None,
+        max_polls: Optional[int] = None,
+    ) -> int:
+        """
+        Dosyayı izle ve yeni episode'ları geldikçe işle.
+
+        Args:
+            poll_interval_s: Yoklama aralığı
+            stop_event: Set edilince döngü biter
+            max_polls: Maksimum yoklama sayısı (None = sınırsız)
+
+        Returns:
+            Toplam işlenen episode sayısı
+        """
+        stop_event = stop_event or threading.Event()
+        total = 0
+        polls = 0
+
+        while not stop_event.is_set():
+            total += self.run_once()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            stop_event.wait(poll_interval_s)
+
+        return total
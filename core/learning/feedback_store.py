@@ -6,14 +6,23 @@ FeedbackStore - Construction feedback istatistiklerinin JSON persistence'ı.
 ConstructionStats'ları JSON dosyasında saklar ve yükler.
 Selector tarafından re-ranking için okunur.
 
+Yazım modeli:
+- update_stats tek satırlık delta'yı journal'a ekler (append-only, O(1))
+- Journal compact_every satırı geçince snapshot yeniden yazılır
+  (geçici dosya + atomic rename) ve journal sıfırlanır
+- flush_interval_s > 0 ise delta'lar bellekte birleştirilir ve
+  aralıklı olarak journal'a yazılır (debounce)
+
 UEM v2 - Faz 5 Feedback-Driven Learning.
 """
 
 import json
 import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, TextIO
 
 from .feedback_stats import ConstructionStats
 
@@ -25,7 +34,8 @@ class FeedbackStore:
     Construction feedback istatistiklerini JSON'da saklar.
 
     Attributes:
-        path: JSON dosya yolu
+        path: Snapshot JSON dosya yolu
+        journal_path: Delta journal (JSONL) yolu
         _stats: Memory cache {construction_id: ConstructionStats}
 
     Kullanım:
@@ -34,22 +44,46 @@ class FeedbackStore:
         if stats:
             print(f"Uses: {stats.total_uses}")
 
-        # Güncelleme
+        # Güncelleme (journal'a tek satır eklenir)
         new_stats = ConstructionStats(construction_id="greet_basic_01", ...)
         store.update_stats(new_stats)
+
+        # Debounce: delta'lar 2 saniyede bir yazılır
+        store = FeedbackStore(flush_interval_s=2.0)
+        ...
+        store.close()  # Bekleyen delta'ları yaz
     """
 
     DEFAULT_PATH = Path("data/construction_stats.json")
-
-    def __init__(self, path: Optional[Path] = None):
+    JOURNAL_SUFFIX = ".journal.jsonl"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        compact_every: int = 1000,
+        flush_interval_s: float = 0.0,
+    ):
         """
         FeedbackStore oluştur.
 
         Args:
             path: JSON dosya yolu (default: data/construction_stats.json)
+            compact_every: Bu kadar journal satırından sonra snapshot yaz
+            flush_interval_s: Delta'ları bu aralıkla toplu yaz (0 = hemen)
         """
-        self.path = path or self.DEFAULT_PATH
+        self.path = Path(path) if path is not None else self.DEFAULT_PATH
+        self.journal_path = self.path.with_name(self.path.name + self.JOURNAL_SUFFIX)
+        self.compact_every = max(1, compact_every)
+        self.flush_interval_s = flush_interval_s
+
         self._stats: Dict[str, ConstructionStats] = {}
+        self._lock = threading.RLock()
+        self._pending: Dict[str, ConstructionStats] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        self._journal: Optional[TextIO] = None
+        self._journal_lines = 0
+        self._seq = 0  # Son yazilan delta sira numarasi
+
         self._load()
 
     def _ensure_directory_exists(self) -> None:
@@ -57,29 +91,61 @@ class FeedbackStore:
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
     def _load(self) -> None:
-        """JSON dosyasından yükle."""
-        if not self.path.exists():
+        """Snapshot'ı yükle, sonra journal'ı üzerine uygula."""
+        snapshot_seq = 0
+
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+
+                # Data yapısı: {"stats": {construction_id: {...}, ...}, "metadata": {...}}
+                stats_data = data.get("stats", {})
+                for cid, stat_dict in stats_data.items():
+                    self._stats[cid] = ConstructionStats.from_dict(stat_dict)
+                snapshot_seq = data.get("metadata", {}).get("journal_seq", 0)
+
+                logger.info(f"FeedbackStore: Loaded {len(self._stats)} construction stats from {self.path}")
+
+            except json.JSONDecodeError as e:
+                logger.warning(f"FeedbackStore: JSON parse error in {self.path}: {e}")
+            except Exception as e:
+                logger.warning(f"FeedbackStore: Error loading {self.path}: {e}")
+        else:
             logger.debug(f"FeedbackStore: No existing file at {self.path}")
-            return
-
-        try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = json.load(f)
 
-            # Data yapısı: {"stats": {construction_id: {...}, ...}, "metadata": {...}}
-            stats_data = data.get("stats", {})
-            for cid, stat_dict in stats_data.items():
-                self._stats[cid] = ConstructionStats.from_dict(stat_dict)
+        self._seq = snapshot_seq
+        self._replay_journal(snapshot_seq)
 
-            logger.info(f"FeedbackStore: Loaded {len(self._stats)} construction stats from {self.path}")
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"FeedbackStore: JSON parse error in {self.path}: {e}")
-        except Exception as e:
-            logger.warning(f"FeedbackStore: Error loading {self.path}: {e}")
+    def _replay_journal(self, snapshot_seq: int) -> None:
+        """Snapshot'tan sonraki delta'ları uygula."""
+        if not self.journal_path.exists():
+            return
 
-    def _save(self) -> None:
-        """JSON dosyasına kaydet."""
+        replayed = 0
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                self._journal_lines += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Yarım kalmış son satır
+                    logger.warning(f"FeedbackStore: Skipping corrupt journal line in {self.journal_path}")
+                    continue
+
+                seq = entry.get("seq", 0)
+                if seq <= snapshot_seq:
+                    continue  # Snapshot'a zaten dahil
+                stats = ConstructionStats.from_dict(entry["stats"])
+                self._stats[stats.construction_id] = stats
+                self._seq = max(self._seq, seq)
+                replayed += 1
+
+        if replayed:
+            logger.info(f"FeedbackStore: Replayed {replayed} journal entries from {self.journal_path}")
+
+    def _compact(self) -> None:
+        """Snapshot'ı yeniden yaz (geçici dosya + atomic rename), journal'ı sıfırla."""
         self._ensure_directory_exists()
 
         data = {
@@ -87,13 +153,23 @@ class FeedbackStore:
                 "version": "1.0",
                 "last_updated": datetime.now().isoformat(),
                 "count": len(self._stats),
+                "journal_seq": self._seq,
             },
             "stats": {cid: stats.to_dict() for cid, stats in self._stats.items()},
         }
 
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+            # Snapshot journal_seq'i kapsadığı için journal güvenle sıfırlanır
+            self._close_journal()
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_lines = 0
 
             logger.debug(f"FeedbackStore: Saved {len(self._stats)} stats to {self.path}")
 
@@ -101,6 +177,53 @@ class FeedbackStore:
             logger.error(f"FeedbackStore: Error saving to {self.path}: {e}")
             raise
 
+    def _append(self, stats_list) -> None:
+        """Delta'ları journal'a ekle; eşik aşılırsa compact et."""
+        if self._journal is None:
+            self._ensure_directory_exists()
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+        for stats in stats_list:
+            self._seq += 1
+            self._journal.write(json.dumps(
+                {"seq": self._seq, "stats": stats.to_dict()},
+                ensure_ascii=False,
+            ) + "\n")
+            self._journal_lines += 1
+        self._journal.flush()
+
+        if self._journal_lines >= self.compact_every:
+            self._compact()
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def flush(self) -> None:
+        """Bekleyen (debounce edilmiş) delta'ları journal'a yaz."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._append(pending)
+
+    def compact(self) -> None:
+        """Bekleyenleri yaz ve snapshot'ı hemen yenile."""
+        with self._lock:
+            self.flush()
+            self._compact()
+
+    def close(self) -> None:
+        """Bekleyen delta'ları yaz ve journal'ı kapat."""
+        with self._lock:
+            self.flush()
+            self._close_journal()
+
     def get_stats(self, construction_id: str) -> Optional[ConstructionStats]:
         """
         Belirli construction için stats döndür.
@@ -117,23 +240,40 @@ class FeedbackStore:
         """
         Tek stats güncelle ve kaydet.
 
+        Sadece bu construction'ın delta'sı journal'a eklenir; debounce
+        açıksa bir sonraki flush'a kadar bellekte birleştirilir.
+
         Args:
             stats: Güncellenecek ConstructionStats
         """
-        self._stats[stats.construction_id] = stats
-        self._save()
+        with self._lock:
+            self._stats[stats.construction_id] = stats
+
+            if self.flush_interval_s <= 0:
+                self._append([stats])
+                return
+
+            self._pending[stats.construction_id] = stats
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval_s, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
     def bulk_update(self, stats_dict: Dict[str, ConstructionStats]) -> None:
         """
         Toplu güncelleme (aggregator için).
 
-        Mevcut stats'ları günceller veya yeni ekler, sonra kaydeder.
+        Mevcut stats'ları günceller veya yeni ekler, sonra snapshot'ı
+        yeniden yazar.
 
         Args:
             stats_dict: {construction_id: ConstructionStats} sözlüğü
         """
-        self._stats.update(stats_dict)
-        self._save()
+        with self._lock:
+            self._stats.update(stats_dict)
+            self._pending.clear()
+            self.flush()
+            self._compact()
         logger.info(f"FeedbackStore: Bulk updated {len(stats_dict)} construction stats")
 
     def get_all(self) -> Dict[str, ConstructionStats]:
@@ -147,8 +287,11 @@ class FeedbackStore:
 
     def clear(self) -> None:
         """Tüm stats'ları sil (testing için)."""
-        self._stats.clear()
-        self._save()
+        with self._lock:
+            self._stats.clear()
+            self._pending.clear()
+            self.flush()
+            self._compact()
         logger.info("FeedbackStore: Cleared all stats")
 
     def count(self) -> int:
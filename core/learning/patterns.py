@@ -6,7 +6,8 @@ UEM v2 - Embedding tabanli benzer pattern bulma.
 
 Ozellikler:
 - Pattern depolama ve indeksleme
-- Embedding-based similarity search
+- Embedding-based similarity search (EmbeddingMatrix, vektorize filtreleme)
+- Batch query (birden fazla context tek matris carpimi)
 - Success/failure tracking
 - Pattern pruning
 - Optional PostgreSQL persistence
@@ -18,6 +19,8 @@ import logging
 
 import numpy as np
 
+from core.memory.vector_store import EmbeddingMatrix
+
 from .types import (
     Pattern,
     PatternType,
@@ -58,7 +61,12 @@ class PatternStorage:
         self.encoder = encoder
         self.repository = repository
         self._patterns: Dict[str, Pattern] = {}
-        self._embeddings: Dict[str, np.ndarray] = {}
+
+        # Benzerlik indexi: satir -> pattern ID EmbeddingMatrix'te; success_count
+        # ayni satir sirasiyla ayri bir dizide (compaction sonrasi yeniden kurulur)
+        self._embeddings = EmbeddingMatrix(initial_capacity=64)
+        self._success = np.zeros(0, dtype=np.int64)
+        self._success_layout = self._embeddings.layout_version
 
         # Load from DB if repository available
         if self.repository:
@@ -73,9 +81,9 @@ class PatternStorage:
             patterns = self.repository.get_all()
             for pattern in patterns:
                 self._patterns[pattern.id] = pattern
-                # Reconstruct embedding array if available
+                # Reconstruct embedding row if available
                 if pattern.embedding:
-                    self._embeddings[pattern.id] = np.array(pattern.embedding)
+                    self._index_embedding(pattern, np.array(pattern.embedding))
             logger.info(f"Loaded {len(patterns)} patterns from database")
         except Exception as e:
             logger.error(f"Error loading patterns from database: {e}")
@@ -131,7 +139,7 @@ class PatternStorage:
 
         # Store embedding for similarity search
         if embedding_array is not None:
-            self._embeddings[pattern_id] = embedding_array
+            self._index_embedding(pattern, embedding_array)
 
         # Persist to database
         self._save_to_db(pattern)
@@ -177,28 +185,120 @@ class PatternStorage:
         except Exception:
             return []
 
-        # Calculate similarities
-        similarities = []
-        for pattern_id, embedding in self._embeddings.items():
-            similarity = self._cosine_similarity(query_embedding, embedding)
-            if similarity >= min_similarity:
-                pattern = self._patterns[pattern_id]
-                # Filter by minimum uses
-                if pattern.success_count >= min_uses:
-                    similarities.append((pattern, float(similarity)))
-
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
-
-        return similarities[:k]
-
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
+        matches = self._query(query_embedding, k, min_similarity, min_uses)[0]
+        return [(self._patterns[pid], similarity) for pid, similarity in matches]
+
+    def find_similar_batch(
+        self,
+        contents: List[str],
+        k: int = 5,
+        min_similarity: float = 0.85,
+        min_uses: int = 3
+    ) -> List[List[Tuple[Pattern, float]]]:
+        """
+        Birden fazla icerik icin benzer patternleri bul.
+
+        Icerikler tek seferde encode edilir ve tek matris carpimi ile
+        skorlanir.
+
+        Args:
+            contents: Aranacak icerikler
+            k: Icerik basina maksimum sonuc sayisi
+            min_similarity: Minimum benzerlik esigi (default: 0.85)
+            min_uses: Minimum kullanim sayisi (default: 3)
+
+        Returns:
+            Her icerik icin (Pattern, similarity) tuple listesi
+        """
+        empty: List[List[Tuple[Pattern, float]]] = [[] for _ in contents]
+        if not contents or self.encoder is None or len(self._embeddings) == 0:
+            return empty
+
+        try:
+            query_embeddings = self.encoder.encode_batch(list(contents))
+        except Exception:
+            return empty
+
+        return [
+            [(self._patterns[pid], similarity) for pid, similarity in matches]
+            for matches in self._query(query_embeddings, k, min_similarity, min_uses)
+        ]
+
+    def _index_embedding(self, pattern: Pattern, embedding: np.ndarray) -> None:
+        """Add pattern embedding row to the similarity index."""
+        try:
+            row = self._embeddings.add(pattern.id, embedding)
+        except ValueError:
+            logger.warning(f"Embedding dimension mismatch, not indexed: {pattern.id}")
+            return
+        self._success_rows()[row] = pattern.success_count
+
+    def _success_rows(self) -> np.ndarray:
+        """Matris satirlariyla hizali success_count dizisi."""
+        matrix = self._embeddings
+        if self._success_layout != matrix.layout_version:
+            self._success = np.array(
+                [
+                    self._patterns[pid].success_count if pid is not None else 0
+                    for pid in map(matrix.id_of, range(matrix.size))
+                ],
+                dtype=np.int64,
+            )
+            self._success_layout = matrix.layout_version
+        if len(self._success) < matrix.capacity:
+            success = np.zeros(matrix.capacity, dtype=np.int64)
+            success[:len(self._success)] = self._success
+            self._success = success
+        return self._success
+
+    def _query(
+        self,
+        queries: np.ndarray,
+        k: int,
+        min_similarity: float,
+        min_uses: int,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Sorgu basina top-k (pattern_id, similarity).
+
+        Benzerlik, esik, tombstone ve min_uses filtresi tek (m, n)
+        matris uzerinde uygulanir.
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+
+        matrix = self._embeddings
+        size = matrix.size
+        if size == 0 or k <= 0 or queries.shape[1] != matrix.dimension:
+            return [[] for _ in range(len(queries))]
+
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1.0, norms)
+
+        scores = queries @ matrix.vectors.T
+        valid = (
+            (scores >= min_similarity)
+            & (self._success_rows()[:size] >= min_uses)
+            & matrix.alive
+        )
+        scores = np.where(valid, scores, -np.inf)
+
+        if k < size:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(size), (len(scores), size))
+
+        results = []
+        for q, candidates in enumerate(top):
+            row_scores = scores[q, candidates]
+            order = np.argsort(-row_scores, kind="stable")
+            results.append([
+                (matrix.id_of(candidates[i]), float(row_scores[i]))
+                for i in order
+                if row_scores[i] != -np.inf
+            ])
+        return results
 
     def update_stats(
         self,
@@ -220,6 +320,9 @@ class PatternStorage:
 
         if success:
             pattern.success_count += 1
+            row = self._embeddings.row_of(pattern_id)
+            if row is not None:
+                self._success_rows()[row] = pattern.success_count
         else:
             pattern.failure_count += 1
 
@@ -309,8 +412,7 @@ class PatternStorage:
 
         for pattern_id in to_remove:
             del self._patterns[pattern_id]
-            if pattern_id in self._embeddings:
-                del self._embeddings[pattern_id]
+            self._embeddings.remove(pattern_id)
             # Delete from database
             if self.repository:
                 try:
@@ -6,11 +6,12 @@ Repository for Feedback PostgreSQL persistence.
 Provides CRUD operations for learning feedbacks.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Callable
 import logging
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, exists, func
 from sqlalchemy.orm import Session
 
 from core.memory.persistence.models import FeedbackModel
@@ -18,6 +19,50 @@ from core.learning.types import Feedback, FeedbackType
 
 logger = logging.getLogger(__name__)
 
+# Pozitif/negatif siniri (get_stats)
+POSITIVE_THRESHOLD = 0.3
+NEGATIVE_THRESHOLD = -0.3
+
+
+@dataclass
+class _FeedbackStatsSnapshot:
+    """Cached get_stats values, updated on each save."""
+    total: int = 0
+    positive: int = 0
+    negative: int = 0
+    explicit: int = 0
+    implicit: int = 0
+    value_sum: float = 0.0
+    unique_users: int = 0
+    unique_interactions: int = 0
+
+    def apply(self, feedback: Feedback, new_user: bool, new_interaction: bool) -> None:
+        self.total += 1
+        self.value_sum += feedback.value
+        if feedback.value > POSITIVE_THRESHOLD:
+            self.positive += 1
+        elif feedback.value < NEGATIVE_THRESHOLD:
+            self.negative += 1
+        if feedback.feedback_type == FeedbackType.EXPLICIT:
+            self.explicit += 1
+        elif feedback.feedback_type == FeedbackType.IMPLICIT:
+            self.implicit += 1
+        self.unique_users += int(new_user)
+        self.unique_interactions += int(new_interaction)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_feedback": self.total,
+            "positive_count": self.positive,
+            "negative_count": self.negative,
+            "neutral_count": self.total - self.positive - self.negative,
+            "explicit_count": self.explicit,
+            "implicit_count": self.implicit,
+            "average_score": self.value_sum / self.total if self.total else 0.0,
+            "unique_users": self.unique_users,
+            "unique_interactions": self.unique_interactions,
+        }
+
 
 class FeedbackRepository:
     """
@@ -35,16 +80,27 @@ class FeedbackRepository:
 
         # Get by interaction
         feedbacks = repo.get_by_interaction("int_123")
+
+        # Stats snapshot: ilk get_stats sorgular, sonraki save'ler gunceller
+        repo = FeedbackRepository(Session, cache_stats=True)
     """
 
-    def __init__(self, session_factory: Callable[[], Session]):
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        cache_stats: bool = False,
+    ):
         """
         Initialize feedback repository.
 
         Args:
             session_factory: Callable that returns SQLAlchemy Session
+            cache_stats: get_stats sonucunu onbellekte tut ve save ile
+                artimli guncelle (tek yazici varsayar)
         """
         self.session_factory = session_factory
+        self.cache_stats = cache_stats
+        self._stats_snapshot: Optional[_FeedbackStatsSnapshot] = None
 
     def save(self, feedback: Feedback) -> str:
         """
@@ -58,9 +114,23 @@ class FeedbackRepository:
         """
         session = self.session_factory()
         try:
+            snapshot = self._stats_snapshot
+            if snapshot is not None:
+                # Distinct sayaclari icin indeksli varlik kontrolu
+                new_user = feedback.user_id is not None and not session.query(
+                    exists().where(FeedbackModel.user_id == feedback.user_id)
+                ).scalar()
+                new_interaction = not session.query(
+                    exists().where(FeedbackModel.interaction_id == feedback.interaction_id)
+                ).scalar()
+
             model = self._to_model(feedback)
             session.add(model)
             session.commit()
+
+            if snapshot is not None:
+                snapshot.apply(feedback, new_user, new_interaction)
+
             logger.debug(f"Feedback saved: {feedback.id}")
             return feedback.id
         except Exception as e:
@@ -188,6 +258,7 @@ class FeedbackRepository:
             session.commit()
 
             if result > 0:
+                self._stats_snapshot = None
                 logger.debug(f"Feedback deleted: {feedback_id}")
                 return True
             return False
@@ -215,72 +286,50 @@ class FeedbackRepository:
         """
         Get feedback statistics.
 
+        Tum sayaclar tek bir aggregate sorguda (COUNT ... FILTER) hesaplanir.
+        cache_stats aktifse sonuc snapshot olarak tutulur.
+
         Returns:
             Statistics dict
         """
+        if self._stats_snapshot is not None:
+            return self._stats_snapshot.to_dict()
+
         session = self.session_factory()
         try:
-            total = session.query(FeedbackModel).count()
-
-            if total == 0:
-                return {
-                    "total_feedback": 0,
-                    "positive_count": 0,
-                    "negative_count": 0,
-                    "neutral_count": 0,
-                    "explicit_count": 0,
-                    "implicit_count": 0,
-                    "average_score": 0.0,
-                    "unique_users": 0,
-                    "unique_interactions": 0
-                }
-
-            # Count by value
-            positive = session.query(FeedbackModel).filter(
-                FeedbackModel.value > 0.3
-            ).count()
-            negative = session.query(FeedbackModel).filter(
-                FeedbackModel.value < -0.3
-            ).count()
-            neutral = total - positive - negative
-
-            # Count by type
-            explicit = session.query(FeedbackModel).filter(
-                FeedbackModel.feedback_type == FeedbackType.EXPLICIT.value
-            ).count()
-            implicit = session.query(FeedbackModel).filter(
-                FeedbackModel.feedback_type == FeedbackType.IMPLICIT.value
-            ).count()
-
-            # Average score
-            avg_score = session.query(func.avg(FeedbackModel.value)).scalar() or 0.0
-
-            # Unique users
-            unique_users = session.query(
-                func.count(func.distinct(FeedbackModel.user_id))
-            ).filter(
-                FeedbackModel.user_id.isnot(None)
-            ).scalar() or 0
-
-            # Unique interactions
-            unique_interactions = session.query(
-                func.count(func.distinct(FeedbackModel.interaction_id))
-            ).scalar() or 0
-
-            return {
-                "total_feedback": total,
-                "positive_count": positive,
-                "negative_count": negative,
-                "neutral_count": neutral,
-                "explicit_count": explicit,
-                "implicit_count": implicit,
-                "average_score": float(avg_score),
-                "unique_users": unique_users,
-                "unique_interactions": unique_interactions
-            }
+            count_all = func.count(FeedbackModel.id)
+            row = session.query(
+                count_all,
+                count_all.filter(FeedbackModel.value > POSITIVE_THRESHOLD),
+                count_all.filter(FeedbackModel.value < NEGATIVE_THRESHOLD),
+                count_all.filter(FeedbackModel.feedback_type == FeedbackType.EXPLICIT.value),
+                count_all.filter(FeedbackModel.feedback_type == FeedbackType.IMPLICIT.value),
+                func.coalesce(func.sum(FeedbackModel.value), 0.0),
+                # COUNT(DISTINCT) NULL'lari saymaz
+                func.count(func.distinct(FeedbackModel.user_id)),
+                func.count(func.distinct(FeedbackModel.interaction_id)),
+            ).one()
         finally:
             session.close()
 
+        snapshot = _FeedbackStatsSnapshot(
+            total=row[0] or 0,
+            positive=row[1] or 0,
+            negative=row[2] or 0,
+            explicit=row[3] or 0,
+            implicit=row[4] or 0,
+            value_sum=float(row[5] or 0.0),
+            unique_users=row[6] or 0,
+            unique_interactions=row[7] or 0,
+        )
+        if self.cache_stats:
+            self._stats_snapshot = snapshot
+        return snapshot.to_dict()
+
+    def invalidate_stats(self) -> None:
+        """Drop cached stats snapshot (next get_stats re-queries)."""
+        self._stats_snapshot = None
+
     def get_average_score(self, user_id: Optional[str] = None) -> float:
         """
         Get average feedback score.
@@ -314,6 +363,8 @@ class FeedbackRepository:
         try:
             count = session.query(FeedbackModel).delete()
             session.commit()
+            if self.cache_stats:
+                self._stats_snapshot = _FeedbackStatsSnapshot()
             logger.info(f"Cleared {count} feedbacks")
             return count
         except Exception as e:
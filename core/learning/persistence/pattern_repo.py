@@ -6,11 +6,12 @@ Repository for Pattern PostgreSQL persistence.
 Provides CRUD operations for learning patterns.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 import logging
 
-from sqlalchemy import desc, func
+from sqlalchemy import Float, cast, desc, func
 from sqlalchemy.orm import Session
 
 from core.memory.persistence.models import PatternModel
@@ -19,6 +20,40 @@ from core.learning.types import Pattern, PatternType
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PatternStatsSnapshot:
+    """Cached get_stats values, updated on each save/update."""
+    by_type: Dict[str, int] = field(default_factory=dict)
+    total_uses: int = 0
+    rate_sum: float = 0.0     # Kullanilmis patternlerin basari orani toplami
+    used_count: int = 0
+
+    def add(self, pattern_type: str, success: int, failure: int, sign: int = 1) -> None:
+        """Bir satirin katkisini ekle (sign=-1 ile cikar)."""
+        self.by_type[pattern_type] = self.by_type.get(pattern_type, 0) + sign
+        if self.by_type[pattern_type] == 0:
+            del self.by_type[pattern_type]
+        uses = success + failure
+        self.total_uses += sign * uses
+        if uses > 0:
+            self.rate_sum += sign * success / uses
+            self.used_count += sign
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_patterns": sum(self.by_type.values()),
+            "by_type": {
+                ptype.value: self.by_type[ptype.value]
+                for ptype in PatternType
+                if self.by_type.get(ptype.value)
+            },
+            "total_uses": self.total_uses,
+            "average_success_rate": (
+                self.rate_sum / self.used_count if self.used_count else 0.0
+            ),
+        }
+
+
 class PatternRepository:
     """
     Repository for pattern persistence operations.
@@ -38,16 +73,27 @@ class PatternRepository:
 
         # Get all patterns
         patterns = repo.get_all()
+
+        # Stats snapshot: ilk get_stats sorgular, sonraki save'ler gunceller
+        repo = PatternRepository(Session, cache_stats=True)
     """
 
-    def __init__(self, session_factory: Callable[[], Session]):
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        cache_stats: bool = False,
+    ):
         """
         Initialize pattern repository.
 
         Args:
             session_factory: Callable that returns SQLAlchemy Session
+            cache_stats: get_stats sonucunu onbellekte tut ve save/update
+                ile artimli guncelle (tek yazici varsayar)
         """
         self.session_factory = session_factory
+        self.cache_stats = cache_stats
+        self._stats_snapshot: Optional[_PatternStatsSnapshot] = None
 
     def save(self, pattern: Pattern) -> str:
         """
@@ -68,6 +114,8 @@ class PatternRepository:
                 PatternModel.id == pattern.id
             ).first()
 
+            previous = self._stats_key(existing)
+
             if existing:
                 # Update existing
                 existing.pattern_type = model.pattern_type
@@ -83,6 +131,7 @@ class PatternRepository:
                 session.add(model)
 
             session.commit()
+            self._update_snapshot(previous, pattern)
             logger.debug(f"Pattern saved: {pattern.id}")
             return pattern.id
         except Exception as e:
@@ -147,6 +196,7 @@ class PatternRepository:
             if not existing:
                 return False
 
+            previous = self._stats_key(existing)
             existing.pattern_type = pattern.pattern_type.value
             existing.content = pattern.content
             existing.embedding = pattern.embedding
@@ -157,6 +207,7 @@ class PatternRepository:
             existing.extra_data = pattern.extra_data
 
             session.commit()
+            self._update_snapshot(previous, pattern)
             logger.debug(f"Pattern updated: {pattern.id}")
             return True
         except Exception as e:
@@ -185,6 +236,7 @@ class PatternRepository:
             session.commit()
 
             if result > 0:
+                self._stats_snapshot = None
                 logger.debug(f"Pattern deleted: {pattern_id}")
                 return True
             return False
@@ -263,58 +315,69 @@ class PatternRepository:
         """
         Get pattern statistics.
 
+        pattern_type bazinda tek bir GROUP BY sorgusu ile hesaplanir.
+        cache_stats aktifse sonuc snapshot olarak tutulur.
+
         Returns:
             Statistics dict
         """
+        if self._stats_snapshot is not None:
+            return self._stats_snapshot.to_dict()
+
+        uses = PatternModel.success_count + PatternModel.failure_count
+        rate = cast(PatternModel.success_count, Float) / cast(func.nullif(uses, 0), Float)
+
         session = self.session_factory()
         try:
-            total = session.query(PatternModel).count()
-
-            if total == 0:
-                return {
-                    "total_patterns": 0,
-                    "by_type": {},
-                    "total_uses": 0,
-                    "average_success_rate": 0.0
-                }
-
-            # Count by type
-            by_type = {}
-            for ptype in PatternType:
-                count = session.query(PatternModel).filter(
-                    PatternModel.pattern_type == ptype.value
-                ).count()
-                if count > 0:
-                    by_type[ptype.value] = count
-
-            # Total uses
-            total_uses = session.query(
-                func.sum(PatternModel.success_count + PatternModel.failure_count)
-            ).scalar() or 0
-
-            # Average success rate (for patterns with uses)
-            used_patterns = session.query(PatternModel).filter(
-                (PatternModel.success_count + PatternModel.failure_count) > 0
-            ).all()
-
-            if used_patterns:
-                rates = []
-                for p in used_patterns:
-                    total_p = p.success_count + p.failure_count
-                    rates.append(p.success_count / total_p if total_p > 0 else 0)
-                avg_success = sum(rates) / len(rates)
-            else:
-                avg_success = 0.0
-
-            return {
-                "total_patterns": total,
-                "by_type": by_type,
-                "total_uses": total_uses,
-                "average_success_rate": avg_success
-            }
+            rows = session.query(
+                PatternModel.pattern_type,
+                func.count(PatternModel.id),
+                func.coalesce(func.sum(uses), 0),
+                func.coalesce(func.sum(rate).filter(uses > 0), 0.0),
+                func.count(PatternModel.id).filter(uses > 0),
+            ).group_by(PatternModel.pattern_type).all()
         finally:
             session.close()
 
+        snapshot = _PatternStatsSnapshot()
+        for pattern_type, count, type_uses, rate_sum, used_count in rows:
+            snapshot.by_type[pattern_type] = count
+            snapshot.total_uses += int(type_uses or 0)
+            snapshot.rate_sum += float(rate_sum or 0.0)
+            snapshot.used_count += used_count or 0
+
+        if self.cache_stats:
+            self._stats_snapshot = snapshot
+        return snapshot.to_dict()
+
+    def invalidate_stats(self) -> None:
+        """Drop cached stats snapshot (next get_stats re-queries)."""
+        self._stats_snapshot = None
+
+    @staticmethod
+    def _stats_key(model: Optional[PatternModel]) -> Optional[Tuple[str, int, int]]:
+        """(pattern_type, success, failure) of a stored row before update."""
+        if model is None:
+            return None
+        return (model.pattern_type, model.success_count or 0, model.failure_count or 0)
+
+    def _update_snapshot(
+        self,
+        previous: Optional[Tuple[str, int, int]],
+        pattern: Pattern,
+    ) -> None:
+        """Apply a committed save/update to the stats snapshot."""
+        snapshot = self._stats_snapshot
+        if snapshot is None:
+            return
+        if previous is not None:
+            snapshot.add(*previous, sign=-1)
+        snapshot.add(
+            pattern.pattern_type.value,
+            pattern.success_count,
+            pattern.failure_count,
+        )
+
     def clear(self) -> int:
         """
         Delete all patterns.
@@ -326,6 +389,8 @@ class PatternRepository:
         try:
             count = session.query(PatternModel).delete()
             session.commit()
+            if self.cache_stats:
+                self._stats_snapshot = _PatternStatsSnapshot()
             logger.info(f"Cleared {count} patterns")
             return count
         except Exception as e:
@@ -100,6 +100,7 @@ from .conversation import (
     create_conversation_memory,
     reset_conversation_memory,
 )
+from .conversation_store import FileConversationStore
 
 # Embeddings
 from .embeddings import (
@@ -164,6 +165,7 @@ __all__ = [
     "get_conversation_memory",
     "create_conversation_memory",
     "reset_conversation_memory",
+    "FileConversationStore",
 
     # Consolidation
     "ConsolidationTask",
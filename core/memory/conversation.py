@@ -9,13 +9,17 @@ Ozellikler:
 - Diyalog turleri (user/agent)
 - Context window yonetimi
 - Duygusal akis takibi
-- Keyword-based arama
+- Keyword-based arama (inverted index + BM25)
+- Bellek siniri: LRU oturum tahliyesi ve diske spill (erisimde geri yukleme)
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
+import heapq
 import logging
+import math
 import re
 
 from .types import (
@@ -25,9 +29,15 @@ from .types import (
     EpisodeType,
     MemoryType,
 )
+from .conversation_store import FileConversationStore, SpilledSession
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\b\w+\b')
+_INDEX_WORD_RE = re.compile(r'\b\w{3,}\b')    # Kisa (< 3) kelimeler indexlenmez
+
+_TIMEOUT_SUMMARY = "Session timed out"
+
 
 @dataclass
 class ConversationConfig:
@@ -44,7 +54,17 @@ class ConversationConfig:
 
     # Arama
     default_search_limit: int = 20
-    min_search_relevance: float = 0.1
+    min_search_relevance: float = 0.1     # Eslesen sorgu kelimesi orani (0-1)
+    bm25_k1: float = 1.2                  # BM25 terim frekansi doygunlugu
+    bm25_b: float = 0.75                  # BM25 uzunluk normalizasyonu
+
+    # Bellek siniri (0 = sinirsiz); asilinca en az kullanilan oturum
+    # diske yazilir (depo yoksa sadece kapanmis oturumlar birakilir)
+    max_sessions_in_memory: int = 0
+    max_turns_in_memory: int = 0
+    idle_spill_minutes: float = 0.0       # Bu sure erisilmeyen oturum spill edilir (0 = kapali)
+    spill_path: str = ""                  # FileConversationStore dizini (bos = depo yok)
+    spill_retention_minutes: float = 1440.0  # Kapanmis oturumun diskte kalma suresi (0 = sinirsiz)
 
     # Duygusal analiz
     track_emotional_arc: bool = True
@@ -71,15 +91,38 @@ class ConversationMemory:
         conv_memory.end_conversation(session_id)
     """
 
-    def __init__(self, config: Optional[ConversationConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ConversationConfig] = None,
+        store: Optional[Any] = None,
+    ):
+        """
+        Args:
+            config: Yapilandirma
+            store: Spill deposu (save/load/delete/scan); None ise
+                   config.spill_path doluysa FileConversationStore kullanilir.
+                   Depodaki oturumlar acilista spill indexine alinir.
+        """
         self.config = config or ConversationConfig()
 
-        # In-memory stores
-        self._conversations: Dict[str, Conversation] = {}  # session_id -> Conversation
-        self._active_sessions: Dict[str, str] = {}         # user_id -> active session_id
+        if store is None and self.config.spill_path:
+            store = FileConversationStore(self.config.spill_path)
+        self._store = store
 
-        # Arama indexi (basit keyword index)
-        self._keyword_index: Dict[str, List[str]] = {}     # keyword -> [turn_id, ...]
+        # In-memory stores (LRU sirasi: en eski erisim basta)
+        self._conversations: "OrderedDict[str, Conversation]" = OrderedDict()
+        self._active_sessions: Dict[str, str] = {}         # user_id -> active session_id
+        self._spilled: Dict[str, SpilledSession] = {}      # session_id -> diskteki oturum ozeti
+        self._turns_in_memory = 0
+
+        # Arama indexi: postings oturuma gore gruplu, boylece session/user
+        # filtresi posting taramasina girmeden uygulanir
+        self._postings: Dict[str, Dict[str, Dict[str, int]]] = {}  # keyword -> session_id -> {turn_id: tf}
+        self._session_terms: Dict[str, Set[str]] = {}      # session_id -> keywords
+        self._user_sessions: Dict[str, Set[str]] = {}      # user_id -> session_ids
+        self._turns: Dict[str, DialogueTurn] = {}          # turn_id -> DialogueTurn
+        self._turn_lengths: Dict[str, int] = {}            # turn_id -> indexlenen kelime sayisi
+        self._total_length = 0
         self._turn_to_conversation: Dict[str, str] = {}    # turn_id -> session_id
 
         # Stats
@@ -88,8 +131,16 @@ class ConversationMemory:
             "total_turns": 0,
             "active_sessions": 0,
             "searches": 0,
+            "sessions_spilled": 0,
+            "sessions_loaded": 0,
+            "sessions_dropped": 0,
+            "sessions_purged": 0,
+            "spill_errors": 0,
         }
 
+        if self._store is not None:
+            self._restore_spill_index()
+
         logger.info("ConversationMemory initialized")
 
     # ===================================================================
@@ -132,9 +183,11 @@ class ConversationMemory:
 
         if user_id:
             self._active_sessions[user_id] = conversation.session_id
+            self._user_sessions.setdefault(user_id, set()).add(conversation.session_id)
 
         self._stats["total_conversations"] += 1
         self._stats["active_sessions"] = len(self._active_sessions)
+        self._enforce_limits(keep=conversation.session_id)
 
         logger.debug(f"Conversation started: {conversation.session_id}")
         return conversation.session_id
@@ -154,7 +207,7 @@ class ConversationMemory:
         Returns:
             Kapatilan Conversation veya None
         """
-        conversation = self._conversations.get(session_id)
+        conversation = self._get(session_id)
         if not conversation:
             logger.warning(f"Conversation not found: {session_id}")
             return None
@@ -181,7 +234,7 @@ class ConversationMemory:
 
     def get_conversation(self, session_id: str) -> Optional[Conversation]:
         """Conversation getir."""
-        return self._conversations.get(session_id)
+        return self._get(session_id)
 
     # ===================================================================
     # TURN MANAGEMENT
@@ -216,7 +269,7 @@ class ConversationMemory:
         Returns:
             Eklenen DialogueTurn veya None
         """
-        conversation = self._conversations.get(session_id)
+        conversation = self._get(session_id)
         if not conversation:
             logger.warning(f"Conversation not found: {session_id}")
             return None
@@ -250,22 +303,271 @@ class ConversationMemory:
         self._index_turn(turn)
 
         self._stats["total_turns"] += 1
+        self._turns_in_memory += 1
+        self._enforce_limits(keep=session_id)
 
         logger.debug(f"Turn added to {session_id}: {role}")
         return turn
 
     def _index_turn(self, turn: DialogueTurn) -> None:
         """Turn'u keyword index'e ekle."""
-        # Basit tokenization
-        words = re.findall(r'\b\w+\b', turn.content.lower())
+        # Basit tokenization, kisa kelimeler atlanir
+        term_freqs = Counter(_INDEX_WORD_RE.findall(turn.content.lower()))
+
+        session_id = turn.conversation_id
+        turn_id = turn.id
+        postings_index = self._postings
+        for word, tf in term_freqs.items():
+            by_session = postings_index.get(word)
+            if by_session is None:
+                by_session = postings_index[word] = {}
+            postings = by_session.get(session_id)
+            if postings is None:
+                postings = by_session[session_id] = {}
+            postings[turn_id] = tf
+
+        session_terms = self._session_terms.get(session_id)
+        if session_terms is None:
+            session_terms = self._session_terms[session_id] = set()
+        session_terms.update(term_freqs)
+
+        length = sum(term_freqs.values())
+        self._turns[turn_id] = turn
+        self._turn_lengths[turn_id] = length
+        self._total_length += length
+        self._turn_to_conversation[turn_id] = session_id
+
+    def _unindex_session(self, session_id: str) -> int:
+        """
+        Oturumun tum turlarini arama indexinden cikar.
+
+        Returns:
+            Cikarilan tur sayisi
+        """
+        for word in self._session_terms.pop(session_id, ()):
+            by_session = self._postings.get(word)
+            if not by_session:
+                continue
+            by_session.pop(session_id, None)
+            if not by_session:
+                del self._postings[word]
+
+        removed = 0
+        conversation = self._conversations.get(session_id)
+        for turn in conversation.turns if conversation else ():
+            if self._turns.pop(turn.id, None) is None:
+                continue
+            self._total_length -= self._turn_lengths.pop(turn.id, 0)
+            self._turn_to_conversation.pop(turn.id, None)
+            removed += 1
+        return removed
+
+    # ===================================================================
+    # TIERING (memory <-> spill store)
+    # ===================================================================
+
+    def _get(self, session_id: str) -> Optional[Conversation]:
+        """
+        Oturumu getir ve LRU sirasinda en sona tasi.
+
+        Spill edilmis oturum depodan yuklenir, indexlenir ve bellek
+        sinirlari yeniden uygulanir. Zaman asimiyla kapanmis oturumlar
+        indexe geri alinmaz (cleanup_inactive_sessions onlari cikarir).
+        """
+        conversation = self._conversations.get(session_id)
+        if conversation is not None:
+            self._conversations.move_to_end(session_id)
+            return conversation
+
+        if session_id not in self._spilled:
+            return None
+
+        try:
+            conversation = self._store.load(session_id)
+        except Exception as e:
+            self._stats["spill_errors"] += 1
+            logger.error(f"Failed to load spilled conversation {session_id}: {e}")
+            return None
+        if conversation is None:
+            logger.warning(f"Spilled conversation missing from store: {session_id}")
+            del self._spilled[session_id]
+            return None
+
+        del self._spilled[session_id]
+        self._store.delete(session_id)
+        self._conversations[session_id] = conversation
+        self._turns_in_memory += len(conversation.turns)
+        if conversation.is_active or conversation.summary != _TIMEOUT_SUMMARY:
+            for turn in conversation.turns:
+                self._index_turn(turn)
+
+        self._stats["sessions_loaded"] += 1
+        self._enforce_limits(keep=session_id)
+
+        logger.debug(f"Conversation loaded from spill store: {session_id}")
+        return conversation
+
+    def _over_limits(self) -> bool:
+        max_sessions = self.config.max_sessions_in_memory
+        max_turns = self.config.max_turns_in_memory
+        return (
+            (max_sessions > 0 and len(self._conversations) > max_sessions)
+            or (max_turns > 0 and self._turns_in_memory > max_turns)
+        )
+
+    def _enforce_limits(self, keep: Optional[str] = None) -> int:
+        """
+        Bellek sinirlari asildiysa en az kullanilan oturumlari tahliye et.
+
+        Args:
+            keep: Tahliye edilmeyecek oturum (o an kullanilan)
+
+        Returns:
+            Tahliye edilen oturum sayisi
+        """
+        if not self._over_limits():
+            return 0
+
+        evicted = 0
+        for session_id in list(self._conversations):
+            if session_id == keep:
+                continue
+            if self._evict(session_id):
+                evicted += 1
+                if not self._over_limits():
+                    break
+        return evicted
+
+    def _evict(self, session_id: str) -> bool:
+        """
+        Oturumu bellekten cikar: depo varsa diske yaz, yoksa sadece
+        kapanmis oturumlari birak (aktif oturum kaybedilmez).
+
+        Returns:
+            Oturum bellekten cikarildi mi
+        """
+        conversation = self._conversations[session_id]
+
+        if self._store is not None:
+            try:
+                self._store.save(conversation)
+            except Exception as e:
+                self._stats["spill_errors"] += 1
+                logger.error(f"Failed to spill conversation {session_id}: {e}")
+                return False
+            self._spilled[session_id] = SpilledSession.from_conversation(conversation)
+            self._stats["sessions_spilled"] += 1
+        elif conversation.is_active:
+            return False
+        else:
+            self._forget_user_session(conversation.user_id, session_id)
+            self._stats["sessions_dropped"] += 1
+
+        self._unindex_session(session_id)
+        del self._conversations[session_id]
+        self._turns_in_memory -= len(conversation.turns)
+
+        logger.debug(f"Conversation evicted from memory: {session_id}")
+        return True
+
+    def _forget_user_session(self, user_id: Optional[str], session_id: str) -> None:
+        if not user_id:
+            return
+        sessions = self._user_sessions.get(user_id)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self._user_sessions[user_id]
+
+    def _restore_spill_index(self) -> None:
+        """Depodaki oturumlari spill indexine al (yeniden baslatma sonrasi)."""
+        try:
+            entries = self._store.scan()
+        except Exception as e:
+            self._stats["spill_errors"] += 1
+            logger.error(f"Failed to scan conversation spill store: {e}")
+            return
+
+        for entry in entries:
+            self._spilled[entry.session_id] = entry
+            if not entry.user_id:
+                continue
+            self._user_sessions.setdefault(entry.user_id, set()).add(entry.session_id)
+            if entry.is_active:
+                # Kullanici basina tek aktif oturum: en son erisilen kazanir
+                current = self._spilled.get(self._active_sessions.get(entry.user_id, ""))
+                if current is None or current.last_accessed < entry.last_accessed:
+                    self._active_sessions[entry.user_id] = entry.session_id
+
+        self._stats["active_sessions"] = len(self._active_sessions)
+        if entries:
+            logger.info(f"Restored {len(entries)} spilled conversations from store")
+
+    def purge_spilled_sessions(self, retention_minutes: Optional[float] = None) -> int:
+        """
+        Diskteki kapanmis oturumlardan saklama suresi dolanlari sil.
+
+        Args:
+            retention_minutes: Saklama suresi (None = config.spill_retention_minutes,
+                               0 = sinirsiz)
+
+        Returns:
+            Silinen oturum sayisi
+        """
+        retention = (
+            retention_minutes if retention_minutes is not None
+            else self.config.spill_retention_minutes
+        )
+        if retention <= 0 or not self._spilled:
+            return 0
+        cutoff = datetime.now() - timedelta(minutes=retention)
+
+        expired = [
+            entry for entry in self._spilled.values()
+            if not entry.is_active and (entry.ended_at or entry.last_accessed) < cutoff
+        ]
+        purged = 0
+        for entry in expired:
+            try:
+                self._store.delete(entry.session_id)
+            except Exception as e:
+                self._stats["spill_errors"] += 1
+                logger.error(f"Failed to delete spilled conversation {entry.session_id}: {e}")
+                continue
+            del self._spilled[entry.session_id]
+            self._forget_user_session(entry.user_id, entry.session_id)
+            purged += 1
+
+        self._stats["sessions_purged"] += purged
+        if purged > 0:
+            logger.info(f"Purged {purged} expired conversations from spill store")
+        return purged
 
-        for word in words:
-            if len(word) >= 3:  # Kisa kelimeleri atla
-                if word not in self._keyword_index:
-                    self._keyword_index[word] = []
-                self._keyword_index[word].append(turn.id)
+    def spill_idle_sessions(self, idle_minutes: Optional[float] = None) -> int:
+        """
+        Belirli suredir erisilmeyen oturumlari bellekten cikar.
+
+        Args:
+            idle_minutes: Inaktivite suresi (None = config.idle_spill_minutes)
 
-        self._turn_to_conversation[turn.id] = turn.conversation_id
+        Returns:
+            Tahliye edilen oturum sayisi
+        """
+        idle = idle_minutes if idle_minutes is not None else self.config.idle_spill_minutes
+        if idle <= 0:
+            return 0
+        cutoff = datetime.now() - timedelta(minutes=idle)
+
+        idle_sessions = [
+            session_id
+            for session_id, conv in self._conversations.items()
+            if conv.last_accessed < cutoff
+        ]
+        evicted = sum(1 for session_id in idle_sessions if self._evict(session_id))
+
+        if evicted > 0:
+            logger.info(f"Evicted {evicted} idle sessions from memory")
+        return evicted
 
     # ===================================================================
     # CONTEXT RETRIEVAL
@@ -288,7 +590,7 @@ class ConversationMemory:
         Returns:
             DialogueTurn listesi (kronolojik sira)
         """
-        conversation = self._conversations.get(session_id)
+        conversation = self._get(session_id)
         if not conversation:
             return []
 
@@ -296,11 +598,11 @@ class ConversationMemory:
         max_tokens = max_tokens or self.config.max_context_tokens
 
         # Token bazli context window
-        return conversation.get_context_window(max_tokens)
+        return conversation.get_context_window(max_tokens, self.config.chars_per_token)
 
     def get_full_history(self, session_id: str) -> List[DialogueTurn]:
         """Tum sohbet gecmisini getir."""
-        conversation = self._conversations.get(session_id)
+        conversation = self._get(session_id)
         if not conversation:
             return []
         return list(conversation.turns)
@@ -311,7 +613,7 @@ class ConversationMemory:
         n: int = 5,
     ) -> List[DialogueTurn]:
         """Son n turu getir."""
-        conversation = self._conversations.get(session_id)
+        conversation = self._get(session_id)
         if not conversation:
             return []
         return conversation.get_last_n_turns(n)
@@ -357,7 +659,7 @@ class ConversationMemory:
         limit: int = 20,
     ) -> List[Tuple[DialogueTurn, float]]:
         """
-        Sohbet gecmisinde ara.
+        Sohbet gecmisinde ara (BM25 siralama).
 
         Args:
             query: Arama sorgusu
@@ -366,68 +668,78 @@ class ConversationMemory:
             limit: Maksimum sonuc
 
         Returns:
-            (DialogueTurn, relevance_score) tuples
+            (DialogueTurn, relevance_score) tuples, skora gore azalan
+
+        Not: Sadece bellekteki oturumlar aranir; diske spill edilmis
+        oturumlar yuklenene kadar sonuclarda yer almaz.
         """
         self._stats["searches"] += 1
 
-        # Query'yi tokenize et
-        query_words = set(re.findall(r'\b\w+\b', query.lower()))
+        # Query'yi tokenize et (index'te olmayan kelimeler de kapsama oranina sayilir)
+        query_words = set(_WORD_RE.findall(query.lower()))
+        if not query_words or not self._turns:
+            return []
+
+        # Filtre: taranacak oturumlar (None = tumu)
+        sessions: Optional[Set[str]] = None
+        if session_id:
+            sessions = {session_id}
+        if user_id:
+            user_sessions = self._user_sessions.get(user_id, set())
+            sessions = user_sessions if sessions is None else sessions & user_sessions
+        if sessions is not None and not sessions:
+            return []
+
+        k1 = self.config.bm25_k1
+        b = self.config.bm25_b
+        doc_count = len(self._turns)
+        avg_length = self._total_length / doc_count if doc_count else 0.0
+        lengths = self._turn_lengths
 
-        # Eslesenleri bul
         turn_scores: Dict[str, float] = {}
+        turn_matches: Dict[str, int] = {}
 
         for word in query_words:
-            if word in self._keyword_index:
-                for turn_id in self._keyword_index[word]:
-                    if turn_id not in turn_scores:
-                        turn_scores[turn_id] = 0.0
-                    turn_scores[turn_id] += 1.0
-
-        # Normalize scores
-        if query_words:
-            for turn_id in turn_scores:
-                turn_scores[turn_id] /= len(query_words)
-
-        # Filtreleme
-        results: List[Tuple[DialogueTurn, float]] = []
-
-        for turn_id, score in turn_scores.items():
-            if score < self.config.min_search_relevance:
+            by_session = self._postings.get(word)
+            if not by_session:
                 continue
 
-            conv_id = self._turn_to_conversation.get(turn_id)
-            if not conv_id:
-                continue
+            df = sum(len(postings) for postings in by_session.values())
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
 
-            # Session filtresi
-            if session_id and conv_id != session_id:
-                continue
+            if sessions is None:
+                posting_lists = by_session.values()
+            else:
+                posting_lists = [by_session[s] for s in sessions if s in by_session]
 
-            # User filtresi
-            if user_id:
-                conv = self._conversations.get(conv_id)
-                if not conv or conv.user_id != user_id:
-                    continue
+            for postings in posting_lists:
+                for turn_id, tf in postings.items():
+                    norm = 1.0 - b + b * lengths[turn_id] / avg_length if avg_length else 1.0
+                    score = idf * tf * (k1 + 1.0) / (tf + k1 * norm)
+                    turn_scores[turn_id] = turn_scores.get(turn_id, 0.0) + score
+                    turn_matches[turn_id] = turn_matches.get(turn_id, 0) + 1
 
-            # Turn'u bul
-            conv = self._conversations.get(conv_id)
-            if conv:
-                for turn in conv.turns:
-                    if turn.id == turn_id:
-                        results.append((turn, score))
-                        break
+        # Kapsama filtresi: eslesen sorgu kelimesi orani
+        min_matches = self.config.min_search_relevance * len(query_words)
+        candidates = [
+            (self._turns[turn_id], score)
+            for turn_id, score in turn_scores.items()
+            if turn_matches[turn_id] >= min_matches
+        ]
 
-        # Skorla sirala
-        results.sort(key=lambda x: x[1], reverse=True)
-
-        return results[:limit]
+        return heapq.nlargest(limit, candidates, key=lambda x: x[1])
 
     def search_by_topic(
         self,
         topic: str,
         limit: int = 20,
     ) -> List[Conversation]:
-        """Konuya gore sohbet ara."""
+        """
+        Konuya gore sohbet ara.
+
+        Not: Sadece bellekteki oturumlar aranir; diske spill edilmis
+        oturumlar yuklenene kadar sonuclarda yer almaz.
+        """
         results = []
 
         for conv in self._conversations.values():
@@ -472,7 +784,7 @@ class ConversationMemory:
 
         Episodic memory ile entegrasyon icin.
         """
-        conversation = self._conversations.get(session_id)
+        conversation = self._get(session_id)
         if not conversation:
             return None
 
@@ -523,7 +835,12 @@ class ConversationMemory:
         timeout_minutes: Optional[float] = None,
     ) -> int:
         """
-        Inaktif oturumlari kapat.
+        Inaktif oturumlari kapat ve arama indexinden cikar.
+
+        Diskteki aktif oturumlar yuklenmeden, sadece depo basligi
+        guncellenerek kapatilir; idle_spill_minutes
+        ayarliysa idle oturumlar ardindan bellekten cikarilir ve saklama
+        suresi dolan kapanmis oturumlar diskten silinir.
 
         Returns:
             Kapatilan oturum sayisi
@@ -532,28 +849,70 @@ class ConversationMemory:
         cutoff = datetime.now() - timedelta(minutes=timeout)
 
         closed = 0
-        sessions_to_close = []
-
-        for session_id, conv in self._conversations.items():
-            if conv.is_active and conv.last_accessed < cutoff:
-                sessions_to_close.append(session_id)
+        sessions_to_close = [
+            session_id
+            for session_id, conv in self._conversations.items()
+            if conv.is_active and conv.last_accessed < cutoff
+        ]
+        spilled_to_close = [
+            entry
+            for entry in self._spilled.values()
+            if entry.is_active and entry.last_accessed < cutoff
+        ]
 
         for session_id in sessions_to_close:
-            self.end_conversation(session_id, summary="Session timed out")
+            if self.end_conversation(session_id, summary=_TIMEOUT_SUMMARY) is None:
+                continue
+            self._unindex_session(session_id)
             closed += 1
 
+        for entry in spilled_to_close:
+            if self._close_spilled(entry, summary=_TIMEOUT_SUMMARY):
+                closed += 1
+
         if closed > 0:
             logger.info(f"Closed {closed} inactive sessions")
 
+        self.spill_idle_sessions()
+        self.purge_spilled_sessions()
         return closed
 
+    def _close_spilled(self, entry: SpilledSession, summary: Optional[str] = None) -> bool:
+        """
+        Diskteki oturumu yuklemeden kapat (sadece depo basligi guncellenir).
+
+        Returns:
+            Oturum kapatildi mi
+        """
+        session_id = entry.session_id
+        ended_at = datetime.now()
+        try:
+            found = self._store.mark_ended(session_id, ended_at, summary=summary)
+        except Exception as e:
+            self._stats["spill_errors"] += 1
+            logger.error(f"Failed to close spilled conversation {session_id}: {e}")
+            return False
+        if not found:
+            logger.warning(f"Spilled conversation missing from store: {session_id}")
+            del self._spilled[session_id]
+            self._forget_user_session(entry.user_id, session_id)
+            return False
+
+        self._spilled[session_id] = replace(entry, is_active=False, ended_at=ended_at)
+        if entry.user_id and self._active_sessions.get(entry.user_id) == session_id:
+            del self._active_sessions[entry.user_id]
+        self._stats["active_sessions"] = len(self._active_sessions)
+
+        logger.debug(f"Spilled conversation ended: {session_id}")
+        return True
+
     def get_user_conversations(
         self,
         user_id: str,
         include_inactive: bool = False,
         limit: int = 50,
     ) -> List[Conversation]:
-        """Kullanicinin sohbetlerini getir."""
+        """Kullanicinin sohbetlerini getir (diskteki oturumlar yuklenir)."""
         results = []
 
         for conv in self._conversations.values():
@@ -561,6 +920,15 @@ class ConversationMemory:
                 if include_inactive or conv.is_active:
                     results.append(conv)
 
+        spilled = [s for s in self._user_sessions.get(user_id, ()) if s in self._spilled]
+        if not include_inactive:
+            active_session = self._active_sessions.get(user_id)
+            spilled = [s for s in spilled if s == active_session]
+        for session_id in spilled:
+            conv = self._get(session_id)
+            if conv is not None:
+                results.append(conv)
+
         # Son erisime gore sirala
         results.sort(key=lambda c: c.last_accessed, reverse=True)
         return results[:limit]
@@ -575,7 +943,9 @@ class ConversationMemory:
         return {
             **self._stats,
             "conversations_in_memory": len(self._conversations),
-            "keywords_indexed": len(self._keyword_index),
+            "turns_in_memory": self._turns_in_memory,
+            "sessions_on_disk": len(self._spilled),
+            "keywords_indexed": len(self._postings),
             "turns_indexed": len(self._turn_to_conversation),
         }
 
@@ -625,6 +995,7 @@ def reset_conversation_memory() -> None:
 
 def create_conversation_memory(
     config: Optional[ConversationConfig] = None,
+    store: Optional[Any] = None,
 ) -> ConversationMemory:
     """Yeni conversation memory olustur (test icin)."""
-    return ConversationMemory(config)
+    return ConversationMemory(config, store)
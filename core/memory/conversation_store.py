@@ -0,0 +1,314 @@
+"""
+core/memory/conversation_store.py
+
+Conversation spill store - bellekten cikarilan oturumlarin disk katmani.
+UEM v2 - ConversationMemory'nin soguk katmani.
+
+Her oturum tek bir gzip'li dosyaya yazilir (<session_id>.json.gz).
+Dosyanin ilk satiri kucuk bir JSON baslik (SpilledSession alanlari),
+ikinci satiri oturumun tamamidir; scan() sadece basliklari okuyarak
+yeniden baslatmadan sonra spill indexini kurar. mark_ended() oturumu
+yuklemeden sadece basligi gunceller; load() baslikteki kapanis
+alanlarini govdenin ustune uygular. Yazim once gecici
+dosyaya yapilir ve os.replace ile atomik olarak yerine konur; yarida
+kalan yazim onceki kopyayi bozmaz.
+
+Kullanim:
+    store = FileConversationStore("data/conversations")
+    store.save(conversation)
+    conversation = store.load(session_id)
+    entries = store.scan()
+    store.mark_ended(session_id, datetime.now(), summary="Session timed out")
+"""
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+
+from .types import Conversation, DialogueTurn, MemoryType
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT_VERSION = 2
+STORE_FILE_SUFFIX = ".json.gz"
+
+_SAFE_NAME_RE = re.compile(r"[A-Za-z0-9_\-]+")
+
+_CONVERSATION_DATETIME_FIELDS = frozenset({
+    "created_at", "last_accessed", "started_at", "ended_at",
+})
+_TURN_DATETIME_FIELDS = frozenset({"timestamp"})
+
+
+@dataclass(frozen=True)
+class SpilledSession:
+    """Diskteki oturumun ozet bilgisi (spill indexi kaydi)."""
+    session_id: str
+    user_id: Optional[str]
+    is_active: bool
+    last_accessed: datetime
+    ended_at: Optional[datetime] = None
+
+    @classmethod
+    def from_conversation(cls, conversation: Conversation) -> "SpilledSession":
+        return cls(
+            session_id=conversation.session_id,
+            user_id=conversation.user_id,
+            is_active=conversation.is_active,
+            last_accessed=conversation.last_accessed,
+            ended_at=conversation.ended_at,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "is_active": self.is_active,
+            "last_accessed": self.last_accessed.isoformat(),
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpilledSession":
+        ended_at = data.get("ended_at")
+        return cls(
+            session_id=data["session_id"],
+            user_id=data.get("user_id"),
+            is_active=data["is_active"],
+            last_accessed=datetime.fromisoformat(data["last_accessed"]),
+            ended_at=datetime.fromisoformat(ended_at) if ended_at else None,
+        )
+
+
+# ========================================================================
+# SERIALIZATION
+# ========================================================================
+
+def _json_default(value: Any) -> Any:
+    """JSON'a dogrudan yazilamayan degerler (extra_data/context icinde)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def _turn_to_dict(turn: DialogueTurn) -> Dict[str, Any]:
+    data = {f.name: getattr(turn, f.name) for f in fields(turn)}
+    data["timestamp"] = turn.timestamp.isoformat()
+    return data
+
+
+def _turn_from_dict(data: Dict[str, Any]) -> DialogueTurn:
+    known = {f.name for f in fields(DialogueTurn)}
+    kwargs = {k: v for k, v in data.items() if k in known}
+    for name in _TURN_DATETIME_FIELDS & kwargs.keys():
+        kwargs[name] = datetime.fromisoformat(kwargs[name])
+    return DialogueTurn(**kwargs)
+
+
+def conversation_to_dict(conversation: Conversation) -> Dict[str, Any]:
+    """Conversation'i JSON uyumlu dict'e cevir."""
+    data: Dict[str, Any] = {}
+    for f in fields(conversation):
+        if not f.init:
+            continue
+        value = getattr(conversation, f.name)
+        if f.name == "turns":
+            value = [_turn_to_dict(turn) for turn in value]
+        elif f.name in _CONVERSATION_DATETIME_FIELDS:
+            value = value.isoformat() if value is not None else None
+        elif f.name == "memory_type":
+            value = value.value
+        data[f.name] = value
+    return data
+
+
+def conversation_from_dict(data: Dict[str, Any]) -> Conversation:
+    """conversation_to_dict ciktisindan Conversation olustur."""
+    init_fields = {f.name for f in fields(Conversation) if f.init}
+    kwargs = {k: v for k, v in data.items() if k in init_fields}
+    for name in _CONVERSATION_DATETIME_FIELDS & kwargs.keys():
+        if kwargs[name] is not None:
+            kwargs[name] = datetime.fromisoformat(kwargs[name])
+    if "memory_type" in kwargs:
+        kwargs["memory_type"] = MemoryType(kwargs["memory_type"])
+    kwargs["turns"] = [_turn_from_dict(turn) for turn in kwargs.get("turns", [])]
+    return Conversation(**kwargs)
+
+
+# ========================================================================
+# FILE STORE
+# ========================================================================
+
+class FileConversationStore:
+    """
+    Dizin tabanli oturum deposu.
+
+    ConversationMemory ile kullanilan arayuz: save, load, delete, scan,
+    mark_ended.
+    Ayni arayuzu saglayan baska bir depo (or. conversations/dialogue_turns
+    tablolari) yerine verilebilir.
+    """
+
+    def __init__(self, path: str, compress_level: int = 6):
+        """
+        Args:
+            path: Oturum dosyalarinin dizini (yoksa olusturulur)
+            compress_level: gzip seviyesi (1-9)
+        """
+        self.path = path
+        self.compress_level = compress_level
+        os.makedirs(path, exist_ok=True)
+
+    def _file_for(self, session_id: str) -> str:
+        if _SAFE_NAME_RE.fullmatch(session_id):
+            name = session_id
+        else:
+            name = hashlib.sha1(session_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, name + STORE_FILE_SUFFIX)
+
+    def save(self, conversation: Conversation) -> int:
+        """
+        Oturumu diske yaz (varsa ustune).
+
+        Returns:
+            Yazilan byte sayisi
+        """
+        header = SpilledSession.from_conversation(conversation).to_dict()
+        header["version"] = STORE_FORMAT_VERSION
+        body = conversation_to_dict(conversation)
+        raw = "\n".join(
+            json.dumps(part, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+            for part in (header, body)
+        ).encode("utf-8")
+        return self._write(self._file_for(conversation.session_id), raw)
+
+    def _write(self, target: str, raw: bytes) -> int:
+        data = gzip.compress(raw, compresslevel=self.compress_level)
+        tmp = target + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+        return len(data)
+
+    def load(self, session_id: str) -> Optional[Conversation]:
+        """Oturumu diskten oku (yoksa None)."""
+        target = self._file_for(session_id)
+        try:
+            with open(target, "rb") as f:
+                raw = gzip.decompress(f.read())
+        except FileNotFoundError:
+            return None
+
+        header_line, _, body = raw.partition(b"\n")
+        header = json.loads(header_line)
+        self._check_header(header, target)
+        conversation = conversation_from_dict(json.loads(body))
+
+        # mark_ended() sadece basligi gunceller; kapanis bilgisi basliktan gelir
+        conversation.is_active = header["is_active"]
+        if header.get("ended_at"):
+            conversation.ended_at = datetime.fromisoformat(header["ended_at"])
+        if "summary" in header:
+            conversation.summary = header["summary"]
+        return conversation
+
+    def mark_ended(
+        self,
+        session_id: str,
+        ended_at: datetime,
+        summary: Optional[str] = None,
+    ) -> bool:
+        """
+        Diskteki oturumu yuklemeden kapat (sadece baslik yeniden yazilir).
+
+        Args:
+            session_id: Oturum ID
+            ended_at: Kapanis zamani
+            summary: Opsiyonel ozet (load() sirasinda oturuma uygulanir)
+
+        Returns:
+            Oturum depoda bulundu mu
+        """
+        target = self._file_for(session_id)
+        try:
+            with open(target, "rb") as f:
+                raw = gzip.decompress(f.read())
+        except FileNotFoundError:
+            return False
+
+        header_line, _, body = raw.partition(b"\n")
+        header = json.loads(header_line)
+        self._check_header(header, target)
+        header["is_active"] = False
+        header["ended_at"] = ended_at.isoformat()
+        if summary is not None:
+            header["summary"] = summary
+        header_line = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._write(target, header_line + b"\n" + body)
+        return True
+
+    def scan(self) -> List[SpilledSession]:
+        """
+        Diskteki tum oturumlarin ozetleri (sadece baslik satirlari okunur).
+
+        Okunamayan dosyalar loglanir ve atlanir.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(STORE_FILE_SUFFIX):
+                continue
+            target = os.path.join(self.path, name)
+            try:
+                with gzip.open(target, "rb") as f:
+                    header = json.loads(f.readline())
+                self._check_header(header, target)
+                entries.append(SpilledSession.from_dict(header))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping unreadable conversation file {target}: {e}")
+        return entries
+
+    @staticmethod
+    def _check_header(header: Dict[str, Any], target: str) -> None:
+        if header.get("version") != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported conversation store version in {target}")
+
+    def delete(self, session_id: str) -> bool:
+        """Oturum dosyasini sil."""
+        try:
+            os.remove(self._file_for(session_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def __contains__(self, session_id: str) -> bool:
+        return os.path.exists(self._file_for(session_id))
+
+    def session_ids(self) -> List[str]:
+        """Diskteki oturum ID'leri."""
+        return [entry.session_id for entry in self.scan()]
+
+    def stats(self) -> Dict[str, Any]:
+        """Depo istatistikleri."""
+        count = 0
+        total_bytes = 0
+        for name in os.listdir(self.path):
+            if name.endswith(STORE_FILE_SUFFIX):
+                count += 1
+                total_bytes += os.path.getsize(os.path.join(self.path, name))
+        return {"path": self.path, "sessions": count, "bytes": total_bytes}
+
+
+__all__ = [
+    "FileConversationStore",
+    "SpilledSession",
+    "conversation_to_dict",
+    "conversation_from_dict",
+]
@@ -361,30 +361,27 @@ def top_k_indices(
     Returns:
         List of (index, score) tuples, sorted by score descending
     """
-    if similarities.size == 0:
+    if similarities.size == 0 or k <= 0:
         return []
 
     # Apply threshold
-    valid_mask = similarities >= min_threshold
-    valid_indices = np.where(valid_mask)[0]
-    valid_scores = similarities[valid_mask]
+    valid_indices = np.flatnonzero(similarities >= min_threshold)
+    valid_scores = similarities[valid_indices]
 
     if len(valid_indices) == 0:
         return []
 
-    # Sort by score descending
-    sorted_order = np.argsort(valid_scores)[::-1]
-
-    # Take top k
-    top_k = min(k, len(sorted_order))
-
-    results = []
-    for i in range(top_k):
-        idx = valid_indices[sorted_order[i]]
-        score = float(valid_scores[sorted_order[i]])
-        results.append((int(idx), score))
-
-    return results
+    # Partial selection (O(n)) then sort only the top k
+    if k < len(valid_scores):
+        candidates = np.argpartition(-valid_scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(valid_scores))
+    sorted_order = candidates[np.argsort(-valid_scores[candidates], kind="stable")]
+
+    return [
+        (int(valid_indices[i]), float(valid_scores[i]))
+        for i in sorted_order
+    ]
 
 
 def euclidean_distance(a: np.ndarray, b: np.ndarray) -> float:
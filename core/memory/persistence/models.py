@@ -515,6 +515,64 @@ class CycleMetricModel(Base):
         }
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# CYCLE METRIC ROLLUPS
+# ═══════════════════════════════════════════════════════════════════════════
+
+class CycleMetricRollupModel(Base):
+    """
+    Cycle metrics rollup - dakika/saat bazında önceden toplanmış değerler.
+
+    MonitoringPersistence tarafından her yazımda artımlı güncellenir.
+    """
+    __tablename__ = "cycle_metric_rollups"
+
+    bucket_size = Column(Text, primary_key=True)       # "minute" | "hour"
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+
+    cycle_count = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    duration_sum_ms = Column(Float, nullable=False, default=0.0)
+    duration_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "bucket_size": self.bucket_size,
+            "bucket_start": self.bucket_start.isoformat() if self.bucket_start else None,
+            "cycle_count": self.cycle_count,
+            "success_count": self.success_count,
+            "duration_sum_ms": self.duration_sum_ms,
+            "duration_count": self.duration_count,
+        }
+
+
+class PhaseDurationRollupModel(Base):
+    """
+    Phase duration rollup - bucket ve phase başına süre toplamı.
+    """
+    __tablename__ = "phase_duration_rollups"
+
+    bucket_size = Column(Text, primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    phase = Column(Text, primary_key=True)
+
+    duration_sum_ms = Column(Float, nullable=False, default=0.0)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "bucket_size": self.bucket_size,
+            "bucket_start": self.bucket_start.isoformat() if self.bucket_start else None,
+            "phase": self.phase,
+            "duration_sum_ms": self.duration_sum_ms,
+            "sample_count": self.sample_count,
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # ACTIVITY LOG
 # ═══════════════════════════════════════════════════════════════════════════
@@ -687,6 +745,12 @@ class PatternModel(Base):
         Index("idx_patterns_type", pattern_type),
         Index("idx_patterns_created_at", created_at.desc()),
         Index("idx_patterns_success_count", success_count.desc()),
+        # get_stats GROUP BY icin index-only scan
+        Index(
+            "idx_patterns_type_counts",
+            pattern_type,
+            postgresql_include=["success_count", "failure_count"],
+        ),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -742,6 +806,13 @@ class FeedbackModel(Base):
         Index("idx_feedbacks_user", user_id),
         Index("idx_feedbacks_timestamp", timestamp.desc()),
         Index("idx_feedbacks_type", feedback_type),
+        # get_stats aggregate icin index-only scan
+        Index(
+            "idx_feedbacks_stats",
+            feedback_type,
+            value,
+            postgresql_include=["user_id", "interaction_id"],
+        ),
     )
 
     def to_dict(self) -> Dict[str, Any]:
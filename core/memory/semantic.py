@@ -5,18 +5,20 @@ Semantic Memory - Embedding bazli semantik arama.
 UEM v2 - Vector store ile benzerlik araması.
 
 Ozellikler:
-- In-memory vector index
+- In-memory vector index (EmbeddingMatrix - tek matris-vektor carpimi)
 - Embedding encoder entegrasyonu
 - Episode, DialogueTurn, Conversation indexleme
-- Persistence (save/load)
-- Source type filtreleme
+- Persistence (JSON save/load + memmap'li binary format, append-only)
+- Source type + zaman penceresi filtreleme (PartitionIndex, bolum bazli top-k)
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Any, TYPE_CHECKING
 from datetime import datetime
+import heapq
 import json
 import logging
+import os
 
 import numpy as np
 
@@ -30,23 +32,47 @@ from .types import (
 from .embeddings import (
     EmbeddingEncoder,
     get_embedding_encoder,
-    batch_cosine_similarity,
     top_k_indices,
 )
+from .vector_store import EmbeddingMatrix, PartitionIndex
 
 logger = logging.getLogger(__name__)
 
 
+# SourceType -> EmbeddingMatrix etiketi
+_SOURCE_LABELS: Dict[SourceType, int] = {st: i for i, st in enumerate(SourceType)}
+
+# Binary format dosyalari (dizin icinde)
+BINARY_FORMAT = "uem-semantic-binary"
+BINARY_VERSION = "2.0"
+BINARY_MANIFEST_FILE = "manifest.json"
+BINARY_VECTORS_FILE = "vectors.f32"
+BINARY_ENTRIES_FILE = "entries.jsonl"
+
+
 @dataclass
 class IndexEntry:
-    """Internal index entry."""
+    """
+    Internal index entry (metadata).
+
+    Embedding'ler EmbeddingMatrix'te normalize edilmis satirlar olarak tutulur.
+    """
     id: str
     content: str
     source_type: SourceType
     source_id: Optional[str]
     timestamp: Optional[datetime]
     extra_data: Dict[str, Any]
-    embedding: np.ndarray
+
+
+@dataclass
+class _BinarySyncState:
+    """Son binary kayittan bu yana bellekteki degisiklikler."""
+    path: str
+    layout_version: int
+    rows: int                                   # Diskteki satir sayisi
+    dirty_rows: set = field(default_factory=set)  # Diskte olup guncellenen
+    removed: List[str] = field(default_factory=list)
 
 
 class SemanticMemory:
@@ -65,23 +91,40 @@ class SemanticMemory:
         # Arama
         results = semantic.search("selam", k=5)
 
+        # Filtreli arama (sadece eslesen bolumler skorlanir)
+        results = semantic.search_filtered(
+            "selam", source_types=[SourceType.DIALOGUE], since=week_start
+        )
+
         # Episode indexleme
         semantic.index_episode(episode)
 
         # Kaydet/Yukle
         semantic.save("semantic_index.json")
         semantic.load("semantic_index.json")
+
+        # Binary (memmap) format - tekrar kayitlarda sadece degisenler yazilir
+        semantic.save_binary("semantic_index/")
+        semantic.load_binary("semantic_index/")
     """
 
-    def __init__(self, encoder: Optional[EmbeddingEncoder] = None):
+    def __init__(
+        self,
+        encoder: Optional[EmbeddingEncoder] = None,
+        partition_seconds: float = 86400.0,
+    ):
         """
         Initialize SemanticMemory.
 
         Args:
             encoder: EmbeddingEncoder instance (uses singleton if not provided)
+            partition_seconds: Zaman bolumu genisligi (filtreli arama icin)
         """
         self._encoder = encoder
         self._index: Dict[str, IndexEntry] = {}
+        self._vectors = EmbeddingMatrix()
+        self._partitions = PartitionIndex(partition_seconds)
+        self._binary_state: Optional[_BinarySyncState] = None
 
         # Stats
         self._stats = {
@@ -110,6 +153,7 @@ class SemanticMemory:
         source_type: SourceType,
         source_id: Optional[str] = None,
         extra_data: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None,
     ) -> None:
         """
         Add content to semantic index.
@@ -120,6 +164,7 @@ class SemanticMemory:
             source_type: Source type (episode, dialogue, fact, concept)
             source_id: Optional source reference ID
             extra_data: Optional metadata
+            timestamp: Source event time (default: now)
         """
         if not content or not content.strip():
             logger.warning(f"Skipping empty content for id: {id}")
@@ -132,12 +177,11 @@ class SemanticMemory:
             content=content,
             source_type=source_type,
             source_id=source_id,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             extra_data=extra_data or {},
-            embedding=embedding,
         )
 
-        self._index[id] = entry
+        self._store(entry, embedding)
         self._stats["total_adds"] += 1
 
         logger.debug(f"Added to index: {id} (source={source_type.value})")
@@ -148,7 +192,7 @@ class SemanticMemory:
 
         Args:
             items: List of dicts with keys: id, content, source_type,
-                   and optional: source_id, extra_data
+                   and optional: source_id, extra_data, timestamp
 
         Returns:
             Number of items added
@@ -183,12 +227,11 @@ class SemanticMemory:
                 content=texts[i],
                 source_type=source_type,
                 source_id=item.get("source_id"),
-                timestamp=datetime.now(),
+                timestamp=item.get("timestamp") or datetime.now(),
                 extra_data=item.get("extra_data", {}),
-                embedding=embeddings[i],
             )
 
-            self._index[entry.id] = entry
+            self._store(entry, embeddings[i])
 
         self._stats["total_adds"] += len(valid_items)
         logger.debug(f"Batch added {len(valid_items)} items to index")
@@ -206,7 +249,13 @@ class SemanticMemory:
             True if removed, False if not found
         """
         if id in self._index:
+            self._track_binary_remove(id)
             del self._index[id]
+            layout_version = self._vectors.layout_version
+            self._partitions.remove(self._vectors.row_of(id))
+            self._vectors.remove(id)
+            if self._vectors.layout_version != layout_version:
+                self._rebuild_partitions()
             self._stats["total_removes"] += 1
             logger.debug(f"Removed from index: {id}")
             return True
@@ -216,6 +265,8 @@ class SemanticMemory:
         """Clear all items from index."""
         count = len(self._index)
         self._index.clear()
+        self._vectors.clear()
+        self._partitions.clear()
         logger.info(f"Cleared {count} items from index")
 
     def count(self) -> int:
@@ -226,6 +277,63 @@ class SemanticMemory:
         """Check if ID exists in index."""
         return id in self._index
 
+    def get_embedding(self, id: str) -> Optional[np.ndarray]:
+        """
+        Get stored (normalized) embedding for an ID.
+
+        Args:
+            id: Item ID
+
+        Returns:
+            float32 vector copy or None if not found
+        """
+        return self._vectors.get(id)
+
+    def _store(self, entry: IndexEntry, embedding: np.ndarray) -> None:
+        """Write entry metadata and its embedding row."""
+        label = _SOURCE_LABELS[entry.source_type]
+        row = self._vectors.add(entry.id, embedding, label)
+        self._index[entry.id] = entry
+        self._partitions.add(row, label, _epoch(entry.timestamp))
+
+        state = self._binary_state
+        if state is not None and row < state.rows:
+            state.dirty_rows.add(row)
+
+    def _build_results(
+        self,
+        scores: np.ndarray,
+        k: int,
+        min_similarity: float,
+    ) -> List[EmbeddingResult]:
+        """Top-k rows of a score vector as EmbeddingResults."""
+        return [
+            self._to_result(row, score)
+            for row, score in top_k_indices(scores, k, min_similarity)
+        ]
+
+    def _to_result(self, row: int, score: float) -> EmbeddingResult:
+        entry = self._index[self._vectors.id_of(row)]
+        return EmbeddingResult(
+            id=entry.id,
+            content=entry.content,
+            similarity=score,
+            source_type=entry.source_type,
+            source_id=entry.source_id,
+            timestamp=entry.timestamp,
+            extra_data=entry.extra_data,
+        )
+
+    def _rebuild_partitions(self) -> None:
+        """Re-map partitions after the matrix row layout changed."""
+        self._partitions.clear()
+        for id, entry in self._index.items():
+            self._partitions.add(
+                self._vectors.row_of(id),
+                _SOURCE_LABELS[entry.source_type],
+                _epoch(entry.timestamp),
+            )
+
     # ===================================================================
     # SEARCH
     # ===================================================================
@@ -256,29 +364,9 @@ class SemanticMemory:
         # Encode query
         query_embedding = self.encoder.encode(query)
 
-        # Get all embeddings
-        entries = list(self._index.values())
-        embeddings = np.array([e.embedding for e in entries])
-
-        # Compute similarities
-        similarities = batch_cosine_similarity(query_embedding, embeddings)
-
-        # Get top-k
-        top_results = top_k_indices(similarities, k, min_similarity)
-
-        # Build results
-        results = []
-        for idx, score in top_results:
-            entry = entries[idx]
-            results.append(EmbeddingResult(
-                id=entry.id,
-                content=entry.content,
-                similarity=score,
-                source_type=entry.source_type,
-                source_id=entry.source_id,
-                timestamp=entry.timestamp,
-                extra_data=entry.extra_data,
-            ))
+        # Single matrix-vector product over all rows
+        scores = self._vectors.scores(query_embedding)
+        results = self._build_results(scores, k, min_similarity)
 
         self._stats["total_searches"] += 1
         return results
@@ -299,6 +387,40 @@ class SemanticMemory:
             k: Number of results to return
             min_similarity: Minimum similarity threshold
 
+        Returns:
+            List of EmbeddingResult sorted by similarity descending
+        """
+        return self.search_filtered(
+            query,
+            k=k,
+            source_types=[source_type],
+            min_similarity=min_similarity,
+        )
+
+    def search_filtered(
+        self,
+        query: str,
+        k: int = 5,
+        source_types: Optional[Iterable[SourceType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        min_similarity: float = 0.3,
+    ) -> List[EmbeddingResult]:
+        """
+        Search within source types and/or a time window.
+
+        Sadece filtreye uyan (source type, zaman dilimi) bolumleri
+        skorlanir; bolum basina top-k alinip birlestirilir. Zaman filtresi
+        verildiginde timestamp'i olmayan kayitlar dahil edilmez.
+
+        Args:
+            query: Search query text
+            k: Number of results to return
+            source_types: Source types to include (None = all)
+            since: Inclusive lower bound on entry timestamp
+            until: Inclusive upper bound on entry timestamp
+            min_similarity: Minimum similarity threshold
+
         Returns:
             List of EmbeddingResult sorted by similarity descending
         """
@@ -308,37 +430,23 @@ class SemanticMemory:
         if not query or not query.strip():
             return []
 
-        # Filter entries by source type
-        entries = [e for e in self._index.values() if e.source_type == source_type]
+        labels = None
+        if source_types is not None:
+            labels = [_SOURCE_LABELS[st] for st in source_types]
 
-        if not entries:
-            return []
+        query_vector = self._vectors.normalize(self.encoder.encode(query))
 
-        # Encode query
-        query_embedding = self.encoder.encode(query)
+        # Bolum basina top-k, sonra birlestir
+        candidates = []
+        for rows in self._partitions.select(labels, _epoch(since), _epoch(until)):
+            scores = self._vectors.scores(query_vector, normalized=True, rows=rows)
+            candidates.extend(
+                (score, int(rows[i]))
+                for i, score in top_k_indices(scores, k, min_similarity)
+            )
 
-        # Get embeddings for filtered entries
-        embeddings = np.array([e.embedding for e in entries])
-
-        # Compute similarities
-        similarities = batch_cosine_similarity(query_embedding, embeddings)
-
-        # Get top-k
-        top_results = top_k_indices(similarities, k, min_similarity)
-
-        # Build results
-        results = []
-        for idx, score in top_results:
-            entry = entries[idx]
-            results.append(EmbeddingResult(
-                id=entry.id,
-                content=entry.content,
-                similarity=score,
-                source_type=entry.source_type,
-                source_id=entry.source_id,
-                timestamp=entry.timestamp,
-                extra_data=entry.extra_data,
-            ))
+        top = heapq.nlargest(k, candidates, key=lambda c: c[0])
+        results = [self._to_result(row, score) for score, row in top]
 
         self._stats["total_searches"] += 1
         return results
@@ -363,36 +471,13 @@ class SemanticMemory:
         if id not in self._index:
             return []
 
-        reference = self._index[id]
-
-        # Get all other entries
-        entries = [e for e in self._index.values() if e.id != id]
+        row = self._vectors.row_of(id)
+        reference = self._vectors.vectors[row]
 
-        if not entries:
-            return []
-
-        # Get embeddings
-        embeddings = np.array([e.embedding for e in entries])
-
-        # Compute similarities
-        similarities = batch_cosine_similarity(reference.embedding, embeddings)
-
-        # Get top-k
-        top_results = top_k_indices(similarities, k, min_similarity)
-
-        # Build results
-        results = []
-        for idx, score in top_results:
-            entry = entries[idx]
-            results.append(EmbeddingResult(
-                id=entry.id,
-                content=entry.content,
-                similarity=score,
-                source_type=entry.source_type,
-                source_id=entry.source_id,
-                timestamp=entry.timestamp,
-                extra_data=entry.extra_data,
-            ))
+        # Reference row itself is excluded
+        scores = self._vectors.scores(reference, normalized=True)
+        scores[row] = -np.inf
+        results = self._build_results(scores, k, min_similarity)
 
         self._stats["total_searches"] += 1
         return results
@@ -439,6 +524,7 @@ class SemanticMemory:
             source_type=SourceType.EPISODE,
             source_id=episode.id,
             extra_data=extra_data,
+            timestamp=episode.when,
         )
 
     def index_dialogue_turn(
@@ -470,6 +556,7 @@ class SemanticMemory:
             source_type=SourceType.DIALOGUE,
             source_id=conversation_id,
             extra_data=extra_data,
+            timestamp=turn.timestamp,
         )
 
     def index_conversation(self, conversation: Conversation) -> int:
@@ -497,7 +584,7 @@ class SemanticMemory:
 
     def save(self, path: str) -> None:
         """
-        Save index to file.
+        Save index to file (JSON).
 
         Args:
             path: File path to save to
@@ -509,15 +596,9 @@ class SemanticMemory:
         }
 
         for entry in self._index.values():
-            data["entries"].append({
-                "id": entry.id,
-                "content": entry.content,
-                "source_type": entry.source_type.value,
-                "source_id": entry.source_id,
-                "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
-                "extra_data": entry.extra_data,
-                "embedding": entry.embedding.tolist(),
-            })
+            item = _entry_to_dict(entry)
+            item["embedding"] = self._vectors.get(entry.id).tolist()
+            data["entries"].append(item)
 
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
@@ -529,32 +610,228 @@ class SemanticMemory:
         Load index from file.
 
         Args:
-            path: File path to load from
+            path: JSON file path, or a directory written by save_binary
         """
+        if os.path.isdir(path):
+            self.load_binary(path)
+            return
+
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        self._index.clear()
+        self.clear()
 
         for item in data.get("entries", []):
-            timestamp = None
-            if item.get("timestamp"):
-                timestamp = datetime.fromisoformat(item["timestamp"])
-
-            entry = IndexEntry(
-                id=item["id"],
-                content=item["content"],
-                source_type=SourceType(item["source_type"]),
-                source_id=item.get("source_id"),
-                timestamp=timestamp,
-                extra_data=item.get("extra_data", {}),
-                embedding=np.array(item["embedding"]),
+            self._store(
+                _entry_from_dict(item),
+                np.array(item["embedding"], dtype=np.float32),
             )
 
-            self._index[entry.id] = entry
-
         logger.info(f"Loaded {len(self._index)} entries from {path}")
 
+    def save_binary(self, path: str, incremental: bool = True) -> Dict[str, Any]:
+        """
+        Save index in binary format.
+
+        Dizin yapisi:
+            manifest.json  - boyut, satir sayisi, format versiyonu
+            vectors.f32    - (rows, dimension) normalize float32 satirlar
+            entries.jsonl  - satir basina metadata; {"remove": id} kayitlari
+
+        Ayni dizine daha once kaydedilmis/yuklenmisse ve satir duzeni
+        degismediyse (compaction, clear) sadece yeni satirlar eklenir,
+        guncellenen satirlar yerinde yazilir. Aksi halde tam yazim yapilir.
+
+        Args:
+            path: Target directory
+            incremental: False ise her zaman tam yazim
+
+        Returns:
+            {"mode": "append"|"full", "appended_rows", "rewritten_rows", "removed"}
+        """
+        os.makedirs(path, exist_ok=True)
+        state = self._binary_state
+
+        can_append = (
+            incremental
+            and state is not None
+            and state.path == os.path.abspath(path)
+            and state.layout_version == self._vectors.layout_version
+            and os.path.exists(os.path.join(path, BINARY_MANIFEST_FILE))
+        )
+
+        if can_append:
+            result = self._append_binary(path, state)
+        else:
+            result = self._write_binary(path)
+
+        logger.info(
+            f"Saved binary index to {path} "
+            f"(mode={result['mode']}, appended={result['appended_rows']})"
+        )
+        return result
+
+    def load_binary(self, path: str, mmap: bool = True) -> None:
+        """
+        Load index saved by save_binary.
+
+        Args:
+            path: Directory written by save_binary
+            mmap: True ise vektorler np.memmap (copy-on-write) ile
+                  kopyalanmadan eslenir; False ise belleğe okunur
+        """
+        with open(os.path.join(path, BINARY_MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        if manifest.get("format") != BINARY_FORMAT:
+            raise ValueError(f"Not a semantic binary index: {path}")
+
+        rows = int(manifest["rows"])
+        dimension = int(manifest["dimension"])
+
+        # Metadata - sonraki kayit oncekini ezer, remove kaydi siler
+        records: Dict[str, Dict[str, Any]] = {}
+        with open(os.path.join(path, BINARY_ENTRIES_FILE), "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if "remove" in item:
+                    records.pop(item["remove"], None)
+                elif item["row"] < rows:
+                    records[item["id"]] = item
+
+        self.clear()
+
+        if rows and dimension:
+            vectors_path = os.path.join(path, BINARY_VECTORS_FILE)
+            if mmap:
+                vectors = np.memmap(
+                    vectors_path, dtype=np.float32, mode="c", shape=(rows, dimension)
+                )
+            else:
+                vectors = np.fromfile(
+                    vectors_path, dtype=np.float32, count=rows * dimension
+                ).reshape(rows, dimension)
+
+            row_ids: List[Optional[str]] = [None] * rows
+            labels = np.zeros(rows, dtype=np.int16)
+            for id, item in records.items():
+                entry = _entry_from_dict(item)
+                row_ids[item["row"]] = id
+                labels[item["row"]] = _SOURCE_LABELS[entry.source_type]
+                self._index[id] = entry
+
+            self._vectors.attach(vectors, row_ids, labels)
+            self._rebuild_partitions()
+
+        self._binary_state = _BinarySyncState(
+            path=os.path.abspath(path),
+            layout_version=self._vectors.layout_version,
+            rows=rows,
+        )
+
+        logger.info(f"Loaded {len(self._index)} entries from {path} (mmap={mmap})")
+
+    def _write_binary(self, path: str) -> Dict[str, Any]:
+        """Full rewrite: compact, write temp files, atomically replace."""
+        if self._vectors.compact():
+            self._rebuild_partitions()
+        vectors = self._vectors.vectors
+        rows = self._vectors.size
+
+        vectors_tmp = os.path.join(path, BINARY_VECTORS_FILE + ".tmp")
+        entries_tmp = os.path.join(path, BINARY_ENTRIES_FILE + ".tmp")
+
+        with open(vectors_tmp, "wb") as f:
+            f.write(np.ascontiguousarray(vectors).tobytes())
+
+        with open(entries_tmp, "w", encoding="utf-8") as f:
+            for row in range(rows):
+                f.write(self._entry_line(row))
+
+        os.replace(vectors_tmp, os.path.join(path, BINARY_VECTORS_FILE))
+        os.replace(entries_tmp, os.path.join(path, BINARY_ENTRIES_FILE))
+        self._write_manifest(path, rows)
+
+        self._binary_state = _BinarySyncState(
+            path=os.path.abspath(path),
+            layout_version=self._vectors.layout_version,
+            rows=rows,
+        )
+        return {"mode": "full", "appended_rows": rows, "rewritten_rows": 0, "removed": 0}
+
+    def _append_binary(self, path: str, state: _BinarySyncState) -> Dict[str, Any]:
+        """Append new rows, rewrite dirty rows in place, journal removals."""
+        vectors = self._vectors.vectors
+        rows = self._vectors.size
+        row_bytes = self._vectors.dimension * np.dtype(np.float32).itemsize if rows else 0
+        dirty = sorted(r for r in state.dirty_rows if self._vectors.id_of(r) is not None)
+
+        with open(os.path.join(path, BINARY_VECTORS_FILE), "r+b") as f:
+            # Yarida kalmis onceki yazimlari at
+            f.truncate(state.rows * row_bytes)
+            for row in dirty:
+                f.seek(row * row_bytes)
+                f.write(vectors[row].tobytes())
+            f.seek(state.rows * row_bytes)
+            f.write(np.ascontiguousarray(vectors[state.rows:rows]).tobytes())
+
+        with open(os.path.join(path, BINARY_ENTRIES_FILE), "a", encoding="utf-8") as f:
+            for id in state.removed:
+                f.write(json.dumps({"remove": id}, ensure_ascii=False) + "\n")
+            for row in dirty:
+                f.write(self._entry_line(row))
+            for row in range(state.rows, rows):
+                if self._vectors.id_of(row) is not None:
+                    f.write(self._entry_line(row))
+
+        self._write_manifest(path, rows)
+
+        result = {
+            "mode": "append",
+            "appended_rows": rows - state.rows,
+            "rewritten_rows": len(dirty),
+            "removed": len(state.removed),
+        }
+        state.rows = rows
+        state.dirty_rows.clear()
+        state.removed.clear()
+        return result
+
+    def _write_manifest(self, path: str, rows: int) -> None:
+        manifest = {
+            "format": BINARY_FORMAT,
+            "version": BINARY_VERSION,
+            "dtype": "float32",
+            "dimension": self._vectors.dimension or 0,
+            "rows": rows,
+            "count": len(self._index),
+        }
+        tmp = os.path.join(path, BINARY_MANIFEST_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, os.path.join(path, BINARY_MANIFEST_FILE))
+
+    def _entry_line(self, row: int) -> str:
+        """JSONL metadata line for a live row ('' for tombstones)."""
+        id = self._vectors.id_of(row)
+        if id is None:
+            return ""
+        item = _entry_to_dict(self._index[id])
+        item["row"] = row
+        return json.dumps(item, ensure_ascii=False) + "\n"
+
+    def _track_binary_remove(self, id: str) -> None:
+        """Record a removal of a row that is already on disk."""
+        state = self._binary_state
+        if state is None:
+            return
+        row = self._vectors.row_of(id)
+        if row is not None and row < state.rows:
+            state.removed.append(id)
+            state.dirty_rows.discard(row)
+
     # ===================================================================
     # STATS
     # ===================================================================
@@ -570,10 +847,44 @@ class SemanticMemory:
         return {
             "index_size": len(self._index),
             "source_counts": source_counts,
+            "partitions": self._partitions.stats()["partitions"],
             **self._stats,
         }
 
 
+def _epoch(timestamp: Optional[datetime]) -> Optional[float]:
+    """datetime -> epoch seconds (None korunur)."""
+    return timestamp.timestamp() if timestamp is not None else None
+
+
+def _entry_to_dict(entry: IndexEntry) -> Dict[str, Any]:
+    """Serialize entry metadata (without embedding)."""
+    return {
+        "id": entry.id,
+        "content": entry.content,
+        "source_type": entry.source_type.value,
+        "source_id": entry.source_id,
+        "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
+        "extra_data": entry.extra_data,
+    }
+
+
+def _entry_from_dict(item: Dict[str, Any]) -> IndexEntry:
+    """Deserialize entry metadata."""
+    timestamp = None
+    if item.get("timestamp"):
+        timestamp = datetime.fromisoformat(item["timestamp"])
+
+    return IndexEntry(
+        id=item["id"],
+        content=item["content"],
+        source_type=SourceType(item["source_type"]),
+        source_id=item.get("source_id"),
+        timestamp=timestamp,
+        extra_data=item.get("extra_data", {}),
+    )
+
+
 # ========================================================================
 # FACTORY & SINGLETON
 # ========================================================================
@@ -75,6 +75,11 @@ class MemoryConfig:
     conversation_context_turns: int = 10
     conversation_max_tokens: int = 4000
     conversation_session_timeout_min: float = 30.0
+    conversation_max_sessions_in_memory: int = 0   # 0 = sinirsiz
+    conversation_max_turns_in_memory: int = 0      # 0 = sinirsiz
+    conversation_idle_spill_min: float = 0.0       # 0 = idle spill kapali
+    conversation_spill_path: str = ""              # Bos = disk deposu yok
+    conversation_spill_retention_min: float = 1440.0  # 0 = sinirsiz
 
 
 class MemoryStore:
@@ -114,6 +119,11 @@ class MemoryStore:
             default_context_turns=self.config.conversation_context_turns,
             max_context_tokens=self.config.conversation_max_tokens,
             session_timeout_minutes=self.config.conversation_session_timeout_min,
+            max_sessions_in_memory=self.config.conversation_max_sessions_in_memory,
+            max_turns_in_memory=self.config.conversation_max_turns_in_memory,
+            idle_spill_minutes=self.config.conversation_idle_spill_min,
+            spill_path=self.config.conversation_spill_path,
+            spill_retention_minutes=self.config.conversation_spill_retention_min,
         )
         self.conversation = ConversationMemory(conv_config)
 
@@ -5,10 +5,12 @@ Memory modulu icin tum veri tipleri.
 UEM v2 - Norobiliml bazli bellek sistemi.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from datetime import datetime
+from itertools import accumulate
 import uuid
 
 
@@ -578,11 +580,20 @@ class Conversation(MemoryItem):
     coherence_score: float = 1.0        # 0-1, sohbet tutarliligi
     engagement_score: float = 0.5       # 0-1, kullanici katilimi
 
+    # Tur uzunluklarinin on-toplami: _char_prefix[i] = ilk i turun karakter sayisi
+    _char_prefix: List[int] = field(
+        default_factory=lambda: [0], init=False, repr=False, compare=False
+    )
+
     def add_turn(self, turn: DialogueTurn) -> None:
         """Diyalog turu ekle."""
         turn.conversation_id = self.session_id
         self.turns.append(turn)
         self.turn_count += 1
+
+        prefix = self._char_prefix
+        if len(prefix) == len(self.turns):
+            prefix.append(prefix[-1] + len(turn.content))
         self.last_accessed = datetime.now()
 
         # Duygusal arc guncelle
@@ -605,23 +616,30 @@ class Conversation(MemoryItem):
         """Son n turu getir."""
         return self.turns[-n:] if self.turns else []
 
-    def get_context_window(self, max_tokens: int = 2000) -> List[DialogueTurn]:
+    def get_context_window(
+        self,
+        max_tokens: int = 2000,
+        chars_per_token: int = 4,
+    ) -> List[DialogueTurn]:
         """
         Token limitine uygun context penceresi getir.
         Basit karakter tahmini kullanir (4 char ~= 1 token).
+
+        Limite sigan en uzun son-tur dizisi, on-toplamlar uzerinde binary
+        search ile bulunur (O(log n)).
         """
-        result = []
-        total_chars = 0
-        char_limit = max_tokens * 4
-
-        for turn in reversed(self.turns):
-            turn_chars = len(turn.content)
-            if total_chars + turn_chars > char_limit:
-                break
-            result.insert(0, turn)
-            total_chars += turn_chars
-
-        return result
+        prefix = self._context_prefix()
+        total_chars = prefix[-1]
+        start = bisect_left(prefix, total_chars - max_tokens * chars_per_token)
+        return self.turns[start:]
+
+    def _context_prefix(self) -> List[int]:
+        """Karakter on-toplamlari; turns disaridan degistiyse yeniden kurulur."""
+        if len(self._char_prefix) != len(self.turns) + 1:
+            self._char_prefix = list(accumulate(
+                (len(turn.content) for turn in self.turns), initial=0
+            ))
+        return self._char_prefix
 
     def end_conversation(self) -> None:
         """Sohbeti sonlandir."""
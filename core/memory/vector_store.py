@@ -0,0 +1,520 @@
+"""
+core/memory/vector_store.py
+
+Embedding Matrix - SemanticMemory icin sutun tabanli vektor deposu.
+UEM v2 - Tek matris-vektor carpimi ile benzerlik aramasi.
+
+Ozellikler:
+- Onceden ayrilan, buyuyebilen float32 matris
+- Satirlar eklenirken normalize edilir (arama = dot product)
+- id <-> satir haritalari
+- Satir basina tamsayi etiket (ör. source type) ile maskeli arama
+- remove icin tombstone, esik asilinca compaction
+- attach ile disk uzerindeki (memmap) matrisi kopyalamadan kullanma
+- PartitionIndex: etiket + zaman dilimi bazli satir bolumleri (filtreli arama)
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingMatrix:
+    """
+    Normalize edilmis embedding'ler icin buyuyebilen matris.
+
+    Kapasite dolunca ikiye katlanir. Silinen satirlar tombstone olarak
+    isaretlenir ve aramada maskelenir; tombstone orani compact_ratio'yu
+    gectiginde canli satirlar basa tasinir.
+
+    Kullanim:
+        matrix = EmbeddingMatrix()
+        matrix.add("id1", embedding)
+        scores = matrix.scores(query)       # (size,) - tombstone = -inf
+        id = matrix.id_of(row)
+    """
+
+    def __init__(
+        self,
+        dimension: Optional[int] = None,
+        initial_capacity: int = 256,
+        compact_ratio: float = 0.25,
+        min_compact: int = 64,
+    ):
+        """
+        Initialize EmbeddingMatrix.
+
+        Args:
+            dimension: Embedding boyutu (None = ilk eklemede belirlenir)
+            initial_capacity: Baslangic satir kapasitesi
+            compact_ratio: Tombstone / satir orani bu degeri asinca compaction
+            min_compact: Compaction icin minimum tombstone sayisi
+        """
+        self._dimension = dimension
+        self._initial_capacity = max(1, initial_capacity)
+        self._compact_ratio = compact_ratio
+        self._min_compact = min_compact
+
+        self._matrix: np.ndarray = np.empty((0, dimension or 0), dtype=np.float32)
+        self._alive: np.ndarray = np.zeros(0, dtype=bool)
+        self._labels: np.ndarray = np.zeros(0, dtype=np.int16)
+        self._row_ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0          # Kullanilan satir sayisi (tombstone dahil)
+        self._tombstones = 0
+        self._compactions = 0
+        self._layout_version = 0  # compact/clear/attach satir duzenini degistirir
+
+        if dimension:
+            self._allocate(self._initial_capacity)
+
+    # ===================================================================
+    # PROPERTIES
+    # ===================================================================
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._rows
+
+    @property
+    def dimension(self) -> Optional[int]:
+        return self._dimension
+
+    @property
+    def size(self) -> int:
+        """Kullanilan satir sayisi (tombstone dahil)."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._matrix.shape[0]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Kullanilan satirlar (view, tombstone dahil)."""
+        return self._matrix[:self._size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Canli satir maskesi (view)."""
+        return self._alive[:self._size]
+
+    @property
+    def layout_version(self) -> int:
+        """Satir indeksleri yeniden duzenlendiginde artar."""
+        return self._layout_version
+
+    # ===================================================================
+    # MUTATION
+    # ===================================================================
+
+    def add(self, id: str, embedding: np.ndarray, label: int = 0) -> int:
+        """
+        Embedding ekle veya guncelle.
+
+        Args:
+            id: Kayit ID
+            embedding: Ham (normalize edilmemis) vektor
+            label: Filtreleme etiketi
+
+        Returns:
+            Satir indeksi
+        """
+        vector = self._normalize(embedding)
+
+        row = self._rows.get(id)
+        if row is None:
+            if self._size == self.capacity:
+                self._allocate(max(self._initial_capacity, self.capacity * 2))
+            row = self._size
+            self._size += 1
+            self._rows[id] = row
+            self._row_ids.append(id)
+            self._alive[row] = True
+
+        self._matrix[row] = vector
+        self._labels[row] = label
+        return row
+
+    def remove(self, id: str) -> bool:
+        """
+        Kaydi tombstone olarak isaretle.
+
+        Returns:
+            True if removed, False if not found
+        """
+        row = self._rows.pop(id, None)
+        if row is None:
+            return False
+
+        self._alive[row] = False
+        self._row_ids[row] = None
+        self._tombstones += 1
+
+        if (
+            self._tombstones >= self._min_compact
+            and self._tombstones > self._compact_ratio * self._size
+        ):
+            self.compact()
+        return True
+
+    def compact(self) -> int:
+        """
+        Canli satirlari basa tasi, tombstone'lari at.
+
+        Returns:
+            Atilan tombstone sayisi
+        """
+        if self._tombstones == 0:
+            return 0
+
+        live_rows = np.flatnonzero(self._alive[:self._size])
+        count = len(live_rows)
+
+        self._matrix[:count] = self._matrix[live_rows]
+        self._labels[:count] = self._labels[live_rows]
+        self._row_ids = [self._row_ids[r] for r in live_rows]
+        self._rows = {id: i for i, id in enumerate(self._row_ids)}
+        self._alive[:count] = True
+        self._alive[count:self._size] = False
+
+        removed = self._tombstones
+        self._size = count
+        self._tombstones = 0
+        self._compactions += 1
+        self._layout_version += 1
+        logger.debug(f"EmbeddingMatrix compacted, {removed} tombstones removed")
+        return removed
+
+    def clear(self) -> None:
+        """Tum satirlari sil (kapasite korunur)."""
+        self._alive[:] = False
+        self._row_ids = []
+        self._rows = {}
+        self._size = 0
+        self._tombstones = 0
+        self._layout_version += 1
+
+    def attach(
+        self,
+        vectors: np.ndarray,
+        row_ids: List[Optional[str]],
+        labels: np.ndarray,
+    ) -> None:
+        """
+        Hazir (normalize edilmis) satirlari kopyalamadan benimse.
+
+        vectors bir np.memmap olabilir; ilk buyumeye kadar dogrudan
+        kullanilir. row_ids'te None olan satirlar tombstone sayilir.
+
+        Args:
+            vectors: (rows, dimension) float32 matris
+            row_ids: Satir basina ID (None = tombstone)
+            labels: (rows,) etiketler
+        """
+        if vectors.ndim != 2 or vectors.dtype != np.float32:
+            raise ValueError("vectors must be a 2D float32 array")
+        if len(row_ids) != vectors.shape[0] or len(labels) != vectors.shape[0]:
+            raise ValueError("row_ids/labels length must match vector rows")
+
+        rows = vectors.shape[0]
+        self._dimension = vectors.shape[1]
+        self._matrix = vectors
+        self._labels = np.asarray(labels, dtype=np.int16).copy()
+        self._alive = np.array([id is not None for id in row_ids], dtype=bool)
+        self._row_ids = list(row_ids)
+        self._rows = {id: row for row, id in enumerate(row_ids) if id is not None}
+        self._size = rows
+        self._tombstones = rows - len(self._rows)
+        self._layout_version += 1
+
+    # ===================================================================
+    # LOOKUP & SEARCH
+    # ===================================================================
+
+    def row_of(self, id: str) -> Optional[int]:
+        """ID'nin satir indeksi."""
+        return self._rows.get(id)
+
+    def id_of(self, row: int) -> Optional[str]:
+        """Satirin ID'si (tombstone ise None)."""
+        return self._row_ids[row]
+
+    def get(self, id: str) -> Optional[np.ndarray]:
+        """Normalize edilmis vektorun kopyasi."""
+        row = self._rows.get(id)
+        if row is None:
+            return None
+        return self._matrix[row].copy()
+
+    def scores(
+        self,
+        query: np.ndarray,
+        label: Optional[int] = None,
+        normalized: bool = False,
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Sorgu ile satirlarin cosine benzerligi.
+
+        Args:
+            query: Sorgu vektoru
+            label: Verilirse sadece bu etiketli satirlar
+            normalized: Sorgu zaten normalize mi
+            rows: Verilirse sadece bu satirlar skorlanir (sonuc rows ile hizali)
+
+        Returns:
+            (size,) veya (len(rows),) benzerlikler - tombstone/filtre disi -inf
+        """
+        if rows is not None:
+            return self._score_rows(query, rows, label, normalized)
+
+        if self._size == 0:
+            return np.empty(0, dtype=np.float32)
+
+        q = query if normalized else self._normalize(query)
+        scores = self._matrix[:self._size] @ q
+        if self._tombstones:
+            scores[~self._alive[:self._size]] = -np.inf
+        if label is not None:
+            scores[self._labels[:self._size] != label] = -np.inf
+        return scores
+
+    def normalize(self, embedding: np.ndarray) -> np.ndarray:
+        """Sorguyu bir kez normalize et (tekrarli scores(..., normalized=True) icin)."""
+        return self._normalize(embedding)
+
+    def label_of(self, id: str) -> Optional[int]:
+        """ID'nin etiketi."""
+        row = self._rows.get(id)
+        return int(self._labels[row]) if row is not None else None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rows": len(self._rows),
+            "capacity": self.capacity,
+            "tombstones": self._tombstones,
+            "compactions": self._compactions,
+        }
+
+    # ===================================================================
+    # INTERNAL
+    # ===================================================================
+
+    def _score_rows(
+        self,
+        query: np.ndarray,
+        rows: np.ndarray,
+        label: Optional[int],
+        normalized: bool,
+    ) -> np.ndarray:
+        if len(rows) == 0:
+            return np.empty(0, dtype=np.float32)
+
+        q = query if normalized else self._normalize(query)
+        scores = self._matrix[rows] @ q
+        if self._tombstones:
+            scores[~self._alive[rows]] = -np.inf
+        if label is not None:
+            scores[self._labels[rows] != label] = -np.inf
+        return scores
+
+    def _normalize(self, embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+
+        if self._dimension is None:
+            self._dimension = vector.shape[0]
+            self._allocate(self._initial_capacity)
+        elif vector.shape[0] != self._dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self._dimension}, "
+                f"got {vector.shape[0]}"
+            )
+
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return np.zeros(self._dimension, dtype=np.float32)
+        return vector / norm
+
+    def _allocate(self, capacity: int) -> None:
+        """Matrisi yeni kapasiteye buyut (mevcut satirlar korunur)."""
+        matrix = np.zeros((capacity, self._dimension), dtype=np.float32)
+        alive = np.zeros(capacity, dtype=bool)
+        labels = np.zeros(capacity, dtype=np.int16)
+        if self._size:
+            matrix[:self._size] = self._matrix[:self._size]
+            alive[:self._size] = self._alive[:self._size]
+            labels[:self._size] = self._labels[:self._size]
+        self._matrix = matrix
+        self._alive = alive
+        self._labels = labels
+
+
+class _Partition:
+    """Tek (etiket, zaman dilimi) bolumu - satirlar ve zaman damgalari."""
+
+    __slots__ = ("rows", "timestamps", "_arrays")
+
+    def __init__(self):
+        self.rows: List[int] = []
+        self.timestamps: List[float] = []
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def append(self, row: int, timestamp: float) -> None:
+        self.rows.append(row)
+        self.timestamps.append(timestamp)
+        self._arrays = None
+
+    def discard(self, row: int) -> None:
+        i = self.rows.index(row)
+        del self.rows[i]
+        del self.timestamps[i]
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(rows, timestamps) NumPy dizileri - degisene kadar onbellekte."""
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self.rows, dtype=np.int64),
+                np.asarray(self.timestamps, dtype=np.float64),
+            )
+        return self._arrays
+
+
+class PartitionIndex:
+    """
+    EmbeddingMatrix satirlari icin etiket + zaman dilimi bolumleri.
+
+    Her satir (label, floor(timestamp / partition_seconds)) bolumune
+    duser; zaman damgasi olmayan satirlar ayri bir bolumde tutulur ve
+    zaman filtreli sorgulara dahil edilmez. Filtreli arama sadece
+    eslesen bolumlerin satirlarini skorlar.
+
+    Satir indeksleri EmbeddingMatrix'e aittir; matris compaction
+    yaptiginda (layout_version degisir) rebuild edilmelidir.
+
+    Kullanim:
+        partitions = PartitionIndex()
+        partitions.add(row, label=1, timestamp=time.time())
+        for rows in partitions.select(labels=[1], start=since):
+            scores = matrix.scores(query, rows=rows)
+    """
+
+    _NO_TIME = None  # Zaman damgasiz satirlarin bolum anahtari
+
+    def __init__(self, partition_seconds: float = 86400.0):
+        """
+        Initialize PartitionIndex.
+
+        Args:
+            partition_seconds: Zaman dilimi genisligi (varsayilan 1 gun)
+        """
+        if partition_seconds <= 0:
+            raise ValueError("partition_seconds must be positive")
+        self._partition_seconds = partition_seconds
+        self._by_label: Dict[int, Dict[Optional[int], _Partition]] = {}
+        self._row_keys: Dict[int, Tuple[int, Optional[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._row_keys)
+
+    def add(self, row: int, label: int, timestamp: Optional[float]) -> None:
+        """Satiri bolumune ekle (mevcutsa tasinir)."""
+        bucket = self._bucket(timestamp)
+        key = (label, bucket)
+
+        if row in self._row_keys:
+            if self._row_keys[row] == key:
+                self._partition(key).discard(row)
+            else:
+                self.remove(row)
+
+        self._partition(key).append(row, math.nan if timestamp is None else timestamp)
+        self._row_keys[row] = key
+
+    def remove(self, row: int) -> bool:
+        """Satiri bolumunden cikar."""
+        key = self._row_keys.pop(row, None)
+        if key is None:
+            return False
+
+        label, bucket = key
+        buckets = self._by_label[label]
+        buckets[bucket].discard(row)
+        if not buckets[bucket].rows:
+            del buckets[bucket]
+        return True
+
+    def clear(self) -> None:
+        self._by_label.clear()
+        self._row_keys.clear()
+
+    def select(
+        self,
+        labels: Optional[Iterable[int]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Filtreye uyan satir dizileri (bolum basina bir dizi).
+
+        Args:
+            labels: Etiketler (None = hepsi)
+            start: Dahil alt zaman siniri (epoch saniye)
+            end: Dahil ust zaman siniri (epoch saniye)
+
+        Yields:
+            Satir indeksleri (int64); sinir bolumlerinde zaman maskeli
+        """
+        label_keys = self._by_label.keys() if labels is None else labels
+        timed = start is not None or end is not None
+        first = self._bucket(start) if start is not None else None
+        last = self._bucket(end) if end is not None else None
+
+        for label in label_keys:
+            for bucket, partition in self._by_label.get(label, {}).items():
+                if not timed:
+                    yield partition.arrays()[0]
+                    continue
+                if bucket is self._NO_TIME:
+                    continue
+                if (first is not None and bucket < first) or (last is not None and bucket > last):
+                    continue
+
+                rows, timestamps = partition.arrays()
+                # Sadece sinir bolumleri zaman maskesi gerektirir
+                if bucket == first or bucket == last:
+                    mask = np.ones(len(rows), dtype=bool)
+                    if start is not None:
+                        mask &= timestamps >= start
+                    if end is not None:
+                        mask &= timestamps <= end
+                    rows = rows[mask]
+                if len(rows):
+                    yield rows
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rows": len(self._row_keys),
+            "partitions": sum(len(b) for b in self._by_label.values()),
+            "labels": len(self._by_label),
+        }
+
+    def _bucket(self, timestamp: Optional[float]) -> Optional[int]:
+        if timestamp is None:
+            return self._NO_TIME
+        return int(timestamp // self._partition_seconds)
+
+    def _partition(self, key: Tuple[int, Optional[int]]) -> _Partition:
+        label, bucket = key
+        buckets = self._by_label.setdefault(label, {})
+        partition = buckets.get(bucket)
+        if partition is None:
+            partition = buckets[bucket] = _Partition()
+        return partition
@@ -6,9 +6,20 @@ UEM v2 Utility Functions.
 Common utilities used across all modules.
 """
 
-from .text import normalize_turkish, normalize_for_matching
+from .text import (
+    normalize_turkish,
+    normalize_for_matching,
+    turkish_lower,
+    tokenize_turkish,
+    text_cache_info,
+    clear_text_caches,
+)
 
 __all__ = [
     "normalize_turkish",
     "normalize_for_matching",
+    "turkish_lower",
+    "tokenize_turkish",
+    "text_cache_info",
+    "clear_text_caches",
 ]
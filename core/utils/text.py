@@ -7,7 +7,9 @@ Provides Turkish character normalization and text processing utilities
 used across all language modules for consistent pattern matching.
 """
 
-from typing import Dict
+import re
+from functools import lru_cache
+from typing import Dict, Tuple
 
 # Turkish character mapping to ASCII equivalents
 TURKISH_TO_ASCII: Dict[str, str] = {
@@ -19,6 +21,40 @@ TURKISH_TO_ASCII: Dict[str, str] = {
     'ç': 'c', 'Ç': 'C',
 }
 
+# Replacement table derived once from TURKISH_TO_ASCII
+_TURKISH_REPLACEMENTS: Tuple[Tuple[str, str], ...] = tuple(TURKISH_TO_ASCII.items())
+
+# Turkish casing: dotted/dotless I pairs lowercase differently than in English
+_TURKISH_LOWER_TABLE = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+# Apostrophe variants used before suffixes on proper nouns ("Ali’ye", "Ankara`da")
+_APOSTROPHE_TABLE = str.maketrans({'\u2019': "'", '\u2018': "'", '`': "'"})
+
+# Word: letters, optionally joined by apostrophes ("n'aber", "istanbul'da");
+# number: digits with decimal/thousand separators ("3,5", "1.000")
+_TOKEN_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*|\d+(?:[.,]\d+)*")
+
+# Memo cache bounds: recent inputs are reused across modules (intent, risk,
+# MDL, feedback, conversation) within a turn. Longer texts bypass the cache.
+NORMALIZE_CACHE_SIZE = 2048
+NORMALIZE_CACHE_MAX_LEN = 512
+TOKENIZE_CACHE_SIZE = 1024
+
+
+def _normalize_uncached(text: str) -> str:
+    """Table-driven normalization (no cache)."""
+    if text.isascii():
+        return text.lower()
+
+    result = text
+    for tr_char, ascii_char in _TURKISH_REPLACEMENTS:
+        result = result.replace(tr_char, ascii_char)
+
+    return result.lower()
+
+
+_normalize_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(_normalize_uncached)
+
 
 def normalize_turkish(text: str) -> str:
     """
@@ -47,11 +83,11 @@ def normalize_turkish(text: str) -> str:
     if not text:
         return ""
 
-    result = text
-    for tr_char, ascii_char in TURKISH_TO_ASCII.items():
-        result = result.replace(tr_char, ascii_char)
-
-    return result.lower()
+    # ASCII text only needs lower(); short texts are memoized since the
+    # same message is normalized by several modules in one turn
+    if len(text) > NORMALIZE_CACHE_MAX_LEN:
+        return _normalize_uncached(text)
+    return _normalize_cached(text)
 
 
 def normalize_for_matching(text: str) -> str:
@@ -72,3 +108,101 @@ def normalize_for_matching(text: str) -> str:
         'uzgunum'
     """
     return normalize_turkish(text)
+
+
+def turkish_lower(text: str) -> str:
+    """
+    Lowercase text using Turkish casing rules, keeping Turkish characters.
+
+    Unlike str.lower(), 'I' becomes 'ı' and 'İ' becomes 'i' (not 'i̇').
+
+    Args:
+        text: Input text
+
+    Returns:
+        Lowercased text
+
+    Examples:
+        >>> turkish_lower("IŞIK İçin")
+        'ışık için'
+    """
+    if not text:
+        return ""
+    return text.translate(_TURKISH_LOWER_TABLE).lower()
+
+
+@lru_cache(maxsize=TOKENIZE_CACHE_SIZE)
+def _tokenize_cached(text: str, normalize: bool, keep_suffix: bool) -> Tuple[str, ...]:
+    lowered = normalize_turkish(text) if normalize else turkish_lower(text)
+    if "`" in lowered or not lowered.isascii():
+        lowered = lowered.translate(_APOSTROPHE_TABLE)
+
+    tokens = _TOKEN_RE.findall(lowered)
+    if not keep_suffix:
+        tokens = [token.split("'", 1)[0] for token in tokens]
+    return tuple(tokens)
+
+
+def tokenize_turkish(
+    text: str,
+    normalize: bool = True,
+    keep_suffix: bool = True,
+) -> Tuple[str, ...]:
+    """
+    Split Turkish text into word and number tokens.
+
+    Punctuation and underscores are dropped. Suffixes attached with an
+    apostrophe stay on the word ("istanbul'da") unless keep_suffix is
+    False, in which case only the stem is kept ("istanbul"). Decimal
+    numbers written with a comma stay whole ("3,5").
+
+    Recent inputs are memoized (see TOKENIZE_CACHE_SIZE); the result is
+    an immutable tuple so cached values can be shared.
+
+    Args:
+        text: Input text
+        normalize: True for ASCII-normalized tokens, False to keep Turkish
+            characters (Turkish-aware lowercase)
+        keep_suffix: Keep apostrophe suffixes on proper nouns
+
+    Returns:
+        Tuple of tokens
+
+    Examples:
+        >>> tokenize_turkish("Yarın İstanbul'a gidiyorum!")
+        ('yarin', "istanbul'a", 'gidiyorum')
+        >>> tokenize_turkish("Yarın İstanbul'a gidiyorum!", keep_suffix=False)
+        ('yarin', 'istanbul', 'gidiyorum')
+        >>> tokenize_turkish("IŞIK 3,5 saat", normalize=False)
+        ('ışık', '3,5', 'saat')
+    """
+    if not text:
+        return ()
+    if len(text) > NORMALIZE_CACHE_MAX_LEN:
+        return _tokenize_cached.__wrapped__(text, normalize, keep_suffix)
+    return _tokenize_cached(text, normalize, keep_suffix)
+
+
+def text_cache_info() -> Dict[str, Dict[str, int]]:
+    """
+    Memo cache statistics for normalize_turkish and tokenize_turkish.
+
+    Returns:
+        {"normalize": {...}, "tokenize": {...}} with hits, misses, size, maxsize
+    """
+    result = {}
+    for name, func in (("normalize", _normalize_cached), ("tokenize", _tokenize_cached)):
+        info = func.cache_info()
+        result[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return result
+
+
+def clear_text_caches() -> None:
+    """Clear normalize_turkish and tokenize_turkish memo caches."""
+    _normalize_cached.cache_clear()
+    _tokenize_cached.cache_clear()
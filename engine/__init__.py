@@ -4,12 +4,13 @@ UEM v2 - Engine Module
 Cognitive Cycle, Events, Phases.
 """
 
-from .cycle import CognitiveCycle, CycleConfig, CycleState
+from .cycle import CognitiveCycle, CycleBatchResult, CycleConfig, CycleState
 from .events import EventType, Event, EventBus, get_event_bus
-from .phases import Phase, PhaseConfig, PhaseResult
+from .phases import Phase, PhaseConfig, PhaseGraph, PhaseResult
 
 __all__ = [
     "CognitiveCycle",
+    "CycleBatchResult",
     "CycleConfig",
     "CycleState",
     "EventType",
@@ -18,5 +19,6 @@ __all__ = [
     "get_event_bus",
     "Phase",
     "PhaseConfig",
+    "PhaseGraph",
     "PhaseResult",
 ]
@@ -1,22 +1,45 @@
 """
 UEM v2 - Cognitive Cycle
 
-Ana işlem döngüsü - 10 faz sırayla çalışır.
+Ana işlem döngüsü - 10 faz sırayla (veya PhaseGraph ile paralel) çalışır.
 
 BUG FIX: Phase results artık context.metadata'ya da ekleniyor,
 böylece DECIDE handler orchestrator suggestion'a erişebiliyor.
 
 MONITORING: CycleMetrics ile entegre - her cycle ve phase ölçülür.
+
+PARALLEL: parallel_phases=True ile PhaseConfig.inputs/outputs'tan kurulan
+PhaseGraph'a göre bağımsız fazlar thread pool'da eşzamanlı çalışır.
+Pool'da çalışan handler state/context'in özel kopyasını alır; yazdıkları
+ana thread'de, faz zamanında bittiyse paylaşılan cycle'a birleştirilir.
+
+DEADLINES: Her faz PhaseBudget alır (context.metadata["phase_budgets"]).
+enforce_deadlines=True ise süresi dolan handler beklenmez, kısmi/degraded
+sonuçla devam edilir. max_cycle_time_ms dolunca opsiyonel fazlar atlanır.
+
+BATCH: run_batch(stimuli) birden çok cycle'ı faz-öncelikli çalıştırır;
+run_batch metodu olan handler'lar tüm batch'i tek çağrıda işler.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 from datetime import datetime
+import queue
+import threading
 import time
 import logging
 
 from .events import EventType, Event, EventBus, get_event_bus
-from .phases import Phase, PhaseConfig, PhaseResult, DEFAULT_PHASE_CONFIGS
+from .phases import (
+    Phase,
+    PhaseBudget,
+    PhaseConfig,
+    PhaseGraph,
+    PhaseResult,
+    DEFAULT_PHASE_CONFIGS,
+)
 from foundation.state import StateVector
 from foundation.types import Context, ModuleType, Stimulus
 from meta.monitoring.metrics import CycleMetrics, CycleMetricsHistory
@@ -28,6 +51,10 @@ logger = logging.getLogger(__name__)
 # Phase handler tipi
 PhaseHandler = Callable[[Phase, StateVector, Context], PhaseResult]
 
+# Engine'in yönettiği metadata anahtarları: handler kopyası bunların da
+# kopyasını alır, birleştirmede atlanır (engine kendisi yazar).
+_ENGINE_METADATA_KEYS = ("phase_results", "phase_budgets")
+
 
 @dataclass
 class CycleConfig:
@@ -42,6 +69,13 @@ class CycleConfig:
     report_each_cycle: bool = False  # Her cycle sonunda rapor yaz
     compact_reports: bool = True     # Kompakt rapor formatı
 
+    # Paralel faz çalıştırma (PhaseGraph)
+    parallel_phases: bool = False    # Bağımsız fazları thread pool'da çalıştır
+    max_workers: int = 4             # Thread pool boyutu
+
+    # Deadline ayarları
+    enforce_deadlines: bool = False  # Süresi dolan handler'ı bekleme (thread pool'da çalışır)
+
 
 @dataclass
 class CycleState:
@@ -52,7 +86,8 @@ class CycleState:
     phase_results: Dict[Phase, PhaseResult] = field(default_factory=dict)
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    
+    latency_ms: Optional[float] = None  # run_batch: paylaştırılmış cycle gecikmesi
+
     @property
     def duration_ms(self) -> float:
         if self.start_time and self.end_time:
@@ -64,6 +99,146 @@ class CycleState:
         return self.end_time is not None
 
 
+@dataclass
+class CycleBatchResult:
+    """run_batch sonucu: cycle state'leri, gecikmeler ve throughput."""
+    states: List[CycleState]
+    latencies_ms: List[float]       # Cycle başına (batch çağrıları paylaştırılmış) süre
+    total_duration_ms: float        # Batch'in toplam wall time'ı
+
+    @property
+    def cycle_count(self) -> int:
+        return len(self.states)
+
+    @property
+    def cycles_per_second(self) -> float:
+        if self.total_duration_ms <= 0:
+            return 0.0
+        return len(self.states) / (self.total_duration_ms / 1000)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        return sum(self.latencies_ms) / len(self.latencies_ms)
+
+    def latency_percentile(self, q: float) -> float:
+        """Cycle gecikmesi yüzdeliği (q: 0-100, nearest-rank)."""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cycles": self.cycle_count,
+            "total_duration_ms": self.total_duration_ms,
+            "cycles_per_second": self.cycles_per_second,
+            "avg_latency_ms": self.avg_latency_ms,
+            "p50_latency_ms": self.latency_percentile(50),
+            "p95_latency_ms": self.latency_percentile(95),
+        }
+
+
+@dataclass
+class _PhaseRun:
+    """Pool'da çalışan faz: özel state/context kopyası ve gönderim anı snapshot'ı."""
+    config: PhaseConfig
+    budget: PhaseBudget
+    state: StateVector
+    context: Context
+    base_state: StateVector
+    base_metadata: Dict[str, Any]
+
+
+class _PhaseWorkerPool:
+    """
+    Faz handler'ları için daemon thread havuzu.
+
+    ThreadPoolExecutor'dan farkı: süresi dolan handler abandon() ile
+    bırakılınca yerine yeni worker açılır, hiç dönmeyen bir handler
+    havuz kapasitesini kalıcı olarak tüketmez. Thread'ler daemon'dır;
+    bırakılmış handler yorumlayıcının kapanmasını engellemez. Bırakılan
+    worker handler'ı bitince çıkar.
+    """
+
+    def __init__(self, max_workers: int, name_prefix: str = "uem-phase"):
+        self._tasks: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers: Set[threading.Thread] = set()
+        self._orphans: Set[threading.Thread] = set()
+        self._running: Dict[Future, threading.Thread] = {}
+        self._name_prefix = name_prefix
+        self._spawned = 0
+        self._shutdown = False
+        self.abandoned_count = 0
+        for _ in range(max(1, max_workers)):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self._name_prefix}_{self._spawned}",
+            daemon=True,
+        )
+        self._spawned += 1
+        self._workers.add(thread)
+        thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def abandon(self, future: Future) -> None:
+        """Süresi dolan işi bırak; başlamışsa worker'ın yerine yenisini aç."""
+        with self._lock:
+            if future.cancel():
+                return
+            thread = self._running.get(future)
+            if thread is None or thread not in self._workers:
+                return
+            self._workers.discard(thread)
+            self._orphans.add(thread)
+            self.abandoned_count += 1
+            if not self._shutdown:
+                self._spawn()
+
+    def _worker(self) -> None:
+        me = threading.current_thread()
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                break
+            future, fn, args = item
+            with self._lock:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running[future] = me
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            with self._lock:
+                del self._running[future]
+                if me in self._orphans:
+                    self._orphans.discard(me)
+                    return
+        with self._lock:
+            self._workers.discard(me)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._workers) + list(self._orphans)
+            for _ in self._workers:
+                self._tasks.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
 class CognitiveCycle:
     """
     10-Phase Cognitive Cycle.
@@ -72,6 +247,7 @@ class CognitiveCycle:
         cycle = CognitiveCycle()
         cycle.register_handler(Phase.SENSE, my_sense_handler)
         result = cycle.run(stimulus)
+        batch = cycle.run_batch([stimulus_a, stimulus_b])
     """
     
     def __init__(
@@ -92,6 +268,14 @@ class CognitiveCycle:
         self._metrics_history = CycleMetricsHistory()
         self._current_metrics: Optional[CycleMetrics] = None
 
+        # Paralel çalıştırma (lazy)
+        self._executor: Optional[_PhaseWorkerPool] = None
+        self._graph: Optional[PhaseGraph] = None
+        self._graph_key: Optional[tuple] = None
+
+        # Cycle bütçesi (time.monotonic deadline, run içinde set edilir)
+        self._cycle_deadline: Optional[float] = None
+
         # Default placeholder handlers
         self._register_default_handlers()
     
@@ -171,6 +355,12 @@ class CognitiveCycle:
         # DECIDE handler buradan okuyacak
         # ═══════════════════════════════════════════════════════════════
         context.metadata["phase_results"] = {}
+        context.metadata["phase_budgets"] = {}
+
+        # Cycle bütçesi: dolunca opsiyonel fazlar atlanır
+        self._cycle_deadline = None
+        if self.config.max_cycle_time_ms > 0:
+            self._cycle_deadline = time.monotonic() + self.config.max_cycle_time_ms / 1000
 
         # Cycle metrics'i context'e ekle (phase handler'lar kullanabilsin)
         if self._current_metrics:
@@ -186,72 +376,11 @@ class CognitiveCycle:
 
         logger.info(f"Cycle {self._cycle_count} started")
         
-        # Fazları sırayla çalıştır
-        for phase_config in self.config.phase_configs:
-            if not phase_config.enabled:
-                cycle_state.phase_results[phase_config.phase] = PhaseResult(
-                    phase=phase_config.phase,
-                    success=True,
-                    skipped=True,
-                )
-                continue
-
-            cycle_state.current_phase = phase_config.phase
-
-            # ═══════════════════════════════════════════════════════════
-            # MONITORING: Phase başlangıcı
-            # ═══════════════════════════════════════════════════════════
-            if self._current_metrics:
-                self._current_metrics.record_phase_start(phase_config.phase.value)
-
-            # Faz eventi
-            if self.config.emit_events:
-                self.event_bus.emit(
-                    EventType.MODULE_START,
-                    source="engine",
-                    cycle_id=self._cycle_count,
-                    phase=phase_config.phase.value,
-                )
-
-            # Handler'ı çalıştır
-            result = self._run_phase(
-                phase_config,
-                cycle_state.state_vector,
-                context,
-            )
-
-            # ═══════════════════════════════════════════════════════════
-            # BUG FIX: Result'ı HEM cycle_state'e HEM context'e yaz
-            # ═══════════════════════════════════════════════════════════
-            cycle_state.phase_results[phase_config.phase] = result
-            context.metadata["phase_results"][phase_config.phase] = result
-
-            # ═══════════════════════════════════════════════════════════
-            # MONITORING: Phase bitişi
-            # ═══════════════════════════════════════════════════════════
-            if self._current_metrics:
-                self._current_metrics.record_phase_end(
-                    phase_config.phase.value,
-                    success=result.success,
-                    duration_ms=result.duration_ms,
-                )
-
-            # Faz bitiş eventi
-            if self.config.emit_events:
-                self.event_bus.emit(
-                    EventType.MODULE_END,
-                    source="engine",
-                    cycle_id=self._cycle_count,
-                    phase=phase_config.phase.value,
-                    success=result.success,
-                    duration_ms=result.duration_ms,
-                )
+        if self.config.parallel_phases:
+            self._run_phases_parallel(cycle_state, context)
+        else:
+            self._run_phases_serial(cycle_state, context)
 
-            # Hata kontrolü
-            if not result.success and phase_config.required and self.config.stop_on_error:
-                logger.error(f"Phase {phase_config.phase.value} failed, stopping cycle")
-                break
-        
         # Cycle bitir
         cycle_state.end_time = datetime.now()
         cycle_state.current_phase = None
@@ -286,6 +415,589 @@ class CognitiveCycle:
 
         return cycle_state
     
+    def run_batch(
+        self,
+        stimuli: Sequence[Optional[Stimulus]],
+        initial_state: Optional[StateVector] = None,
+    ) -> "CycleBatchResult":
+        """
+        Birden çok stimulus için cycle'ları toplu çalıştır.
+
+        Fazlar faz-öncelikli (phase-major) sırayla çalışır: önce tüm
+        cycle'ların SENSE'i, sonra tüm ATTEND'leri... Böylece run_batch
+        metodu olan handler'lar (örn. RetrievePhaseHandler) tek çağrıda
+        tüm batch'i işleyip sorgu/kurulum maliyetini paylaştırır; olmayanlar
+        cycle başına normal çağrılır. MODULE_START/END eventleri faz başına
+        bir kez yayınlanır; fazı çalıştıran cycle'ların cycle_ids listesini
+        (cycle_id ilk cycle'dır) ve MODULE_END aynı sırada cycle başına
+        durations_ms listesini taşır. CYCLE_START/END cycle başına yayınlanır.
+
+        Cycle gecikmesi, cycle'ın faz sürelerinin (batch çağrılarında
+        paylaştırılmış) toplamıdır. CycleState.latency_ms, CYCLE_END
+        duration_ms, CycleMetrics.total_duration_ms ve latencies_ms aynı
+        değeri verir. start_time/end_time gerçek zamanlardır (batch başı/sonu),
+        bu yüzden CycleState.duration_ms batch'in wall time'ıdır.
+
+        Bütçeler: faz bütçesi timeout_ms * batch_size, cycle bütçesi
+        max_cycle_time_ms * batch_size. parallel_phases ve enforce_deadlines
+        batch modunda uygulanmaz.
+
+        Args:
+            stimuli: Cycle başına bir stimulus (None = stimulus'suz cycle)
+            initial_state: Her cycle'ın başlangıç durumu (kopyalanır)
+
+        Returns:
+            CycleBatchResult - cycle state'leri, gecikmeler ve throughput
+        """
+        batch_start = time.perf_counter()
+        n = len(stimuli)
+        if n == 0:
+            return CycleBatchResult(states=[], latencies_ms=[], total_duration_ms=0.0)
+
+        started_at = datetime.now()
+        base_state = initial_state or StateVector()
+        monitoring = self.config.enable_monitoring
+
+        cycle_states: List[CycleState] = []
+        contexts: List[Context] = []
+        metrics: List[Optional[CycleMetrics]] = []
+
+        for stimulus in stimuli:
+            self._cycle_count += 1
+            cycle_states.append(CycleState(
+                cycle_id=self._cycle_count,
+                state_vector=base_state.copy(),
+                start_time=started_at,
+            ))
+            context = Context(
+                cycle_id=self._cycle_count,
+                metadata={"stimulus": stimulus} if stimulus else {},
+            )
+            context.metadata["phase_results"] = {}
+            context.metadata["phase_budgets"] = {}
+            cycle_metrics = CycleMetrics(cycle_id=self._cycle_count) if monitoring else None
+            if cycle_metrics:
+                context.metadata["cycle_metrics"] = cycle_metrics
+            contexts.append(context)
+            metrics.append(cycle_metrics)
+
+            if self.config.emit_events:
+                self.event_bus.emit(
+                    EventType.CYCLE_START,
+                    source="engine",
+                    cycle_id=self._cycle_count,
+                    batch_size=n,
+                )
+
+        self._cycle_deadline = None
+        if self.config.max_cycle_time_ms > 0:
+            self._cycle_deadline = (
+                time.monotonic() + self.config.max_cycle_time_ms * n / 1000
+            )
+
+        latencies = [0.0] * n
+        active = list(range(n))
+
+        for phase_config in self.config.phase_configs:
+            if not active:
+                break
+            phase = phase_config.phase
+
+            budget_ms = self._budget_ms(phase_config, scale=len(active))
+            if not phase_config.enabled or budget_ms is None:
+                for i in active:
+                    self._skip_phase(
+                        phase_config,
+                        cycle_states[i],
+                        budget_exhausted=phase_config.enabled,
+                        metrics=metrics[i],
+                    )
+                continue
+
+            budget = PhaseBudget(phase, budget_ms)
+            cycle_ids = [cycle_states[i].cycle_id for i in active]
+            for i in active:
+                contexts[i].metadata["phase_budgets"][phase] = budget
+                cycle_states[i].current_phase = phase
+                if metrics[i]:
+                    metrics[i].record_phase_start(phase.value)
+
+            if self.config.emit_events:
+                self.event_bus.emit(
+                    EventType.MODULE_START,
+                    source="engine",
+                    cycle_id=cycle_ids[0],
+                    cycle_ids=cycle_ids,
+                    phase=phase.value,
+                    batch_size=len(active),
+                )
+
+            results = self._run_phase_batch(
+                phase_config,
+                [cycle_states[i].state_vector for i in active],
+                [contexts[i] for i in active],
+            )
+
+            per_cycle_budget_ms = budget_ms / len(active)
+            still_active = []
+            for i, result in zip(active, results):
+                cycle_states[i].phase_results[phase] = result
+                contexts[i].metadata["phase_results"][phase] = result
+                latencies[i] += result.duration_ms
+
+                if metrics[i]:
+                    missed = result.duration_ms > per_cycle_budget_ms
+                    if missed:
+                        metrics[i].record_deadline_miss(phase.value)
+                    metrics[i].record_phase_end(
+                        phase.value,
+                        success=result.success,
+                        duration_ms=result.duration_ms,
+                        degraded=result.degraded,
+                        deadline_missed=missed,
+                    )
+                    # Wall time yerine paylaştırılmış süre
+                    metrics[i].phase_metrics[phase.value].duration_ms = result.duration_ms
+
+                if not self._should_stop(phase_config, result):
+                    still_active.append(i)
+            active = still_active
+
+            if self.config.emit_events:
+                self.event_bus.emit(
+                    EventType.MODULE_END,
+                    source="engine",
+                    cycle_id=cycle_ids[0],
+                    cycle_ids=cycle_ids,
+                    phase=phase.value,
+                    batch_size=len(results),
+                    success=all(r.success for r in results),
+                    duration_ms=sum(r.duration_ms for r in results),
+                    durations_ms=[r.duration_ms for r in results],
+                )
+
+        ended_at = datetime.now()
+        for i, cycle_state in enumerate(cycle_states):
+            cycle_state.end_time = ended_at
+            cycle_state.latency_ms = latencies[i]
+            cycle_state.current_phase = None
+
+            if metrics[i]:
+                metrics[i].finalize()
+                metrics[i].total_duration_ms = latencies[i]
+                self._metrics_history.add(metrics[i])
+
+            if self.config.emit_events:
+                self.event_bus.emit(
+                    EventType.CYCLE_END,
+                    source="engine",
+                    cycle_id=cycle_state.cycle_id,
+                    duration_ms=latencies[i],
+                    success=all(r.success for r in cycle_state.phase_results.values()),
+                )
+
+        self._current_state = cycle_states[-1]
+        self._current_metrics = metrics[-1]
+
+        batch_result = CycleBatchResult(
+            states=cycle_states,
+            latencies_ms=latencies,
+            total_duration_ms=(time.perf_counter() - batch_start) * 1000,
+        )
+        logger.info(
+            f"Batch of {n} cycles completed in {batch_result.total_duration_ms:.1f}ms "
+            f"({batch_result.cycles_per_second:.1f} cycles/s)"
+        )
+        return batch_result
+
+    def _run_phase_batch(
+        self,
+        config: PhaseConfig,
+        states: List[StateVector],
+        contexts: List[Context],
+    ) -> List[PhaseResult]:
+        """
+        Bir fazı batch'teki tüm cycle'lar için çalıştır.
+
+        Handler'ın run_batch(phase, states, contexts) metodu varsa tek
+        çağrıda kullanılır ve geçen süre cycle'lara eşit paylaştırılır;
+        yoksa her cycle için _run_phase çağrılır.
+        """
+        handler = self._handlers.get(config.phase, self._default_handler)
+        batch_handler = getattr(handler, "run_batch", None)
+        if batch_handler is None:
+            return [self._run_phase(config, s, c) for s, c in zip(states, contexts)]
+
+        start_time = time.perf_counter()
+        try:
+            results = list(batch_handler(config.phase, states, contexts))
+            if len(results) != len(states):
+                raise ValueError(
+                    f"run_batch returned {len(results)} results for {len(states)} cycles"
+                )
+        except Exception as e:
+            logger.error(f"Phase {config.phase.value} batch error: {e}")
+            duration = (time.perf_counter() - start_time) * 1000 / len(states)
+            return [
+                PhaseResult(phase=config.phase, success=False, duration_ms=duration, error=str(e))
+                for _ in states
+            ]
+
+        duration = (time.perf_counter() - start_time) * 1000 / len(states)
+        for result in results:
+            result.duration_ms = duration
+        return results
+
+    def _run_phases_serial(self, cycle_state: CycleState, context: Context) -> None:
+        """Fazları sırayla çalıştır."""
+        for phase_config in self.config.phase_configs:
+            if not phase_config.enabled:
+                self._skip_phase(phase_config, cycle_state)
+                continue
+
+            budget = self._start_budget(phase_config, context)
+            if budget is None:
+                self._skip_phase(phase_config, cycle_state, budget_exhausted=True)
+                continue
+
+            cycle_state.current_phase = phase_config.phase
+            self._begin_phase(phase_config)
+
+            # Handler'ı çalıştır
+            if self.config.enforce_deadlines:
+                executor = self._get_executor()
+                run = self._isolate(phase_config, budget, cycle_state, context)
+                future = executor.submit(self._run_phase, phase_config, run.state, run.context)
+                try:
+                    result = future.result(timeout=budget.remaining_ms / 1000)
+                    self._merge_isolated(run, cycle_state, context)
+                except FuturesTimeoutError:
+                    executor.abandon(future)
+                    result = self._deadline_result(phase_config, budget)
+            else:
+                result = self._run_phase(
+                    phase_config,
+                    cycle_state.state_vector,
+                    context,
+                )
+
+            self._finish_phase(phase_config, result, cycle_state, context, budget)
+
+            # Hata kontrolü
+            if self._should_stop(phase_config, result):
+                break
+
+    def _run_phases_parallel(self, cycle_state: CycleState, context: Context) -> None:
+        """
+        Fazları PhaseGraph'a göre eşzamanlı çalıştır.
+
+        Bir faz, bağımlı olduğu tüm fazlar bitince thread pool'a gönderilir.
+        Her faz state/context'in özel kopyasında çalışır; yazdıkları,
+        event, metrics ve phase_results ana thread'de, faz bitince
+        birleştirilir. Böylece aynı seviyedeki fazlar paylaşılan
+        StateVector/metadata'ya eşzamanlı yazmaz ve bir faz yalnızca
+        bağımlılıklarının çıktılarını görür. Cycle sonunda phase_results
+        sözlükleri konfigürasyon sırasına göre yeniden dizilir, böylece
+        çıktı çalışma sırasından bağımsızdır.
+        """
+        graph = self.phase_graph
+        configs = {c.phase: c for c in self.config.phase_configs}
+        pending = {p: len(graph.dependencies[p]) for p in graph.order}
+        running: Dict[Future, _PhaseRun] = {}
+        ready: List[Phase] = []
+        stopped = False
+        executor = self._get_executor()
+
+        def release(phase: Phase) -> None:
+            for child in graph.dependents[phase]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+
+        def complete(future: Future, result: PhaseResult, merge: bool) -> None:
+            nonlocal stopped
+            run = running.pop(future)
+            if merge:
+                self._merge_isolated(run, cycle_state, context)
+            self._finish_phase(run.config, result, cycle_state, context, run.budget)
+            if self._should_stop(run.config, result):
+                stopped = True
+                ready.clear()
+            if not stopped:
+                release(run.config.phase)
+
+        def order_key(future: Future) -> int:
+            return graph.order.index(running[future].config.phase)
+
+        ready.extend(p for p in graph.order if pending[p] == 0)
+
+        while ready or running:
+            # Hazır fazları liste sırasıyla başlat
+            ready.sort(key=graph.order.index)
+            while ready and not stopped:
+                phase_config = configs[ready.pop(0)]
+                budget = None
+                if phase_config.enabled:
+                    budget = self._start_budget(phase_config, context)
+                if budget is None:
+                    self._skip_phase(
+                        phase_config, cycle_state, budget_exhausted=phase_config.enabled
+                    )
+                    release(phase_config.phase)
+                    continue
+                self._begin_phase(phase_config)
+                run = self._isolate(phase_config, budget, cycle_state, context)
+                future = executor.submit(self._run_phase, phase_config, run.state, run.context)
+                running[future] = run
+
+            if not running:
+                break
+
+            timeout = None
+            if self.config.enforce_deadlines:
+                timeout = min(r.budget.remaining_ms for r in running.values()) / 1000
+
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=order_key):
+                complete(future, future.result(), merge=True)
+
+            # Süresi dolan fazları bekleme; kopyaları atılır, kısmi/degraded sonuçla devam et
+            if self.config.enforce_deadlines:
+                expired = [
+                    f for f, r in running.items()
+                    if r.budget.remaining_ms <= 0 and not f.done()
+                ]
+                for future in sorted(expired, key=order_key):
+                    executor.abandon(future)
+                    run = running[future]
+                    complete(future, self._deadline_result(run.config, run.budget), merge=False)
+
+        # Deterministik birleştirme: konfigürasyon sırası
+        ordered = {
+            p: cycle_state.phase_results[p]
+            for p in graph.order if p in cycle_state.phase_results
+        }
+        for results in (cycle_state.phase_results, context.metadata["phase_results"]):
+            results.clear()
+            results.update(ordered)
+
+    def _start_budget(
+        self,
+        phase_config: PhaseConfig,
+        context: Context,
+    ) -> Optional[PhaseBudget]:
+        """
+        Faz bütçesini oluştur ve context'e koy.
+
+        Zorunlu fazlar timeout_ms kadar bütçe alır. Opsiyonel fazlar kalan
+        cycle bütçesiyle sınırlanır; cycle bütçesi bitmişse None döner
+        (faz atlanır).
+        """
+        budget_ms = self._budget_ms(phase_config)
+        if budget_ms is None:
+            return None
+
+        budget = PhaseBudget(phase_config.phase, budget_ms)
+        context.metadata["phase_budgets"][phase_config.phase] = budget
+        return budget
+
+    def _budget_ms(self, phase_config: PhaseConfig, scale: int = 1) -> Optional[float]:
+        """Faz bütçesi (ms); opsiyonel faz ve cycle bütçesi bitmişse None."""
+        budget_ms = phase_config.timeout_ms * scale
+        if not phase_config.required and self._cycle_deadline is not None:
+            cycle_remaining_ms = (self._cycle_deadline - time.monotonic()) * 1000
+            if cycle_remaining_ms <= 0:
+                return None
+            budget_ms = min(budget_ms, cycle_remaining_ms)
+        return budget_ms
+
+    def _deadline_result(self, phase_config: PhaseConfig, budget: PhaseBudget) -> PhaseResult:
+        """
+        Süresi dolan faz için sonuç üret.
+
+        Handler arka planda bitebilir ama sonucu kullanılmaz; özel
+        kopyasına yazdıkları paylaşılan cycle'a birleştirilmez. Bütçe iptal
+        edilir ki kooperatif handler'lar erken çıksın. publish_partial ile
+        bırakılmış çıktı varsa faz degraded-başarılı sayılır.
+        """
+        budget.cancel()
+        partial = budget.partial_output
+        logger.warning(
+            f"Phase {phase_config.phase.value} deadline exceeded "
+            f"({budget.budget_ms:.1f}ms), continuing with "
+            f"{'partial' if partial is not None else 'no'} output"
+        )
+        return PhaseResult(
+            phase=phase_config.phase,
+            success=partial is not None,
+            duration_ms=budget.elapsed_ms,
+            output=partial,
+            error=None if partial is not None else "deadline exceeded",
+            degraded=True,
+        )
+
+    def _isolate(
+        self,
+        phase_config: PhaseConfig,
+        budget: PhaseBudget,
+        cycle_state: CycleState,
+        context: Context,
+    ) -> _PhaseRun:
+        """
+        Pool'da çalışacak faz için state/context kopyası hazırla.
+
+        Metadata sığ kopyalanır; engine'in sözlükleri (_ENGINE_METADATA_KEYS)
+        ayrıca kopyalanır. Paylaşılan iç içe nesnelerin yerinde değiştirilmesi
+        (örn. cycle_metrics) izole edilmez.
+        """
+        metadata = dict(context.metadata)
+        for key in _ENGINE_METADATA_KEYS:
+            metadata[key] = dict(context.metadata[key])
+        return _PhaseRun(
+            config=phase_config,
+            budget=budget,
+            state=cycle_state.state_vector.copy(),
+            context=replace(context, metadata=metadata),
+            base_state=cycle_state.state_vector.copy(),
+            base_metadata=dict(context.metadata),
+        )
+
+    def _merge_isolated(self, run: _PhaseRun, cycle_state: CycleState, context: Context) -> None:
+        """
+        Zamanında biten fazın yazdıklarını paylaşılan cycle'a birleştir.
+
+        Yalnızca fazın gönderim anından beri değiştirdiği StateVector alanları
+        ve eklediği/değiştirdiği/sildiği üst seviye metadata anahtarları
+        yazılır; aynı anda biten kardeş fazın yazdıkları ezilmez.
+        """
+        for key, value in run.state:
+            if not run.base_state.has(key) or run.base_state.get(key) != value:
+                cycle_state.state_vector.set(key, value)
+
+        metadata = context.metadata
+        for key, value in run.context.metadata.items():
+            if key in _ENGINE_METADATA_KEYS:
+                continue
+            if key not in run.base_metadata or run.base_metadata[key] is not value:
+                metadata[key] = value
+        for key in run.base_metadata.keys() - run.context.metadata.keys():
+            metadata.pop(key, None)
+
+    def _skip_phase(
+        self,
+        phase_config: PhaseConfig,
+        cycle_state: CycleState,
+        budget_exhausted: bool = False,
+        metrics: Optional[CycleMetrics] = None,
+    ) -> None:
+        metrics = metrics or self._current_metrics
+        cycle_state.phase_results[phase_config.phase] = PhaseResult(
+            phase=phase_config.phase,
+            success=True,
+            skipped=True,
+            output={"reason": "cycle_budget_exhausted"} if budget_exhausted else None,
+        )
+        if budget_exhausted:
+            logger.info(f"Phase {phase_config.phase.value} skipped: cycle budget exhausted")
+            if metrics:
+                metrics.record_budget_skip(phase_config.phase.value)
+
+    def _begin_phase(self, phase_config: PhaseConfig) -> None:
+        # ═══════════════════════════════════════════════════════════
+        # MONITORING: Phase başlangıcı
+        # ═══════════════════════════════════════════════════════════
+        if self._current_metrics:
+            self._current_metrics.record_phase_start(phase_config.phase.value)
+
+        # Faz eventi
+        if self.config.emit_events:
+            self.event_bus.emit(
+                EventType.MODULE_START,
+                source="engine",
+                cycle_id=self._cycle_count,
+                phase=phase_config.phase.value,
+            )
+
+    def _finish_phase(
+        self,
+        phase_config: PhaseConfig,
+        result: PhaseResult,
+        cycle_state: CycleState,
+        context: Context,
+        budget: PhaseBudget,
+    ) -> None:
+        # ═══════════════════════════════════════════════════════════
+        # BUG FIX: Result'ı HEM cycle_state'e HEM context'e yaz
+        # ═══════════════════════════════════════════════════════════
+        cycle_state.phase_results[phase_config.phase] = result
+        context.metadata["phase_results"][phase_config.phase] = result
+
+        # Deadline kontrolü
+        missed = budget.cancelled or result.duration_ms > budget.budget_ms
+        if missed and not budget.cancelled:
+            logger.warning(
+                f"Phase {phase_config.phase.value} exceeded timeout: "
+                f"{result.duration_ms:.1f}ms > {budget.budget_ms:.1f}ms"
+            )
+
+        # ═══════════════════════════════════════════════════════════
+        # MONITORING: Phase bitişi
+        # ═══════════════════════════════════════════════════════════
+        if self._current_metrics:
+            if missed:
+                self._current_metrics.record_deadline_miss(phase_config.phase.value)
+            self._current_metrics.record_phase_end(
+                phase_config.phase.value,
+                success=result.success,
+                duration_ms=result.duration_ms,
+                degraded=result.degraded,
+                deadline_missed=missed,
+            )
+
+        # Faz bitiş eventi
+        if self.config.emit_events:
+            self.event_bus.emit(
+                EventType.MODULE_END,
+                source="engine",
+                cycle_id=self._cycle_count,
+                phase=phase_config.phase.value,
+                success=result.success,
+                duration_ms=result.duration_ms,
+            )
+
+    def _should_stop(self, phase_config: PhaseConfig, result: PhaseResult) -> bool:
+        if not result.success and phase_config.required and self.config.stop_on_error:
+            logger.error(f"Phase {phase_config.phase.value} failed, stopping cycle")
+            return True
+        return False
+
+    def _get_executor(self) -> _PhaseWorkerPool:
+        if self._executor is None:
+            self._executor = _PhaseWorkerPool(self.config.max_workers)
+        return self._executor
+
+    @property
+    def phase_graph(self) -> PhaseGraph:
+        """Mevcut phase_configs için bağımlılık grafı (config değişince yenilenir)."""
+        key = tuple(
+            (c.phase, c.inputs, c.outputs) for c in self.config.phase_configs
+        )
+        if self._graph is None or key != self._graph_key:
+            self._graph = PhaseGraph(self.config.phase_configs)
+            self._graph_key = key
+        return self._graph
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Faz thread pool'unu kapat.
+
+        Args:
+            wait: Süresi dolup bırakılan handler'ların bitmesini bekle
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
     def _run_phase(
         self,
         config: PhaseConfig,
@@ -300,14 +1012,6 @@ class CognitiveCycle:
         try:
             result = handler(config.phase, state, context)
             result.duration_ms = (time.perf_counter() - start_time) * 1000
-            
-            # Timeout kontrolü
-            if result.duration_ms > config.timeout_ms:
-                logger.warning(
-                    f"Phase {config.phase.value} exceeded timeout: "
-                    f"{result.duration_ms:.1f}ms > {config.timeout_ms}ms"
-                )
-            
             return result
             
         except Exception as e:
@@ -320,7 +1024,7 @@ class CognitiveCycle:
                 duration_ms=duration,
                 error=str(e),
             )
-    
+
     @property
     def cycle_count(self) -> int:
         """Toplam çalıştırılan cycle sayısı."""
@@ -338,6 +1042,7 @@ class CognitiveCycle:
             "registered_handlers": len([h for h in self._handlers.values()
                                         if h != self._default_handler]),
             "event_bus_stats": self.event_bus.stats,
+            "abandoned_handlers": self._executor.abandoned_count if self._executor else 0,
         }
 
         # Monitoring stats
@@ -349,6 +1054,7 @@ class CognitiveCycle:
                 "phase_averages": self._metrics_history.get_phase_averages(100),
                 "memory_stats": self._metrics_history.get_memory_stats(100),
                 "trust_stats": self._metrics_history.get_trust_stats(100),
+                "deadline_stats": self._metrics_history.get_deadline_stats(100),
             }
 
         return stats
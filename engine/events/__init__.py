@@ -8,6 +8,9 @@ from .bus import (
     EventType,
     Event,
     EventHandler,
+    DispatchMode,
+    BackpressurePolicy,
+    HandlerStats,
     EventBus,
     get_event_bus,
     reset_event_bus,
@@ -17,6 +20,9 @@ __all__ = [
     "EventType",
     "Event",
     "EventHandler",
+    "DispatchMode",
+    "BackpressurePolicy",
+    "HandlerStats",
     "EventBus",
     "get_event_bus",
     "reset_event_bus",
@@ -5,11 +5,16 @@ Modüller arası iletişim sistemi (Pub/Sub pattern).
 Spagetti import yerine temiz, gevşek bağlı iletişim.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from enum import Enum
 from datetime import datetime
+import heapq
+import itertools
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -78,32 +83,245 @@ class Event:
 EventHandler = Callable[[Event], None]
 
 
+class DispatchMode(str, Enum):
+    """Handler çağırma modu."""
+    SYNC = "sync"          # publish() içinde, çağıran thread'de
+    THREADED = "threaded"  # Handler'a ait kuyruk + worker thread
+
+
+class BackpressurePolicy(str, Enum):
+    """Kuyruk dolduğunda davranış."""
+    DROP_NEWEST = "drop_newest"    # Gelen event düşürülür
+    DROP_LOWEST = "drop_lowest"    # Kuyruktaki en düşük öncelikli event düşürülür
+    BLOCK = "block"                # Yer açılana kadar (block_timeout_s) bekle
+
+
+@dataclass
+class HandlerStats:
+    """Handler başına gecikme ve kuyruk metrikleri."""
+    name: str
+    mode: DispatchMode = DispatchMode.SYNC
+    calls: int = 0
+    errors: int = 0
+    dropped: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+    queue_depth: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def record(self, duration_ms: float, success: bool) -> None:
+        self.calls += 1
+        if not success:
+            self.errors += 1
+        self.total_ms += duration_ms
+        self.last_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "mode": self.mode.value,
+            "calls": self.calls,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "avg_ms": self.avg_ms,
+            "max_ms": self.max_ms,
+            "last_ms": self.last_ms,
+            "queue_depth": self.queue_depth,
+        }
+
+
+class _Subscriber:
+    """
+    Tek bir handler'ın dağıtım durumu.
+
+    THREADED modda event'ler (öncelik, sıra) anahtarlı sınırlı bir heap'e
+    konur; worker thread en yüksek öncelikli (eşitlikte en eski) event'i
+    işler.
+    """
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        mode: DispatchMode,
+        queue_size: int,
+        policy: BackpressurePolicy,
+        block_timeout_s: float,
+    ):
+        self.handler = handler
+        self.mode = mode
+        self.stats = HandlerStats(
+            name=getattr(handler, "__qualname__", repr(handler)),
+            mode=mode,
+        )
+        self._queue_size = max(1, queue_size)
+        self._policy = policy
+        self._block_timeout_s = block_timeout_s
+        self._heap: List[Tuple[int, int, Event]] = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        if mode == DispatchMode.THREADED:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"uem-event-{self.stats.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def dispatch(self, event: Event) -> bool:
+        """Event'i işle veya kuyruğa koy. Başarılı mı?"""
+        if self.mode == DispatchMode.SYNC:
+            return self._call(event)
+        return self._enqueue(event)
+
+    def _call(self, event: Event) -> bool:
+        start = time.perf_counter()
+        success = True
+        try:
+            self.handler(event)
+        except Exception as e:
+            success = False
+            logger.error(f"Handler error for {event.event_type.value}: {e}")
+        self.stats.record((time.perf_counter() - start) * 1000, success)
+        return success
+
+    def _enqueue(self, event: Event) -> bool:
+        entry = (-event.priority, next(self._sequence), event)
+        with self._cond:
+            if self._stopped:
+                return False
+            if len(self._heap) >= self._queue_size:
+                if not self._make_room(event):
+                    self.stats.dropped += 1
+                    return False
+            heapq.heappush(self._heap, entry)
+            self.stats.queue_depth = len(self._heap)
+            self._cond.notify_all()
+        return True
+
+    def _make_room(self, event: Event) -> bool:
+        """Dolu kuyrukta politika uygula (lock altında)."""
+        if self._policy == BackpressurePolicy.BLOCK:
+            deadline = time.monotonic() + self._block_timeout_s
+            while len(self._heap) >= self._queue_size and not self._stopped:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._stopped
+
+        if self._policy == BackpressurePolicy.DROP_LOWEST:
+            # En düşük öncelikli, eşitlikte en yeni kayıt
+            lowest = max(range(len(self._heap)), key=lambda i: self._heap[i][:2])
+            if -self._heap[lowest][0] > event.priority:
+                return False
+            self._heap[lowest] = self._heap[-1]
+            self._heap.pop()
+            heapq.heapify(self._heap)
+            self.stats.dropped += 1
+            return True
+
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._stopped:
+                    self._cond.wait()
+                if not self._heap and self._stopped:
+                    return
+                _, _, event = heapq.heappop(self._heap)
+                self.stats.queue_depth = len(self._heap)
+                self._in_flight += 1
+                self._cond.notify_all()
+            try:
+                self._call(event)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Kuyruk boşalana kadar bekle."""
+        if self.mode == DispatchMode.SYNC:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._heap or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Kalan event'leri işleyip worker'ı durdur."""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+
+
 class EventBus:
     """
     Merkezi event bus - Pub/Sub pattern.
     
+    Varsayılan olarak handler'lar publish() içinde senkron çağrılır.
+    DispatchMode.THREADED ile abone olan handler'lar kendi kuyruğu ve
+    worker thread'inde çalışır: event'ler Event.priority sırasıyla işlenir,
+    kuyruk sınırında BackpressurePolicy uygulanır. Böylece yavaş aboneler
+    (ör. DB persistence) cycle'ı bekletmez.
+
     Usage:
         bus = EventBus()
         
         # Subscribe
         bus.subscribe(EventType.THREAT_DETECTED, my_handler)
+        bus.subscribe_all(slow_handler, mode=DispatchMode.THREADED)
         
         # Publish
         bus.publish(Event(EventType.THREAT_DETECTED, data={"level": 0.8}))
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        default_mode: DispatchMode = DispatchMode.SYNC,
+        queue_size: int = 1000,
+        backpressure: BackpressurePolicy = BackpressurePolicy.DROP_NEWEST,
+        block_timeout_s: float = 0.1,
+        max_history: int = 1000,
+    ):
         self._handlers: Dict[EventType, List[EventHandler]] = {}
         self._global_handlers: List[EventHandler] = []
-        self._event_history: List[Event] = []
-        self._max_history: int = 1000
+        self._subscribers: Dict[EventHandler, _Subscriber] = {}
+        self._event_history: Deque[Event] = deque(maxlen=max_history)
+        self._max_history: int = max_history
         self._paused: bool = False
         self._event_count: int = 0
+        self._default_mode = default_mode
+        self._queue_size = queue_size
+        self._backpressure = backpressure
+        self._block_timeout_s = block_timeout_s
     
     def subscribe(
         self,
         event_type: EventType,
         handler: EventHandler,
+        mode: Optional[DispatchMode] = None,
+        queue_size: Optional[int] = None,
+        backpressure: Optional[BackpressurePolicy] = None,
     ) -> None:
         """
         Belirli bir event tipine abone ol.
@@ -111,19 +329,30 @@ class EventBus:
         Args:
             event_type: Dinlenecek event tipi
             handler: Event geldiğinde çağrılacak fonksiyon
+            mode: Dağıtım modu (None = bus varsayılanı)
+            queue_size: THREADED kuyruk boyutu (None = bus varsayılanı)
+            backpressure: Kuyruk dolu politikası (None = bus varsayılanı)
         """
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         
         if handler not in self._handlers[event_type]:
+            self._register(handler, mode, queue_size, backpressure)
             self._handlers[event_type].append(handler)
             logger.debug(f"Handler subscribed to {event_type.value}")
     
-    def subscribe_all(self, handler: EventHandler) -> None:
+    def subscribe_all(
+        self,
+        handler: EventHandler,
+        mode: Optional[DispatchMode] = None,
+        queue_size: Optional[int] = None,
+        backpressure: Optional[BackpressurePolicy] = None,
+    ) -> None:
         """
         Tüm eventlere abone ol (monitoring için).
         """
         if handler not in self._global_handlers:
+            self._register(handler, mode, queue_size, backpressure)
             self._global_handlers.append(handler)
             logger.debug("Global handler subscribed")
     
@@ -136,6 +365,41 @@ class EventBus:
         if event_type in self._handlers:
             if handler in self._handlers[event_type]:
                 self._handlers[event_type].remove(handler)
+                self._release(handler)
+    
+    def unsubscribe_all(self, handler: EventHandler) -> None:
+        """Global aboneliği iptal et."""
+        if handler in self._global_handlers:
+            self._global_handlers.remove(handler)
+            self._release(handler)
+    
+    def _register(
+        self,
+        handler: EventHandler,
+        mode: Optional[DispatchMode],
+        queue_size: Optional[int],
+        backpressure: Optional[BackpressurePolicy],
+    ) -> None:
+        """Handler için dağıtım durumu oluştur (ilk abonelikte)."""
+        if handler in self._subscribers:
+            return
+        self._subscribers[handler] = _Subscriber(
+            handler,
+            mode or self._default_mode,
+            queue_size or self._queue_size,
+            backpressure or self._backpressure,
+            self._block_timeout_s,
+        )
+    
+    def _release(self, handler: EventHandler) -> None:
+        """Handler'ın başka aboneliği kalmadıysa worker'ı durdur."""
+        if handler in self._global_handlers:
+            return
+        if any(handler in handlers for handlers in self._handlers.values()):
+            return
+        subscriber = self._subscribers.pop(handler, None)
+        if subscriber:
+            subscriber.stop()
     
     def publish(self, event: Event) -> int:
         """
@@ -145,7 +409,7 @@ class EventBus:
             event: Yayınlanacak event
             
         Returns:
-            Event'i işleyen handler sayısı
+            Event'i işleyen (THREADED için kuyruğa alan) handler sayısı
         """
         if self._paused:
             logger.debug(f"Event bus paused, skipping: {event.event_type.value}")
@@ -154,31 +418,21 @@ class EventBus:
         self._event_count += 1
         handlers_called = 0
         
-        # Global handlers
+        # Global handlers, then type-specific handlers
         for handler in self._global_handlers:
-            try:
-                handler(event)
+            if self._subscribers[handler].dispatch(event):
                 handlers_called += 1
-            except Exception as e:
-                logger.error(f"Global handler error: {e}")
         
-        # Type-specific handlers
-        if event.event_type in self._handlers:
-            for handler in self._handlers[event.event_type]:
-                try:
-                    handler(event)
-                    handlers_called += 1
-                except Exception as e:
-                    logger.error(f"Handler error for {event.event_type.value}: {e}")
+        for handler in self._handlers.get(event.event_type, ()):
+            if self._subscribers[handler].dispatch(event):
+                handlers_called += 1
         
         # History
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history = self._event_history[-self._max_history:]
         
         logger.debug(f"Published {event.event_type.value}, {handlers_called} handlers called")
         return handlers_called
-    
+
     def emit(
         self,
         event_type: EventType,
@@ -218,12 +472,35 @@ class EventBus:
         limit: int = 100,
     ) -> List[Event]:
         """Event geçmişini getir."""
-        events = self._event_history
+        events = list(self._event_history)
         
         if event_type:
             events = [e for e in events if e.event_type == event_type]
         
-        return events[-limit:]
+        return events[-limit:] if limit > 0 else []
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        THREADED handler kuyruklarının boşalmasını bekle.
+        
+        Returns:
+            Süre dolmadan tüm kuyruklar boşaldı mı
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscriber in list(self._subscribers.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not subscriber.wait_idle(remaining):
+                return False
+        return True
+    
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Kuyruktaki event'leri işleyip tüm worker thread'leri durdur."""
+        for subscriber in self._subscribers.values():
+            subscriber.stop(timeout)
+    
+    def get_handler_stats(self) -> List[Dict[str, Any]]:
+        """Handler başına gecikme/kuyruk metrikleri."""
+        return [s.stats.to_dict() for s in self._subscribers.values()]
     
     @property
     def stats(self) -> Dict[str, Any]:
@@ -234,6 +511,7 @@ class EventBus:
             "subscriber_count": sum(len(h) for h in self._handlers.values()),
             "global_handlers": len(self._global_handlers),
             "paused": self._paused,
+            "dropped_events": sum(s.stats.dropped for s in self._subscribers.values()),
         }
 
 
@@ -252,4 +530,6 @@ def get_event_bus() -> EventBus:
 def reset_event_bus() -> None:
     """Event bus'ı sıfırla (test için)."""
     global _default_bus
+    if _default_bus is not None:
+        _default_bus.shutdown()
     _default_bus = None
@@ -21,7 +21,7 @@ sys.path.insert(0, '.')
 
 from foundation.state import StateVector, SVField
 from foundation.types import Context
-from engine.phases import Phase, PhaseResult
+from engine.phases import Phase, PhaseResult, get_phase_budget
 
 from core.memory import (
     get_memory_store,
@@ -87,6 +87,9 @@ class RetrievePhaseHandler:
         self._memory = get_memory_store()
         self._state = RetrieveHandlerState()
 
+        # run_batch süresince memory sorgu sonuçları (batch içi tekrarlar için)
+        self._batch_cache: Optional[Dict[tuple, Any]] = None
+
     def __call__(
         self,
         phase: Phase,
@@ -103,6 +106,10 @@ class RetrievePhaseHandler:
 
             retrieved_items: List[Dict[str, Any]] = []
 
+            # Bütçe dolarsa kalan sorgular atlanır (degraded sonuç)
+            budget = get_phase_budget(context, phase)
+            degraded = False
+
             # 1. Algılanan agent'lar için relationship bilgisi getir
             if self.config.query_relationships and agents:
                 relationship_items = self._retrieve_relationships(agents, context)
@@ -110,13 +117,19 @@ class RetrievePhaseHandler:
 
             # 2. Benzer durumları getir
             if self.config.query_episodic and current_situation:
-                similar_items = self._retrieve_similar_episodes(current_situation)
-                retrieved_items.extend(similar_items)
+                if budget and budget.expired:
+                    degraded = True
+                else:
+                    similar_items = self._retrieve_similar_episodes(current_situation)
+                    retrieved_items.extend(similar_items)
 
             # 3. Agent'larla geçmiş olayları getir
             if self.config.query_episodic and agents:
-                past_items = self._retrieve_past_episodes(agents)
-                retrieved_items.extend(past_items)
+                if budget and budget.expired:
+                    degraded = True
+                else:
+                    past_items = self._retrieve_past_episodes(agents)
+                    retrieved_items.extend(past_items)
 
             # Context'e sonuçları ekle
             context.metadata["retrieved_memories"] = retrieved_items
@@ -143,6 +156,7 @@ class RetrievePhaseHandler:
                     "types": list(set(item["type"] for item in retrieved_items)),
                     "agents_processed": len(agents),
                 },
+                degraded=degraded,
             )
 
         except Exception as e:
@@ -154,6 +168,32 @@ class RetrievePhaseHandler:
                 error=str(e),
             )
 
+    def run_batch(
+        self,
+        phase: Phase,
+        states: List[StateVector],
+        contexts: List[Context],
+    ) -> List[PhaseResult]:
+        """
+        RETRIEVE fazını bir batch için çalıştır.
+
+        Aynı agent'ın relationship'i, aynı durumun benzer episode'ları ve
+        aynı agent'ın geçmiş episode'ları batch boyunca bir kez sorgulanır.
+        """
+        self._batch_cache = {}
+        try:
+            return [self(phase, state, context) for state, context in zip(states, contexts)]
+        finally:
+            self._batch_cache = None
+
+    def _query(self, key: tuple, fn):
+        """Batch içindeyse sonucu önbellekten ver, değilse doğrudan sorgula."""
+        if self._batch_cache is None:
+            return fn()
+        if key not in self._batch_cache:
+            self._batch_cache[key] = fn()
+        return self._batch_cache[key]
+
     def _get_agents_from_context(self, context: Context) -> List[Dict[str, Any]]:
         """Context'ten agent listesi çıkar."""
         agents = []
@@ -182,13 +222,17 @@ class RetrievePhaseHandler:
     ) -> List[Dict[str, Any]]:
         """Agent'lar için relationship bilgisi getir."""
         items = []
+        trust: Dict[str, Any] = {}
 
         for agent in agents:
             agent_id = agent.get("agent_id")
             if not agent_id:
                 continue
 
-            relationship = self._memory.get_relationship(agent_id)
+            relationship = self._query(
+                ("relationship", agent_id),
+                lambda: self._memory.get_relationship(agent_id),
+            )
 
             items.append({
                 "type": "relationship",
@@ -206,7 +250,10 @@ class RetrievePhaseHandler:
             })
 
             # Trust modülüne başlangıç bilgisi ver
-            context.metadata[f"memory_trust_{agent_id}"] = relationship.get_trust_recommendation()
+            trust[agent_id] = relationship.get_trust_recommendation()
+
+        if trust:
+            context.metadata["memory_trust"] = trust
 
         return items
 
@@ -214,9 +261,9 @@ class RetrievePhaseHandler:
         """Benzer durumları getir."""
         items = []
 
-        similar_episodes = self._memory.recall_similar_episodes(
-            situation,
-            limit=3,
+        similar_episodes = self._query(
+            ("similar", situation),
+            lambda: self._memory.recall_similar_episodes(situation, limit=3),
         )
 
         for episode in similar_episodes:
@@ -246,9 +293,9 @@ class RetrievePhaseHandler:
             if not agent_id:
                 continue
 
-            past_episodes = self._memory.recall_episodes(
-                agent_id=agent_id,
-                limit=3,
+            past_episodes = self._query(
+                ("past", agent_id),
+                lambda: self._memory.recall_episodes(agent_id=agent_id, limit=3),
             )
 
             for episode in past_episodes:
@@ -122,10 +122,15 @@ class SensePhaseHandler:
                 state.set(SVField.AROUSAL, output["intensity"])
 
             # Context'e ekle (ATTEND ve PERCEIVE icin)
+            content = getattr(stimulus, "content", stimulus)
             context.metadata["perceptual_input"] = perceptual_input
-            context.metadata["stimulus_content"] = getattr(stimulus, "content", stimulus)
+            context.metadata["stimulus_content"] = content
             context.metadata["stimulus_source"] = getattr(stimulus, "source_entity", None)
 
+            # RETRIEVE benzer durumlari bununla sorgular
+            if isinstance(content, dict) and content.get("situation"):
+                context.metadata["situation"] = content["situation"]
+
             logger.debug(
                 f"Sensed stimulus: type={output['stimulus_type']}, "
                 f"intensity={output['intensity']}"
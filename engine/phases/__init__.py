@@ -9,11 +9,18 @@ from .definitions import (
     PhaseConfig,
     PhaseResult,
     DEFAULT_PHASE_CONFIGS,
+    result_artifact,
 )
+from .graph import PhaseGraph
+from .budget import PhaseBudget, get_phase_budget
 
 __all__ = [
     "Phase",
     "PhaseConfig",
     "PhaseResult",
     "DEFAULT_PHASE_CONFIGS",
+    "result_artifact",
+    "PhaseGraph",
+    "PhaseBudget",
+    "get_phase_budget",
 ]
@@ -0,0 +1,82 @@
+"""
+UEM v2 - Phase Budget
+
+Faz başına iptal edilebilir zaman bütçesi.
+
+Engine her faz için bir PhaseBudget oluşturur ve context.metadata["phase_budgets"]
+altına koyar. Handler'lar uzun işlerin arasında bütçeyi kontrol edip erken
+dönebilir (degraded sonuç) veya o ana kadarki çıktıyı publish_partial ile
+bırakabilir; süre dolduğunda engine bu kısmi çıktıyı kullanır.
+
+Usage:
+    budget = get_phase_budget(context, phase)
+    for step in steps:
+        if budget and budget.expired:
+            return PhaseResult(phase=phase, success=True, degraded=True, output=partial)
+        ...
+        if budget:
+            budget.publish_partial(partial)
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from foundation.types import Context
+
+from .definitions import Phase
+
+
+class PhaseBudget:
+    """Tek bir fazın zaman bütçesi (thread-safe)."""
+
+    def __init__(self, phase: Phase, budget_ms: float):
+        self.phase = phase
+        self.budget_ms = budget_ms
+        self._started = time.monotonic()
+        self._deadline = self._started + max(0.0, budget_ms) / 1000.0
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._partial: Optional[Dict[str, Any]] = None
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self._started) * 1000
+
+    @property
+    def remaining_ms(self) -> float:
+        """Kalan süre (iptal edildiyse 0)."""
+        if self._cancelled.is_set():
+            return 0.0
+        return max(0.0, (self._deadline - time.monotonic()) * 1000)
+
+    @property
+    def expired(self) -> bool:
+        """Süre doldu mu veya iptal edildi mi?"""
+        return self._cancelled.is_set() or time.monotonic() >= self._deadline
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Bütçeyi iptal et (engine süre dolunca çağırır)."""
+        self._cancelled.set()
+
+    def publish_partial(self, output: Dict[str, Any]) -> None:
+        """O ana kadarki çıktıyı bırak; süre dolarsa engine bunu kullanır."""
+        with self._lock:
+            self._partial = dict(output)
+
+    @property
+    def partial_output(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return dict(self._partial) if self._partial is not None else None
+
+
+def get_phase_budget(context: Context, phase: Phase) -> Optional[PhaseBudget]:
+    """Context'ten fazın bütçesini getir (engine dışında çağrılırsa None)."""
+    budgets = context.metadata.get("phase_budgets")
+    if not budgets:
+        return None
+    return budgets.get(phase)
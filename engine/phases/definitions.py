@@ -5,7 +5,7 @@ Cognitive cycle fazları - 10-phase model.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import Enum, auto
 
 
@@ -76,9 +76,16 @@ class PhaseConfig:
     phase: Phase
     enabled: bool = True
     timeout_ms: float = 1000.0  # Maksimum çalışma süresi
-    required: bool = True       # Başarısız olursa cycle durur mu?
+    required: bool = True       # Başarısız olursa cycle durur mu? (False = opsiyonel,
+                                # cycle bütçesi bitince atlanır)
     retry_count: int = 0        # Başarısızlıkta kaç kez dene
 
+    # Bağımlılık bildirimi (PhaseGraph için). Artifact adları context.metadata
+    # anahtarlarıdır; StateVector alanları "state.<alan>" ile yazılır.
+    # None = bildirilmemiş, faz bariyer olarak ele alınır.
+    inputs: Optional[Tuple[str, ...]] = None
+    outputs: Optional[Tuple[str, ...]] = None
+
 
 @dataclass  
 class PhaseResult:
@@ -89,24 +96,139 @@ class PhaseResult:
     output: Optional[dict] = None
     error: Optional[str] = None
     skipped: bool = False
+    degraded: bool = False      # Bütçe dolduğu için kısmi/eksik sonuç
     
     @property
     def status_str(self) -> str:
         if self.skipped:
             return "SKIPPED"
+        if self.degraded:
+            return "DEGRADED"
         return "OK" if self.success else "FAILED"
 
 
+def result_artifact(phase: Phase) -> str:
+    """
+    Fazın context.metadata["phase_results"] kaydının artifact adı.
+
+    Engine her fazın sonucunu kendisi yazar; PhaseGraph bunu her fazın örtük
+    output'u sayar. Başka fazın sonucunu okuyan faz bunu inputs'a ekler.
+    """
+    return f"phase_results.{phase.value}"
+
+
 # Default faz yapılandırması
+#
+# inputs/outputs mevcut handler'ların (engine/handlers, register_all_handlers
+# + create_attend_handler) gerçekte okuduğu/yazdığı anahtarlardır; okuma
+# StateVector'da yazmadan önce de olsa (örn. state.threat = max(state.threat,
+# ...)) inputs'a girer. tests/integration/test_full_cycle.py bildirimleri
+# handler erişimiyle karşılaştırır; handler değiştiğinde burası da
+# güncellenmeli. stimulus, agent, entity, relationship, empathy_context
+# cycle dışından gelir, hiçbir faz üretmez.
+#
+# Aynı seviyedeki fazlar paralel modda state/context'in özel kopyasında
+# çalışır ve yazdıkları ana thread'de sırayla birleştirilir; paylaşılan
+# StateVector/metadata'ya eşzamanlı yazılmaz. Ortak bir anahtarı yazan iki
+# faz graf tarafından zaten sıralanır (write-after-write).
+#
+# Mevcut handler'larla seviyeler PLAN || ACT dışında seridir (örn. FEEL,
+# EVALUATE'e state.arousal, PERCEIVE'e state.threat üzerinden bağlı).
+# PLAN'ın handler'ı yok (placeholder); bildirimi gelecekteki handler'ın
+# sözleşmesidir.
 DEFAULT_PHASE_CONFIGS = [
-    PhaseConfig(Phase.SENSE, timeout_ms=100),
-    PhaseConfig(Phase.ATTEND, timeout_ms=50),
-    PhaseConfig(Phase.PERCEIVE, timeout_ms=200),
-    PhaseConfig(Phase.RETRIEVE, timeout_ms=300),
-    PhaseConfig(Phase.REASON, timeout_ms=500),
-    PhaseConfig(Phase.EVALUATE, timeout_ms=200),
-    PhaseConfig(Phase.FEEL, timeout_ms=100),
-    PhaseConfig(Phase.DECIDE, timeout_ms=200),
-    PhaseConfig(Phase.PLAN, timeout_ms=300),
-    PhaseConfig(Phase.ACT, timeout_ms=100),
+    PhaseConfig(
+        Phase.SENSE, timeout_ms=100,
+        inputs=("stimulus",),
+        outputs=(
+            "perceptual_input", "stimulus_content", "stimulus_source", "situation",
+            "state.arousal",
+        ),
+    ),
+    PhaseConfig(
+        Phase.ATTEND, timeout_ms=50,
+        inputs=("perceptual_input", "current_attention"),
+        outputs=("perceptual_input", "attention", "current_attention", "state.attention_focus"),
+    ),
+    PhaseConfig(
+        Phase.PERCEIVE, timeout_ms=200,
+        inputs=("perceptual_input", "attention", "stimulus", "stimulus_source", "state.threat"),
+        outputs=(
+            "detected_agents", "perceived_agents", "threat_assessment",
+            "perceptual_features", "state.threat", "state.attention_focus",
+        ),
+    ),
+    PhaseConfig(
+        Phase.RETRIEVE, timeout_ms=300,
+        inputs=("stimulus", "situation", "perceived_agents"),
+        outputs=(
+            "retrieved_memories", "memory_retrieval_count", "memory_trust",
+            "state.memory_load", "state.known_agent",
+            "state.relationship_quality", "state.memory_relevance",
+        ),
+    ),
+    PhaseConfig(
+        Phase.REASON, timeout_ms=500,
+        inputs=(
+            "stimulus", "detected_agents", "threat_assessment",
+            "perceptual_features", "retrieved_memories",
+            "state.threat", "state.resource",
+        ),
+        outputs=("reasoning_results", "cognitive_state"),
+    ),
+    PhaseConfig(
+        Phase.EVALUATE, timeout_ms=200,
+        inputs=(
+            "detected_agents", "threat_assessment", "perceptual_features",
+            "reasoning_results", "cognitive_state", "retrieved_memories",
+            "state.threat", "state.resource", "state.wellbeing",
+        ),
+        outputs=(
+            "situation_assessment", "current_plan",
+            "state.wellbeing", "state.arousal", "state.cognitive_load",
+        ),
+    ),
+    PhaseConfig(
+        Phase.FEEL, timeout_ms=100,
+        inputs=(
+            "stimulus", "agent", "entity", "detected_agents", "relationship",
+            "empathy_context", "state.threat", "state.valence", "state.arousal",
+            "state.dominance", "state.empathy_total", "state.sympathy_level",
+            "state.trust_value",
+        ),
+        outputs=(
+            "state.valence", "state.arousal", "state.dominance", "state.emotional_intensity",
+            "state.empathy_total", "state.cognitive_empathy", "state.affective_empathy",
+            "state.somatic_empathy", "state.projective_empathy",
+            "state.sympathy_level", "state.sympathy_valence",
+            "state.trust_value", "state.trust_competence", "state.trust_benevolence",
+            "state.trust_integrity", "state.trust_predictability",
+        ),
+    ),
+    PhaseConfig(
+        Phase.DECIDE, timeout_ms=200,
+        inputs=(
+            result_artifact(Phase.FEEL), "state.threat", "state.trust_value",
+            "state.empathy_total", "state.sympathy_level", "state.sympathy_valence",
+            "state.valence",
+        ),
+        outputs=("selected_action", "action_confidence", "action_reasoning"),
+    ),
+    PhaseConfig(
+        Phase.PLAN, timeout_ms=300,
+        inputs=("selected_action", "current_plan"),
+        outputs=("plan",),
+    ),
+    PhaseConfig(
+        Phase.ACT, timeout_ms=100,
+        inputs=(
+            "selected_action", "action_confidence",
+            "state.threat", "state.wellbeing", "state.social_engagement",
+            "state.attention_focus", "state.valence", "state.dominance",
+        ),
+        outputs=(
+            "state.threat", "state.wellbeing", "state.social_engagement",
+            "state.attention_focus", "state.valence", "state.dominance",
+        ),
+    ),
 ]
@@ -0,0 +1,97 @@
+"""
+UEM v2 - Phase Dependency Graph
+
+PhaseConfig.inputs / outputs bildirimlerinden faz DAG'ı kurar.
+
+Kenar kuralı (sıralı listede önce gelen A, sonra gelen B için):
+    - A'nın yazdığını B okuyor veya yazıyor  (read-after-write / write-after-write)
+    - A'nın okuduğunu B yazıyor               (write-after-read)
+ise A -> B kenarı eklenir. inputs veya outputs bildirmeyen (None) faz bariyerdir:
+öncesindeki tüm fazlara ve sonrasındaki tüm fazlar ona bağlanır.
+Her faz kendi phase_results kaydını (result_artifact) örtük olarak yazar.
+
+Kenarlar her zaman liste sırasına uyar; bu yüzden graf döngüsüzdür ve
+seri çalıştırma her zaman geçerli bir topolojik sıradır.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .definitions import Phase, PhaseConfig, result_artifact
+
+
+def _artifacts(names: Optional[Tuple[str, ...]]) -> Optional[FrozenSet[str]]:
+    return frozenset(names) if names is not None else None
+
+
+class PhaseGraph:
+    """
+    Faz bağımlılık grafı.
+
+    Usage:
+        graph = PhaseGraph(DEFAULT_PHASE_CONFIGS)
+        graph.dependencies[Phase.DECIDE]   # {Phase.FEEL, ...}
+        graph.levels()                      # paralel çalışabilecek katmanlar
+    """
+
+    def __init__(self, configs: Sequence[PhaseConfig]):
+        self.order: List[Phase] = [c.phase for c in configs]
+        self.dependencies: Dict[Phase, FrozenSet[Phase]] = {}
+        self.dependents: Dict[Phase, Tuple[Phase, ...]] = {}
+
+        reads = [_artifacts(c.inputs) for c in configs]
+        writes = [
+            _artifacts(c.outputs) | {result_artifact(c.phase)} if c.outputs is not None else None
+            for c in configs
+        ]
+        children: Dict[Phase, List[Phase]] = {p: [] for p in self.order}
+
+        for j, later in enumerate(self.order):
+            deps = set()
+            for i in range(j):
+                if self._conflicts(reads[i], writes[i], reads[j], writes[j]):
+                    deps.add(self.order[i])
+                    children[self.order[i]].append(later)
+            self.dependencies[later] = frozenset(deps)
+
+        for phase, kids in children.items():
+            self.dependents[phase] = tuple(kids)
+
+    @staticmethod
+    def _conflicts(
+        read_a: Optional[FrozenSet[str]],
+        write_a: Optional[FrozenSet[str]],
+        read_b: Optional[FrozenSet[str]],
+        write_b: Optional[FrozenSet[str]],
+    ) -> bool:
+        """A (önce) ile B (sonra) arasında sıralama zorunlu mu?"""
+        if None in (read_a, write_a, read_b, write_b):
+            return True
+        return bool(write_a & (read_b | write_b)) or bool(read_a & write_b)
+
+    def levels(self) -> List[List[Phase]]:
+        """
+        Fazları bağımlılık derinliğine göre katmanla.
+
+        Aynı katmandaki fazlar birbirinden bağımsızdır; katman içi sıra
+        liste sırasıdır.
+        """
+        depth: Dict[Phase, int] = {}
+        for phase in self.order:
+            deps = self.dependencies[phase]
+            depth[phase] = 1 + max((depth[d] for d in deps), default=-1)
+
+        result: List[List[Phase]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for phase in self.order:
+            result[depth[phase]].append(phase)
+        return result
+
+    @property
+    def max_parallelism(self) -> int:
+        """En geniş katmandaki faz sayısı."""
+        return max((len(level) for level in self.levels()), default=0)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {
+            phase.value: sorted(d.value for d in self.dependencies[phase])
+            for phase in self.order
+        }
@@ -667,28 +667,26 @@ class CLIChat:
             return
 
         try:
-            from core.learning.feedback_aggregator import FeedbackAggregator
+            from core.learning.feedback_aggregator import CheckpointedFeedbackAggregator
             from core.learning.feedback_store import FeedbackStore
 
-            # Episode'ları yükle
-            episodes = self._episode_store.get_all()
-
-            if not episodes:
+            if self._episode_store.count() == 0:
                 print("\n[Henuz episode verisi yok]")
                 return
 
-            # Aggregate
-            aggregator = FeedbackAggregator()
-            stats = aggregator.aggregate(episodes)
-
-            # Kaydet
+            # Tam aggregation: store sifirlanir, checkpoint log sonuna yazilir
+            # (sonraki artimli calismalar ayni episode'lari tekrar saymaz)
             feedback_store = FeedbackStore()
-            feedback_store.bulk_update(stats)
+            incremental = CheckpointedFeedbackAggregator(
+                self._episode_store.filepath, feedback_store
+            )
+            processed = incremental.rebuild()
+            stats = feedback_store.get_all()
 
             # Özet
-            summary = aggregator.get_summary(stats)
+            summary = incremental.aggregator.get_summary(stats)
             print(f"\n--- Aggregation Tamamlandi ---")
-            print(f"  Episode sayisi: {len(episodes)}")
+            print(f"  Episode sayisi: {processed}")
             print(f"  Construction sayisi: {len(stats)}")
             print(f"  Toplam kullanim: {summary['total_uses']}")
             print(f"  Explicit feedback: {summary['total_explicit_feedback']} (+{summary['explicit_positive']}/-{summary['explicit_negative']})")
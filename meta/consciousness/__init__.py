@@ -70,6 +70,7 @@ from .attention import (
 from .integration import (
     GlobalWorkspaceConfig,
     BroadcastListener,
+    ContentHeap,
     GlobalWorkspace,
     create_global_workspace,
 )
@@ -115,6 +116,7 @@ __all__ = [
     # === INTEGRATION (Global Workspace) ===
     "GlobalWorkspaceConfig",
     "BroadcastListener",
+    "ContentHeap",
     "GlobalWorkspace",
     "create_global_workspace",
 
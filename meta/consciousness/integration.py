@@ -11,8 +11,10 @@ Workspace = Bilincin "sahnesi"
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
-from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+import heapq
+import itertools
 import uuid
 
 from .types import (
@@ -84,6 +86,107 @@ class BroadcastListener:
         return content_type in self.content_types
 
 
+# ============================================================================
+# CONTENT HEAP
+# ============================================================================
+
+class ContentHeap:
+    """
+    Indekslenebilir ikili heap.
+
+    Her eleman bir icerik ID'sine karsilik gelir; pozisyon haritasi sayesinde
+    ID ile kaldirma ve anahtar guncelleme O(log n) calisir. Anahtar tuple'lari
+    kucukten buyuge siralanir (max-heap icin skor negatif verilir).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[Tuple, str]] = []
+        self._positions: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def push(self, item_id: str, key: Tuple) -> None:
+        """Eleman ekle (varsa anahtarini guncelle)."""
+        if item_id in self._positions:
+            self.update(item_id, key)
+            return
+        self._heap.append((key, item_id))
+        self._positions[item_id] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def update(self, item_id: str, key: Tuple) -> bool:
+        """Elemanin anahtarini guncelle."""
+        pos = self._positions.get(item_id)
+        if pos is None:
+            return False
+        old_key = self._heap[pos][0]
+        self._heap[pos] = (key, item_id)
+        if key < old_key:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+        return True
+
+    def remove(self, item_id: str) -> bool:
+        """Elemani kaldir."""
+        pos = self._positions.pop(item_id, None)
+        if pos is None:
+            return False
+        last = self._heap.pop()
+        if pos < len(self._heap):
+            self._heap[pos] = last
+            self._positions[last[1]] = pos
+            self._sift_up(pos)
+            self._sift_down(self._positions[last[1]])
+        return True
+
+    def peek(self) -> Optional[str]:
+        """En kucuk anahtarli elemanin ID'si."""
+        return self._heap[0][1] if self._heap else None
+
+    def pop(self) -> Optional[str]:
+        """En kucuk anahtarli elemani cikar."""
+        item_id = self.peek()
+        if item_id is not None:
+            self.remove(item_id)
+        return item_id
+
+    def clear(self) -> None:
+        """Heap'i bosalt."""
+        self._heap.clear()
+        self._positions.clear()
+
+    def _swap(self, i: int, j: int) -> None:
+        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
+        self._positions[self._heap[i][1]] = i
+        self._positions[self._heap[j][1]] = j
+
+    def _sift_up(self, pos: int) -> None:
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if self._heap[pos][0] < self._heap[parent][0]:
+                self._swap(pos, parent)
+                pos = parent
+            else:
+                break
+
+    def _sift_down(self, pos: int) -> None:
+        size = len(self._heap)
+        while True:
+            smallest = pos
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < size and self._heap[child][0] < self._heap[smallest][0]:
+                    smallest = child
+            if smallest == pos:
+                break
+            self._swap(pos, smallest)
+            pos = smallest
+
+
 # ============================================================================
 # GLOBAL WORKSPACE
 # ============================================================================
@@ -122,6 +225,16 @@ class GlobalWorkspace:
         # Cycle sayaci
         self._cycle_count = 0
 
+        # Yarisma indeksleri (competition_score uzerinde)
+        # - _min_heap: tum aktif icerikler, tahliye icin en dusuk skor
+        # - _pending_heap: PENDING icerikler, kazanan secimi icin en yuksek skor
+        # - _expiry_heap: (bitis zamani, id) - lazy TTL temizligi
+        self._min_heap = ContentHeap()
+        self._pending_heap = ContentHeap()
+        self._expiry_heap: List[Tuple[datetime, int, str]] = []
+        self._sequence = itertools.count()
+        self._content_seq: Dict[str, int] = {}
+
         # Istatistikler
         self._stats = {
             "contents_submitted": 0,
@@ -176,12 +289,16 @@ class GlobalWorkspace:
             ttl_ms=ttl_ms or self.config.content_ttl_ms,
         )
 
+        # Suresi dolmus icerikleri once temizle (lazy TTL)
+        self._expire_contents()
+
         # Kapasite kontrolu
         if len(self.state.active_contents) >= self.config.max_active_contents:
             # En dusuk skorlu icerigi kaldir
             self._remove_lowest_content()
 
         self.state.add_content(content)
+        self._index_content(content)
         self._stats["contents_submitted"] += 1
 
         # Catisma kontrolu
@@ -192,15 +309,95 @@ class GlobalWorkspace:
 
     def _remove_lowest_content(self) -> Optional[str]:
         """En dusuk skorlu icerigi kaldir."""
-        if not self.state.active_contents:
-            return None
+        while self._min_heap:
+            lowest_id = self._min_heap.peek()
+            if lowest_id in self.state.active_contents:
+                self.remove_content(lowest_id)
+                return lowest_id
+            # Disaridan kaldirilmis - indeksi temizle
+            self._unindex_content(lowest_id)
+        return None
+
+    def remove_content(self, content_id: str) -> Optional[WorkspaceContent]:
+        """
+        Icerigi workspace'ten ve yarisma indekslerinden kaldir.
 
-        lowest = min(
-            self.state.active_contents.values(),
-            key=lambda c: c.competition_score,
-        )
-        self.state.remove_content(lowest.id)
-        return lowest.id
+        Args:
+            content_id: Icerik ID
+
+        Returns:
+            Kaldirilan icerik veya None
+        """
+        self._unindex_content(content_id)
+        return self.state.remove_content(content_id)
+
+    def refresh_content(self, content_id: str) -> bool:
+        """
+        Icerigin yarisma indekslerini guncelle.
+
+        relevance/urgency/novelty/priority veya status disaridan
+        degistirildiginde cagrilmali.
+
+        Args:
+            content_id: Icerik ID
+
+        Returns:
+            Icerik bulundu mu
+        """
+        content = self.state.get_content(content_id)
+        if not content:
+            return False
+        self._index_content(content)
+        return True
+
+    # ========================================================================
+    # CONTENT INDEX
+    # ========================================================================
+
+    def _index_content(self, content: WorkspaceContent) -> None:
+        """Icerigi heap'lere ekle veya anahtarini guncelle."""
+        seq = self._content_seq.get(content.id)
+        if seq is None:
+            seq = next(self._sequence)
+            self._content_seq[content.id] = seq
+            expires_at = content.created_at + timedelta(milliseconds=content.ttl_ms)
+            heapq.heappush(self._expiry_heap, (expires_at, seq, content.id))
+
+        score = content.competition_score
+        # Esit skorda once eklenen icerik secilir (min/max ile ayni davranis)
+        self._min_heap.push(content.id, (score, seq))
+        if content.status == IntegrationStatus.PENDING:
+            self._pending_heap.push(content.id, (-score, seq))
+        else:
+            self._pending_heap.remove(content.id)
+
+    def _unindex_content(self, content_id: str) -> None:
+        """Icerigi heap'lerden kaldir (expiry heap lazy temizlenir)."""
+        self._min_heap.remove(content_id)
+        self._pending_heap.remove(content_id)
+        self._content_seq.pop(content_id, None)
+
+    def _expire_contents(self, now: Optional[datetime] = None) -> int:
+        """
+        Suresi dolmus icerikleri expiry heap'inden cikar.
+
+        Sadece suresi gecmis kayitlara dokunur; kaldirilmis iceriklere ait
+        eski kayitlar burada atlanir.
+
+        Returns:
+            Kaldirilan icerik sayisi
+        """
+        now = now or datetime.now()
+        expired = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, seq, content_id = heapq.heappop(self._expiry_heap)
+            if self._content_seq.get(content_id) != seq:
+                continue  # Eski kayit
+            if self.remove_content(content_id) is not None:
+                expired += 1
+        if expired:
+            self._stats["contents_expired"] += expired
+        return expired
 
     # ========================================================================
     # COMPETITION
@@ -213,21 +410,28 @@ class GlobalWorkspace:
         Returns:
             Kazanan icerik veya None
         """
-        # Henuz entegre olmamis icerikleri al
-        candidates = [
-            c for c in self.state.active_contents.values()
-            if c.status == IntegrationStatus.PENDING
-            and c.competition_score >= self.config.competition_threshold
-        ]
+        self._expire_contents()
+
+        # Henuz entegre olmamis en yuksek skorlu icerik
+        winner = None
+        while self._pending_heap:
+            candidate_id = self._pending_heap.peek()
+            candidate = self.state.get_content(candidate_id)
+            if candidate is None:
+                self._unindex_content(candidate_id)
+                continue
+            if candidate.status != IntegrationStatus.PENDING:
+                self._pending_heap.remove(candidate_id)
+                continue
+            winner = candidate
+            break
 
-        if not candidates:
+        if winner is None or winner.competition_score < self.config.competition_threshold:
             return None
 
-        # En yuksek skorlu icerik
-        winner = max(candidates, key=lambda c: c.competition_score)
-
         # Kazanana bonus
         winner.relevance = min(1.0, winner.relevance + self.config.winner_boost)
+        self._index_content(winner)
 
         return winner
 
@@ -270,6 +474,7 @@ class GlobalWorkspace:
         self._link_related_contents(content)
 
         content.mark_integrated(integration_score)
+        self._index_content(content)
         self._stats["contents_integrated"] += 1
 
         # Yayin kuyuguna ekle
@@ -389,6 +594,7 @@ class GlobalWorkspace:
 
         # Yayin sonrasi decay
         content.relevance = max(0.0, content.relevance - self.config.broadcast_decay)
+        self._index_content(content)
 
         self.state.last_broadcast = datetime.now()
 
@@ -525,8 +731,7 @@ class GlobalWorkspace:
         Returns:
             Temizlik raporu
         """
-        expired = self.state.cleanup_expired()
-        self._stats["contents_expired"] += expired
+        expired = self._expire_contents()
 
         return {
             "expired_removed": expired,
@@ -640,6 +845,7 @@ def create_global_workspace(
 __all__ = [
     "GlobalWorkspaceConfig",
     "BroadcastListener",
+    "ContentHeap",
     "GlobalWorkspace",
     "create_global_workspace",
 ]
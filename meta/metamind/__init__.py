@@ -10,6 +10,7 @@ Alt Moduller:
     - insights: Ogrenilen dersler ("Ne ogrendim?")
     - patterns: Kalip tespiti ("Tekrarlayan kalipler var mi?")
     - learning: Ogrenme yonetimi ("Nasil gelistebilirim?")
+    - rolling: Kayan pencere istatistikleri (analyzers/patterns ortak)
 
 Kullanim:
     from meta.metamind import MetaMindProcessor, create_metamind_processor
@@ -50,6 +51,12 @@ from .types import (
     MetaState,
 )
 
+# Rolling statistics
+from .rolling import (
+    RollingWindow,
+    RollingSeries,
+)
+
 # Analyzers
 from .analyzers import (
     AnalyzerConfig,
@@ -87,6 +94,7 @@ from .learning import (
 from .processor import (
     MetaMindConfig,
     MetaMindOutput,
+    MetaMindSnapshot,
     MetaMindProcessor,
     create_metamind_processor,
     get_metamind_processor,
@@ -107,6 +115,9 @@ __all__ = [
     "Pattern",
     "LearningGoal",
     "MetaState",
+    # Rolling statistics
+    "RollingWindow",
+    "RollingSeries",
     # Analyzers
     "AnalyzerConfig",
     "CycleAnalyzer",
@@ -131,6 +142,7 @@ __all__ = [
     # Processor
     "MetaMindConfig",
     "MetaMindOutput",
+    "MetaMindSnapshot",
     "MetaMindProcessor",
     "create_metamind_processor",
     "get_metamind_processor",
@@ -4,11 +4,12 @@ UEM v2 - MetaMind Analyzers
 Cycle performans analizi: "Bu cycle nasil gitti?"
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from datetime import datetime
-import statistics
 
+from .rolling import RollingSeries
 from .types import (
     CycleAnalysisResult,
     AnalysisScope,
@@ -48,6 +49,9 @@ class AnalyzerConfig:
     # Gecmis tutma
     max_history: int = 1000                  # Max analiz sonucu
 
+    # Kayan istatistikler
+    ewma_alpha: float = 0.1                  # Sure EWMA katsayisi
+
 
 # ============================================================================
 # CYCLE ANALYZER
@@ -70,11 +74,19 @@ class CycleAnalyzer:
         self.config = config or AnalyzerConfig()
 
         # Analiz sonuclari gecmisi
-        self._analysis_history: List[CycleAnalysisResult] = []
+        self._analysis_history: Deque[CycleAnalysisResult] = deque(
+            maxlen=self.config.max_history
+        )
 
-        # Istatistikler
-        self._duration_history: List[float] = []
-        self._phase_histories: Dict[str, List[float]] = {}
+        # Kayan istatistikler (pencere basina artimli toplamlar)
+        self._duration_history = RollingSeries(
+            self.config.max_history,
+            ewma_alpha=self.config.ewma_alpha,
+            track_quantiles=True,
+        )
+        self._success_history = RollingSeries(self.config.max_history)
+        self._anomaly_history = RollingSeries(self.config.max_history)
+        self._phase_histories: Dict[str, RollingSeries] = {}
 
         # Sayaclar
         self._cycles_analyzed = 0
@@ -185,7 +197,7 @@ class CycleAnalyzer:
         if len(self._duration_history) < self.config.min_samples_for_anomaly:
             return None
 
-        avg = statistics.mean(self._duration_history[-self.config.comparison_window:])
+        avg = self._duration_history.window(self.config.comparison_window).mean
         if avg == 0:
             return None
 
@@ -196,7 +208,7 @@ class CycleAnalyzer:
         if not self._duration_history:
             return None
 
-        prev = self._duration_history[-1]
+        prev = self._duration_history.last
         if prev == 0:
             return None
 
@@ -228,9 +240,9 @@ class CycleAnalyzer:
 
         # Istatistiksel anomali
         if len(self._duration_history) >= self.config.min_samples_for_anomaly:
-            recent = self._duration_history[-self.config.comparison_window:]
-            mean = statistics.mean(recent)
-            stdev = statistics.stdev(recent) if len(recent) > 1 else 0
+            recent = self._duration_history.window(self.config.comparison_window)
+            mean = recent.mean
+            stdev = recent.stdev if len(recent) > 1 else 0
 
             if stdev > 0:
                 z_score = (duration_ms - mean) / stdev
@@ -255,23 +267,19 @@ class CycleAnalyzer:
 
     def _update_history(self, result: CycleAnalysisResult) -> None:
         """Gecmisi guncelle."""
-        # Ana sure gecmisi
-        self._duration_history.append(result.total_duration_ms)
-        if len(self._duration_history) > self.config.max_history:
-            self._duration_history.pop(0)
+        # Ana sure gecmisi ve basari/anomali bayraklari (pencereler O(1) guncellenir)
+        self._duration_history.push(result.total_duration_ms)
+        self._success_history.push(1.0 if result.success else 0.0)
+        self._anomaly_history.push(1.0 if result.is_anomaly else 0.0)
 
         # Phase gecmisleri
         for phase, duration in result.phase_durations.items():
             if phase not in self._phase_histories:
-                self._phase_histories[phase] = []
-            self._phase_histories[phase].append(duration)
-            if len(self._phase_histories[phase]) > self.config.max_history:
-                self._phase_histories[phase].pop(0)
+                self._phase_histories[phase] = RollingSeries(self.config.max_history)
+            self._phase_histories[phase].push(duration)
 
         # Analiz sonucu gecmisi
         self._analysis_history.append(result)
-        if len(self._analysis_history) > self.config.max_history:
-            self._analysis_history.pop(0)
 
     # ========================================================================
     # AGGREGATE ANALYSIS
@@ -298,11 +306,9 @@ class CycleAnalyzer:
         elif scope == AnalysisScope.MEDIUM_TERM:
             n = 100
         else:  # LONG_TERM
-            n = len(self._duration_history)
+            n = 0  # Tum gecmis (max_size penceresi)
 
-        recent = self._duration_history[-n:] if self._duration_history else []
-
-        if not recent:
+        if not self._duration_history:
             return {
                 "scope": scope.value,
                 "sample_count": 0,
@@ -310,24 +316,31 @@ class CycleAnalyzer:
                 "min_duration_ms": 0,
                 "max_duration_ms": 0,
                 "std_deviation_ms": 0,
+                "p50_duration_ms": 0,
+                "p95_duration_ms": 0,
+                "ewma_duration_ms": 0,
                 "success_rate": 0,
                 "anomaly_rate": 0,
             }
 
-        # Basari orani
-        recent_results = self._analysis_history[-n:] if self._analysis_history else []
-        success_count = sum(1 for r in recent_results if r.success)
-        anomaly_count = sum(1 for r in recent_results if r.is_anomaly)
+        recent = self._duration_history.window(n)
+
+        # Basari/anomali oranlari: bayrak pencerelerinin toplami
+        successes = self._success_history.window(n)
+        anomalies = self._anomaly_history.window(n)
 
         return {
             "scope": scope.value,
             "sample_count": len(recent),
-            "average_duration_ms": statistics.mean(recent),
-            "min_duration_ms": min(recent),
-            "max_duration_ms": max(recent),
-            "std_deviation_ms": statistics.stdev(recent) if len(recent) > 1 else 0,
-            "success_rate": success_count / len(recent_results) if recent_results else 1.0,
-            "anomaly_rate": anomaly_count / len(recent_results) if recent_results else 0.0,
+            "average_duration_ms": recent.mean,
+            "min_duration_ms": recent.min,
+            "max_duration_ms": recent.max,
+            "std_deviation_ms": recent.stdev if len(recent) > 1 else 0,
+            "p50_duration_ms": recent.quantile(0.5),
+            "p95_duration_ms": recent.quantile(0.95),
+            "ewma_duration_ms": self._duration_history.ewma,
+            "success_rate": successes.sum / len(successes) if len(successes) else 1.0,
+            "anomaly_rate": anomalies.sum / len(anomalies) if len(anomalies) else 0.0,
         }
 
     def get_phase_stats(
@@ -348,15 +361,16 @@ class CycleAnalyzer:
         if phase_name not in self._phase_histories:
             return {}
 
-        recent = self._phase_histories[phase_name][-n:]
-        if not recent:
+        history = self._phase_histories[phase_name]
+        if not history:
             return {}
 
+        recent = history.window(n)
         return {
-            "average_ms": statistics.mean(recent),
-            "min_ms": min(recent),
-            "max_ms": max(recent),
-            "std_ms": statistics.stdev(recent) if len(recent) > 1 else 0,
+            "average_ms": recent.mean,
+            "min_ms": recent.min,
+            "max_ms": recent.max,
+            "std_ms": recent.stdev if len(recent) > 1 else 0,
             "sample_count": len(recent),
         }
 
@@ -365,7 +379,7 @@ class CycleAnalyzer:
         phase_avgs = []
         for phase, durations in self._phase_histories.items():
             if durations:
-                avg = statistics.mean(durations[-100:])
+                avg = durations.window(100).mean
                 phase_avgs.append((phase, avg))
 
         return sorted(phase_avgs, key=lambda x: x[1], reverse=True)[:n]
@@ -389,19 +403,19 @@ class CycleAnalyzer:
         Returns:
             Trend analizi
         """
-        if len(self._duration_history) < window:
+        if window < 2 or len(self._duration_history) < window:
             return {
                 "trend": "insufficient_data",
                 "direction": 0,
                 "slope": 0,
             }
 
-        recent = self._duration_history[-window:]
-        first_half = recent[:window // 2]
-        second_half = recent[window // 2:]
+        # Ilk yari = son `window` - son `window - window // 2`
+        recent = self._duration_history.window(window)
+        second_half = self._duration_history.window(window - window // 2)
 
-        avg_first = statistics.mean(first_half)
-        avg_second = statistics.mean(second_half)
+        avg_first = (recent.sum - second_half.sum) / (window // 2)
+        avg_second = second_half.mean
 
         # Trend yonu
         if avg_second < avg_first * 0.95:
@@ -457,6 +471,8 @@ class CycleAnalyzer:
         """Tum gecmisi temizle."""
         self._analysis_history.clear()
         self._duration_history.clear()
+        self._success_history.clear()
+        self._anomaly_history.clear()
         self._phase_histories.clear()
         self._cycles_analyzed = 0
         self._anomalies_detected = 0
@@ -4,11 +4,12 @@ UEM v2 - MetaMind Patterns
 Kalip tespiti: "Tekrarlayan kalipler var mi?"
 """
 
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
-import statistics
 
+from .rolling import RollingSeries, RollingWindow
 from .types import (
     Pattern,
     PatternType,
@@ -43,6 +44,9 @@ class PatternDetectorConfig:
     pattern_max_age_hours: int = 48            # Max yas
     max_patterns: int = 50                     # Max kalip sayisi
 
+    # Darbogaz: phase, cycle suresinin bu oranini asarsa darbogaz sayilir
+    bottleneck_share: float = 0.4
+
 
 # ============================================================================
 # PATTERN DETECTOR
@@ -67,10 +71,25 @@ class PatternDetector:
         # Tespit edilen kalipler
         self._patterns: Dict[str, Pattern] = {}
 
-        # Veri gecmisleri
-        self._duration_history: List[Tuple[int, float]] = []  # (cycle_id, duration)
-        self._phase_histories: Dict[str, List[Tuple[int, float]]] = {}
-        self._anomaly_history: List[Tuple[int, str]] = []  # (cycle_id, reason)
+        config = self.config
+        history_size = max(
+            config.long_window, config.medium_window,
+            config.short_window, config.min_stability_samples,
+        )
+
+        # Veri gecmisleri (kayan pencereler, cycle basina O(1) guncelleme)
+        self._duration_history = RollingSeries(history_size)
+        self._last_cycle_id: Optional[int] = None
+        self._phase_histories: Dict[str, RollingSeries] = {}
+        self._anomaly_history: Deque[Tuple[int, str]] = deque(maxlen=config.long_window)
+        self._anomaly_reasons: Counter = Counter()
+
+        # Son short_window cycle'da darbogaz olan phase'ler ve sayilari
+        self._bottleneck_window: Deque[FrozenSet[str]] = deque(maxlen=config.short_window)
+        self._bottleneck_counts: Counter = Counter()
+
+        # Salinti: ic noktalarin tepe/cukur bayraklari (son short_window deger)
+        self._turn_flags = RollingWindow(max(1, config.short_window - 2))
 
         # Sayaclar
         self._patterns_detected = 0
@@ -144,24 +163,42 @@ class PatternDetector:
 
     def _update_histories(self, analysis: CycleAnalysisResult) -> None:
         """Gecmisleri guncelle."""
+        duration = analysis.total_duration_ms
+
+        # Salinti bayragi: onceki deger yeni degere gore tepe/cukur mu?
+        if len(self._duration_history) >= 2:
+            before, middle = self._duration_history.values(2)
+            turned = (middle > before and middle > duration) or \
+                     (middle < before and middle < duration)
+            self._turn_flags.push(1.0 if turned else 0.0)
+
         # Duration history
-        self._duration_history.append((analysis.cycle_id, analysis.total_duration_ms))
-        if len(self._duration_history) > self.config.long_window * 2:
-            self._duration_history = self._duration_history[-self.config.long_window:]
+        self._duration_history.push(duration)
+        self._last_cycle_id = analysis.cycle_id
 
         # Phase histories
-        for phase, duration in analysis.phase_durations.items():
+        for phase, phase_duration in analysis.phase_durations.items():
             if phase not in self._phase_histories:
-                self._phase_histories[phase] = []
-            self._phase_histories[phase].append((analysis.cycle_id, duration))
-            if len(self._phase_histories[phase]) > self.config.long_window:
-                self._phase_histories[phase] = self._phase_histories[phase][-self.config.long_window:]
+                self._phase_histories[phase] = RollingSeries(self.config.long_window)
+            self._phase_histories[phase].push(phase_duration)
+
+        # Darbogaz penceresi
+        bottlenecks = frozenset(
+            phase for phase, phase_duration in analysis.phase_durations.items()
+            if duration > 0 and phase_duration / duration > self.config.bottleneck_share
+        )
+        if len(self._bottleneck_window) == self._bottleneck_window.maxlen:
+            self._bottleneck_counts.subtract(self._bottleneck_window[0])
+        self._bottleneck_window.append(bottlenecks)
+        self._bottleneck_counts.update(bottlenecks)
 
         # Anomaly history
         if analysis.is_anomaly:
-            self._anomaly_history.append((analysis.cycle_id, analysis.anomaly_reason or "unknown"))
-            if len(self._anomaly_history) > self.config.long_window:
-                self._anomaly_history = self._anomaly_history[-self.config.long_window:]
+            if len(self._anomaly_history) == self._anomaly_history.maxlen:
+                self._anomaly_reasons[self._anomaly_history[0][1]] -= 1
+            reason = analysis.anomaly_reason or "unknown"
+            self._anomaly_history.append((analysis.cycle_id, reason))
+            self._anomaly_reasons[reason] += 1
 
     # ========================================================================
     # SPIKE DETECTION
@@ -172,11 +209,11 @@ class PatternDetector:
         if len(self._duration_history) < self.config.min_occurrences:
             return None
 
-        recent = [d for _, d in self._duration_history[-self.config.short_window:]]
-        if not recent:
+        recent = self._duration_history.window(self.config.short_window)
+        if not len(recent):
             return None
 
-        avg = statistics.mean(recent)
+        avg = recent.mean
         if avg == 0:
             return None
 
@@ -219,7 +256,7 @@ class PatternDetector:
 
         # Ayni nedenden kac anomali var?
         reason = analysis.anomaly_reason
-        similar_count = sum(1 for _, r in self._anomaly_history if r == reason)
+        similar_count = self._anomaly_reasons[reason]
 
         if similar_count >= self.config.min_occurrences:
             pattern_key = f"recurring_anomaly_{hash(reason) % 10000}"
@@ -263,23 +300,11 @@ class PatternDetector:
         if len(phase_data) < self.config.min_occurrences:
             return None
 
-        # Bu phase kac kez en yavas oldu?
-        # Son N cycle'da kontrol et
-        recent_analyses = self._duration_history[-self.config.short_window:]
-        bottleneck_count = 0
+        # Bu phase son N cycle'in kacinda sureyi domine etti? (%40+)
+        recent_count = len(self._bottleneck_window)
+        bottleneck_count = self._bottleneck_counts[phase]
 
-        for cycle_id, _ in recent_analyses:
-            # Bu cycle icin phase verisi var mi?
-            phase_dur = next((d for cid, d in phase_data if cid == cycle_id), None)
-            if phase_dur is None:
-                continue
-
-            # Toplam sure icin diger phase'leri de kontrol et
-            total_dur = next((d for cid, d in self._duration_history if cid == cycle_id), 0)
-            if total_dur > 0 and phase_dur / total_dur > 0.4:  # %40+
-                bottleneck_count += 1
-
-        frequency = bottleneck_count / len(recent_analyses) if recent_analyses else 0
+        frequency = bottleneck_count / recent_count if recent_count else 0
 
         if frequency >= self.config.recurrence_threshold:
             pattern_key = f"bottleneck_{phase}"
@@ -289,7 +314,7 @@ class PatternDetector:
                 self._patterns[pattern_key].update_occurrence(analysis.cycle_id)
                 return None
             else:
-                avg_phase_dur = statistics.mean([d for _, d in phase_data[-self.config.short_window:]])
+                avg_phase_dur = phase_data.window(self.config.short_window).mean
 
                 pattern = Pattern(
                     pattern_type=PatternType.RECURRING,
@@ -316,15 +341,15 @@ class PatternDetector:
         if len(self._duration_history) < self.config.medium_window:
             return None
 
-        recent = self._duration_history[-self.config.medium_window:]
-        first_half = [d for _, d in recent[:len(recent)//2]]
-        second_half = [d for _, d in recent[len(recent)//2:]]
-
-        if not first_half or not second_half:
+        recent = self._duration_history.window(self.config.medium_window)
+        half = len(recent) // 2
+        if half == 0:
             return None
 
-        avg_first = statistics.mean(first_half)
-        avg_second = statistics.mean(second_half)
+        # Ilk yari = pencere toplami - ikinci yari toplami
+        second_half = self._duration_history.window(len(recent) - half)
+        avg_first = (recent.sum - second_half.sum) / half
+        avg_second = second_half.mean
 
         if avg_first == 0:
             return None
@@ -349,7 +374,7 @@ class PatternDetector:
         # Ayni trend zaten var mi?
         if pattern_key in self._patterns:
             self._patterns[pattern_key].average_impact = change_percent
-            cycle_id = recent[-1][0]
+            cycle_id = self._last_cycle_id
             self._patterns[pattern_key].update_occurrence(cycle_id, change_percent)
             return None
         else:
@@ -362,7 +387,7 @@ class PatternDetector:
                 confidence=0.75,
                 stability=0.6,
             )
-            cycle_id = recent[-1][0]
+            cycle_id = self._last_cycle_id
             pattern.update_occurrence(cycle_id, change_percent)
 
             self._register_pattern(pattern, pattern_key)
@@ -377,14 +402,10 @@ class PatternDetector:
         if len(self._duration_history) < self.config.short_window:
             return None
 
-        recent = [d for _, d in self._duration_history[-self.config.short_window:]]
+        recent = self._duration_history.window(self.config.short_window)
 
-        # Yon degisimi say
-        direction_changes = 0
-        for i in range(1, len(recent) - 1):
-            if (recent[i] > recent[i-1] and recent[i] > recent[i+1]) or \
-               (recent[i] < recent[i-1] and recent[i] < recent[i+1]):
-                direction_changes += 1
+        # Yon degisimi: son short_window degerin ic noktalarindaki tepe/cukur sayisi
+        direction_changes = self._turn_flags.sum
 
         # Cok fazla yon degisimi = oscillation
         oscillation_rate = direction_changes / (len(recent) - 2) if len(recent) > 2 else 0
@@ -394,12 +415,12 @@ class PatternDetector:
 
             if pattern_key in self._patterns:
                 self._patterns[pattern_key].frequency = oscillation_rate
-                cycle_id = self._duration_history[-1][0]
+                cycle_id = self._last_cycle_id
                 self._patterns[pattern_key].update_occurrence(cycle_id)
                 return None
             else:
-                avg = statistics.mean(recent)
-                stdev = statistics.stdev(recent) if len(recent) > 1 else 0
+                avg = recent.mean
+                stdev = recent.stdev if len(recent) > 1 else 0
 
                 pattern = Pattern(
                     pattern_type=PatternType.OSCILLATION,
@@ -410,7 +431,7 @@ class PatternDetector:
                     frequency=oscillation_rate,
                     confidence=0.7,
                 )
-                cycle_id = self._duration_history[-1][0]
+                cycle_id = self._last_cycle_id
                 pattern.update_occurrence(cycle_id, stdev)
 
                 self._register_pattern(pattern, pattern_key)
@@ -427,13 +448,13 @@ class PatternDetector:
         if len(self._duration_history) < self.config.min_stability_samples:
             return None
 
-        recent = [d for _, d in self._duration_history[-self.config.min_stability_samples:]]
+        recent = self._duration_history.window(self.config.min_stability_samples)
 
-        avg = statistics.mean(recent)
+        avg = recent.mean
         if avg == 0:
             return None
 
-        stdev = statistics.stdev(recent) if len(recent) > 1 else 0
+        stdev = recent.stdev if len(recent) > 1 else 0
         cv = stdev / avg  # Coefficient of variation
 
         # Dusuk CV = yuksek kararlilik
@@ -444,7 +465,7 @@ class PatternDetector:
 
             if pattern_key in self._patterns:
                 self._patterns[pattern_key].stability = stability
-                cycle_id = self._duration_history[-1][0]
+                cycle_id = self._last_cycle_id
                 self._patterns[pattern_key].update_occurrence(cycle_id)
                 return None
             else:
@@ -457,7 +478,7 @@ class PatternDetector:
                     stability=stability,
                     confidence=0.85,
                 )
-                cycle_id = self._duration_history[-1][0]
+                cycle_id = self._last_cycle_id
                 pattern.update_occurrence(cycle_id, stability)
 
                 self._register_pattern(pattern, pattern_key)
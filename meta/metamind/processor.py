@@ -2,11 +2,24 @@
 UEM v2 - MetaMind Processor
 
 Meta-bilissel islemci - tum alt modulleri koordine eder.
+
+Arka plan modu (MetaMindConfig.background=True, start() ile):
+cycle tarafi submit() ile sadece cycle metriklerini kuyruga birakir
+(deque.append, kilit yok) ve hemen doner; analiz, insight, pattern ve
+ogrenme adimlari tek bir worker thread'inde yurutulur. Worker geride
+kalirsa (kuyruk > coalesce_threshold) eski cycle'lar hafif yoldan
+(analiz + pattern + metrik takibi) gecirilir, insight/adaptasyon sadece
+en yeni cycle icin calisir. Son durum get_snapshot() ile okunur.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Deque, Dict, List, Optional, Callable, Tuple
 from datetime import datetime
+import itertools
+import logging
+import threading
+import time
 
 from .types import (
     MetaState,
@@ -25,6 +38,8 @@ from .insights import InsightGenerator, InsightGeneratorConfig
 from .patterns import PatternDetector, PatternDetectorConfig
 from .learning import LearningManager, LearningManagerConfig, AdaptationStrategy
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # CONFIGURATION
@@ -53,6 +68,12 @@ class MetaMindConfig:
     log_insights: bool = False                 # Insight'lari logla
     emit_events: bool = True                   # Event yayinla
 
+    # Arka plan isleme (start() ile baslar, False = submit() senkron isler)
+    background: bool = False
+    queue_size: int = 1024                     # Bekleyen cycle limiti (dolunca en eski duser)
+    coalesce_threshold: int = 8                # Bu backlog ustunde eski cycle'lar birlestirilir
+    stop_timeout_s: float = 5.0                # stop() icin bekleme suresi
+
 
 # ============================================================================
 # METAMIND OUTPUT
@@ -103,6 +124,59 @@ class MetaMindOutput:
         }
 
 
+@dataclass(frozen=True)
+class MetaMindSnapshot:
+    """
+    MetaMind'in yayinlanan son durumu.
+
+    Worker her islenen cycle'dan sonra yeni bir snapshot olusturup
+    referansini degistirir; okuyucular kilit almadan tutarli bir gorunum
+    alir. Icerdigi nesneler salt okunur kabul edilmelidir.
+    """
+    cycle_id: int = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+    state: MetaStateType = MetaStateType.IDLE
+    system_health: float = 1.0
+    performance_score: float = 0.0
+    insights: Tuple[Insight, ...] = ()
+    patterns: Tuple[Pattern, ...] = ()
+    goals: Tuple[LearningGoal, ...] = ()
+    suggested_adaptation: Optional[AdaptationStrategy] = None
+    last_output: Optional[MetaMindOutput] = None
+    cycles_processed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary'ye donustur."""
+        return {
+            "cycle_id": self.cycle_id,
+            "timestamp": self.timestamp.isoformat(),
+            "state": self.state.value,
+            "system_health": self.system_health,
+            "performance_score": self.performance_score,
+            "insights": len(self.insights),
+            "patterns": len(self.patterns),
+            "goals": len(self.goals),
+            "has_adaptation": self.suggested_adaptation is not None,
+            "cycles_processed": self.cycles_processed,
+        }
+
+
+@dataclass
+class _CycleSample:
+    """Kuyruktaki tek cycle verisi."""
+    seq: int
+    enqueued_at: float
+    cycle_id: int
+    duration_ms: float
+    phase_durations: Dict[str, float]
+    success: bool = True
+    failed_phases: Optional[List[str]] = None
+    memory_retrievals: int = 0
+    memory_stores: int = 0
+    events_processed: int = 0
+    additional_data: Optional[Dict[str, Any]] = None
+
+
 # ============================================================================
 # METAMIND PROCESSOR
 # ============================================================================
@@ -116,6 +190,10 @@ class MetaMindProcessor:
     - InsightGenerator: "Ne ogrendim?"
     - PatternDetector: "Tekrarlayan kalipler var mi?"
     - LearningManager: "Nasil gelistebilirim?"
+
+    process() cagiran thread'de senkron calisir. Arka plan modunda
+    submit() kullanilir; worker calisirken alt modullerin getter'lari
+    yerine get_snapshot() okunmalidir.
     """
 
     def __init__(self, config: Optional[MetaMindConfig] = None):
@@ -151,6 +229,27 @@ class MetaMindProcessor:
             "adaptations_suggested": 0,
         }
 
+        # Arka plan kuyrugu: uretici sadece append yapar, worker popleft
+        self._pending: Deque[_CycleSample] = deque(maxlen=max(1, self.config.queue_size))
+        self._seq = itertools.count(1)
+        self._last_seq = 0
+        self._done_seq = 0
+        self._wakeup = threading.Event()
+        self._done = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._snapshot = MetaMindSnapshot()
+        self._last_output: Optional[MetaMindOutput] = None
+        self._dropped = 0
+        self._bg_stats = {
+            "processed": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "max_queue_depth": 0,
+        }
+        self._lag_total_ms = 0.0
+        self._lag_max_ms = 0.0
+
     # ========================================================================
     # MAIN PROCESSING
     # ========================================================================
@@ -184,16 +283,9 @@ class MetaMindProcessor:
         Returns:
             MetaMindOutput
         """
-        start_time = datetime.now()
-        self._cycle_count += 1
-        self._stats["process_calls"] += 1
-
-        # Durum guncelle
-        self._state.state_type = MetaStateType.ANALYZING
-        self._state.timestamp = datetime.now()
-
-        # 1. Cycle analizi
-        analysis = self.analyzer.analyze_cycle(
+        return self._process_sample(_CycleSample(
+            seq=0,
+            enqueued_at=time.monotonic(),
             cycle_id=cycle_id,
             duration_ms=duration_ms,
             phase_durations=phase_durations,
@@ -202,6 +294,26 @@ class MetaMindProcessor:
             memory_retrievals=memory_retrievals,
             memory_stores=memory_stores,
             events_processed=events_processed,
+            additional_data=additional_data,
+        ))
+
+    def _analyze(self, sample: _CycleSample) -> CycleAnalysisResult:
+        """Cycle analizi ve gecmis guncellemesi (adim 1)."""
+        self._cycle_count += 1
+
+        # Durum guncelle
+        self._state.state_type = MetaStateType.ANALYZING
+        self._state.timestamp = datetime.now()
+
+        analysis = self.analyzer.analyze_cycle(
+            cycle_id=sample.cycle_id,
+            duration_ms=sample.duration_ms,
+            phase_durations=sample.phase_durations,
+            success=sample.success,
+            failed_phases=sample.failed_phases,
+            memory_retrievals=sample.memory_retrievals,
+            memory_stores=sample.memory_stores,
+            events_processed=sample.events_processed,
         )
 
         # Gecmise ekle
@@ -210,7 +322,38 @@ class MetaMindProcessor:
             self._analysis_history = self._analysis_history[-500:]
 
         self._state.cycles_analyzed += 1
-        self._state.last_analysis_cycle = cycle_id
+        self._state.last_analysis_cycle = sample.cycle_id
+        return analysis
+
+    def _absorb(self, sample: _CycleSample) -> List[Pattern]:
+        """
+        Birlestirilen cycle icin hafif yol.
+
+        Analiz, pattern tespiti ve metrik takibi yapilir; insight ve
+        adaptasyon onerisi atlanir. Yeni pattern'ler bir sonraki tam
+        isleme tasinir.
+        """
+        analysis = self._analyze(sample)
+        new_patterns: List[Pattern] = []
+        if self.config.detect_patterns:
+            new_patterns = self.patterns.process_analysis(analysis)
+        if self.config.suggest_adaptations:
+            self.learning.track_analysis(analysis)
+        self._state.state_type = MetaStateType.MONITORING
+        return new_patterns
+
+    def _process_sample(
+        self,
+        sample: _CycleSample,
+        carried_patterns: Optional[List[Pattern]] = None,
+    ) -> MetaMindOutput:
+        """Tam isleme: analiz, insight, pattern, ogrenme."""
+        start_time = datetime.now()
+        self._stats["process_calls"] += 1
+        cycle_id = sample.cycle_id
+
+        # 1. Cycle analizi
+        analysis = self._analyze(sample)
 
         # 2. Insight uretimi
         new_insights = []
@@ -225,9 +368,9 @@ class MetaMindProcessor:
             self._stats["insights_generated"] += len(new_insights)
 
         # 3. Pattern tespiti
-        new_patterns = []
+        new_patterns = list(carried_patterns) if carried_patterns else []
         if self.config.detect_patterns:
-            new_patterns = self.patterns.process_analysis(analysis)
+            new_patterns.extend(self.patterns.process_analysis(analysis))
             self._state.patterns_detected = self.patterns._patterns_detected
             self._state.active_patterns_count = len(self.patterns.get_all_patterns())
             self._stats["patterns_detected"] += len(new_patterns)
@@ -285,6 +428,8 @@ class MetaMindProcessor:
             processing_time_ms=processing_time,
         )
 
+        self._last_output = output
+
         # Listener'lara bildir
         self._notify_listeners(output)
 
@@ -300,6 +445,10 @@ class MetaMindProcessor:
         Returns:
             MetaMindOutput
         """
+        return self.process(**self._metrics_kwargs(metrics))
+
+    def _metrics_kwargs(self, metrics: Any) -> Dict[str, Any]:
+        """CycleMetrics'ten process/submit argumanlari."""
         phase_durations = {}
         failed_phases = []
 
@@ -309,15 +458,224 @@ class MetaMindProcessor:
                 if not pm.success:
                     failed_phases.append(name)
 
-        return self.process(
-            cycle_id=getattr(metrics, "cycle_id", 0),
-            duration_ms=getattr(metrics, "total_duration_ms", 0.0),
+        return {
+            "cycle_id": getattr(metrics, "cycle_id", 0),
+            "duration_ms": getattr(metrics, "total_duration_ms", 0.0),
+            "phase_durations": phase_durations,
+            "success": getattr(metrics, "success", True),
+            "failed_phases": failed_phases,
+            "memory_retrievals": getattr(metrics, "memory_retrievals", 0),
+            "memory_stores": getattr(metrics, "memory_stores", 0),
+            "events_processed": getattr(metrics, "events_processed", 0),
+        }
+
+    # ========================================================================
+    # BACKGROUND PROCESSING
+    # ========================================================================
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Arka plan worker'ini baslat (config.background=False ise no-op)."""
+        if not self.config.background or self.running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="uem-metamind",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Kuyruktakileri isle ve worker'i durdur."""
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join(timeout=self.config.stop_timeout_s)
+        if self._thread.is_alive():
+            logger.warning("MetaMind worker did not stop in time")
+            return
+        self._thread = None
+        # Durma aninda kuyruga girenleri senkron isle
+        self._drain()
+
+    def submit(
+        self,
+        cycle_id: int,
+        duration_ms: float,
+        phase_durations: Dict[str, float],
+        success: bool = True,
+        failed_phases: Optional[List[str]] = None,
+        memory_retrievals: int = 0,
+        memory_stores: int = 0,
+        events_processed: int = 0,
+        additional_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[MetaMindOutput]:
+        """
+        Cycle verisini kuyruga birak (bloklamaz).
+
+        Worker calismiyorsa process() ile ayni sekilde senkron islenir.
+        Kuyruk doluysa en eski bekleyen cycle duser.
+
+        Args:
+            process() ile ayni
+
+        Returns:
+            Senkron islendiyse MetaMindOutput, kuyruga alindiysa None
+        """
+        sample = _CycleSample(
+            seq=next(self._seq),
+            enqueued_at=time.monotonic(),
+            cycle_id=cycle_id,
+            duration_ms=duration_ms,
             phase_durations=phase_durations,
-            success=getattr(metrics, "success", True),
+            success=success,
             failed_phases=failed_phases,
-            memory_retrievals=getattr(metrics, "memory_retrievals", 0),
-            memory_stores=getattr(metrics, "memory_stores", 0),
-            events_processed=getattr(metrics, "events_processed", 0),
+            memory_retrievals=memory_retrievals,
+            memory_stores=memory_stores,
+            events_processed=events_processed,
+            additional_data=additional_data,
+        )
+
+        self._last_seq = sample.seq
+        if not self.running:
+            output = self._process_sample(sample)
+            self._done_seq = sample.seq
+            return output
+
+        if len(self._pending) == self._pending.maxlen:
+            self._dropped += 1
+        self._pending.append(sample)
+        self._wakeup.set()
+        return None
+
+    def submit_from_metrics(self, metrics: Any) -> Optional[MetaMindOutput]:
+        """
+        CycleMetrics'i kuyruga birak.
+
+        Alanlar cagiran thread'de kopyalanir; metrics nesnesi sonradan
+        degisse de kuyruktaki veri etkilenmez.
+        """
+        return self.submit(**self._metrics_kwargs(metrics))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Su ana kadar submit edilen cycle'larin islenmesini bekle.
+
+        Args:
+            timeout: Maksimum bekleme (saniye, None = sinirsiz)
+
+        Returns:
+            Sure dolmadan islendi mi
+        """
+        target = self._last_seq
+        if not self.running:
+            self._drain()
+            return True
+        with self._done:
+            return self._done.wait_for(lambda: self._done_seq >= target, timeout)
+
+    def get_snapshot(self) -> MetaMindSnapshot:
+        """
+        Son MetaMind durumu.
+
+        Worker calisirken yayinlanan snapshot kilitsiz dondurulur;
+        calismiyorsa guncel durumdan olusturulur.
+        """
+        if self.running:
+            return self._snapshot
+        return self._build_snapshot()
+
+    def queue_depth(self) -> int:
+        """Bekleyen cycle sayisi."""
+        return len(self._pending)
+
+    def get_background_stats(self) -> Dict[str, Any]:
+        """Arka plan kuyrugu metrikleri."""
+        stats: Dict[str, Any] = dict(self._bg_stats)
+        handled = stats["processed"] + stats["coalesced"]
+        stats["submitted"] = self._last_seq
+        stats["dropped"] = self._dropped
+        stats["queue_depth"] = len(self._pending)
+        stats["lag_avg_ms"] = self._lag_total_ms / handled if handled else 0.0
+        stats["lag_max_ms"] = self._lag_max_ms
+        stats["running"] = self.running
+        return stats
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self._drain()
+            if self._stopping:
+                break
+
+    def _drain(self) -> None:
+        """Bekleyen cycle'lari isle; backlog buyukse birlestir."""
+        pending = self._pending
+        while pending:
+            backlog = len(pending)
+            if backlog > self._bg_stats["max_queue_depth"]:
+                self._bg_stats["max_queue_depth"] = backlog
+
+            if backlog <= self.config.coalesce_threshold:
+                self._handle(pending.popleft())
+                continue
+
+            # Geride kaldik: eskileri hafif yoldan gecir, en yeniyi tam isle
+            batch = [pending.popleft() for _ in range(backlog)]
+            carried: List[Pattern] = []
+            for sample in batch[:-1]:
+                try:
+                    carried.extend(self._absorb(sample))
+                except Exception as e:
+                    self._bg_stats["errors"] += 1
+                    logger.error(f"MetaMind failed on cycle {sample.cycle_id}: {e}")
+                self._bg_stats["coalesced"] += 1
+                self._record_lag(sample)
+            self._handle(batch[-1], carried)
+
+    def _handle(
+        self,
+        sample: _CycleSample,
+        carried_patterns: Optional[List[Pattern]] = None,
+    ) -> None:
+        try:
+            self._process_sample(sample, carried_patterns)
+        except Exception as e:
+            self._bg_stats["errors"] += 1
+            logger.error(f"MetaMind failed on cycle {sample.cycle_id}: {e}")
+        self._bg_stats["processed"] += 1
+        self._record_lag(sample)
+        self._snapshot = self._build_snapshot()
+
+        with self._done:
+            self._done_seq = sample.seq
+            self._done.notify_all()
+
+    def _record_lag(self, sample: _CycleSample) -> None:
+        lag_ms = (time.monotonic() - sample.enqueued_at) * 1000
+        self._lag_total_ms += lag_ms
+        if lag_ms > self._lag_max_ms:
+            self._lag_max_ms = lag_ms
+
+    def _build_snapshot(self) -> MetaMindSnapshot:
+        output = self._last_output
+        return MetaMindSnapshot(
+            cycle_id=output.cycle_id if output else 0,
+            state=self._state.state_type,
+            system_health=self._state.system_health,
+            performance_score=output.performance_score if output else 0.0,
+            insights=tuple(self.insights.get_active_insights()),
+            patterns=tuple(self.patterns.get_all_patterns()),
+            goals=tuple(self.learning.get_active_goals()),
+            suggested_adaptation=output.suggested_adaptation if output else None,
+            last_output=output,
+            cycles_processed=self._state.cycles_analyzed,
         )
 
     # ========================================================================
@@ -481,6 +839,7 @@ class MetaMindProcessor:
             "insights": self.insights.get_stats(),
             "patterns": self.patterns.get_stats(),
             "learning": self.learning.get_stats(),
+            "background": self.get_background_stats(),
         }
 
     def summary(self) -> Dict[str, Any]:
@@ -501,6 +860,8 @@ class MetaMindProcessor:
         self._analysis_history.clear()
         self._state = MetaState()
         self._cycle_count = 0
+        self._last_output = None
+        self._snapshot = MetaMindSnapshot()
         self._stats = {
             "process_calls": 0,
             "insights_generated": 0,
@@ -538,6 +899,7 @@ def get_metamind_processor() -> MetaMindProcessor:
 __all__ = [
     "MetaMindConfig",
     "MetaMindOutput",
+    "MetaMindSnapshot",
     "MetaMindProcessor",
     "create_metamind_processor",
     "get_metamind_processor",
@@ -0,0 +1,344 @@
+"""
+UEM v2 - MetaMind Rolling Statistics
+
+Kayan pencere istatistikleri: CycleAnalyzer ve PatternDetector ortak yapisi.
+
+- RollingWindow: Son N deger icin artimli toplam / kareler toplami,
+  ortalama, varyans, min/max (monoton deque), EWMA ve pencere quantile'lari
+- RollingSeries: Tek seri gecmisi + farkli boyutlarda RollingWindow'lar
+  (ilk sorguda gecmisten doldurulur, sonra her push'ta guncellenir)
+
+Her push ve okuma pencere boyutundan bagimsiz O(1)'dir (quantile takibi
+acik pencerelerde sirali liste eklemesi haric). Toplamlar ilk degere
+kaydirilmis (shifted) tutulur ve pencere her tam dondugunde bastan
+hesaplanir; sabit serilerde varyans tam olarak 0 kalir.
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import math
+
+
+# ============================================================================
+# ROLLING WINDOW
+# ============================================================================
+
+class RollingWindow:
+    """
+    Son `size` deger uzerinde artimli istatistikler.
+
+    Ortalama ve varyans kaydirilmis toplamlarla (x - K) tutulur; boylece
+    buyuk ama birbirine yakin degerlerde (ms sureleri) iptal hatasi olusmaz.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        ewma_alpha: Optional[float] = None,
+        track_quantiles: bool = False,
+    ):
+        """
+        RollingWindow olustur.
+
+        Args:
+            size: Pencere boyutu
+            ewma_alpha: EWMA katsayisi (0-1], None ise EWMA tutulmaz
+            track_quantiles: Pencere quantile'lari icin sirali kopya tut
+        """
+        if size < 1:
+            raise ValueError(f"Window size must be >= 1, got {size}")
+        if ewma_alpha is not None and not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError(f"EWMA alpha must be in (0, 1], got {ewma_alpha}")
+
+        self.size = size
+        self.ewma_alpha = ewma_alpha
+        self._values: Deque[float] = deque()
+        self._sorted: Optional[List[float]] = [] if track_quantiles else None
+
+        self._shift = 0.0
+        self._sum = 0.0          # sum(x - shift)
+        self._sum_sq = 0.0       # sum((x - shift) ** 2)
+        self._evictions = 0
+
+        # Monoton deque'ler: (sira no, deger)
+        self._index = 0
+        self._min_queue: Deque[Tuple[int, float]] = deque()
+        self._max_queue: Deque[Tuple[int, float]] = deque()
+
+        self._ewma: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.size
+
+    def push(self, x: float) -> Optional[float]:
+        """
+        Deger ekle.
+
+        Args:
+            x: Yeni deger
+
+        Returns:
+            Pencereden cikan deger (pencere dolu degilse None)
+        """
+        evicted = None
+        if len(self._values) == self.size:
+            evicted = self._values.popleft()
+            d = evicted - self._shift
+            self._sum -= d
+            self._sum_sq -= d * d
+            self._evictions += 1
+            if self._sorted is not None:
+                del self._sorted[bisect_left(self._sorted, evicted)]
+        elif not self._values:
+            self._shift = x
+            self._sum = 0.0
+            self._sum_sq = 0.0
+
+        self._values.append(x)
+        d = x - self._shift
+        self._sum += d
+        self._sum_sq += d * d
+
+        if self._sorted is not None:
+            insort(self._sorted, x)
+
+        index = self._index
+        self._index += 1
+        while self._min_queue and self._min_queue[-1][1] >= x:
+            self._min_queue.pop()
+        self._min_queue.append((index, x))
+        while self._max_queue and self._max_queue[-1][1] <= x:
+            self._max_queue.pop()
+        self._max_queue.append((index, x))
+        oldest = index - len(self._values) + 1
+        if self._min_queue[0][0] < oldest:
+            self._min_queue.popleft()
+        if self._max_queue[0][0] < oldest:
+            self._max_queue.popleft()
+
+        if self.ewma_alpha is not None:
+            if self._ewma is None:
+                self._ewma = x
+            else:
+                self._ewma += self.ewma_alpha * (x - self._ewma)
+
+        # Pencere bir tur dondugunde toplamlari yeniden hesapla (drift onlenir)
+        if self._evictions >= self.size:
+            self._recompute()
+
+        return evicted
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._values[-1] if self._values else None
+
+    @property
+    def sum(self) -> float:
+        return self._shift * len(self._values) + self._sum
+
+    @property
+    def mean(self) -> Optional[float]:
+        n = len(self._values)
+        if n == 0:
+            return None
+        return self._shift + self._sum / n
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Orneklem varyansi (n-1); n < 2 ise None."""
+        n = len(self._values)
+        if n < 2:
+            return None
+        if self._min_queue[0][1] == self._max_queue[0][1]:
+            return 0.0
+        variance = (self._sum_sq - self._sum * self._sum / n) / (n - 1)
+        return variance if variance > 0.0 else 0.0
+
+    @property
+    def stdev(self) -> Optional[float]:
+        """Orneklem standart sapmasi; n < 2 ise None."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min_queue[0][1] if self._min_queue else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max_queue[0][1] if self._max_queue else None
+
+    @property
+    def ewma(self) -> Optional[float]:
+        """Ussel agirlikli hareketli ortalama (tum gecmis uzerinde)."""
+        return self._ewma
+
+    def quantile(self, p: float) -> Optional[float]:
+        """
+        Pencere quantile'i (lineer interpolasyon, numpy varsayilani).
+
+        Args:
+            p: Quantile [0, 1]
+
+        Returns:
+            Quantile degeri veya pencere bossa None
+        """
+        if self._sorted is None:
+            raise ValueError("Quantile tracking is disabled for this window")
+        if not 0.0 <= p <= 1.0:
+            raise ValueError(f"Quantile must be in [0, 1], got {p}")
+        n = len(self._sorted)
+        if n == 0:
+            return None
+        position = p * (n - 1)
+        lower = int(position)
+        upper = min(lower + 1, n - 1)
+        fraction = position - lower
+        return self._sorted[lower] + (self._sorted[upper] - self._sorted[lower]) * fraction
+
+    def values(self) -> List[float]:
+        """Penceredeki degerler (eskiden yeniye)."""
+        return list(self._values)
+
+    def clear(self) -> None:
+        """Pencereyi bosalt."""
+        self._values.clear()
+        if self._sorted is not None:
+            self._sorted.clear()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._evictions = 0
+        self._min_queue.clear()
+        self._max_queue.clear()
+        self._ewma = None
+
+    def _recompute(self) -> None:
+        n = len(self._values)
+        self._shift = self._shift + self._sum / n
+        total = 0.0
+        total_sq = 0.0
+        for value in self._values:
+            d = value - self._shift
+            total += d
+            total_sq += d * d
+        self._sum = total
+        self._sum_sq = total_sq
+        self._evictions = 0
+
+
+# ============================================================================
+# ROLLING SERIES
+# ============================================================================
+
+class RollingSeries:
+    """
+    Sinirli seri gecmisi ve bu gecmisin son-N pencereleri.
+
+    window(n) ilk cagrida n boyutlu bir RollingWindow'u gecmisten doldurur
+    ve saklar; sonraki push'lar tum saklanan pencereleri O(1) gunceller.
+    Tum gecmisi kapsayan istekler (n >= len) tek max_size penceresini
+    paylasir; gecmis dolarken her boyut icin ayri pencere birikmez.
+    En fazla MAX_WINDOWS pencere saklanir, fazlasi her cagrida gecmisten
+    gecici olarak kurulur.
+    """
+
+    MAX_WINDOWS = 16
+
+    def __init__(
+        self,
+        max_size: int,
+        ewma_alpha: Optional[float] = None,
+        track_quantiles: bool = False,
+    ):
+        """
+        RollingSeries olustur.
+
+        Args:
+            max_size: Tutulacak max deger sayisi
+            ewma_alpha: Pencerelerin EWMA katsayisi (opsiyonel)
+            track_quantiles: Pencerelerde quantile takibi
+        """
+        self.max_size = max(1, max_size)
+        self.ewma_alpha = ewma_alpha
+        self.track_quantiles = track_quantiles
+        self._history: Deque[float] = deque(maxlen=self.max_size)
+        self._windows: Dict[int, RollingWindow] = {}
+        self._ewma: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def push(self, x: float) -> None:
+        """Deger ekle ve tum pencereleri guncelle."""
+        self._history.append(x)
+        for window in self._windows.values():
+            window.push(x)
+        if self.ewma_alpha is not None:
+            if self._ewma is None:
+                self._ewma = x
+            else:
+                self._ewma += self.ewma_alpha * (x - self._ewma)
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._history[-1] if self._history else None
+
+    @property
+    def ewma(self) -> Optional[float]:
+        """Tum seri uzerinde EWMA."""
+        return self._ewma
+
+    def window(self, n: int) -> RollingWindow:
+        """
+        Son n degerin penceresi (liste dilimi [-n:] ile ayni kapsam).
+
+        Args:
+            n: Pencere boyutu (<= 0 veya gecmis uzunlugu ve ustu = tum gecmis)
+
+        Returns:
+            RollingWindow (salt okunur kullanilmali)
+        """
+        if n <= 0 or n >= len(self._history):
+            # Son n = tum gecmis; max_size penceresi ayni kapsamdadir
+            n = self.max_size
+
+        window = self._windows.get(n)
+        if window is not None:
+            return window
+
+        window = RollingWindow(n, track_quantiles=self.track_quantiles)
+        start = max(0, len(self._history) - n)
+        for i in range(start, len(self._history)):
+            window.push(self._history[i])
+
+        if len(self._windows) < self.MAX_WINDOWS:
+            self._windows[n] = window
+        return window
+
+    def values(self, n: Optional[int] = None) -> List[float]:
+        """Son n deger (eskiden yeniye)."""
+        if n is None or n <= 0 or n >= len(self._history):
+            return list(self._history)
+        return [self._history[i] for i in range(len(self._history) - n, len(self._history))]
+
+    def clear(self) -> None:
+        """Gecmisi ve pencereleri bosalt."""
+        self._history.clear()
+        for window in self._windows.values():
+            window.clear()
+        self._ewma = None
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    "RollingWindow",
+    "RollingSeries",
+]
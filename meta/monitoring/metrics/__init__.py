@@ -10,6 +10,11 @@ from .collector import (
     MetricsCollector,
     get_metrics_collector,
 )
+from .streaming import (
+    RingBuffer,
+    P2Quantile,
+    StreamingSummary,
+)
 from .cycle import (
     MetricType,
     PhaseMetrics,
@@ -23,6 +28,10 @@ __all__ = [
     "MetricSummary",
     "MetricsCollector",
     "get_metrics_collector",
+    # Streaming structures
+    "RingBuffer",
+    "P2Quantile",
+    "StreamingSummary",
     # Cycle metrics
     "MetricType",
     "PhaseMetrics",
@@ -7,8 +7,11 @@ Sistem metriklerini toplama ve izleme.
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from collections import defaultdict
-import statistics
+import time
+
+import numpy as np
+
+from .streaming import RingBuffer, StreamingSummary
 
 
 @dataclass
@@ -34,12 +37,32 @@ class MetricSummary:
     sum_value: float
     last_value: float
     stddev: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
+@dataclass
+class _Counter:
+    """Gerçek sayaç - her artış yeni kayıt oluşturmaz."""
+    value: float = 0.0
+    updates: int = 0
+    timestamp: float = 0.0
+    tags: Optional[Dict[str, str]] = None
 
 
 class MetricsCollector:
     """
     Sistem metriklerini toplayan collector.
     
+    Her metrik adı için bir NumPy halka tampon (son max_history kayıt) ve
+    bir akan özet (Welford + P² quantile) tutulur. Sayaçlar tek değer
+    olarak saklanır.
+
+    get_summary() akan özetten O(1) okunur ve toplayıcı başlatıldığından
+    (veya clear'dan) beri tüm kayıtları kapsar; `since` verilirse halka
+    tampondaki pencere üzerinden hesaplanır.
+
     Usage:
         collector = MetricsCollector()
         collector.record("cycle_duration_ms", 45.2)
@@ -49,7 +72,9 @@ class MetricsCollector:
     """
     
     def __init__(self, max_history_per_metric: int = 10000):
-        self._metrics: Dict[str, List[Metric]] = defaultdict(list)
+        self._buffers: Dict[str, RingBuffer] = {}
+        self._summaries: Dict[str, StreamingSummary] = {}
+        self._counters: Dict[str, _Counter] = {}
         self._max_history = max_history_per_metric
         self._start_time = datetime.now()
     
@@ -70,14 +95,23 @@ class MetricsCollector:
         Returns:
             Oluşturulan Metric
         """
-        metric = Metric(name=name, value=value, tags=tags)
-        self._metrics[name].append(metric)
-        
-        # History limit
-        if len(self._metrics[name]) > self._max_history:
-            self._metrics[name] = self._metrics[name][-self._max_history:]
-        
-        return metric
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            buffer = RingBuffer(self._max_history)
+            self._buffers[name] = buffer
+            self._summaries[name] = StreamingSummary()
+
+        now = time.time()
+        value = float(value)
+        buffer.append(value, now, tags)
+        self._summaries[name].update(value)
+
+        return Metric(
+            name=name,
+            value=value,
+            timestamp=datetime.fromtimestamp(now),
+            tags=tags,
+        )
     
     def increment(
         self,
@@ -86,10 +120,23 @@ class MetricsCollector:
         **tags: str,
     ) -> Metric:
         """Counter artır."""
-        # Son değeri al ve artır
-        last = self.get_last(name)
-        new_value = (last.value if last else 0) + amount
-        return self.record(name, new_value, **tags)
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = _Counter()
+            self._counters[name] = counter
+
+        now = time.time()
+        counter.value += amount
+        counter.updates += 1
+        counter.timestamp = now
+        counter.tags = tags or None
+
+        return Metric(
+            name=name,
+            value=counter.value,
+            timestamp=datetime.fromtimestamp(now),
+            tags=tags,
+        )
     
     def gauge(
         self,
@@ -109,11 +156,24 @@ class MetricsCollector:
         """Süre kaydet."""
         return self.record(name, duration_ms, **tags)
     
+    def get_counter(self, name: str) -> float:
+        """Sayaç değerini getir."""
+        counter = self._counters.get(name)
+        return counter.value if counter else 0.0
+    
     def get_last(self, name: str) -> Optional[Metric]:
         """Son kaydedilen metriği getir."""
-        if name in self._metrics and self._metrics[name]:
-            return self._metrics[name][-1]
-        return None
+        counter = self._counters.get(name)
+        if counter is not None:
+            return self._counter_metric(name, counter)
+
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            return None
+        last = buffer.last()
+        if last is None:
+            return None
+        return self._to_metric(name, *last)
     
     def get_history(
         self,
@@ -122,58 +182,133 @@ class MetricsCollector:
         since: Optional[datetime] = None,
     ) -> List[Metric]:
         """Metrik geçmişini getir."""
-        metrics = self._metrics.get(name, [])
-        
-        if since:
-            metrics = [m for m in metrics if m.timestamp >= since]
-        
-        return metrics[-limit:]
+        counter = self._counters.get(name)
+        if counter is not None:
+            # Sayaçların geçmişi yok - yalnızca güncel değer
+            if since and datetime.fromtimestamp(counter.timestamp) < since:
+                return []
+            return [self._counter_metric(name, counter)][-limit:] if limit > 0 else []
+
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            return []
+
+        records = buffer.records(
+            limit=limit,
+            since=since.timestamp() if since else None,
+        )
+        return [self._to_metric(name, *record) for record in records]
     
     def get_summary(
         self,
         name: str,
         since: Optional[datetime] = None,
     ) -> Optional[MetricSummary]:
-        """Metrik özetini hesapla."""
-        metrics = self.get_history(name, limit=self._max_history, since=since)
-        
-        if not metrics:
+        """Metrik özetini getir."""
+        counter = self._counters.get(name)
+        if counter is not None:
+            return MetricSummary(
+                name=name,
+                count=counter.updates,
+                min_value=counter.value,
+                max_value=counter.value,
+                avg_value=counter.value,
+                sum_value=counter.value,
+                last_value=counter.value,
+            )
+
+        if since is not None:
+            return self._window_summary(name, since)
+
+        summary = self._summaries.get(name)
+        if summary is None or summary.count == 0:
             return None
-        
-        values = [m.value for m in metrics]
-        
+
         return MetricSummary(
             name=name,
-            count=len(values),
-            min_value=min(values),
-            max_value=max(values),
-            avg_value=statistics.mean(values),
-            sum_value=sum(values),
-            last_value=values[-1],
-            stddev=statistics.stdev(values) if len(values) > 1 else None,
+            count=summary.count,
+            min_value=summary.min_value,
+            max_value=summary.max_value,
+            avg_value=summary.mean,
+            sum_value=summary.sum_value,
+            last_value=summary.last_value,
+            stddev=summary.stddev,
+            p50=summary.quantile(0.5),
+            p95=summary.quantile(0.95),
+            p99=summary.quantile(0.99),
         )
     
     def get_all_names(self) -> List[str]:
         """Tüm metrik adlarını listele."""
-        return list(self._metrics.keys())
+        return list(self._buffers.keys()) + [
+            name for name in self._counters if name not in self._buffers
+        ]
     
     def clear(self, name: Optional[str] = None) -> None:
         """Metrikleri temizle."""
         if name:
-            self._metrics.pop(name, None)
+            self._buffers.pop(name, None)
+            self._summaries.pop(name, None)
+            self._counters.pop(name, None)
         else:
-            self._metrics.clear()
+            self._buffers.clear()
+            self._summaries.clear()
+            self._counters.clear()
     
     @property
     def stats(self) -> Dict[str, Any]:
         """Collector istatistikleri."""
-        total_metrics = sum(len(v) for v in self._metrics.values())
+        total_metrics = sum(len(b) for b in self._buffers.values()) + len(self._counters)
         return {
-            "metric_names": len(self._metrics),
+            "metric_names": len(self.get_all_names()),
             "total_records": total_metrics,
             "uptime_seconds": (datetime.now() - self._start_time).total_seconds(),
         }
 
+    def _window_summary(self, name: str, since: datetime) -> Optional[MetricSummary]:
+        """Halka tampondaki pencere üzerinden özet hesapla."""
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            return None
+
+        values = buffer.values()
+        values = values[buffer.timestamps() >= since.timestamp()]
+        if values.size == 0:
+            return None
+
+        p50, p95, p99 = np.quantile(values, (0.5, 0.95, 0.99))
+        return MetricSummary(
+            name=name,
+            count=int(values.size),
+            min_value=float(values.min()),
+            max_value=float(values.max()),
+            avg_value=float(values.mean()),
+            sum_value=float(values.sum()),
+            last_value=float(values[-1]),
+            stddev=float(values.std(ddof=1)) if values.size > 1 else None,
+            p50=float(p50),
+            p95=float(p95),
+            p99=float(p99),
+        )
+
+    @staticmethod
+    def _to_metric(
+        name: str,
+        value: float,
+        timestamp: float,
+        tags: Optional[Dict[str, str]],
+    ) -> Metric:
+        return Metric(
+            name=name,
+            value=value,
+            timestamp=datetime.fromtimestamp(timestamp),
+            tags=dict(tags) if tags else {},
+        )
+
+    @classmethod
+    def _counter_metric(cls, name: str, counter: _Counter) -> Metric:
+        return cls._to_metric(name, counter.value, counter.timestamp, counter.tags)
+
 
 # Singleton instance
 _default_collector: Optional[MetricsCollector] = None
@@ -71,6 +71,10 @@ class CycleMetrics:
     events_emitted: int = 0
     events_processed: int = 0
 
+    # Deadline metrics
+    deadline_misses: Dict[str, int] = field(default_factory=dict)
+    budget_skips: List[str] = field(default_factory=list)
+
     def record_phase_start(self, phase_name: str) -> None:
         """Phase başlangıcını kaydet."""
         self.phase_metrics[phase_name] = PhaseMetrics(
@@ -96,6 +100,14 @@ class CycleMetrics:
         if pm.start_time:
             pm.duration_ms = (pm.end_time - pm.start_time).total_seconds() * 1000
 
+    def record_deadline_miss(self, phase_name: str) -> None:
+        """Phase bütçesini aştı."""
+        self.deadline_misses[phase_name] = self.deadline_misses.get(phase_name, 0) + 1
+
+    def record_budget_skip(self, phase_name: str) -> None:
+        """Opsiyonel phase cycle bütçesi bittiği için atlandı."""
+        self.budget_skips.append(phase_name)
+
     def record_memory_retrieval(self, count: int = 1) -> None:
         """Memory retrieval kaydet."""
         self.memory_retrievals += count
@@ -161,6 +173,10 @@ class CycleMetrics:
                 "emitted": self.events_emitted,
                 "processed": self.events_processed,
             },
+            "deadlines": {
+                "misses": dict(self.deadline_misses),
+                "budget_skips": list(self.budget_skips),
+            },
         }
 
     def get_phase_summary(self) -> Dict[str, float]:
@@ -268,6 +284,23 @@ class CycleMetricsHistory:
             "negative_changes": sum(1 for c in all_changes if c["delta"] < 0),
         }
 
+    def get_deadline_stats(self, n: int = 100) -> Dict[str, Any]:
+        """Son N cycle'da phase başına deadline aşımı ve bütçe atlaması."""
+        recent = self.get_last(n)
+        misses: Dict[str, int] = {}
+        skips: Dict[str, int] = {}
+        for m in recent:
+            for name, count in m.deadline_misses.items():
+                misses[name] = misses.get(name, 0) + count
+            for name in m.budget_skips:
+                skips[name] = skips.get(name, 0) + 1
+
+        return {
+            "total_misses": sum(misses.values()),
+            "misses": misses,
+            "budget_skips": skips,
+        }
+
     @property
     def count(self) -> int:
         """Toplam kayıtlı cycle sayısı."""
@@ -0,0 +1,264 @@
+"""
+UEM v2 - Streaming Metric Structures
+
+MetricsCollector için sabit bellekli yapılar:
+- RingBuffer: Metrik başına NumPy halka tampon (değer + zaman damgası)
+- P2Quantile: P² algoritması ile akan veride quantile tahmini (Jain & Chlamtac)
+- StreamingSummary: Welford ortalama/varyans + min/max/sum + p50/p95/p99
+
+Kayıt sırasında liste kopyalama yapılmaz; özetler O(1) okunur.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import math
+
+import numpy as np
+
+
+DEFAULT_QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+class RingBuffer:
+    """
+    Sabit kapasiteli NumPy halka tampon.
+
+    Kapasite gerektiğinde ikiye katlanarak max_capacity'ye kadar büyür;
+    doluyken en eski kaydın üzerine yazar (yeni dizi ayrılmaz).
+    """
+
+    def __init__(self, max_capacity: int, initial_capacity: int = 64):
+        self._max_capacity = max(1, max_capacity)
+        capacity = min(self._max_capacity, max(1, initial_capacity))
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._tags = np.empty(capacity, dtype=object)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._values)
+
+    def append(
+        self,
+        value: float,
+        timestamp: float,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Kayıt ekle."""
+        capacity = len(self._values)
+        if self._size == capacity and capacity < self._max_capacity:
+            self._grow(min(self._max_capacity, capacity * 2))
+            capacity = len(self._values)
+
+        if self._size < capacity:
+            idx = (self._start + self._size) % capacity
+            self._size += 1
+        else:
+            # Dolu - en eskinin üzerine yaz
+            idx = self._start
+            self._start = (self._start + 1) % capacity
+
+        self._values[idx] = value
+        self._timestamps[idx] = timestamp
+        self._tags[idx] = tags or None
+
+    def last(self) -> Optional[Tuple[float, float, Optional[Dict[str, str]]]]:
+        """Son kayıt (value, timestamp, tags)."""
+        if self._size == 0:
+            return None
+        idx = (self._start + self._size - 1) % len(self._values)
+        return float(self._values[idx]), float(self._timestamps[idx]), self._tags[idx]
+
+    def indices(self, limit: Optional[int] = None) -> np.ndarray:
+        """Son `limit` kaydın fiziksel indeksleri (eskiden yeniye)."""
+        count = self._size if limit is None else max(0, min(limit, self._size))
+        offset = self._size - count
+        return (self._start + offset + np.arange(count)) % len(self._values)
+
+    def values(self, limit: Optional[int] = None) -> np.ndarray:
+        """Değerler (eskiden yeniye)."""
+        return self._values[self.indices(limit)]
+
+    def timestamps(self, limit: Optional[int] = None) -> np.ndarray:
+        """Zaman damgaları (eskiden yeniye)."""
+        return self._timestamps[self.indices(limit)]
+
+    def records(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[float] = None,
+    ) -> List[Tuple[float, float, Optional[Dict[str, str]]]]:
+        """Kayıtları (value, timestamp, tags) olarak getir."""
+        idx = self.indices()
+        if since is not None:
+            idx = idx[self._timestamps[idx] >= since]
+        if limit is not None:
+            idx = idx[-limit:] if limit > 0 else idx[:0]
+        return [
+            (float(self._values[i]), float(self._timestamps[i]), self._tags[i])
+            for i in idx
+        ]
+
+    def clear(self) -> None:
+        """Tamponu boşalt (kapasite korunur)."""
+        self._start = 0
+        self._size = 0
+        self._tags.fill(None)
+
+    def _grow(self, new_capacity: int) -> None:
+        idx = self.indices()
+        values = np.empty(new_capacity, dtype=np.float64)
+        timestamps = np.empty(new_capacity, dtype=np.float64)
+        tags = np.empty(new_capacity, dtype=object)
+        values[:self._size] = self._values[idx]
+        timestamps[:self._size] = self._timestamps[idx]
+        tags[:self._size] = self._tags[idx]
+        self._values, self._timestamps, self._tags = values, timestamps, tags
+        self._start = 0
+
+
+class P2Quantile:
+    """
+    P² quantile tahmincisi.
+
+    Beş işaretçi ile tek bir quantile'ı O(1) bellek ve güncelleme
+    maliyetiyle izler. İlk beş gözlemde kesin değer döner.
+    """
+
+    def __init__(self, p: float):
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"Quantile must be in (0, 1), got {p}")
+        self.p = p
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        """Gözlem ekle."""
+        if not self._heights:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._initial.sort()
+                p = self.p
+                self._heights = list(self._initial)
+                self._positions = [1, 2, 3, 4, 5]
+                self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+            return
+
+        q = self._heights
+        n = self._positions
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def value(self) -> Optional[float]:
+        """Güncel quantile tahmini."""
+        if self._heights:
+            return self._heights[2]
+        if not self._initial:
+            return None
+        return float(np.quantile(self._initial, self.p))
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+
+class StreamingSummary:
+    """
+    Akan metrik özeti.
+
+    Welford algoritması ile ortalama/varyans, P² ile quantile'lar.
+    Her güncelleme ve okuma O(1).
+    """
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min_value = math.inf
+        self.max_value = -math.inf
+        self.sum_value = 0.0
+        self.last_value = 0.0
+        self._quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def update(self, x: float) -> None:
+        """Gözlem ekle."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+        if x < self.min_value:
+            self.min_value = x
+        if x > self.max_value:
+            self.max_value = x
+        self.sum_value += x
+        self.last_value = x
+
+        for estimator in self._quantiles.values():
+            estimator.add(x)
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Örneklem varyansı (n-1)."""
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Örneklem standart sapması."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, p: float) -> Optional[float]:
+        """İzlenen bir quantile'ın tahmini."""
+        estimator = self._quantiles.get(p)
+        return estimator.value() if estimator else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.min_value if self.count else None,
+            "max": self.max_value if self.count else None,
+            "sum": self.sum_value,
+            "last": self.last_value,
+            "quantiles": {p: self.quantile(p) for p in self._quantiles},
+        }
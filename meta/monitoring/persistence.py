@@ -7,16 +7,22 @@ Dashboard farklı process'te çalıştığında verilere erişebilmesi için.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 import logging
 import json
+import queue
+import threading
+import time
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from core.memory.persistence.repository import get_session, get_engine
 from core.memory.persistence.models import (
     CycleMetricModel,
+    CycleMetricRollupModel,
+    PhaseDurationRollupModel,
     ActivityLogModel,
     RelationshipModel,
     EpisodeModel,
@@ -26,12 +32,269 @@ from engine.events import Event, EventType, EventBus, get_event_bus
 
 logger = logging.getLogger(__name__)
 
+ROLLUP_BUCKETS = ("minute", "hour")
+
+
+def _bucket_start(timestamp: datetime, bucket_size: str) -> datetime:
+    """Zaman damgasını bucket başlangıcına yuvarla."""
+    if bucket_size == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(second=0, microsecond=0)
+
+
+def aggregate_cycle_rollups(
+    rows: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Cycle satırlarını dakika/saat bucket'larına topla.
+
+    Args:
+        rows: CycleMetricModel kolon dict'leri
+
+    Returns:
+        (cycle rollup satırları, phase rollup satırları) - upsert için
+    """
+    cycles: Dict[Tuple[str, datetime], Dict[str, Any]] = {}
+    phases: Dict[Tuple[str, datetime, str], Dict[str, Any]] = {}
+
+    for row in rows:
+        started_at = row.get("started_at") or datetime.now()
+        duration = row.get("duration_ms")
+        for bucket_size in ROLLUP_BUCKETS:
+            bucket = _bucket_start(started_at, bucket_size)
+            agg = cycles.get((bucket_size, bucket))
+            if agg is None:
+                agg = {
+                    "bucket_size": bucket_size,
+                    "bucket_start": bucket,
+                    "cycle_count": 0,
+                    "success_count": 0,
+                    "duration_sum_ms": 0.0,
+                    "duration_count": 0,
+                }
+                cycles[(bucket_size, bucket)] = agg
+            agg["cycle_count"] += 1
+            if row.get("success", True):
+                agg["success_count"] += 1
+            if duration is not None:
+                agg["duration_sum_ms"] += duration
+                agg["duration_count"] += 1
+
+            for phase, phase_duration in (row.get("phase_durations") or {}).items():
+                key = (bucket_size, bucket, phase)
+                phase_agg = phases.get(key)
+                if phase_agg is None:
+                    phase_agg = {
+                        "bucket_size": bucket_size,
+                        "bucket_start": bucket,
+                        "phase": phase,
+                        "duration_sum_ms": 0.0,
+                        "sample_count": 0,
+                    }
+                    phases[key] = phase_agg
+                phase_agg["duration_sum_ms"] += phase_duration
+                phase_agg["sample_count"] += 1
+
+    return list(cycles.values()), list(phases.values())
+
+
+@dataclass
+class PersistenceConfig:
+    """Monitoring persistence yapılandırması."""
+    # Yazımlar arka plan thread'inde toplu yapılır (False = senkron, eski davranış)
+    async_writes: bool = True
+    queue_size: int = 10000               # Bekleyen satır limiti
+    batch_size: int = 200                 # Tek insert'teki max satır
+    flush_interval_s: float = 1.0         # Kuyruk boşalmasa da en geç bu sürede yaz
+    # Aşırı yükte activity satırları örneklenir (cycle satırları örneklenmez)
+    sample_threshold: float = 0.8         # Kuyruk doluluk oranı eşiği
+    overload_sample_rate: int = 10        # Eşik üstünde N activity'den 1'i tutulur
+    stop_timeout_s: float = 5.0           # stop() flush için bekleme süresi
+    # Dashboard için dakika/saat rollup tablolarını güncelle
+    maintain_rollups: bool = True
+
+
+class BatchWriter:
+    """
+    Sınırlı kuyruklu arka plan DB yazıcısı.
+
+    Event handler'ları sadece satır dict'ini kuyruğa koyar; writer thread
+    satırları model türüne göre gruplar ve tek session/commit ile toplu
+    insert yapar. Kuyruk doluysa satır düşürülür ve sayaçlara işlenir.
+    on_batch verilirse aynı transaction içinde çağrılır (ör. rollup'lar).
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        session_factory,
+        config: Optional[PersistenceConfig] = None,
+        on_batch: Optional[Callable[[Session, Dict[Type, List[Dict[str, Any]]]], None]] = None,
+    ):
+        self.config = config or PersistenceConfig()
+        self._session_factory = session_factory
+        self._on_batch = on_batch
+        self._queue: "queue.Queue" = queue.Queue(maxsize=self.config.queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._sample_counter = 0
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "batches": 0,
+            "write_errors": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Writer thread'ini başlat."""
+        if self.running:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="uem-monitoring-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Kuyruktakileri yaz ve thread'i durdur."""
+        if not self.running:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=self.config.stop_timeout_s)
+        if self._thread.is_alive():
+            logger.warning("Monitoring writer did not stop in time")
+        self._thread = None
+
+    def submit(
+        self,
+        model: Type,
+        row: Dict[str, Any],
+        sampleable: bool = False,
+    ) -> bool:
+        """
+        Satırı kuyruğa ekle (bloklamaz).
+
+        Args:
+            model: SQLAlchemy model sınıfı
+            row: Kolon değerleri
+            sampleable: Aşırı yükte örneklenebilir mi
+
+        Returns:
+            Kuyruğa alındı mı
+        """
+        if sampleable and self._is_overloaded():
+            with self._lock:
+                self._sample_counter += 1
+                keep = self._sample_counter % max(1, self.config.overload_sample_rate) == 0
+                if not keep:
+                    self._stats["sampled_out"] += 1
+                    return False
+
+        try:
+            self._queue.put_nowait((model, row))
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            return False
+
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Writer sayaçları."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    def _is_overloaded(self) -> bool:
+        return self._queue.qsize() >= self.config.queue_size * self.config.sample_threshold
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.config.flush_interval_s)
+            except queue.Empty:
+                continue
+
+            batch: List[Tuple[Type, Dict[str, Any]]] = []
+            if item is self._STOP:
+                stopping = True
+            else:
+                batch.append(item)
+
+            # Flush aralığı dolana veya batch_size'a ulaşana kadar topla
+            deadline = time.monotonic() + self.config.flush_interval_s
+            while not stopping and len(batch) < self.config.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            # Durdurulurken kuyruğun tamamını yaz
+            if stopping:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not self._STOP:
+                        batch.append(item)
+
+            for start in range(0, len(batch), self.config.batch_size):
+                self._write_batch(batch[start:start + self.config.batch_size])
+
+    def _write_batch(self, batch: List[Tuple[Type, Dict[str, Any]]]) -> None:
+        """Satırları modele göre gruplayıp toplu insert yap."""
+        grouped: Dict[Type, List[Dict[str, Any]]] = {}
+        for model, row in batch:
+            grouped.setdefault(model, []).append(row)
+
+        session = self._session_factory()
+        try:
+            for model, rows in grouped.items():
+                session.execute(insert(model), rows)
+            if self._on_batch:
+                self._on_batch(session, grouped)
+            session.commit()
+            with self._lock:
+                self._stats["written"] += len(batch)
+                self._stats["batches"] += 1
+            logger.debug(f"Monitoring writer flushed {len(batch)} rows")
+        except Exception as e:
+            logger.error(f"Error writing monitoring batch: {e}")
+            session.rollback()
+            with self._lock:
+                self._stats["write_errors"] += 1
+                self._stats["dropped"] += len(batch)
+        finally:
+            session.close()
+
 
 class MonitoringPersistence:
     """
     Monitoring verilerini PostgreSQL'e kaydeden sınıf.
 
     Event bus'ı dinler ve cycle/phase metriklerini DB'ye yazar.
+    Varsayılan olarak satırlar BatchWriter ile arka planda toplu yazılır,
+    böylece DB gecikmesi cycle'ın kritik yoluna girmez.
 
     Usage:
         persistence = MonitoringPersistence()
@@ -39,22 +302,34 @@ class MonitoringPersistence:
 
         # ... cycles run ...
 
-        persistence.stop()
+        persistence.stop()  # Bekleyen satırları yazar
     """
 
     def __init__(
         self,
         event_bus: Optional[EventBus] = None,
         database_url: Optional[str] = None,
+        config: Optional[PersistenceConfig] = None,
     ):
         self.event_bus = event_bus or get_event_bus()
         self._database_url = database_url
+        self.config = config or PersistenceConfig()
         self._running = False
+        self._engine = None
 
-        # Track current cycle for phase durations
+        # Açık cycle'lar: cycle_id -> (başlangıç, faz süreleri). run_batch
+        # tüm CYCLE_START'ları fazlardan önce yayınladığı için birden çok
+        # cycle aynı anda açık olabilir.
         self._current_cycle_id: Optional[int] = None
-        self._current_cycle_started: Optional[datetime] = None
-        self._phase_durations: Dict[str, float] = {}
+        self._open_cycles: Dict[Optional[int], Tuple[datetime, Dict[str, float]]] = {}
+
+        self._writer: Optional[BatchWriter] = None
+        if self.config.async_writes:
+            self._writer = BatchWriter(
+                self._get_session,
+                self.config,
+                on_batch=self._on_batch_written,
+            )
 
     def start(self) -> None:
         """Monitoring persistence'ı başlat."""
@@ -62,19 +337,29 @@ class MonitoringPersistence:
             return
 
         self._running = True
+        self._open_cycles.clear()
+        if self._writer:
+            self._writer.start()
         self.event_bus.subscribe_all(self._handle_event)
         logger.info("Monitoring persistence started")
 
     def stop(self) -> None:
-        """Monitoring persistence'ı durdur."""
+        """Monitoring persistence'ı durdur (bekleyen yazımları flush eder)."""
         self._running = False
+        if self._writer:
+            self._writer.stop()
         logger.info("Monitoring persistence stopped")
 
+    def get_writer_stats(self) -> Dict[str, int]:
+        """Arka plan yazıcı sayaçları (senkron modda boş)."""
+        return self._writer.get_stats() if self._writer else {}
+
     def _get_session(self) -> Session:
         """Get database session."""
         if self._database_url:
-            engine = get_engine(self._database_url)
-            return get_session(engine)
+            if self._engine is None:
+                self._engine = get_engine(self._database_url)
+            return get_session(self._engine)
         return get_session()
 
     def _handle_event(self, event: Event) -> None:
@@ -106,14 +391,26 @@ class MonitoringPersistence:
     def _on_cycle_start(self, event: Event) -> None:
         """Handle cycle start."""
         self._current_cycle_id = event.data.get("cycle_id", event.cycle_id)
-        self._current_cycle_started = event.timestamp
-        self._phase_durations = {}
+        self._open_cycles[self._current_cycle_id] = (event.timestamp, {})
 
     def _on_phase_end(self, event: Event) -> None:
-        """Handle phase end - collect duration."""
+        """
+        Handle phase end - collect duration.
+
+        Batch eventi (cycle_ids + durations_ms) her cycle'a kendi süresini
+        yazar; tekil event cycle_id'sine (yoksa son başlayan cycle'a) yazılır.
+        """
         phase = event.data.get("phase", "unknown")
-        duration_ms = event.data.get("duration_ms", 0)
-        self._phase_durations[phase] = duration_ms
+        cycle_ids = event.data.get("cycle_ids")
+        durations = event.data.get("durations_ms")
+        if cycle_ids is None or durations is None:
+            cycle_ids = [event.data.get("cycle_id", event.cycle_id) or self._current_cycle_id]
+            durations = [event.data.get("duration_ms", 0)]
+
+        for cycle_id, duration_ms in zip(cycle_ids, durations):
+            entry = self._open_cycles.get(cycle_id)
+            if entry is not None:
+                entry[1][phase] = duration_ms
 
     def _on_cycle_end(self, event: Event) -> None:
         """Handle cycle end - save to DB."""
@@ -121,78 +418,161 @@ class MonitoringPersistence:
         duration_ms = event.data.get("duration_ms", 0)
         success = event.data.get("success", True)
         error_message = event.data.get("error")
+        started_at, phase_durations = self._open_cycles.pop(cycle_id, (None, {}))
+
+        row = {
+            "cycle_id": cycle_id or 0,
+            "started_at": started_at or datetime.now(),
+            "ended_at": event.timestamp,
+            "duration_ms": duration_ms,
+            "success": success,
+            "error_message": error_message,
+            "phase_durations": phase_durations,
+        }
+        self._write(CycleMetricModel, row)
+        logger.debug(f"Queued cycle metric: cycle_id={cycle_id}, duration={duration_ms}ms")
 
-        session = self._get_session()
-        try:
-            metric = CycleMetricModel(
-                cycle_id=cycle_id or 0,
-                started_at=self._current_cycle_started or datetime.now(),
-                ended_at=event.timestamp,
-                duration_ms=duration_ms,
-                success=success,
-                error_message=error_message,
-                phase_durations=self._phase_durations,
-            )
-            session.add(metric)
-            session.commit()
-            logger.debug(f"Saved cycle metric: cycle_id={cycle_id}, duration={duration_ms}ms")
-        except Exception as e:
-            logger.error(f"Error saving cycle metric: {e}")
-            session.rollback()
-        finally:
-            session.close()
-
-        # Reset for next cycle
-        self._current_cycle_id = None
-        self._current_cycle_started = None
-        self._phase_durations = {}
+        if cycle_id == self._current_cycle_id:
+            self._current_cycle_id = None
 
     def _log_activity(self, event: Event) -> None:
         """Log activity to database."""
+        # Serialize event data
+        data = {}
+        for k, v in event.data.items():
+            try:
+                json.dumps(v)  # Test if serializable
+                data[k] = v
+            except (TypeError, ValueError):
+                data[k] = str(v)
+
+        row = {
+            "event_type": event.event_type.value,
+            "source": event.source,
+            "cycle_id": event.cycle_id,
+            "data": data,
+            "created_at": event.timestamp,
+        }
+        self._write(ActivityLogModel, row, sampleable=True)
+
+    def _write(self, model: Type, row: Dict[str, Any], sampleable: bool = False) -> None:
+        """Satırı writer kuyruğuna ver veya senkron yaz."""
+        if self._writer:
+            self._writer.submit(model, row, sampleable=sampleable)
+            return
+
         session = self._get_session()
         try:
-            # Serialize event data
-            data = {}
-            for k, v in event.data.items():
-                try:
-                    json.dumps(v)  # Test if serializable
-                    data[k] = v
-                except (TypeError, ValueError):
-                    data[k] = str(v)
-
-            activity = ActivityLogModel(
-                event_type=event.event_type.value,
-                source=event.source,
-                cycle_id=event.cycle_id,
-                data=data,
-                created_at=event.timestamp,
-            )
-            session.add(activity)
+            session.add(model(**row))
+            self._on_batch_written(session, {model: [row]})
             session.commit()
         except Exception as e:
-            logger.error(f"Error logging activity: {e}")
+            logger.error(f"Error saving {model.__tablename__} row: {e}")
             session.rollback()
         finally:
             session.close()
 
+    def _on_batch_written(
+        self,
+        session: Session,
+        grouped: Dict[Type, List[Dict[str, Any]]],
+    ) -> None:
+        """Yazılan cycle satırları için rollup'ları artımlı güncelle."""
+        if not self.config.maintain_rollups:
+            return
+        cycle_rows = grouped.get(CycleMetricModel)
+        if not cycle_rows:
+            return
+        # Savepoint: rollup hatası ham satırları geri almasın
+        try:
+            with session.begin_nested():
+                upsert_cycle_rollups(session, cycle_rows)
+        except Exception as e:
+            logger.warning(f"Error updating cycle rollups: {e}")
+
+
+def upsert_cycle_rollups(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Cycle satırlarını rollup tablolarına ekle (INSERT ... ON CONFLICT).
+
+    Aynı bucket'a düşen satırlar önce Python'da toplanır; böylece her batch
+    bucket başına tek upsert yapar.
+    """
+    cycle_rollups, phase_rollups = aggregate_cycle_rollups(rows)
+
+    if cycle_rollups:
+        stmt = pg_insert(CycleMetricRollupModel).values(cycle_rollups)
+        excluded = stmt.excluded
+        table = CycleMetricRollupModel
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=[table.bucket_size, table.bucket_start],
+            set_={
+                "cycle_count": table.cycle_count + excluded.cycle_count,
+                "success_count": table.success_count + excluded.success_count,
+                "duration_sum_ms": table.duration_sum_ms + excluded.duration_sum_ms,
+                "duration_count": table.duration_count + excluded.duration_count,
+                "updated_at": func.now(),
+            },
+        ))
+
+    if phase_rollups:
+        stmt = pg_insert(PhaseDurationRollupModel).values(phase_rollups)
+        excluded = stmt.excluded
+        table = PhaseDurationRollupModel
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=[table.bucket_size, table.bucket_start, table.phase],
+            set_={
+                "duration_sum_ms": table.duration_sum_ms + excluded.duration_sum_ms,
+                "sample_count": table.sample_count + excluded.sample_count,
+            },
+        ))
+
 
 class DashboardDataProvider:
     """
     Dashboard için PostgreSQL'den veri sağlayan sınıf.
 
-    Dashboard bu sınıfı kullanarak metrikleri okur.
+    Dashboard bu sınıfı kullanarak metrikleri okur. Cycle metrikleri ve
+    phase süreleri rollup tablolarından okunur (toplam cycle sayısından
+    bağımsız maliyet); sonuçlar kısa süreli bellek içi cache'te tutulur.
     """
 
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        use_rollups: bool = True,
+        cache_ttl_s: float = 2.0,
+    ):
         self._database_url = database_url
+        self._engine = None
+        self._use_rollups = use_rollups
+        self._cache_ttl_s = cache_ttl_s
+        self._cache: Dict[Tuple[str, Any], Tuple[float, Any]] = {}
 
     def _get_session(self) -> Session:
         """Get database session."""
         if self._database_url:
-            engine = get_engine(self._database_url)
-            return get_session(engine)
+            if self._engine is None:
+                self._engine = get_engine(self._database_url)
+            return get_session(self._engine)
         return get_session()
 
+    def _cached(self, key: Tuple[str, Any], loader: Callable[[], Any]) -> Any:
+        """TTL cache üzerinden oku."""
+        if self._cache_ttl_s > 0:
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            if entry and now - entry[0] < self._cache_ttl_s:
+                return entry[1]
+        value = loader()
+        if self._cache_ttl_s > 0:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def clear_cache(self) -> None:
+        """Cache'i temizle."""
+        self._cache.clear()
+
     def get_cycle_metrics(self, limit: int = 100) -> Dict[str, Any]:
         """
         Get cycle metrics summary.
@@ -206,18 +586,19 @@ class DashboardDataProvider:
                 "avg_duration_ms": float,
             }
         """
+        return self._cached(("cycle_metrics", None), self._load_cycle_metrics)
+
+    def _load_cycle_metrics(self) -> Dict[str, Any]:
         session = self._get_session()
         try:
-            total = session.query(CycleMetricModel).count()
-            success_count = session.query(CycleMetricModel).filter(
-                CycleMetricModel.success == True
-            ).count()
-            failed_count = total - success_count
-
-            avg_duration = session.query(
-                func.avg(CycleMetricModel.duration_ms)
-            ).scalar() or 0
+            totals = None
+            if self._use_rollups:
+                totals = self._query_rollup_totals(session)
+            if totals is None:
+                totals = self._query_raw_totals(session)
 
+            total, success_count, avg_duration = totals
+            failed_count = total - success_count
             success_rate = (success_count / total * 100) if total > 0 else 0
 
             return {
@@ -230,39 +611,134 @@ class DashboardDataProvider:
         finally:
             session.close()
 
+    def _query_rollup_totals(self, session: Session) -> Optional[Tuple[int, int, float]]:
+        """Saatlik rollup'lardan toplamlar (tablo yoksa/boşsa None)."""
+        try:
+            row = session.query(
+                func.sum(CycleMetricRollupModel.cycle_count),
+                func.sum(CycleMetricRollupModel.success_count),
+                func.sum(CycleMetricRollupModel.duration_sum_ms),
+                func.sum(CycleMetricRollupModel.duration_count),
+            ).filter(CycleMetricRollupModel.bucket_size == "hour").one()
+        except Exception as e:
+            logger.warning(f"Cycle rollups unavailable, using raw metrics: {e}")
+            session.rollback()
+            return None
+
+        total, success_count, duration_sum, duration_count = row
+        if not total:
+            return None
+        avg_duration = (duration_sum / duration_count) if duration_count else 0
+        return int(total), int(success_count or 0), avg_duration
+
+    def _query_raw_totals(self, session: Session) -> Tuple[int, int, float]:
+        """Ham cycle_metrics tablosundan toplamlar."""
+        total = session.query(CycleMetricModel).count()
+        success_count = session.query(CycleMetricModel).filter(
+            CycleMetricModel.success == True
+        ).count()
+        avg_duration = session.query(
+            func.avg(CycleMetricModel.duration_ms)
+        ).scalar() or 0
+        return total, success_count, avg_duration
+
     def get_phase_durations(self, limit: int = 100) -> Dict[str, float]:
         """
         Get average phase durations.
 
+        Rollup modunda son `limit` cycle'ı kapsayan dakika bucket'ları
+        kullanılır (bucket çözünürlüğünde yaklaşık).
+
         Returns:
             {"1_sense": 12.5, "2_attend": 8.3, ...}
         """
+        return self._cached(
+            ("phase_durations", limit),
+            lambda: self._load_phase_durations(limit),
+        )
+
+    def _load_phase_durations(self, limit: int) -> Dict[str, float]:
         session = self._get_session()
         try:
-            # Get recent cycles
-            cycles = session.query(CycleMetricModel).order_by(
-                desc(CycleMetricModel.started_at)
+            if self._use_rollups:
+                durations = self._query_rollup_phase_durations(session, limit)
+                if durations is not None:
+                    return durations
+            return self._query_raw_phase_durations(session, limit)
+        finally:
+            session.close()
+
+    def _query_rollup_phase_durations(
+        self,
+        session: Session,
+        limit: int,
+    ) -> Optional[Dict[str, float]]:
+        """Son `limit` cycle'a yetecek kadar dakika rollup'ından ortalamalar."""
+        try:
+            # En yeni bucket'lardan geriye, limit'e ulaşana kadar
+            buckets = session.query(
+                CycleMetricRollupModel.bucket_start,
+                CycleMetricRollupModel.cycle_count,
+            ).filter(
+                CycleMetricRollupModel.bucket_size == "minute"
+            ).order_by(
+                desc(CycleMetricRollupModel.bucket_start)
             ).limit(limit).all()
 
-            if not cycles:
-                return {}
+            if not buckets:
+                return None
+
+            covered = 0
+            cutoff = buckets[-1].bucket_start
+            for bucket in buckets:
+                covered += bucket.cycle_count
+                if covered >= limit:
+                    cutoff = bucket.bucket_start
+                    break
+
+            rows = session.query(
+                PhaseDurationRollupModel.phase,
+                func.sum(PhaseDurationRollupModel.duration_sum_ms),
+                func.sum(PhaseDurationRollupModel.sample_count),
+            ).filter(
+                PhaseDurationRollupModel.bucket_size == "minute",
+                PhaseDurationRollupModel.bucket_start >= cutoff,
+            ).group_by(PhaseDurationRollupModel.phase).all()
+        except Exception as e:
+            logger.warning(f"Phase rollups unavailable, using raw metrics: {e}")
+            session.rollback()
+            return None
 
-            # Aggregate phase durations
-            phase_totals: Dict[str, List[float]] = {}
-            for cycle in cycles:
-                if cycle.phase_durations:
-                    for phase, duration in cycle.phase_durations.items():
-                        if phase not in phase_totals:
-                            phase_totals[phase] = []
-                        phase_totals[phase].append(duration)
+        return {
+            phase: duration_sum / sample_count
+            for phase, duration_sum, sample_count in rows
+            if sample_count
+        }
 
-            # Calculate averages
-            return {
-                phase: sum(durations) / len(durations)
-                for phase, durations in phase_totals.items()
-            }
-        finally:
-            session.close()
+    def _query_raw_phase_durations(self, session: Session, limit: int) -> Dict[str, float]:
+        """Ham cycle_metrics satırlarından ortalamalar."""
+        # Get recent cycles
+        cycles = session.query(CycleMetricModel).order_by(
+            desc(CycleMetricModel.started_at)
+        ).limit(limit).all()
+
+        if not cycles:
+            return {}
+
+        # Aggregate phase durations
+        phase_totals: Dict[str, List[float]] = {}
+        for cycle in cycles:
+            if cycle.phase_durations:
+                for phase, duration in cycle.phase_durations.items():
+                    if phase not in phase_totals:
+                        phase_totals[phase] = []
+                    phase_totals[phase].append(duration)
+
+        # Calculate averages
+        return {
+            phase: sum(durations) / len(durations)
+            for phase, durations in phase_totals.items()
+        }
 
     def get_memory_stats(self) -> Dict[str, int]:
         """
@@ -342,9 +818,9 @@ class DashboardDataProvider:
         return {
             "cycle_metrics": self.get_cycle_metrics(),
             "phase_durations": self.get_phase_durations(),
-            "memory_stats": self.get_memory_stats(),
-            "trust_levels": self.get_trust_levels(),
-            "recent_activity": self.get_recent_activity(),
+            "memory_stats": self._cached(("memory_stats", None), self.get_memory_stats),
+            "trust_levels": self._cached(("trust_levels", None), self.get_trust_levels),
+            "recent_activity": self._cached(("recent_activity", None), self.get_recent_activity),
         }
 
 
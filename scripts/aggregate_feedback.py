@@ -7,10 +7,15 @@ Episode loglarından construction feedback stats hesapla.
 Episode JSONL dosyasını okur, her construction için
 feedback istatistiklerini aggregate eder ve JSON'a kaydeder.
 
+Varsayılan olarak artımlıdır: son işlenen byte offset'i checkpoint'te
+saklanır ve sadece yeni episode'lar işlenir.
+
 Kullanım:
     python scripts/aggregate_feedback.py
     python scripts/aggregate_feedback.py --episodes data/episodes.jsonl
     python scripts/aggregate_feedback.py --output data/construction_stats.json
+    python scripts/aggregate_feedback.py --full     # Tam yeniden tarama
+    python scripts/aggregate_feedback.py --follow   # Daemon (tail) modu
     python scripts/aggregate_feedback.py -v  # verbose
 
 UEM v2 - Faz 5 Feedback-Driven Learning.
@@ -44,6 +49,22 @@ def main():
         action="store_true",
         help="Detaylı çıktı göster"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Checkpoint'i yok say, stats'ları baştan hesapla"
+    )
+    parser.add_argument(
+        "--follow", "-f",
+        action="store_true",
+        help="Dosyayı izle ve yeni episode'ları geldikçe işle (Ctrl+C ile çık)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="--follow yoklama aralığı, saniye (default: 2.0)"
+    )
     parser.add_argument(
         "--top", "-n",
         type=int,
@@ -54,8 +75,10 @@ def main():
 
     # Imports
     try:
-        from core.learning.episode_store import JSONLEpisodeStore
-        from core.learning.feedback_aggregator import FeedbackAggregator
+        from core.learning.feedback_aggregator import (
+            FeedbackAggregator,
+            CheckpointedFeedbackAggregator,
+        )
         from core.learning.feedback_store import FeedbackStore
     except ImportError as e:
         print(f"Error: Could not import required modules: {e}")
@@ -64,43 +87,52 @@ def main():
 
     # Check if episodes file exists
     episodes_path = Path(args.episodes)
-    if not episodes_path.exists():
+    if not episodes_path.exists() and not args.follow:
         print(f"Error: Episodes file not found: {episodes_path}")
         print("Run some chat sessions first to generate episode data.")
         sys.exit(1)
 
-    # Load episodes
-    print(f"Loading episodes from {episodes_path}...")
-    episode_store = JSONLEpisodeStore(str(episodes_path))
-    episodes = episode_store.get_all()
-
-    if not episodes:
-        print("No episodes found. Run some chat sessions first.")
+    output_path = Path(args.output)
+    feedback_store = FeedbackStore(output_path)
+    incremental = CheckpointedFeedbackAggregator(episodes_path, feedback_store)
+
+    if args.full:
+        print(f"Full rescan requested, rebuilding stats from {episodes_path}...")
+        processed = incremental.rebuild()
+    else:
+        print(f"Reading {episodes_path} from byte offset {incremental.offset}...")
+        processed = incremental.run_once()
+    print(f"Processed {processed} new episodes "
+          f"({incremental.episodes_processed} total since last reset)")
+
+    if args.follow:
+        print(f"Following {episodes_path} (every {args.interval}s, Ctrl+C to stop)...")
+        try:
+            incremental.tail(poll_interval_s=args.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            feedback_store.close()
+        print(f"\nStopped at offset {incremental.offset}")
+
+    stats = feedback_store.get_all()
+    if not stats:
+        print("No construction stats yet. Run some chat sessions first.")
+        feedback_store.close()
         sys.exit(0)
 
-    print(f"Loaded {len(episodes)} episodes")
-
-    # Aggregate
-    print("\nAggregating feedback...")
-    aggregator = FeedbackAggregator()
-    stats = aggregator.aggregate(episodes)
-
-    print(f"Computed stats for {len(stats)} constructions")
-
     # Get summary
+    aggregator = FeedbackAggregator()
     summary = aggregator.get_summary(stats)
     print(f"\n--- Summary ---")
+    print(f"Constructions: {summary['total_constructions']}")
     print(f"Total uses: {summary['total_uses']}")
     print(f"Explicit feedback: {summary['total_explicit_feedback']} (+{summary['explicit_positive']} / -{summary['explicit_negative']})")
     print(f"Implicit feedback: {summary['total_implicit_feedback']} (+{summary['implicit_positive']} / -{summary['implicit_negative']})")
     print(f"Average score: {summary['average_score']:.3f}")
 
-    # Save
-    output_path = Path(args.output)
-    print(f"\nSaving to {output_path}...")
-    feedback_store = FeedbackStore(output_path)
-    feedback_store.bulk_update(stats)
-    print(f"Saved {len(stats)} construction stats")
+    feedback_store.close()
+    print(f"\nSaved to {output_path}")
 
     # Verbose output
     if args.verbose:
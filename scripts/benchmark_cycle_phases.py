@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+scripts/benchmark_cycle_phases.py
+
+CognitiveCycle seri vs paralel faz ve run() vs run_batch() benchmark'i.
+
+Handler'lar I/O bekleyen modulleri taklit etmek icin time.sleep ile
+sentetik gecikme uretir (sleep GIL'i birakir). Iki yerlesim olculur:
+
+    default  - DEFAULT_PHASE_CONFIGS bildirimleri (gercek handler'larin
+               okuma/yazmalari; buyuk olcude zincir)
+    fanout   - RETRIEVE, REASON ve FEEL'in yalnizca PERCEIVE ciktisina
+               bagli oldugu yerlesim
+
+Ayrica gercek handler'larla (register_all_handlers) run() dongusu ile
+run_batch() throughput'u karsilastirilir.
+
+Kullanim:
+    python scripts/benchmark_cycle_phases.py
+    python scripts/benchmark_cycle_phases.py --cycles 50 --scale 0.02
+"""
+
+import argparse
+import dataclasses
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.cycle import CognitiveCycle, CycleConfig
+from engine.events import EventBus
+from engine.handlers import register_all_handlers
+from engine.phases import DEFAULT_PHASE_CONFIGS, Phase, PhaseResult
+from foundation.types import Entity, Stimulus
+
+
+# Faz basina sentetik gecikme (ms, --scale ile carpilir)
+PHASE_COST_MS = {
+    Phase.SENSE: 2,
+    Phase.ATTEND: 1,
+    Phase.PERCEIVE: 5,
+    Phase.RETRIEVE: 15,
+    Phase.REASON: 10,
+    Phase.EVALUATE: 5,
+    Phase.FEEL: 8,
+    Phase.DECIDE: 3,
+    Phase.PLAN: 4,
+    Phase.ACT: 2,
+}
+
+FANOUT_IO = {
+    Phase.RETRIEVE: (("perceived_agents",), ("retrieved_memories",)),
+    Phase.REASON: (("detected_agents",), ("reasoning_results",)),
+    Phase.FEEL: (("detected_agents",), ("social_affect", "state.valence")),
+    Phase.EVALUATE: (
+        ("reasoning_results", "retrieved_memories"),
+        ("situation_assessment",),
+    ),
+    Phase.DECIDE: (
+        ("situation_assessment", "social_affect", "state.valence"),
+        ("selected_action",),
+    ),
+}
+
+
+def fanout_configs():
+    configs = []
+    for config in DEFAULT_PHASE_CONFIGS:
+        if config.phase in FANOUT_IO:
+            inputs, outputs = FANOUT_IO[config.phase]
+            config = dataclasses.replace(config, inputs=inputs, outputs=outputs)
+        configs.append(config)
+    return configs
+
+
+def make_handler(scale: float):
+    def handler(phase, state, context):
+        time.sleep(PHASE_COST_MS[phase] * scale / 1000.0)
+        return PhaseResult(phase=phase, success=True)
+    return handler
+
+
+def build_cycle(configs, parallel: bool, scale: float, workers: int) -> CognitiveCycle:
+    config = CycleConfig(
+        phase_configs=list(configs),
+        emit_events=False,
+        enable_monitoring=False,
+        parallel_phases=parallel,
+        max_workers=workers,
+    )
+    cycle = CognitiveCycle(config=config, event_bus=EventBus())
+    handler = make_handler(scale)
+    for phase in Phase.ordered():
+        cycle.register_handler(phase, handler)
+    return cycle
+
+
+def measure(cycle: CognitiveCycle, cycles: int):
+    cycle.run()  # warmup (thread pool olusturma)
+    latencies = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        cycle.run()
+        latencies.append((time.perf_counter() - start) * 1000)
+    cycle.shutdown()
+    return latencies
+
+
+def make_stimuli(count: int):
+    situations = ["meeting", "market", "conflict", "greeting"]
+    return [
+        Stimulus(
+            stimulus_type="social",
+            intensity=0.3 + 0.1 * (i % 5),
+            content={"situation": situations[i % len(situations)]},
+            source_entity=Entity(id=f"agent-{i % 7}", entity_type="agent"),
+        )
+        for i in range(count)
+    ]
+
+
+def benchmark_batch(count: int):
+    stimuli = make_stimuli(count)
+
+    def real_cycle():
+        cycle = CognitiveCycle(config=CycleConfig(), event_bus=EventBus())
+        register_all_handlers(cycle)
+        cycle.run(stimuli[0])  # warmup
+        return cycle
+
+    cycle = real_cycle()
+    latencies = []
+    start = time.perf_counter()
+    for stimulus in stimuli:
+        t0 = time.perf_counter()
+        cycle.run(stimulus)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    loop_total = time.perf_counter() - start
+
+    batch = real_cycle().run_batch(stimuli)
+
+    print()
+    print(f"Real handlers, {count} stimuli")
+    print(f"{'mode':10}{'cycles/s':>12}{'avg ms':>10}{'p95 ms':>10}")
+    print(f"{'run()':10}{count / loop_total:12.1f}{statistics.mean(latencies):10.2f}"
+          f"{sorted(latencies)[int(0.95 * (count - 1))]:10.2f}")
+    print(f"{'run_batch':10}{batch.cycles_per_second:12.1f}{batch.avg_latency_ms:10.2f}"
+          f"{batch.latency_percentile(95):10.2f}")
+
+
+def main():
+    """Run cycle phase benchmark."""
+    parser = argparse.ArgumentParser(
+        description="CognitiveCycle serial vs parallel phase benchmark"
+    )
+    parser.add_argument("--cycles", "-n", type=int, default=20)
+    parser.add_argument("--scale", "-s", type=float, default=1.0,
+                        help="Sentetik faz gecikmelerinin carpani")
+    parser.add_argument("--workers", "-w", type=int, default=4)
+    parser.add_argument("--batch", "-b", type=int, default=200,
+                        help="run_batch karsilastirmasi icin stimulus sayisi (0 = atla)")
+    args = parser.parse_args()
+
+    layouts = {
+        "default": list(DEFAULT_PHASE_CONFIGS),
+        "fanout": fanout_configs(),
+    }
+    serial_sum = sum(PHASE_COST_MS.values()) * args.scale
+    print(f"Sum of phase costs: {serial_sum:.1f} ms, {args.cycles} cycles")
+    print()
+    print(f"{'layout':10}{'levels':>8}{'serial p50':>13}{'parallel p50':>15}{'speedup':>10}")
+
+    for name, configs in layouts.items():
+        serial = measure(build_cycle(configs, False, args.scale, args.workers), args.cycles)
+        parallel_cycle = build_cycle(configs, True, args.scale, args.workers)
+        levels = len(parallel_cycle.phase_graph.levels())
+        parallel = measure(parallel_cycle, args.cycles)
+
+        serial_p50 = statistics.median(serial)
+        parallel_p50 = statistics.median(parallel)
+        print(f"{name:10}{levels:8d}{serial_p50:13.2f}{parallel_p50:15.2f}"
+              f"{serial_p50 / parallel_p50:9.2f}x")
+
+    if args.batch > 0:
+        benchmark_batch(args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+scripts/benchmark_semantic_persistence.py
+
+SemanticMemory persistence benchmark.
+
+JSON (save/load) ile binary memmap formatini (save_binary/load_binary)
+kayit suresi, yukleme suresi ve disk boyutu acisindan karsilastirir.
+Embedding'ler sentetik uretilir; model yuklenmez.
+
+Kullanim:
+    python scripts/benchmark_semantic_persistence.py
+    python scripts/benchmark_semantic_persistence.py --entries 50000 --dimension 768
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.semantic import SemanticMemory
+from core.memory.types import SourceType
+
+
+class SyntheticEncoder:
+    """Rastgele (seed'li) embedding ureten encoder."""
+
+    def __init__(self, dimension: int, seed: int = 42):
+        self._rng = np.random.default_rng(seed)
+        self._dimension = dimension
+
+    def encode(self, text):
+        return self._rng.standard_normal(self._dimension).astype(np.float32)
+
+    def encode_batch(self, texts):
+        return self._rng.standard_normal((len(texts), self._dimension)).astype(np.float32)
+
+
+def build_memory(entries: int, dimension: int) -> SemanticMemory:
+    memory = SemanticMemory(encoder=SyntheticEncoder(dimension))
+    source_types = list(SourceType)
+    memory.add_batch([
+        {
+            "id": f"item-{i}",
+            "content": f"Ornek icerik {i}",
+            "source_type": source_types[i % len(source_types)],
+            "extra_data": {"index": i},
+        }
+        for i in range(entries)
+    ])
+    return memory
+
+
+def path_size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)
+        )
+    return os.path.getsize(path)
+
+
+def timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run persistence benchmark."""
+    parser = argparse.ArgumentParser(
+        description="SemanticMemory JSON vs binary persistence benchmark"
+    )
+    parser.add_argument("--entries", "-n", type=int, default=10000)
+    parser.add_argument("--dimension", "-d", type=int, default=384)
+    parser.add_argument("--append", "-a", type=int, default=100,
+                        help="Incremental save icin eklenecek kayit sayisi")
+    args = parser.parse_args()
+
+    print(f"Building index: {args.entries} entries x {args.dimension} dims")
+    memory = build_memory(args.entries, args.dimension)
+    workdir = tempfile.mkdtemp(prefix="semantic_bench_")
+
+    try:
+        json_path = os.path.join(workdir, "index.json")
+        binary_path = os.path.join(workdir, "index_bin")
+
+        json_save = timed(memory.save, json_path)
+        binary_save = timed(memory.save_binary, binary_path)
+
+        json_load = timed(SemanticMemory(encoder=memory.encoder).load, json_path)
+        binary_load = timed(
+            SemanticMemory(encoder=memory.encoder).load_binary, binary_path, mmap=False
+        )
+        mmap_load = timed(SemanticMemory(encoder=memory.encoder).load_binary, binary_path)
+
+        memory.add_batch([
+            {"id": f"extra-{i}", "content": f"Ek icerik {i}", "source_type": SourceType.FACT}
+            for i in range(args.append)
+        ])
+        incremental_save = timed(memory.save_binary, binary_path)
+
+        json_size = path_size(json_path)
+        binary_size = path_size(binary_path)
+
+        print()
+        print(f"{'':24}{'JSON':>12}{'binary':>12}{'speedup':>10}")
+        print(f"{'save (s)':24}{json_save:12.3f}{binary_save:12.3f}"
+              f"{json_save / binary_save:9.1f}x")
+        print(f"{'load (s)':24}{json_load:12.3f}{binary_load:12.3f}"
+              f"{json_load / binary_load:9.1f}x")
+        print(f"{'load mmap (s)':24}{'':12}{mmap_load:12.3f}"
+              f"{json_load / mmap_load:9.1f}x")
+        print(f"{'size (MB)':24}{json_size / 1e6:12.2f}{binary_size / 1e6:12.2f}"
+              f"{json_size / binary_size:9.1f}x")
+        print(f"{f'append {args.append} (s)':24}{'':12}{incremental_save:12.4f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
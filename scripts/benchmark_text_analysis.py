@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+scripts/benchmark_text_analysis.py
+
+Mesaj basina CPU suresi: paylasilan AnalyzedText vs modul basina analiz.
+
+Iki olcum yapilir (time.process_time):
+
+    modules   - Mesaji okuyan modul cagrilari (IntentRecognizer, SituationBuilder
+                duygu/konu/risk/aktor, ContextManager sentiment/topic,
+                UEMChatAgent intent). "unshared" modunda her cagridan once
+                analyze() cache'i temizlenir; boylece her modul metni yeniden
+                normalize edip tarar (eski davranis). "shared" modunda mesaj
+                bir kez analiz edilir ve ayni nesne tum modullere verilir.
+    pipeline  - ThoughtToSpeechPipeline.process uctan uca (mesaj basina bir
+                analiz, cache her mesajdan once temizlenir).
+
+Kullanim:
+    python scripts/benchmark_text_analysis.py
+    python scripts/benchmark_text_analysis.py --rounds 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.language.analysis import analyze, clear_analysis_cache
+from core.language.chat_agent import UEMChatAgent
+from core.language.conversation import ContextManager
+from core.language.conversation.types import Message
+from core.language.dialogue.situation_builder import SituationBuilder
+from core.language.intent import IntentRecognizer
+from core.language.pipeline import ThoughtToSpeechPipeline
+
+
+CORPUS = [
+    "Merhaba, nasılsın?",
+    "Selam! Bugün nasıl gidiyor?",
+    "Günaydın, iyi misin?",
+    "Çok üzgünüm, işten çıkarıldım ve ne yapacağımı bilmiyorum.",
+    "Arkadaşım bana çok kızgın, onunla nasıl konuşmalıyım?",
+    "Peki bunun için doktora gitmeli miyim?",
+    "Bilgisayarım çok yavaş çalışıyor, yardım eder misin?",
+    "Teşekkür ederim, gerçekten çok yardımcı oldun!",
+    "Sınavım yarın ve çok heyecanlıyım, biraz da panik oldum.",
+    "Annem hastanede, çok endişeliyim.",
+    "Bu kod neden hata veriyor anlamıyorum?",
+    "Harika bir gün geçirdim, çok mutluyum!",
+    "Ya şimdi ne olacak?",
+    "Kendimi çok yalnız hissediyorum son zamanlarda.",
+    "Patronum maaşımı artırmıyor, istifa etmeli miyim?",
+    "Hoşçakal, görüşürüz!",
+    "Lütfen bana bir tarif anlatır mısın?",
+    "Sevgilimle ayrıldık, dayanamıyorum.",
+    "Okulda yeni bir ders başladı, programlama öğreniyorum.",
+    "Sen kimsin? Ne yapabilirsin?",
+    "Tamam ama bu yeterli değil, başka bir yol var mı?",
+    "Bugün hava çok güzel, dışarı çıkacağım.",
+    "Kardeşimle kavga ettik, barışmak istiyorum ama nasıl?",
+    "Eyvallah, sağol kanka.",
+]
+
+
+def make_modules():
+    return {
+        "intent": IntentRecognizer(),
+        "situation": SituationBuilder(),
+        "context": ContextManager(),
+        "agent": UEMChatAgent.__new__(UEMChatAgent),
+    }
+
+
+def module_calls(modules, message, text):
+    """Mesaji okuyan modul cagrilari; text = str veya AnalyzedText."""
+    situation = modules["situation"]
+    context = modules["context"]
+    user_msg = Message(role="user", content=message)
+    return [
+        lambda: modules["intent"].recognize(text),
+        lambda: situation._extract_actors(text),
+        lambda: situation._detect_risks(text, []),
+        lambda: situation._detect_emotion(text),
+        lambda: situation._determine_topic(text),
+        lambda: context._update_sentiment(user_msg, None if isinstance(text, str) else text),
+        lambda: context._update_topic(user_msg, None if isinstance(text, str) else text),
+        lambda: modules["agent"]._detect_intent(text),
+    ]
+
+
+def bench_modules(rounds: int, shared: bool) -> float:
+    """Mesaj basina ortalama CPU suresi (ms)."""
+    modules = make_modules()
+    total = 0.0
+    count = 0
+    for _ in range(rounds):
+        for message in CORPUS:
+            clear_analysis_cache()
+            start = time.process_time()
+            if shared:
+                text = analyze(message)
+                for call in module_calls(modules, message, text):
+                    call()
+            else:
+                for call in module_calls(modules, message, message):
+                    clear_analysis_cache()
+                    call()
+            total += time.process_time() - start
+            count += 1
+    return total / count * 1000
+
+
+def bench_pipeline(rounds: int) -> float:
+    """ThoughtToSpeechPipeline.process mesaj basina ortalama CPU suresi (ms)."""
+    pipeline = ThoughtToSpeechPipeline()
+    pipeline.process(CORPUS[0])  # warmup
+    total = 0.0
+    count = 0
+    for _ in range(rounds):
+        for message in CORPUS:
+            clear_analysis_cache()
+            start = time.process_time()
+            pipeline.process(message)
+            total += time.process_time() - start
+            count += 1
+    return total / count * 1000
+
+
+def main():
+    """Run text analysis benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Shared AnalyzedText vs per-module text analysis benchmark"
+    )
+    parser.add_argument("--rounds", "-r", type=int, default=10,
+                        help="Corpus tekrar sayisi")
+    parser.add_argument("--skip-pipeline", action="store_true",
+                        help="Uctan uca pipeline olcumunu atla")
+    args = parser.parse_args()
+
+    messages = args.rounds * len(CORPUS)
+    print(f"{len(CORPUS)} messages x {args.rounds} rounds = {messages} messages")
+    print()
+
+    bench_modules(1, True)  # warmup
+    unshared = bench_modules(args.rounds, shared=False)
+    shared = bench_modules(args.rounds, shared=True)
+
+    print(f"{'mode':12}{'CPU ms/msg':>12}")
+    print(f"{'unshared':12}{unshared:12.4f}")
+    print(f"{'shared':12}{shared:12.4f}  ({unshared / shared:.2f}x)")
+
+    if not args.skip_pipeline:
+        print()
+        print(f"{'pipeline':12}{bench_pipeline(args.rounds):12.4f}  (end-to-end process)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+scripts/benchmark_text_normalize.py
+
+normalize_turkish ve tokenize_turkish mikro-benchmark'i.
+
+Olculen varyantlar (mesaj basina ortalama mikro-saniye):
+
+    chained      - eski uygulama: 12 str.replace + lower()
+    translate    - tek gecis str.translate(TURKISH_TO_ASCII) + lower()
+    uncached     - yeni uygulama, cache'siz (ASCII hizli yol + tablo)
+    turn         - eski vs yeni (cache'li); her mesaj bir turda N modul tarafindan
+                   normalize edilir (--repeat, varsayilan 6)
+
+Tokenizer icin regex \\w+ ve str.split() ile karsilastirma yapilir
+(miss: cache her cagridan once temizlenir, hit: tekrar eden girdi).
+
+Kullanim:
+    python scripts/benchmark_text_normalize.py
+    python scripts/benchmark_text_normalize.py --number 2000 --repeat 8
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils.text import (
+    TURKISH_TO_ASCII,
+    _normalize_uncached,
+    clear_text_caches,
+    normalize_turkish,
+    text_cache_info,
+    tokenize_turkish,
+)
+
+
+# Gercekci sohbet mesajlari: kisa selamlasmalar, uzun anlatimlar,
+# ASCII-only (Turkce karaktersiz yazilmis) mesajlar, emoji ve buyuk harf
+CORPUS = [
+    "Merhaba!",
+    "Selam, nasılsın?",
+    "slm naber",
+    "Günaydın 😊",
+    "Teşekkür ederim, çok yardımcı oldun.",
+    "tesekkurler cok sagol",
+    "Çok üzgünüm, işten çıkarıldım ve ne yapacağımı bilmiyorum.",
+    "Arkadaşım bana çok kızgın, onunla nasıl konuşmalıyım?",
+    "Peki bunun için doktora gitmeli miyim?",
+    "Bilgisayarım çok yavaş çalışıyor, yardım eder misin?",
+    "ŞU AN ÇOK SİNİRLİYİM!!!",
+    "Ankara'ya yarın gidiyorum, hava nasıl olacak?",
+    "ok",
+    "Sınavım yarın ve çok heyecanlıyım, biraz da panik oldum. Geçen dönem "
+    "aynı dersten kalmıştım ve bu sefer geçmem lazım, yoksa bursumu "
+    "kaybedeceğim. Nasıl çalışmalıyım, bir plan önerebilir misin?",
+    "hey whats up, can you help me with something",
+    "Annem hastanede, çok endişeliyim. Doktorlar henüz bir şey söylemedi.",
+    "Bu kod neden hata veriyor anlamıyorum? TypeError: 'NoneType' object",
+    "Hoşçakal, görüşürüz!",
+    "Kendimi çok yalnız hissediyorum son zamanlarda, kimseyle konuşamıyorum.",
+    "İyi geceler",
+]
+
+_TRANSLATE_TABLE = str.maketrans(TURKISH_TO_ASCII)
+_WORD_RE = re.compile(r"\w+")
+
+
+def chained(text: str) -> str:
+    result = text
+    for tr_char, ascii_char in TURKISH_TO_ASCII.items():
+        result = result.replace(tr_char, ascii_char)
+    return result.lower()
+
+
+def translate(text: str) -> str:
+    return text.translate(_TRANSLATE_TABLE).lower()
+
+
+def per_message_us(func, number: int) -> float:
+    """Corpus uzerinde mesaj basina ortalama sure (mikro-saniye, en iyi 5)."""
+    def run():
+        for message in CORPUS:
+            func(message)
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / (number * len(CORPUS)) * 1e6
+
+
+def main():
+    """Run normalize/tokenize microbenchmarks."""
+    parser = argparse.ArgumentParser(description="normalize_turkish microbenchmark")
+    parser.add_argument("--number", "-n", type=int, default=1000,
+                        help="Corpus tekrar sayisi (timeit number)")
+    parser.add_argument("--repeat", "-r", type=int, default=6,
+                        help="Bir turda ayni mesaji normalize eden modul sayisi")
+    args = parser.parse_args()
+
+    for message in CORPUS:
+        assert normalize_turkish(message) == chained(message) == translate(message)
+
+    ascii_share = sum(m.isascii() for m in CORPUS) / len(CORPUS)
+    print(f"{len(CORPUS)} messages ({ascii_share:.0%} ASCII-only), "
+          f"number={args.number}, {args.repeat} normalizations/turn")
+    print()
+
+    base = per_message_us(chained, args.number)
+    rows = [
+        ("chained", base),
+        ("translate", per_message_us(translate, args.number)),
+        ("uncached", per_message_us(_normalize_uncached, args.number)),
+    ]
+
+    # Bir tur: ilk cagri miss, kalan (repeat - 1) cagri cache hit
+    def turn(message):
+        clear_text_caches()
+        for _ in range(args.repeat):
+            normalize_turkish(message)
+
+    def legacy_turn(message):
+        for _ in range(args.repeat):
+            chained(message)
+
+    legacy_turn_us = per_message_us(legacy_turn, max(1, args.number // args.repeat))
+    cached_turn_us = per_message_us(turn, max(1, args.number // args.repeat))
+
+    print(f"{'normalize':14}{'us/msg':>10}{'vs chained':>12}")
+    for name, value in rows:
+        print(f"{name:14}{value:10.3f}{base / value:11.2f}x")
+    print()
+    print(f"{'turn (x' + str(args.repeat) + ')':14}{'us/msg':>10}{'speedup':>12}")
+    print(f"{'chained':14}{legacy_turn_us:10.3f}")
+    print(f"{'cached':14}{cached_turn_us:10.3f}{legacy_turn_us / cached_turn_us:11.2f}x")
+    print()
+
+    clear_text_caches()
+    rows = [
+        ("str.split", per_message_us(lambda m: normalize_turkish(m).split(), args.number)),
+        ("regex \\w+", per_message_us(lambda m: _WORD_RE.findall(normalize_turkish(m)), args.number)),
+        ("tokenize/miss", per_message_us(
+            lambda m: (clear_text_caches(), tokenize_turkish(m)), args.number)),
+        ("tokenize/hit", per_message_us(tokenize_turkish, args.number)),
+    ]
+    print(f"{'tokenize':14}{'us/msg':>10}")
+    for name, value in rows:
+        print(f"{name:14}{value:10.3f}")
+    print()
+    print(f"cache: {text_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -452,27 +452,19 @@ class EpisodeGenerator:
         print()
 
         try:
-            from core.learning.episode_store import JSONLEpisodeStore
-            from core.learning.feedback_aggregator import FeedbackAggregator
+            from core.learning.feedback_aggregator import CheckpointedFeedbackAggregator
             from core.learning.feedback_store import FeedbackStore
 
-            # Load episodes
+            # Full rebuild: resets stats and checkpoints at the end of the log,
+            # so later incremental runs do not count these episodes again
             episodes_path = project_root / "data" / "episodes.jsonl"
-            store = JSONLEpisodeStore(str(episodes_path))
-            episodes = store.get_all()
-
-            print(f"Loaded {len(episodes)} total episodes from store")
-
-            # Aggregate feedback
-            aggregator = FeedbackAggregator()
-            stats = aggregator.aggregate(episodes)
-
-            print(f"Computed stats for {len(stats)} constructions")
-
-            # Save to construction_stats.json
             stats_path = project_root / "data" / "construction_stats.json"
             feedback_store = FeedbackStore(stats_path)
-            feedback_store.bulk_update(stats)
+            processed = CheckpointedFeedbackAggregator(episodes_path, feedback_store).rebuild()
+            stats = feedback_store.get_all()
+
+            print(f"Loaded {processed} total episodes from store")
+            print(f"Computed stats for {len(stats)} constructions")
 
             print(f"Saved construction stats to: {stats_path}")
             print()
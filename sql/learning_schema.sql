@@ -49,6 +49,11 @@ CREATE INDEX IF NOT EXISTS idx_patterns_created_at ON patterns(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_patterns_success_count ON patterns(success_count DESC);
 CREATE INDEX IF NOT EXISTS idx_patterns_last_used ON patterns(last_used DESC);
 
+-- Covering index for PatternRepository.get_stats (GROUP BY pattern_type):
+-- counts are read from the index without touching the heap
+CREATE INDEX IF NOT EXISTS idx_patterns_type_counts
+    ON patterns(pattern_type) INCLUDE (success_count, failure_count);
+
 -- Comment
 COMMENT ON TABLE patterns IS 'Learning patterns - ogrenilen davranis patternleri';
 
@@ -87,6 +92,11 @@ CREATE INDEX IF NOT EXISTS idx_feedbacks_timestamp ON feedbacks(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_feedbacks_type ON feedbacks(feedback_type);
 CREATE INDEX IF NOT EXISTS idx_feedbacks_value ON feedbacks(value);
 
+-- Covering index for FeedbackRepository.get_stats (single COUNT ... FILTER
+-- aggregate): allows an index-only scan instead of a full table scan
+CREATE INDEX IF NOT EXISTS idx_feedbacks_stats
+    ON feedbacks(feedback_type, value) INCLUDE (user_id, interaction_id);
+
 -- Comment
 COMMENT ON TABLE feedbacks IS 'Learning feedbacks - geri bildirim kayitlari';
 
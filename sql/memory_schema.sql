@@ -307,6 +307,57 @@ CREATE INDEX idx_cycle_metrics_started ON cycle_metrics(started_at DESC);
 CREATE INDEX idx_cycle_metrics_cycle_id ON cycle_metrics(cycle_id);
 CREATE INDEX idx_cycle_metrics_success ON cycle_metrics(success);
 
+-- ═══════════════════════════════════════════════════════════════════════════
+-- CYCLE METRIC ROLLUPS
+-- Dashboard için dakika/saat bazında önceden toplanmış cycle metrikleri.
+-- MonitoringPersistence her toplu yazımda artımlı olarak günceller.
+-- ═══════════════════════════════════════════════════════════════════════════
+
+DROP TABLE IF EXISTS cycle_metric_rollups CASCADE;
+
+CREATE TABLE cycle_metric_rollups (
+    bucket_size TEXT NOT NULL CHECK (bucket_size IN ('minute', 'hour')),
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+
+    cycle_count INT NOT NULL DEFAULT 0,
+    success_count INT NOT NULL DEFAULT 0,
+    duration_sum_ms FLOAT NOT NULL DEFAULT 0,
+    duration_count INT NOT NULL DEFAULT 0,
+
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (bucket_size, bucket_start)
+);
+
+DROP TABLE IF EXISTS phase_duration_rollups CASCADE;
+
+CREATE TABLE phase_duration_rollups (
+    bucket_size TEXT NOT NULL CHECK (bucket_size IN ('minute', 'hour')),
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    phase TEXT NOT NULL,
+
+    duration_sum_ms FLOAT NOT NULL DEFAULT 0,
+    sample_count INT NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (bucket_size, bucket_start, phase)
+);
+
+-- Mevcut cycle_metrics verisinden rollup'ları yeniden oluşturmak için:
+--
+--   INSERT INTO cycle_metric_rollups
+--       (bucket_size, bucket_start, cycle_count, success_count, duration_sum_ms, duration_count)
+--   SELECT b.size, date_trunc(b.size, started_at), COUNT(*),
+--          COUNT(*) FILTER (WHERE success), COALESCE(SUM(duration_ms), 0), COUNT(duration_ms)
+--   FROM cycle_metrics, (VALUES ('minute'), ('hour')) AS b(size)
+--   GROUP BY 1, 2;
+--
+--   INSERT INTO phase_duration_rollups
+--       (bucket_size, bucket_start, phase, duration_sum_ms, sample_count)
+--   SELECT b.size, date_trunc(b.size, started_at), p.key, SUM(p.value::float), COUNT(*)
+--   FROM cycle_metrics, jsonb_each_text(phase_durations) AS p,
+--        (VALUES ('minute'), ('hour')) AS b(size)
+--   GROUP BY 1, 2, 3;
+
 -- ═══════════════════════════════════════════════════════════════════════════
 -- ACTIVITY LOG
 -- Dashboard için aktivite logları
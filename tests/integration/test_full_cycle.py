@@ -17,7 +17,7 @@ from datetime import datetime
 
 # Engine
 from engine.cycle import CognitiveCycle, CycleConfig, CycleState
-from engine.phases import Phase, PhaseConfig, PhaseResult, DEFAULT_PHASE_CONFIGS
+from engine.phases import Phase, PhaseConfig, PhaseGraph, PhaseResult, DEFAULT_PHASE_CONFIGS
 from engine.events import EventBus, EventType, Event, get_event_bus
 
 # Foundation
@@ -946,5 +946,790 @@ class TestErrorHandling:
         assert result.phase_results[Phase.SENSE].success is False
 
 
+# ============================================================================
+# PARALLEL PHASE TESTS
+# ============================================================================
+
+def _fanout_configs():
+    """RETRIEVE ve FEEL yalnizca PERCEIVE ciktisina bagli."""
+    return [
+        PhaseConfig(Phase.SENSE, inputs=("stimulus",), outputs=("perceptual_input",)),
+        PhaseConfig(Phase.PERCEIVE, inputs=("perceptual_input",), outputs=("detected_agents",)),
+        PhaseConfig(Phase.RETRIEVE, inputs=("detected_agents",), outputs=("retrieved_memories",)),
+        PhaseConfig(Phase.FEEL, inputs=("detected_agents",), outputs=("state.valence",)),
+        PhaseConfig(
+            Phase.DECIDE,
+            inputs=("retrieved_memories", "state.valence"),
+            outputs=("selected_action",),
+        ),
+    ]
+
+
+_CORE_STATE_FIELDS = ("resource", "threat", "wellbeing")
+
+# Engine'in yönettiği anahtarlar ve cycle dışından gelen girdiler
+_ENGINE_KEYS = {"phase_results", "phase_budgets", "cycle_metrics"}
+_EXTERNAL_INPUTS = {"stimulus", "agent", "entity", "relationship", "empathy_context",
+                    "current_attention"}
+
+
+class _RecordingMetadata(dict):
+    """Okunan/yazılan anahtarları kaydeden metadata sözlüğü."""
+
+    def __init__(self, data, reads, writes, prefix=""):
+        super().__init__(data)
+        self._reads, self._writes, self._prefix = reads, writes, prefix
+
+    def _read(self, key):
+        self._reads.add(self._prefix + str(getattr(key, "value", key)))
+
+    def __getitem__(self, key):
+        self._read(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._read(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self._read(key)
+        return super().__contains__(key)
+
+    def __setitem__(self, key, value):
+        self._writes.add(self._prefix + str(key))
+        super().__setitem__(key, value)
+
+
+class _RecordingState(StateVector):
+    """Okunan/yazılan alanları "state.<alan>" olarak kaydeden StateVector."""
+
+    def __getattribute__(self, name):
+        if name in _CORE_STATE_FIELDS:
+            log = object.__getattribute__(self, "__dict__").get("_log")
+            if log:
+                log[0].add("state." + name)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name, value):
+        log = self.__dict__.get("_log")
+        if name in _CORE_STATE_FIELDS and log:
+            log[1].add("state." + name)
+        object.__setattr__(self, name, value)
+
+    def get(self, key, default=0.0):
+        if key.value not in _CORE_STATE_FIELDS:
+            self._log[0].add("state." + key.value)
+        return super().get(key, default)
+
+    def set(self, key, value):
+        if key.value not in _CORE_STATE_FIELDS:
+            self._log[1].add("state." + key.value)
+        super().set(key, value)
+
+    def has(self, key):
+        self._log[0].add("state." + key.value)
+        return super().has(key)
+
+
+def _recording_handler(handler, access):
+    """Handler'ı kayıt yapan state/metadata kopyalarıyla çalıştır, sonra geri yaz."""
+
+    def run(phase, state, context):
+        reads, writes = access.setdefault(phase, (set(), set()))
+        recorded_state = _RecordingState(
+            resource=state.resource, threat=state.threat, wellbeing=state.wellbeing,
+        )
+        recorded_state._extensions = dict(state._extensions)
+        recorded_state.__dict__["_log"] = (reads, writes)
+
+        shared = context.metadata
+        recorded = _RecordingMetadata(shared, reads, writes)
+        dict.__setitem__(recorded, "phase_results", _RecordingMetadata(
+            shared["phase_results"], reads, writes, prefix="phase_results.",
+        ))
+        context.metadata = recorded
+        try:
+            return handler(phase, recorded_state, context)
+        finally:
+            context.metadata = shared
+            recorded_state.__dict__["_log"] = None
+            for key, value in dict.items(recorded):
+                if key != "phase_results":
+                    shared[key] = value
+            for key, value in recorded_state:
+                state.set(key, value)
+
+    return run
+
+
+class TestPhaseGraph:
+    """Test phase dependency graph construction."""
+
+    def test_fanout_levels(self):
+        graph = PhaseGraph(_fanout_configs())
+
+        assert graph.levels() == [
+            [Phase.SENSE],
+            [Phase.PERCEIVE],
+            [Phase.RETRIEVE, Phase.FEEL],
+            [Phase.DECIDE],
+        ]
+        assert graph.dependencies[Phase.DECIDE] == {Phase.RETRIEVE, Phase.FEEL}
+        assert graph.max_parallelism == 2
+
+    def test_write_after_read_orders_phases(self):
+        graph = PhaseGraph([
+            PhaseConfig(Phase.REASON, inputs=("x",), outputs=("y",)),
+            PhaseConfig(Phase.EVALUATE, inputs=(), outputs=("x",)),
+        ])
+
+        assert graph.dependencies[Phase.EVALUATE] == {Phase.REASON}
+
+    def test_undeclared_phase_is_barrier(self):
+        graph = PhaseGraph([
+            PhaseConfig(Phase.SENSE, inputs=(), outputs=("a",)),
+            PhaseConfig(Phase.ATTEND),
+            PhaseConfig(Phase.PERCEIVE, inputs=(), outputs=("b",)),
+        ])
+
+        assert graph.dependencies[Phase.ATTEND] == {Phase.SENSE}
+        assert graph.dependencies[Phase.PERCEIVE] == {Phase.ATTEND}
+
+    def test_default_configs_declare_io(self):
+        for config in DEFAULT_PHASE_CONFIGS:
+            assert config.inputs is not None
+            assert config.outputs is not None
+
+        graph = PhaseGraph(DEFAULT_PHASE_CONFIGS)
+        assert Phase.FEEL in graph.dependencies[Phase.DECIDE]
+
+    def test_result_artifact_orders_reader(self):
+        from engine.phases import result_artifact
+
+        graph = PhaseGraph([
+            PhaseConfig(Phase.FEEL, inputs=(), outputs=()),
+            PhaseConfig(Phase.DECIDE, inputs=(result_artifact(Phase.FEEL),), outputs=()),
+            PhaseConfig(Phase.ACT, inputs=(), outputs=()),
+        ])
+
+        assert graph.dependencies[Phase.DECIDE] == {Phase.FEEL}
+        assert graph.dependencies[Phase.ACT] == frozenset()
+
+    def test_default_configs_match_handler_access(self, event_bus):
+        from engine.handlers import register_all_handlers
+
+        cycle = CognitiveCycle(CycleConfig(), event_bus=event_bus)
+        register_all_handlers(cycle)
+        cycle.register_handler(Phase.ATTEND, create_attend_handler())
+        access = {}
+        for phase in Phase.ordered():
+            cycle.register_handler(phase, _recording_handler(cycle._handlers[phase], access))
+
+        stimuli = [
+            Stimulus(
+                stimulus_type="social",
+                intensity=0.8,
+                source_entity=Entity(
+                    id="rival", entity_type="agent",
+                    attributes={"expression": "angry", "hostile": True},
+                ),
+                content={"verbal": "Get out!", "situation": "confrontation"},
+            ),
+            Stimulus(
+                stimulus_type="social",
+                intensity=0.5,
+                source_entity=Entity(
+                    id="friend", entity_type="agent",
+                    attributes={"expression": "sad", "relationship": "friend"},
+                ),
+                content={"verbal": "help me", "situation": "distress"},
+            ),
+            Stimulus(stimulus_type="visual", intensity=0.2, content={}),
+            None,
+        ]
+        for stimulus in stimuli:
+            result = cycle.run(stimulus)
+            assert all(r.success for r in result.phase_results.values())
+
+        # PhaseGraph kenarları birebir ad eşleşmesiyle kurar; burada da öyle
+        configs = {c.phase: c for c in DEFAULT_PHASE_CONFIGS}
+        for phase, (reads, writes) in access.items():
+            config = configs[phase]
+            undeclared_reads = reads - _ENGINE_KEYS - set(config.inputs)
+            undeclared_writes = writes - set(config.outputs)
+            assert not undeclared_reads, f"{phase.value} reads {undeclared_reads}"
+            assert not undeclared_writes, f"{phase.value} writes {undeclared_writes}"
+
+        # Her bildirilen metadata girdisini önceki bir faz üretir veya dışarıdan gelir
+        produced = set()
+        for config in DEFAULT_PHASE_CONFIGS:
+            for name in config.inputs:
+                if name.startswith(("state.", "phase_results.")) or name in _EXTERNAL_INPUTS:
+                    continue
+                assert name in produced, f"{config.phase.value} input {name!r} has no producer"
+            produced.update(config.outputs)
+
+
+class TestParallelPhases:
+    """Test parallel phase execution."""
+
+    @staticmethod
+    def _parallel_cycle(event_bus, **kwargs):
+        config = CycleConfig(
+            phase_configs=_fanout_configs(),
+            parallel_phases=True,
+            **kwargs,
+        )
+        return CognitiveCycle(config=config, event_bus=event_bus)
+
+    def test_independent_phases_overlap(self, event_bus):
+        import threading
+
+        cycle = self._parallel_cycle(event_bus)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meeting_handler(phase, state, context):
+            barrier.wait()  # Iki faz ayni anda calismiyorsa BrokenBarrierError
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.RETRIEVE, meeting_handler)
+        cycle.register_handler(Phase.FEEL, meeting_handler)
+        result = cycle.run()
+        cycle.shutdown()
+
+        assert result.phase_results[Phase.RETRIEVE].success
+        assert result.phase_results[Phase.FEEL].success
+
+    def test_results_merged_in_config_order(self, event_bus):
+        import time as _time
+
+        cycle = self._parallel_cycle(event_bus)
+
+        def slow_handler(phase, state, context):
+            _time.sleep(0.05)
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.RETRIEVE, slow_handler)
+        seen = {}
+
+        def decide_handler(phase, state, context):
+            seen.update(context.metadata["phase_results"])
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.DECIDE, decide_handler)
+        result = cycle.run()
+        cycle.shutdown()
+
+        expected = [c.phase for c in _fanout_configs()]
+        assert list(result.phase_results) == expected
+        assert Phase.RETRIEVE in seen and Phase.FEEL in seen
+
+    def test_matches_serial_with_real_handlers(self, event_bus):
+        stimulus = Stimulus(
+            stimulus_type="social",
+            intensity=0.6,
+            content={"situation": "meeting"},
+        )
+
+        results = []
+        for parallel in (False, True):
+            config = CycleConfig(parallel_phases=parallel)
+            cycle = CognitiveCycle(config=config, event_bus=event_bus)
+            cycle.register_handler(Phase.SENSE, create_sense_handler())
+            cycle.register_handler(Phase.ATTEND, create_attend_handler())
+            cycle.register_handler(Phase.PERCEIVE, create_perceive_handler())
+            results.append(cycle.run(stimulus))
+            cycle.shutdown()
+
+        serial, parallel = results
+        assert list(serial.phase_results) == list(parallel.phase_results)
+        assert serial.state_vector.get(SVField.AROUSAL) == parallel.state_vector.get(SVField.AROUSAL)
+
+    def test_stop_on_error_skips_dependents(self, event_bus):
+        cycle = self._parallel_cycle(event_bus, stop_on_error=True)
+
+        def failing_handler(phase, state, context):
+            raise ValueError("Critical error")
+
+        cycle.register_handler(Phase.PERCEIVE, failing_handler)
+        result = cycle.run()
+        cycle.shutdown()
+
+        assert result.phase_results[Phase.PERCEIVE].success is False
+        assert Phase.RETRIEVE not in result.phase_results
+        assert Phase.DECIDE not in result.phase_results
+
+    def test_disabled_phase_does_not_block(self, event_bus):
+        configs = _fanout_configs()
+        configs[2].enabled = False  # RETRIEVE
+        config = CycleConfig(phase_configs=configs, parallel_phases=True)
+        cycle = CognitiveCycle(config=config, event_bus=event_bus)
+
+        result = cycle.run()
+        cycle.shutdown()
+
+        assert result.phase_results[Phase.RETRIEVE].skipped
+        assert Phase.DECIDE in result.phase_results
+
+
+# ============================================================================
+# DEADLINE TESTS
+# ============================================================================
+
+class TestPhaseDeadlines:
+    """Test phase budgets and cycle time budget."""
+
+    @staticmethod
+    def _sleeping_handler(seconds):
+        import time as _time
+
+        def handler(phase, state, context):
+            _time.sleep(seconds)
+            return PhaseResult(phase=phase, success=True, output={"done": True})
+        return handler
+
+    def test_deadline_miss_counted_without_enforcement(self, event_bus):
+        configs = [PhaseConfig(Phase.SENSE, timeout_ms=5), PhaseConfig(Phase.ACT)]
+        cycle = CognitiveCycle(CycleConfig(phase_configs=configs), event_bus=event_bus)
+        cycle.register_handler(Phase.SENSE, self._sleeping_handler(0.03))
+
+        result = cycle.run()
+
+        # Handler beklenir, sonucu kullanılır ama aşım sayılır
+        assert result.phase_results[Phase.SENSE].output == {"done": True}
+        assert cycle.current_metrics.deadline_misses == {Phase.SENSE.value: 1}
+        stats = cycle.metrics_history.get_deadline_stats()
+        assert stats["misses"] == {Phase.SENSE.value: 1}
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_enforced_deadline_uses_partial_output(self, event_bus, parallel):
+        import threading
+        from engine.phases import get_phase_budget
+
+        release = threading.Event()
+
+        def slow_handler(phase, state, context):
+            budget = get_phase_budget(context, phase)
+            budget.publish_partial({"items": 1})
+            release.wait(timeout=2)
+            return PhaseResult(phase=phase, success=True, output={"items": 5})
+
+        configs = [
+            PhaseConfig(Phase.RETRIEVE, timeout_ms=20, inputs=(), outputs=("m",)),
+            PhaseConfig(Phase.DECIDE, inputs=("m",), outputs=()),
+        ]
+        cycle = CognitiveCycle(
+            CycleConfig(
+                phase_configs=configs,
+                enforce_deadlines=True,
+                parallel_phases=parallel,
+            ),
+            event_bus=event_bus,
+        )
+        cycle.register_handler(Phase.RETRIEVE, slow_handler)
+
+        result = cycle.run()
+        release.set()
+        cycle.shutdown()
+
+        retrieve = result.phase_results[Phase.RETRIEVE]
+        assert retrieve.degraded
+        assert retrieve.success
+        assert retrieve.output == {"items": 1}
+        assert retrieve.status_str == "DEGRADED"
+        assert Phase.DECIDE in result.phase_results
+        assert cycle.current_metrics.deadline_misses == {Phase.RETRIEVE.value: 1}
+
+    def test_enforced_deadline_without_partial_fails(self, event_bus):
+        import threading
+
+        release = threading.Event()
+
+        def stuck_handler(phase, state, context):
+            release.wait(timeout=2)
+            return PhaseResult(phase=phase, success=True)
+
+        configs = [PhaseConfig(Phase.REASON, timeout_ms=10)]
+        cycle = CognitiveCycle(
+            CycleConfig(phase_configs=configs, enforce_deadlines=True),
+            event_bus=event_bus,
+        )
+        cycle.register_handler(Phase.REASON, stuck_handler)
+
+        result = cycle.run()
+        release.set()
+        cycle.shutdown()
+
+        reason = result.phase_results[Phase.REASON]
+        assert reason.success is False
+        assert reason.degraded
+        assert reason.error == "deadline exceeded"
+
+    def test_optional_phases_skipped_when_cycle_budget_exhausted(self, event_bus):
+        configs = [
+            PhaseConfig(Phase.SENSE),
+            PhaseConfig(Phase.PLAN, required=False),
+            PhaseConfig(Phase.ACT),
+        ]
+        cycle = CognitiveCycle(
+            CycleConfig(phase_configs=configs, max_cycle_time_ms=10),
+            event_bus=event_bus,
+        )
+        cycle.register_handler(Phase.SENSE, self._sleeping_handler(0.03))
+
+        result = cycle.run()
+
+        plan = result.phase_results[Phase.PLAN]
+        assert plan.skipped
+        assert plan.output == {"reason": "cycle_budget_exhausted"}
+        # Zorunlu fazlar bütçe bitse de çalışır
+        assert result.phase_results[Phase.ACT].skipped is False
+        assert cycle.current_metrics.budget_skips == [Phase.PLAN.value]
+
+    def test_optional_phase_budget_capped_by_cycle(self, event_bus):
+        from engine.phases import get_phase_budget
+
+        seen = {}
+
+        def handler(phase, state, context):
+            seen["budget_ms"] = get_phase_budget(context, phase).budget_ms
+            return PhaseResult(phase=phase, success=True)
+
+        configs = [PhaseConfig(Phase.PLAN, timeout_ms=1000, required=False)]
+        cycle = CognitiveCycle(
+            CycleConfig(phase_configs=configs, max_cycle_time_ms=50),
+            event_bus=event_bus,
+        )
+        cycle.register_handler(Phase.PLAN, handler)
+        cycle.run()
+
+        assert 0 < seen["budget_ms"] <= 50
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_timed_out_handler_writes_do_not_leak(self, event_bus, parallel):
+        import threading
+        import time as _time
+        from engine.phases import get_phase_budget
+
+        written = threading.Event()
+
+        def late_writer(phase, state, context):
+            budget = get_phase_budget(context, phase)
+            while not budget.cancelled:
+                _time.sleep(0.001)
+            # Deadline'dan sonra yazar
+            state.threat = 0.9
+            context.metadata["leak"] = True
+            written.set()
+            return PhaseResult(phase=phase, success=True)
+
+        seen = {}
+
+        def decide_handler(phase, state, context):
+            written.wait(timeout=2)
+            seen["threat"] = state.threat
+            seen["leak"] = "leak" in context.metadata
+            seen["feel"] = context.metadata.get("feel")
+            return PhaseResult(phase=phase, success=True)
+
+        def feel_handler(phase, state, context):
+            state.set(SVField.VALENCE, 0.7)
+            context.metadata["feel"] = "calm"
+            return PhaseResult(phase=phase, success=True)
+
+        configs = [
+            PhaseConfig(Phase.RETRIEVE, timeout_ms=20, inputs=(), outputs=("m",)),
+            PhaseConfig(Phase.FEEL, inputs=(), outputs=("e",)),
+            PhaseConfig(Phase.DECIDE, inputs=("m", "e"), outputs=()),
+        ]
+        cycle = CognitiveCycle(
+            CycleConfig(
+                phase_configs=configs,
+                enforce_deadlines=True,
+                parallel_phases=parallel,
+            ),
+            event_bus=event_bus,
+        )
+        cycle.register_handler(Phase.RETRIEVE, late_writer)
+        cycle.register_handler(Phase.FEEL, feel_handler)
+        cycle.register_handler(Phase.DECIDE, decide_handler)
+
+        result = cycle.run(initial_state=StateVector(threat=0.1))
+        cycle.shutdown()
+
+        assert written.is_set()
+        assert result.phase_results[Phase.RETRIEVE].degraded
+        assert seen == {"threat": pytest.approx(0.1), "leak": False, "feel": "calm"}
+        assert result.state_vector.threat == pytest.approx(0.1)
+        # Zamanında biten fazın yazdıkları birleştirilir
+        assert result.state_vector.get(SVField.VALENCE) == pytest.approx(0.7)
+
+    def test_abandoned_handler_does_not_hold_pool(self, event_bus):
+        import threading
+
+        release = threading.Event()
+        calls = []
+
+        def stuck_once(phase, state, context):
+            calls.append(phase)
+            if len(calls) == 1:
+                release.wait(timeout=5)
+            return PhaseResult(phase=phase, success=True)
+
+        configs = [PhaseConfig(Phase.REASON, timeout_ms=20)]
+        cycle = CognitiveCycle(
+            CycleConfig(phase_configs=configs, enforce_deadlines=True, max_workers=1),
+            event_bus=event_bus,
+        )
+        cycle.register_handler(Phase.REASON, stuck_once)
+
+        first = cycle.run()
+        second = cycle.run()
+
+        assert first.phase_results[Phase.REASON].degraded
+        # Tek worker takılı kalsa da yerine yenisi açıldı
+        assert second.phase_results[Phase.REASON].success
+        assert not second.phase_results[Phase.REASON].degraded
+        assert cycle.get_stats()["abandoned_handlers"] == 1
+        assert all(
+            t.daemon for t in threading.enumerate() if t.name.startswith("uem-phase")
+        )
+
+        release.set()
+        cycle.shutdown()
+
+
+# ============================================================================
+# BATCH TESTS
+# ============================================================================
+
+class TestRunBatch:
+    """Test batched multi-stimulus cycle execution."""
+
+    @staticmethod
+    def _stimuli(count):
+        return [
+            Stimulus(stimulus_type="social", intensity=0.1 * (i + 1), content={"i": i})
+            for i in range(count)
+        ]
+
+    def test_one_cycle_state_per_stimulus(self, cycle_with_handlers):
+        stimuli = self._stimuli(3)
+        before = cycle_with_handlers.cycle_count
+
+        batch = cycle_with_handlers.run_batch(stimuli)
+
+        assert batch.cycle_count == 3
+        assert cycle_with_handlers.cycle_count == before + 3
+        assert [s.cycle_id for s in batch.states] == [before + 1, before + 2, before + 3]
+        for stimulus, cycle_state in zip(stimuli, batch.states):
+            assert cycle_state.is_complete
+            assert len(cycle_state.phase_results) == 10
+            assert cycle_state.state_vector.get(SVField.AROUSAL) == pytest.approx(stimulus.intensity)
+
+    def test_matches_single_runs(self, event_bus):
+        stimuli = self._stimuli(4)
+
+        single = CognitiveCycle(config=CycleConfig(), event_bus=event_bus)
+        single.register_handler(Phase.SENSE, create_sense_handler())
+        expected = [single.run(s).state_vector.get(SVField.AROUSAL) for s in stimuli]
+
+        batched = CognitiveCycle(config=CycleConfig(), event_bus=event_bus)
+        batched.register_handler(Phase.SENSE, create_sense_handler())
+        batch = batched.run_batch(stimuli)
+
+        assert [s.state_vector.get(SVField.AROUSAL) for s in batch.states] == expected
+
+    def test_batch_handler_called_once_per_phase(self, cycle):
+        calls = []
+
+        class BatchHandler:
+            def __call__(self, phase, state, context):
+                calls.append("single")
+                return PhaseResult(phase=phase, success=True)
+
+            def run_batch(self, phase, states, contexts):
+                calls.append(len(states))
+                return [PhaseResult(phase=phase, success=True) for _ in states]
+
+        cycle.register_handler(Phase.RETRIEVE, BatchHandler())
+        batch = cycle.run_batch(self._stimuli(5))
+
+        assert calls == [5]
+        durations = {s.phase_results[Phase.RETRIEVE].duration_ms for s in batch.states}
+        assert len(durations) == 1  # Süre cycle'lara eşit paylaştırılır
+
+    def test_batch_handler_error_fails_all_cycles(self, cycle):
+        class BrokenBatchHandler:
+            def __call__(self, phase, state, context):
+                return PhaseResult(phase=phase, success=True)
+
+            def run_batch(self, phase, states, contexts):
+                return []
+
+        cycle.register_handler(Phase.REASON, BrokenBatchHandler())
+        batch = cycle.run_batch(self._stimuli(2))
+
+        for cycle_state in batch.states:
+            assert cycle_state.phase_results[Phase.REASON].success is False
+            assert Phase.ACT in cycle_state.phase_results
+
+    def test_throughput_and_latency_reported(self, cycle):
+        batch = cycle.run_batch(self._stimuli(4))
+
+        assert batch.cycles_per_second > 0
+        assert len(batch.latencies_ms) == 4
+        assert batch.latency_percentile(95) >= batch.latency_percentile(50)
+        assert batch.to_dict()["cycles"] == 4
+        assert cycle.metrics_history.count == 4
+
+    def test_phase_events_amortized(self, cycle, event_bus):
+        events = []
+        event_bus.subscribe(EventType.MODULE_START, events.append)
+        cycle_ends = []
+        event_bus.subscribe(EventType.CYCLE_END, cycle_ends.append)
+
+        batch = cycle.run_batch(self._stimuli(3))
+
+        assert len(events) == 10
+        assert all(e.data.get("batch_size") == 3 for e in events)
+        cycle_ids = [s.cycle_id for s in batch.states]
+        assert all(e.data.get("cycle_ids") == cycle_ids for e in events)
+        assert len(cycle_ends) == 3
+
+    def test_module_end_lists_cycles_that_ran(self, event_bus):
+        cycle = CognitiveCycle(CycleConfig(stop_on_error=True), event_bus=event_bus)
+
+        def failing_for_first(phase, state, context):
+            if context.metadata["stimulus"].content["i"] == 0:
+                raise ValueError("boom")
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.PERCEIVE, failing_for_first)
+        ends = {}
+        event_bus.subscribe(
+            EventType.MODULE_END, lambda e: ends.setdefault(e.data["phase"], e)
+        )
+
+        batch = cycle.run_batch(self._stimuli(2))
+
+        first, second = (s.cycle_id for s in batch.states)
+        assert ends[Phase.PERCEIVE.value].data["cycle_ids"] == [first, second]
+        assert ends[Phase.ACT.value].data["cycle_ids"] == [second]
+        assert ends[Phase.ACT.value].cycle_id == second
+
+    def test_cycle_duration_matches_reported_latency(self, cycle, event_bus):
+        import time as _time
+
+        def slow_for_second(phase, state, context):
+            if context.metadata["stimulus"].content["i"] == 1:
+                _time.sleep(0.03)
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.REASON, slow_for_second)
+        cycle_ends = {}
+        event_bus.subscribe(
+            EventType.CYCLE_END, lambda e: cycle_ends.__setitem__(e.cycle_id, e)
+        )
+
+        batch = cycle.run_batch(self._stimuli(3))
+
+        for cycle_state, latency in zip(batch.states, batch.latencies_ms):
+            assert cycle_state.latency_ms == latency
+            assert cycle_ends[cycle_state.cycle_id].data["duration_ms"] == latency
+        history = cycle.metrics_history.get_last(3)
+        assert [m.total_duration_ms for m in history] == batch.latencies_ms
+        # Gecikme batch'in wall time'ı değil; end_time gerçek zaman
+        assert batch.states[0].latency_ms < 30 <= batch.states[1].latency_ms
+        assert all(s.duration_ms >= 30 for s in batch.states)
+
+    def test_monitoring_persistence_rows_per_cycle(self, cycle, event_bus, monkeypatch):
+        import time as _time
+        pytest.importorskip("sqlalchemy")
+        from meta.monitoring.persistence import MonitoringPersistence, PersistenceConfig
+
+        persistence = MonitoringPersistence(
+            event_bus=event_bus, config=PersistenceConfig(async_writes=False),
+        )
+        rows = []
+        monkeypatch.setattr(
+            persistence, "_write", lambda model, row, sampleable=False: rows.append(row)
+        )
+        persistence.start()
+
+        def slow_for_second(phase, state, context):
+            if context.metadata["stimulus"].content["i"] == 1:
+                _time.sleep(0.02)
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.REASON, slow_for_second)
+        batch = cycle.run_batch(self._stimuli(3))
+        persistence.stop()
+
+        assert [r["cycle_id"] for r in rows] == [s.cycle_id for s in batch.states]
+        for row, cycle_state in zip(rows, batch.states):
+            assert row["duration_ms"] == cycle_state.latency_ms
+            assert set(row["phase_durations"]) == {p.value for p in Phase.ordered()}
+            expected = {
+                phase.value: result.duration_ms
+                for phase, result in cycle_state.phase_results.items()
+            }
+            assert row["phase_durations"] == expected
+            assert row["started_at"] <= row["ended_at"]
+        reason = Phase.REASON.value
+        assert rows[1]["phase_durations"][reason] >= 20 > rows[0]["phase_durations"][reason]
+
+    def test_stop_on_error_only_stops_failing_cycle(self, event_bus):
+        cycle = CognitiveCycle(CycleConfig(stop_on_error=True), event_bus=event_bus)
+
+        def failing_for_first(phase, state, context):
+            if context.metadata["stimulus"].content["i"] == 0:
+                raise ValueError("boom")
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.PERCEIVE, failing_for_first)
+        batch = cycle.run_batch(self._stimuli(2))
+
+        assert Phase.ACT not in batch.states[0].phase_results
+        assert Phase.ACT in batch.states[1].phase_results
+
+    def test_retrieve_handler_shares_queries_across_batch(self, cycle):
+        from engine.handlers.memory import create_retrieve_handler
+
+        handler = create_retrieve_handler()
+        memory = handler._memory
+        queries = []
+
+        class CountingMemory:
+            def __getattr__(self, name):
+                attr = getattr(memory, name)
+                if name.startswith("recall") or name == "get_relationship":
+                    def counted(*args, **kwargs):
+                        queries.append(name)
+                        return attr(*args, **kwargs)
+                    return counted
+                return attr
+
+        handler._memory = CountingMemory()
+        cycle.register_handler(Phase.RETRIEVE, handler)
+
+        def perceive(phase, state, context):
+            context.metadata["perceived_agents"] = [{"agent_id": "alice"}]
+            context.metadata["situation"] = "meeting"
+            return PhaseResult(phase=phase, success=True)
+
+        cycle.register_handler(Phase.PERCEIVE, perceive)
+        cycle.run_batch(self._stimuli(4))
+
+        assert sorted(queries) == ["get_relationship", "recall_episodes", "recall_similar_episodes"]
+        assert handler._batch_cache is None
+
+    def test_empty_batch(self, cycle):
+        batch = cycle.run_batch([])
+
+        assert batch.cycle_count == 0
+        assert batch.cycles_per_second == 0.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
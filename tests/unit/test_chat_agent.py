@@ -686,3 +686,83 @@ class TestMockLLMIntegration:
         assert r1.content == "R1"
         assert r2.content == "R2"
         assert r3.content == "R3"
+
+
+# ========================================================================
+# POST-TURN QUEUE TESTS
+# ========================================================================
+
+class SlowConversationMemory(MockConversationMemory):
+    """add_turn yavas olan mock (arka plan yazimini gozlemlemek icin)."""
+
+    def __init__(self, delay: float = 0.02):
+        super().__init__()
+        self.delay = delay
+
+    def add_turn(self, session_id: str, role: str, content: str) -> str:
+        import time
+        time.sleep(self.delay)
+        return super().add_turn(session_id, role, content)
+
+
+class TestAsyncPostTurn:
+    """async_post_turn=True testleri."""
+
+    @pytest.fixture
+    def async_agent(self, mock_memory, mock_llm):
+        mock_memory.conversation = SlowConversationMemory()
+        agent = UEMChatAgent(
+            config=ChatConfig(async_post_turn=True, enable_learning=False),
+            memory=mock_memory,
+            llm=mock_llm,
+        )
+        yield agent
+        agent.shutdown()
+
+    def test_sync_mode_runs_inline(self, chat_agent, mock_memory):
+        """Varsayilan modda turn_id doner ve yazim hemen gorunur."""
+        session_id = chat_agent.start_session("user_123")
+        response = chat_agent.chat("Test message")
+        assert response.turn_id == "turn_1"
+        assert len(mock_memory.conversation._conversations[session_id]["turns"]) == 2
+        assert chat_agent.get_post_turn_stats()["inline"] == 1
+
+    def test_reply_returns_before_memory_write(self, async_agent, mock_memory):
+        """Yanit bellek yazimi bitmeden doner."""
+        session_id = async_agent.start_session("user_123")
+        response = async_agent.chat("Merhaba")
+        assert response.content
+        assert response.turn_id is None
+
+        assert async_agent.flush_post_turn(timeout=5.0)
+        assert len(mock_memory.conversation._conversations[session_id]["turns"]) == 2
+
+    def test_turn_order_preserved(self, async_agent, mock_memory):
+        """Ayni oturumun turlari sirayla yazilir."""
+        session_id = async_agent.start_session("user_123")
+        for i in range(4):
+            async_agent.chat(f"Mesaj {i}")
+        history = async_agent.get_conversation_history(n=20)
+
+        assert [t["role"] for t in history] == ["user", "agent"] * 4
+        assert [t["content"] for t in history[::2]] == [f"Mesaj {i}" for i in range(4)]
+
+    def test_end_session_flushes(self, async_agent, mock_memory):
+        """end_session bekleyen yazimlari kapanmadan once tamamlar."""
+        session_id = async_agent.start_session("user_123")
+        async_agent.chat("Merhaba")
+        async_agent.end_session()
+        assert len(mock_memory.conversation._conversations[session_id]["turns"]) == 2
+
+    def test_stats_report_depth_and_lag(self, async_agent):
+        """Kuyruk metrikleri derinlik ve gecikme icerir."""
+        async_agent.start_session("user_123")
+        async_agent.chat("Merhaba")
+        async_agent.flush_post_turn(timeout=5.0)
+
+        stats = async_agent.get_post_turn_stats()
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] >= 1
+        assert stats["lag_max_ms"] >= 0.0
+        assert stats["running"] is True
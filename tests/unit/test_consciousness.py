@@ -4,6 +4,8 @@ UEM v2 - Consciousness Module Tests
 Bilinc modulunun unit testleri.
 """
 
+import time
+
 import pytest
 from datetime import datetime, timedelta
 
@@ -33,6 +35,7 @@ from meta.consciousness import (
     # Integration
     GlobalWorkspaceConfig,
     BroadcastListener,
+    ContentHeap,
     GlobalWorkspace,
     create_global_workspace,
     # Processor
@@ -559,6 +562,97 @@ class TestGlobalWorkspace:
         assert workspace.state.conflict_count > 0
 
 
+class TestWorkspaceCompetitionIndex:
+    """Heap tabanli yarisma indeksi testleri."""
+
+    def test_content_heap_order_update_remove(self):
+        """Heap siralamasi, guncelleme ve kaldirma."""
+        heap = ContentHeap()
+        heap.push("a", (0.5, 0))
+        heap.push("b", (0.2, 1))
+        heap.push("c", (0.9, 2))
+        assert heap.peek() == "b"
+
+        heap.update("c", (0.1, 2))
+        assert heap.peek() == "c"
+
+        assert heap.remove("c")
+        assert "c" not in heap
+        assert heap.pop() == "b"
+        assert heap.pop() == "a"
+        assert heap.pop() is None
+
+    def test_eviction_removes_lowest_score(self):
+        """Kapasite dolunca en dusuk skorlu icerik cikar."""
+        workspace = GlobalWorkspace(GlobalWorkspaceConfig(max_active_contents=3))
+        contents = [
+            workspace.submit_content(
+                content_type=BroadcastType.PERCEPTION,
+                source_module=f"m{i}",
+                payload={},
+                relevance=r,
+            )
+            for i, r in enumerate([0.6, 0.1, 0.8])
+        ]
+        workspace.submit_content(
+            content_type=BroadcastType.PERCEPTION,
+            source_module="m3",
+            payload={},
+            relevance=0.7,
+        )
+        assert contents[1].id not in workspace.state.active_contents
+        assert len(workspace.get_active_contents()) == 3
+
+    def test_competition_skips_integrated_and_expired(self):
+        """Entegre edilmis ve suresi dolmus icerikler yarismaz."""
+        workspace = GlobalWorkspace()
+        stale = workspace.submit_content(
+            content_type=BroadcastType.PERCEPTION,
+            source_module="perception",
+            payload={},
+            relevance=1.0,
+            urgency=1.0,
+            novelty=1.0,
+            ttl_ms=1.0,
+        )
+        time.sleep(0.01)
+
+        first = workspace.submit_content(
+            content_type=BroadcastType.COGNITION,
+            source_module="cognition",
+            payload={},
+            relevance=0.9,
+            novelty=0.9,
+        )
+        second = workspace.submit_content(
+            content_type=BroadcastType.AFFECT,
+            source_module="affect",
+            payload={},
+            relevance=0.8,
+            novelty=0.8,
+        )
+
+        assert stale.id not in workspace.state.active_contents
+        assert workspace.get_stats()["contents_expired"] == 1
+
+        assert workspace.run_competition() is first
+        assert workspace.integrate_content(first.id)
+        assert workspace.run_competition() is second
+
+    def test_competition_threshold(self):
+        """Esik altindaki icerik kazanamaz."""
+        workspace = GlobalWorkspace()
+        workspace.submit_content(
+            content_type=BroadcastType.PERCEPTION,
+            source_module="perception",
+            payload={},
+            relevance=0.1,
+            urgency=0.1,
+            novelty=0.1,
+        )
+        assert workspace.run_competition() is None
+
+
 # ============================================================================
 # CONSCIOUSNESS PROCESSOR TESTS
 # ============================================================================
@@ -12,6 +12,7 @@ Test kategorileri:
 6. Post-processing
 7. Çoklu realize
 8. Yardımcı metodlar
+9. Derlenmiş template'ler
 """
 
 import pytest
@@ -22,14 +23,17 @@ from core.language.construction.realizer import (
     RealizationResult,
 )
 from core.language.construction.grammar import ConstructionGrammar
+from core.language.construction.mvcs import MVCSLoader
 from core.language.construction.types import (
     Construction,
     ConstructionLevel,
     ConstructionForm,
     ConstructionMeaning,
+    MorphologyRule,
     Slot,
     SlotType,
     generate_construction_id,
+    generate_morphology_rule_id,
     generate_slot_id,
 )
 
@@ -578,3 +582,107 @@ class TestIntegration:
         if constructions:
             result = default_realizer.realize(constructions[0], {})
             assert result.success is True
+
+
+# ============================================================================
+# 11. Derlenmiş Template Testleri
+# ============================================================================
+
+class TestCompiledTemplates:
+    """ConstructionForm.compile ve derlenmiş realizasyon testleri."""
+
+    def test_compile_segments(self, simple_construction):
+        """Template literal parçalar + slot referanslarına ayrılır."""
+        simple_construction.form.template = "{konu} hakkında: {bilgi}!"
+        compiled = simple_construction.form.compile()
+
+        assert compiled.segments == ("", " hakkında: ", "!")
+        assert compiled.slot_refs == ("konu", "bilgi")
+        assert compiled.join({"konu": "Python", "bilgi": "dil"}) == "Python hakkında: dil!"
+
+    def test_unknown_placeholder_stays_literal(self, default_realizer, simple_construction):
+        """Slot olarak tanımlı olmayan placeholder literal kalır."""
+        simple_construction.form.template = "{konu} {bilinmeyen} {bilgi}"
+        result = default_realizer.realize(simple_construction, {"konu": "a", "bilgi": "b"})
+        assert result.text == "A {bilinmeyen} b."
+
+    def test_compile_is_cached(self, simple_construction):
+        """Form değişmedikçe aynı derlenmiş nesne döner."""
+        form = simple_construction.form
+        assert form.compile() is form.compile()
+
+    def test_recompile_after_template_change(self, default_realizer, simple_construction):
+        """Template değişirse yeniden derlenir."""
+        values = {"konu": "Python", "bilgi": "güzel"}
+        default_realizer.realize(simple_construction, values)
+
+        simple_construction.form.template = "{bilgi} {konu}"
+        result = default_realizer.realize(simple_construction, values)
+        assert result.text == "Güzel Python."
+
+    def test_recompile_after_slot_added(self, no_slot_construction):
+        """Slot eklenirse yeniden derlenir."""
+        form = no_slot_construction.form
+        first = form.compile()
+        form.template = form.template + " {ek}"
+        form.slots["ek"] = Slot(
+            id=generate_slot_id(), name="ek", slot_type=SlotType.FILLER, required=False
+        )
+        assert form.compile() is not first
+        assert form.compile().slot_refs == ("ek",)
+
+    def test_morphology_hooks_in_priority_order(self, simple_construction):
+        """Kural tipleri önceliğe göre sıralanır, tekrarlar atlanır."""
+        simple_construction.form.morphology_rules = [
+            MorphologyRule(
+                id=generate_morphology_rule_id(), name=name, rule_type=rule_type,
+                condition="", transformation="", priority=priority
+            )
+            for name, rule_type, priority in [
+                ("a", "buffer_consonant", 1),
+                ("b", "vowel_harmony", 5),
+                ("c", "vowel_harmony", 3),
+            ]
+        ]
+        compiled = simple_construction.form.compile()
+        assert compiled.morphology == ("vowel_harmony", "buffer_consonant")
+
+    def test_grammar_add_construction_compiles(self, simple_construction):
+        """add_construction template'i derler."""
+        grammar = ConstructionGrammar()
+        grammar.add_construction(simple_construction)
+        assert simple_construction.form.compiled is not None
+
+    def test_mvcs_load_all_compiles(self):
+        """MVCSLoader.load_all tüm template'leri derler."""
+        constructions = MVCSLoader().load_all()
+        assert all(c.form.compiled is not None for c in constructions)
+
+    def test_surface_cache_respects_config(self, default_realizer, no_slot_construction):
+        """Config değişikliği cache'lenmiş yüzey formunu etkiler."""
+        first = default_realizer.realize(no_slot_construction, {}).text
+        default_realizer.config.add_punctuation = False
+        second = default_realizer.realize(no_slot_construction, {}).text
+        assert first.endswith(".")
+        assert not second.endswith(".")
+
+    def test_surface_cache_is_bounded(self, simple_construction):
+        """Yüzey cache'i SURFACE_CACHE_SIZE ile sınırlı."""
+        realizer = ConstructionRealizer()
+        realizer.SURFACE_CACHE_SIZE = 8
+        for i in range(20):
+            realizer.realize(simple_construction, {"konu": f"k{i}", "bilgi": "b"})
+        assert len(realizer._surface_cache) <= 8
+
+    def test_realize_multiple_reuses_compiled(self, default_realizer, simple_construction,
+                                              construction_with_defaults):
+        """realize_multiple derlenmiş formları yeniden kullanır."""
+        constructions = [simple_construction, construction_with_defaults]
+        compiled = [c.form.compile() for c in constructions]
+
+        result = default_realizer.realize_multiple(
+            constructions, {"konu": "Python", "bilgi": "güzel"}
+        )
+
+        assert result.text == "Python güzel. Evet, anladım."
+        assert all(c.form.compiled is before for c, before in zip(constructions, compiled))
@@ -432,3 +432,49 @@ class TestSortingAndFiltering:
         result = default_selector.select(["inform", "explain"])
         ids = [s.construction.id for s in result.selected]
         assert len(ids) == len(set(ids))
+
+
+# ============================================================================
+# Statik Skor Memo Testleri
+# ============================================================================
+
+class TestStaticScoreMemo:
+    """(construction, act, ton) statik skor memo testleri."""
+
+    def test_repeated_select_is_stable(self, default_selector):
+        """Aynı girdiyle tekrar seçim aynı skorları verir."""
+        first = default_selector.select(["inform", "empathize"], tone="empathic")
+        second = default_selector.select(["inform", "empathize"], tone="empathic")
+        assert [(s.construction.id, s.total_score, s.reasons) for s in first.all_scores] == \
+            [(s.construction.id, s.total_score, s.reasons) for s in second.all_scores]
+        assert default_selector._static_scores
+
+    def test_memo_keyed_by_tone(self, default_selector, empathic_construction):
+        """Farklı ton farklı memo girdisi kullanır."""
+        exact = default_selector.score_construction(empathic_construction, "empathize", "empathic")
+        other = default_selector.score_construction(empathic_construction, "empathize", "formal")
+        assert exact.tone_score == 1.0
+        assert other.tone_score == 0.3
+
+    def test_confidence_read_live(self, default_selector, empathic_construction):
+        """Güven skoru memo'lanmaz; değişiklik bir sonraki skora yansır."""
+        before = default_selector.score_construction(empathic_construction, "empathize")
+        empathic_construction.record_failure()
+        after = default_selector.score_construction(empathic_construction, "empathize")
+        assert after.confidence_score == pytest.approx(0.7)
+        assert after.total_score < before.total_score
+
+    def test_clear_score_cache(self, default_selector, empathic_construction):
+        """clear_score_cache sonrası ton değişikliği yansır."""
+        default_selector.score_construction(empathic_construction, "empathize", "empathic")
+        empathic_construction.extra_data["tone"] = "formal"
+        default_selector.clear_score_cache()
+        score = default_selector.score_construction(empathic_construction, "empathize", "empathic")
+        assert score.tone_score == 0.3
+
+    def test_memo_is_bounded(self, default_grammar):
+        """Memo STATIC_SCORE_CACHE_SIZE'ı aşmaz."""
+        selector = ConstructionSelector(default_grammar)
+        selector.STATIC_SCORE_CACHE_SIZE = 5
+        selector.select(["inform", "explain", "empathize", "greet"], tone="casual")
+        assert len(selector._static_scores) <= 5
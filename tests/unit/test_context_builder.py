@@ -558,6 +558,81 @@ class TestLongConversation:
         assert "Message 5" not in result
 
 
+# ========================================================================
+# INCREMENTAL BUILD TESTS
+# ========================================================================
+
+@dataclass
+class MockSession:
+    """Mock Conversation with session_id (artimli build icin)."""
+    session_id: str
+    turns: List[MockDialogueTurn]
+
+
+class TestIncrementalBuild:
+    """Oturum bazli artimli conversation section testleri."""
+
+    def _fresh_section(self, turns, max_turns):
+        return ContextBuilder()._build_conversation_section(
+            MockConversation(turns=list(turns)), max_turns
+        )
+
+    def test_incremental_matches_fresh_build(self):
+        """Artimli section, sifirdan olusturulanla ayni olmali."""
+        builder = ContextBuilder(ContextConfig(recent_turns_count=3))
+        session = MockSession(session_id="s1", turns=[])
+
+        for i in range(8):
+            session.turns.append(MockDialogueTurn(
+                role="user" if i % 2 == 0 else "agent",
+                content=f"Mesaj {i} çok güzel bir gün",
+            ))
+            section = builder._build_conversation_section(session, 3)
+            fresh = self._fresh_section(session.turns, 3)
+            assert section.content == fresh.content
+            assert section.token_count == fresh.token_count
+
+        assert builder.stats["incremental_conversation_builds"] == 7
+        assert builder.stats["cached_conversations"] == 1
+
+    def test_rebuilds_when_turns_replaced(self):
+        """Turlar degistirilirse pencere yeniden kurulur."""
+        builder = ContextBuilder()
+        session = MockSession(session_id="s1", turns=[
+            MockDialogueTurn(role="user", content="eski mesaj"),
+        ])
+        builder._build_conversation_section(session, 10)
+
+        session.turns = [MockDialogueTurn(role="user", content="yeni mesaj")]
+        section = builder._build_conversation_section(session, 10)
+
+        assert "yeni mesaj" in section.content
+        assert "eski mesaj" not in section.content
+
+    def test_sessions_are_separate(self):
+        """Farkli oturumlar ayri pencere kullanir."""
+        builder = ContextBuilder()
+        a = MockSession(session_id="a", turns=[MockDialogueTurn("user", "alfa")])
+        b = MockSession(session_id="b", turns=[MockDialogueTurn("user", "beta")])
+
+        assert "alfa" in builder.build("x", conversation=a)
+        result = builder.build("x", conversation=b)
+        assert "beta" in result
+        assert "alfa" not in result
+
+    def test_token_count_cache(self):
+        """count_tokens sonucu cache'lenir ve clear_cache ile temizlenir."""
+        builder = ContextBuilder()
+        text = "Merhaba, bugün nasılsın?"
+
+        assert builder.count_tokens(text) == builder.count_tokens(text)
+        assert builder.stats["token_cache_size"] == 1
+
+        builder.clear_cache()
+        assert builder.stats["token_cache_size"] == 0
+        assert builder.stats["cached_conversations"] == 0
+
+
 # ========================================================================
 # FACTORY TESTS
 # ========================================================================
@@ -18,6 +18,7 @@ from core.memory import (
     ConversationMemory,
     ConversationConfig,
     create_conversation_memory,
+    FileConversationStore,
     Episode,
     EpisodeType,
 )
@@ -184,6 +185,31 @@ class TestConversation:
         total_chars = sum(len(t.content) for t in context)
         assert total_chars <= 500 * 4  # 4 char/token
 
+    def test_context_window_is_longest_fitting_suffix(self):
+        """Limite sigan en uzun son-tur dizisi, bos turlar dahil."""
+        conv = Conversation()
+        for content in ["aaaa", "bbbbbbbb", "", "cccc"]:
+            conv.add_turn(DialogueTurn(role="user", content=content))
+
+        assert [t.content for t in conv.get_context_window(1)] == ["", "cccc"]
+        assert [t.content for t in conv.get_context_window(3)] == ["bbbbbbbb", "", "cccc"]
+        assert len(conv.get_context_window(100)) == 4
+        assert conv.get_context_window(0) == []
+        assert [t.content for t in conv.get_context_window(2, chars_per_token=2)] == ["", "cccc"]
+
+    def test_context_window_after_direct_turn_append(self):
+        """turns listesi disaridan degisirse on-toplamlar yeniden kurulur."""
+        conv = Conversation()
+        conv.add_turn(DialogueTurn(role="user", content="x" * 40))
+        conv.turns.append(DialogueTurn(role="agent", content="y" * 8))
+
+        window = conv.get_context_window(max_tokens=3)
+        assert [t.content for t in window] == ["y" * 8]
+
+        conv.add_turn(DialogueTurn(role="user", content="z" * 4))
+        window = conv.get_context_window(max_tokens=3)
+        assert [t.content for t in window] == ["y" * 8, "z" * 4]
+
     def test_end_conversation(self):
         """Sohbeti sonlandir."""
         conv = Conversation()
@@ -452,10 +478,335 @@ class TestConversationMemory:
                 assert result is None, f"Turn {i} should fail due to limit"
 
 
+# ========================================================================
+# SEARCH INDEX TESTS
+# ========================================================================
+
+class TestConversationSearchIndex:
+    """Inverted index ve BM25 arama testleri."""
+
+    def test_postings_are_deduplicated(self, conv_memory):
+        """Ayni kelime bir turda tek posting, tf ile."""
+        session_id = conv_memory.start_conversation()
+        turn = conv_memory.add_turn(session_id, "user", "python python python is")
+
+        postings = conv_memory._postings["python"][session_id]
+        assert postings == {turn.id: 3}
+        assert "is" not in conv_memory._postings  # kisa kelime indexlenmez
+        assert conv_memory.stats["turns_indexed"] == 1
+
+    def test_bm25_prefers_rare_terms_and_short_turns(self, conv_memory):
+        """Nadir terim ve kisa tur daha yuksek skor alir."""
+        session_id = conv_memory.start_conversation()
+        conv_memory.add_turn(session_id, "user", "python error")
+        conv_memory.add_turn(session_id, "user", "python error again and again with more words here")
+        conv_memory.add_turn(session_id, "user", "python works fine")
+
+        results = conv_memory.search_history("python error")
+
+        assert [t.content for t, _ in results][:2] == [
+            "python error",
+            "python error again and again with more words here",
+        ]
+        assert results[0][1] > results[1][1] > results[2][1] > 0
+
+    def test_session_and_user_filters(self, conv_memory):
+        """Session ve user filtreleri."""
+        s1 = conv_memory.start_conversation(user_id="alice")
+        s2 = conv_memory.start_conversation(user_id="bob")
+        conv_memory.add_turn(s1, "user", "weather in Istanbul")
+        conv_memory.add_turn(s2, "user", "weather in Ankara")
+
+        assert len(conv_memory.search_history("weather")) == 2
+
+        by_session = conv_memory.search_history("weather", session_id=s2)
+        assert [t.conversation_id for t, _ in by_session] == [s2]
+
+        by_user = conv_memory.search_history("weather", user_id="alice")
+        assert [t.conversation_id for t, _ in by_user] == [s1]
+
+        assert conv_memory.search_history("weather", session_id=s1, user_id="bob") == []
+        assert conv_memory.search_history("weather", user_id="nobody") == []
+
+    def test_min_relevance_is_query_coverage(self):
+        """min_search_relevance sorgu kelimesi kapsama orani olarak uygulanir."""
+        memory = create_conversation_memory(ConversationConfig(min_search_relevance=0.6))
+        session_id = memory.start_conversation()
+        memory.add_turn(session_id, "user", "python error message")
+        memory.add_turn(session_id, "user", "python tutorial")
+
+        results = memory.search_history("python error")
+        assert [t.content for t, _ in results] == ["python error message"]
+
+    def test_limit(self, conv_memory):
+        """Sonuc limiti."""
+        session_id = conv_memory.start_conversation()
+        for i in range(10):
+            conv_memory.add_turn(session_id, "user", f"python message {i}")
+
+        assert len(conv_memory.search_history("python", limit=3)) == 3
+
+    def test_cleanup_removes_index_entries(self, conv_memory):
+        """Timeout olan oturumlar indexten cikarilir."""
+        old = conv_memory.start_conversation(user_id="old")
+        fresh = conv_memory.start_conversation(user_id="fresh")
+        conv_memory.add_turn(old, "user", "forgotten python topic")
+        conv_memory.add_turn(fresh, "user", "current python topic")
+
+        conv_memory.get_conversation(old).last_accessed = datetime.now() - timedelta(hours=2)
+        assert conv_memory.cleanup_inactive_sessions(timeout_minutes=30) == 1
+
+        results = conv_memory.search_history("python")
+        assert [t.conversation_id for t, _ in results] == [fresh]
+        assert "forgotten" not in conv_memory._postings
+        assert conv_memory.stats["turns_indexed"] == 1
+        assert conv_memory._total_length == 3
+
+
 # ========================================================================
 # MEMORY STORE INTEGRATION TESTS
 # ========================================================================
 
+class TestConversationTiering:
+    """Bellek siniri, spill ve geri yukleme testleri."""
+
+    def _memory(self, tmp_path, **kwargs):
+        config = ConversationConfig(spill_path=str(tmp_path / "spill"), **kwargs)
+        return create_conversation_memory(config)
+
+    def test_store_roundtrip(self, tmp_path):
+        """Conversation diske yazilip aynen okunur."""
+        store = FileConversationStore(str(tmp_path))
+        conv = Conversation(user_id="user1", agent_id="agent", context={"k": [1, 2]})
+        conv.add_turn(DialogueTurn(role="user", content="Çok güzel bir gün", topics=["hava"]))
+        conv.add_turn(DialogueTurn(role="agent", content="Evet", embedding=[0.1, 0.2]))
+        conv.end_conversation()
+
+        store.save(conv)
+        assert conv.session_id in store
+        assert store.load(conv.session_id) == conv
+        assert store.stats()["sessions"] == 1
+
+        assert store.delete(conv.session_id)
+        assert store.load(conv.session_id) is None
+
+    def test_store_unsafe_session_id(self, tmp_path):
+        """Dosya adina uygun olmayan ID'ler hash'lenir."""
+        store = FileConversationStore(str(tmp_path))
+        conv = Conversation(session_id="../a b")
+        store.save(conv)
+        assert store.load("../a b").session_id == "../a b"
+        assert [p.suffix for p in tmp_path.iterdir()] == [".gz"]
+        assert not (tmp_path.parent / "a b.json.gz").exists()
+
+    def test_lru_session_limit(self, tmp_path):
+        """Limit asilinca en az kullanilan oturum diske yazilir."""
+        memory = self._memory(tmp_path, max_sessions_in_memory=2)
+        s1 = memory.start_conversation(user_id="user1")
+        s2 = memory.start_conversation(user_id="user2")
+        memory.add_turn(s1, "user", "first session message")
+        s3 = memory.start_conversation(user_id="user3")
+
+        stats = memory.stats
+        assert stats["conversations_in_memory"] == 2
+        assert stats["sessions_on_disk"] == 1
+        assert stats["sessions_spilled"] == 1
+        assert s2 not in memory._conversations
+        assert s1 in memory._conversations and s3 in memory._conversations
+
+    def test_turn_limit(self, tmp_path):
+        """Tur siniri asilinca eski oturumlar tahliye edilir."""
+        memory = self._memory(tmp_path, max_turns_in_memory=3)
+        s1 = memory.start_conversation(user_id="user1")
+        for i in range(3):
+            memory.add_turn(s1, "user", f"message {i}")
+        s2 = memory.start_conversation(user_id="user2")
+        memory.add_turn(s2, "user", "new message")
+
+        assert memory.stats["turns_in_memory"] == 1
+        assert memory.stats["sessions_on_disk"] == 1
+
+    def test_fault_in_restores_session(self, tmp_path):
+        """Spill edilen oturum erisimde geri yuklenir ve aranabilir."""
+        memory = self._memory(tmp_path, max_sessions_in_memory=1)
+        s1 = memory.start_conversation(user_id="user1")
+        memory.add_turn(s1, "user", "python programlama sorusu")
+        s2 = memory.start_conversation(user_id="user2")
+        memory.add_turn(s2, "user", "hava durumu")
+
+        assert memory.search_history("python") == []
+
+        turn = memory.add_turn(s1, "user", "python devam")
+        assert turn is not None
+        assert len(memory.get_full_history(s1)) == 2
+        assert len(memory.search_history("python")) == 2
+        assert memory.stats["sessions_loaded"] == 1
+        assert memory.get_active_session("user1") == s1
+
+    def test_no_store_drops_only_ended(self):
+        """Depo yoksa sadece kapanmis oturumlar birakilir."""
+        memory = create_conversation_memory(ConversationConfig(max_sessions_in_memory=1))
+        s1 = memory.start_conversation(user_id="user1")
+        s2 = memory.start_conversation(user_id="user2")
+        assert memory.get_conversation(s1) is not None
+        assert memory.stats["sessions_dropped"] == 0
+
+        memory.end_conversation(s1)
+        memory.add_turn(s2, "user", "hello")
+        assert memory.get_conversation(s1) is None
+        assert memory.stats["sessions_dropped"] == 1
+
+    def test_spill_idle_sessions(self, tmp_path):
+        """Idle oturumlar spill edilir, aktif kalir."""
+        memory = self._memory(tmp_path)
+        s1 = memory.start_conversation(user_id="user1")
+        s2 = memory.start_conversation(user_id="user2")
+        memory.get_conversation(s1).last_accessed = datetime.now() - timedelta(minutes=20)
+
+        assert memory.spill_idle_sessions(idle_minutes=10) == 1
+        assert memory.stats["sessions_on_disk"] == 1
+        assert s2 in memory._conversations
+
+        conv = memory.get_conversation(s1)
+        assert conv.is_active
+        assert memory.stats["sessions_on_disk"] == 0
+
+    def test_cleanup_closes_spilled_sessions(self, tmp_path):
+        """Timeout olan spill edilmis aktif oturum kapatilir."""
+        memory = self._memory(tmp_path)
+        s1 = memory.start_conversation(user_id="user1")
+        memory.get_conversation(s1).last_accessed = datetime.now() - timedelta(minutes=60)
+        memory.spill_idle_sessions(idle_minutes=10)
+
+        assert memory.cleanup_inactive_sessions(timeout_minutes=30) == 1
+        assert memory.get_active_session("user1") is None
+        # Oturum yuklenmeden kapatilir, sadece depo basligi guncellenir
+        assert memory.stats["sessions_loaded"] == 0
+        assert memory.stats["sessions_on_disk"] == 1
+        assert not memory._spilled[s1].is_active
+        [entry] = memory._store.scan()
+        assert not entry.is_active and entry.ended_at is not None
+
+        conv = memory.get_conversation(s1)
+        assert not conv.is_active
+        assert conv.summary == "Session timed out"
+        assert conv.ended_at == entry.ended_at
+
+    def test_timed_out_session_not_reindexed(self, tmp_path):
+        """Zaman asimiyla kapanan oturum yuklendiginde aramaya geri donmez."""
+        memory = self._memory(tmp_path)
+        s1 = memory.start_conversation(user_id="user1")
+        memory.add_turn(s1, "user", "python decorators question")
+        s2 = memory.start_conversation(user_id="user2")
+        memory.add_turn(s2, "user", "python generators question")
+        memory.end_conversation(s2)
+        memory.get_conversation(s1).last_accessed = datetime.now() - timedelta(minutes=60)
+
+        memory.cleanup_inactive_sessions(timeout_minutes=30)
+        memory.spill_idle_sessions(idle_minutes=1e-9)
+        assert memory.stats["sessions_on_disk"] == 2
+
+        assert memory.get_conversation(s1) is not None
+        assert memory.get_conversation(s2) is not None
+        results = memory.search_history("python")
+        assert [turn.conversation_id for turn, _ in results] == [s2]
+
+    def test_user_conversations_include_spilled(self, tmp_path):
+        """Kullanici sohbet listesi diskteki oturumlari da icerir."""
+        memory = self._memory(tmp_path, max_sessions_in_memory=1)
+        s1 = memory.start_conversation(user_id="user1")
+        memory.end_conversation(s1)
+        s2 = memory.start_conversation(user_id="user1")
+        memory.start_conversation(user_id="user2")
+
+        assert memory.stats["sessions_on_disk"] == 2
+        all_convs = memory.get_user_conversations("user1", include_inactive=True)
+        assert {c.session_id for c in all_convs} == {s1, s2}
+        active = memory.get_user_conversations("user1")
+        assert [c.session_id for c in active] == [s2]
+
+    def test_purge_expired_spilled_sessions(self, tmp_path):
+        """Saklama suresi dolan kapanmis oturumlar diskten ve indexten silinir."""
+        memory = self._memory(tmp_path, max_sessions_in_memory=2, spill_retention_minutes=60)
+        for i in range(50):
+            session_id = memory.start_conversation(user_id=f"user{i}")
+            memory.add_turn(session_id, "user", f"message {i}")
+            conv = memory.end_conversation(session_id)
+            conv.ended_at = datetime.now() - timedelta(hours=2)
+        memory.start_conversation(user_id="fresh1")
+        memory.start_conversation(user_id="fresh2")
+        assert memory.stats["sessions_on_disk"] == 50
+
+        memory.cleanup_inactive_sessions()
+
+        assert memory.stats["sessions_on_disk"] == 0
+        assert memory.stats["sessions_purged"] == 50
+        assert list((tmp_path / "spill").iterdir()) == []
+        assert set(memory._user_sessions) == {"fresh1", "fresh2"}
+
+    def test_purge_keeps_recent_and_active(self, tmp_path):
+        """Yeni kapanmis ve aktif oturumlar silinmez."""
+        memory = self._memory(tmp_path, spill_retention_minutes=60)
+        s1 = memory.start_conversation(user_id="user1")
+        memory.end_conversation(s1)
+        memory.start_conversation(user_id="user2")
+        assert memory.spill_idle_sessions(idle_minutes=1e-9) == 2
+
+        assert memory.purge_spilled_sessions() == 0
+        assert memory.stats["sessions_on_disk"] == 2
+
+    def test_restart_restores_spill_index(self, tmp_path):
+        """Yeni instance depodaki oturumlari bulur ve yukleyebilir."""
+        memory = self._memory(tmp_path, max_sessions_in_memory=1)
+        s1 = memory.start_conversation(user_id="user1")
+        memory.add_turn(s1, "user", "python sorusu")
+        s2 = memory.start_conversation(user_id="user2")
+        memory.end_conversation(s2)
+        memory.start_conversation()
+        assert memory.stats["sessions_on_disk"] == 2
+
+        restarted = self._memory(tmp_path, max_sessions_in_memory=1)
+        assert restarted.stats["sessions_on_disk"] == 2
+        assert restarted.get_active_session("user1") == s1
+        assert restarted.get_active_session("user2") is None
+        assert [c.session_id for c in restarted.get_user_conversations("user2", include_inactive=True)] == [s2]
+
+        assert restarted.add_turn(s1, "user", "devam") is not None
+        assert len(restarted.get_full_history(s1)) == 2
+
+    def test_store_mark_ended_updates_header(self, tmp_path):
+        """mark_ended() basligi gunceller, load() kapanis bilgisini uygular."""
+        store = FileConversationStore(str(tmp_path))
+        conv = Conversation(user_id="user1")
+        conv.add_turn(DialogueTurn(role="user", content="merhaba"))
+        store.save(conv)
+        ended_at = datetime.now()
+
+        assert store.mark_ended(conv.session_id, ended_at, summary="Session timed out")
+        assert not store.mark_ended("missing", ended_at)
+        [entry] = store.scan()
+        assert not entry.is_active
+        assert entry.ended_at == ended_at
+
+        loaded = store.load(conv.session_id)
+        assert not loaded.is_active
+        assert loaded.ended_at == ended_at
+        assert loaded.summary == "Session timed out"
+        assert [t.content for t in loaded.turns] == ["merhaba"]
+
+    def test_store_scan_reads_headers(self, tmp_path):
+        """scan() guvensiz ID'ler dahil gercek session_id'leri dondurur."""
+        store = FileConversationStore(str(tmp_path))
+        store.save(Conversation(session_id="a/b", user_id="user1"))
+        store.save(Conversation(session_id="plain"))
+        (tmp_path / "broken.json.gz").write_bytes(b"not gzip")
+
+        entries = {e.session_id: e for e in store.scan()}
+        assert set(entries) == {"a/b", "plain"}
+        assert entries["a/b"].user_id == "user1"
+        assert entries["a/b"].is_active
+
+
 class TestMemoryStoreConversation:
     """MemoryStore conversation entegrasyonu."""
 
@@ -0,0 +1,159 @@
+"""
+UEM v2 - Event Bus Tests
+
+Senkron ve THREADED dağıtım, öncelik sırası, backpressure ve metrikler.
+"""
+
+import threading
+
+import pytest
+
+from engine.events import (
+    Event,
+    EventType,
+    EventBus,
+    DispatchMode,
+    BackpressurePolicy,
+)
+
+
+@pytest.fixture
+def bus():
+    bus = EventBus()
+    yield bus
+    bus.shutdown(timeout=1.0)
+
+
+class TestSyncDispatch:
+    """Varsayılan senkron dağıtım."""
+
+    def test_publish_calls_handlers(self, bus):
+        received = []
+        bus.subscribe(EventType.CYCLE_START, received.append)
+        bus.subscribe_all(received.append)
+
+        called = bus.publish(Event(EventType.CYCLE_START))
+
+        assert called == 2
+        assert len(received) == 2
+
+    def test_handler_error_isolated(self, bus):
+        received = []
+
+        def failing(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(EventType.CYCLE_END, failing)
+        bus.subscribe(EventType.CYCLE_END, received.append)
+
+        assert bus.publish(Event(EventType.CYCLE_END)) == 1
+        assert len(received) == 1
+
+        stats = {s["name"]: s for s in bus.get_handler_stats()}
+        assert stats[failing.__qualname__]["errors"] == 1
+
+    def test_history_bounded(self):
+        bus = EventBus(max_history=5)
+        for i in range(12):
+            bus.emit(EventType.MODULE_START, "test", index=i)
+
+        history = bus.get_history()
+        assert len(history) == 5
+        assert history[0].data["index"] == 7
+        assert len(bus.get_history(EventType.MODULE_END)) == 0
+
+
+class TestThreadedDispatch:
+    """Kuyruklu, öncelik sıralı dağıtım."""
+
+    def test_threaded_handler_does_not_block_publish(self, bus):
+        gate = threading.Event()
+        received = []
+
+        def slow(event):
+            gate.wait(1.0)
+            received.append(event)
+
+        bus.subscribe_all(slow, mode=DispatchMode.THREADED)
+        for _ in range(3):
+            bus.emit(EventType.CYCLE_START, "test")
+
+        assert received == []
+        gate.set()
+        assert bus.wait_idle(timeout=2.0)
+        assert len(received) == 3
+
+    def test_priority_order(self, bus):
+        gate = threading.Event()
+        order = []
+
+        def handler(event):
+            gate.wait(1.0)
+            order.append(event.data.get("name"))
+
+        bus.subscribe(EventType.MODULE_END, handler, mode=DispatchMode.THREADED)
+
+        # Worker ilk event'te bekler, kalanlar kuyrukta sıralanır
+        bus.publish(Event(EventType.MODULE_END, data={"name": "first"}))
+        while bus.get_handler_stats()[0]["queue_depth"]:
+            pass
+        bus.publish(Event(EventType.MODULE_END, data={"name": "low"}, priority=0))
+        bus.publish(Event(EventType.MODULE_END, data={"name": "high"}, priority=5))
+        bus.publish(Event(EventType.MODULE_END, data={"name": "mid"}, priority=2))
+        gate.set()
+
+        assert bus.wait_idle(timeout=2.0)
+        assert order == ["first", "high", "mid", "low"]
+
+    def test_backpressure_drop_newest(self, bus):
+        gate = threading.Event()
+        bus.subscribe_all(
+            lambda e: gate.wait(1.0),
+            mode=DispatchMode.THREADED,
+            queue_size=2,
+        )
+
+        results = [bus.emit(EventType.CYCLE_START, "test") for _ in range(6)]
+        gate.set()
+        bus.wait_idle(timeout=2.0)
+
+        assert results.count(0) >= 3
+        assert bus.stats["dropped_events"] == results.count(0)
+
+    def test_backpressure_drop_lowest(self):
+        bus = EventBus(backpressure=BackpressurePolicy.DROP_LOWEST, queue_size=2)
+        gate = threading.Event()
+        seen = []
+
+        def handler(event):
+            gate.wait(1.0)
+            seen.append(event.priority)
+
+        bus.subscribe_all(handler, mode=DispatchMode.THREADED)
+        bus.publish(Event(EventType.CYCLE_START, priority=9))
+        while bus.get_handler_stats()[0]["queue_depth"]:
+            pass
+        bus.publish(Event(EventType.CYCLE_START, priority=1))
+        bus.publish(Event(EventType.CYCLE_START, priority=2))
+        # Kuyruk dolu: priority=1 düşürülür
+        assert bus.publish(Event(EventType.CYCLE_START, priority=3)) == 1
+        # Yeni event kuyruktakilerden düşük: kendisi düşürülür
+        assert bus.publish(Event(EventType.CYCLE_START, priority=0)) == 0
+
+        gate.set()
+        bus.shutdown(timeout=2.0)
+        assert seen == [9, 3, 2]
+
+    def test_shutdown_drains_queue(self):
+        bus = EventBus(default_mode=DispatchMode.THREADED)
+        received = []
+        bus.subscribe(EventType.MEMORY_STORED, received.append)
+
+        for _ in range(50):
+            bus.emit(EventType.MEMORY_STORED, "memory")
+        bus.shutdown(timeout=2.0)
+
+        assert len(received) == 50
+        stats = bus.get_handler_stats()[0]
+        assert stats["calls"] == 50
+        assert stats["mode"] == "threaded"
@@ -16,7 +16,10 @@ import pytest
 
 from core.learning.feedback_stats import ConstructionStats
 from core.learning.feedback_store import FeedbackStore
-from core.learning.feedback_aggregator import FeedbackAggregator
+from core.learning.feedback_aggregator import (
+    FeedbackAggregator,
+    CheckpointedFeedbackAggregator,
+)
 from core.learning.feedback_scorer import (
     WIN_EXPLICIT,
     LOSS_EXPLICIT,
@@ -246,6 +249,68 @@ class TestFeedbackStore:
             store.clear()
             assert store.count() == 0
 
+    def test_feedback_store_update_appends_journal(self):
+        """update_stats snapshot'ı yeniden yazmadan journal'a eklemeli."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            store = FeedbackStore(path)
+            store.bulk_update({"base": ConstructionStats(construction_id="base")})
+            snapshot_mtime = path.stat().st_mtime_ns
+
+            for i in range(5):
+                store.update_stats(ConstructionStats(construction_id="test_01", total_uses=i))
+
+            assert path.stat().st_mtime_ns == snapshot_mtime
+            assert len(store.journal_path.read_text().splitlines()) == 5
+
+            store2 = FeedbackStore(path)
+            assert store2.count() == 2
+            assert store2.get_stats("test_01").total_uses == 4
+
+    def test_feedback_store_compaction(self):
+        """Journal eşiği aşınca snapshot yazılıp journal sıfırlanmalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            store = FeedbackStore(path, compact_every=3)
+
+            for i in range(4):
+                store.update_stats(ConstructionStats(construction_id=f"c{i}"))
+
+            assert path.exists()
+            assert len(store.journal_path.read_text().splitlines()) == 1
+            assert FeedbackStore(path).count() == 4
+
+    def test_feedback_store_replay_skips_compacted_entries(self):
+        """Snapshot'a dahil journal satırları tekrar uygulanmamalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            store = FeedbackStore(path)
+            store.update_stats(ConstructionStats(construction_id="old"))
+            stale_journal = store.journal_path.read_text()
+
+            store.clear()
+            # Rename sonrası journal silinmeden çökme simülasyonu
+            store.journal_path.write_text(stale_journal + '{"seq": 99, "stats": {')
+
+            assert FeedbackStore(path).count() == 0
+
+    def test_feedback_store_debounced_flush(self):
+        """flush_interval_s ile delta'lar birleştirilip toplu yazılmalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stats.json"
+            store = FeedbackStore(path, flush_interval_s=60.0)
+
+            for i in range(10):
+                store.update_stats(ConstructionStats(construction_id="test_01", total_uses=i))
+            store.update_stats(ConstructionStats(construction_id="test_02"))
+
+            assert not store.journal_path.exists()
+            assert store.get_stats("test_01").total_uses == 9
+
+            store.close()
+            assert len(store.journal_path.read_text().splitlines()) == 2
+            assert FeedbackStore(path).get_stats("test_01").total_uses == 9
+
     def test_feedback_store_contains(self):
         """__contains__ doğru çalışıyor mu?"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -411,6 +476,129 @@ class TestFeedbackAggregator:
         assert summary["implicit_negative"] == 3
 
 
+class TestCheckpointedFeedbackAggregator:
+    """CheckpointedFeedbackAggregator testleri."""
+
+    def _write(self, path: Path, *episodes: EpisodeLog, partial: str = "") -> None:
+        with open(path, "a", encoding="utf-8") as f:
+            for episode in episodes:
+                f.write(json.dumps(episode.to_dict(), ensure_ascii=False) + "\n")
+            f.write(partial)
+
+    def _episode(self, construction_id: str, explicit: float = None) -> EpisodeLog:
+        return EpisodeLog(
+            id="ep",
+            session_id="s",
+            turn_number=1,
+            user_message="test",
+            user_message_normalized="test",
+            intent_primary=IntentCategory.GREETING,
+            construction_id=construction_id,
+            feedback_explicit=explicit,
+        )
+
+    def test_processes_only_new_lines(self):
+        """Checkpoint sonrası sadece yeni satırlar işlenmeli."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            episodes = Path(tmpdir) / "episodes.jsonl"
+            store = FeedbackStore(Path(tmpdir) / "stats.json")
+            self._write(episodes, self._episode("c1", 1.0), self._episode("c2"))
+
+            aggregator = CheckpointedFeedbackAggregator(episodes, store)
+            assert aggregator.run_once() == 2
+            assert aggregator.run_once() == 0
+
+            self._write(episodes, self._episode("c1", -1.0))
+            assert aggregator.run_once() == 1
+
+            stats = store.get_stats("c1")
+            assert stats.total_uses == 2
+            assert stats.explicit_pos == 1
+            assert stats.explicit_neg == 1
+            assert store.get_stats("c2").total_uses == 1
+
+    def test_checkpoint_survives_restart(self):
+        """Yeni instance checkpoint'ten devam etmeli, yarım satırı beklemeli."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            episodes = Path(tmpdir) / "episodes.jsonl"
+            stats_path = Path(tmpdir) / "stats.json"
+            line = json.dumps(self._episode("c1").to_dict())
+            self._write(episodes, self._episode("c1"), partial=line[:20])
+
+            first = CheckpointedFeedbackAggregator(episodes, FeedbackStore(stats_path))
+            assert first.run_once() == 1
+
+            with open(episodes, "a", encoding="utf-8") as f:
+                f.write(line[20:] + "\n")
+
+            second = CheckpointedFeedbackAggregator(episodes, FeedbackStore(stats_path))
+            assert second.offset == first.offset
+            assert second.run_once() == 1
+            assert second.store.get_stats("c1").total_uses == 2
+            assert second.episodes_processed == 2
+
+    def test_truncated_file_rebuilds(self):
+        """Dosya küçülürse stats baştan oluşturulmalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            episodes = Path(tmpdir) / "episodes.jsonl"
+            store = FeedbackStore(Path(tmpdir) / "stats.json")
+            self._write(episodes, *[self._episode("old") for _ in range(3)])
+
+            aggregator = CheckpointedFeedbackAggregator(episodes, store)
+            aggregator.run_once()
+
+            episodes.write_text(json.dumps(self._episode("new").to_dict()) + "\n")
+            assert aggregator.run_once() == 1
+            assert "old" not in store
+            assert store.get_stats("new").total_uses == 1
+
+    def test_tail_stops_on_event(self):
+        """tail() max_polls/stop_event ile sonlanmalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            episodes = Path(tmpdir) / "episodes.jsonl"
+            store = FeedbackStore(Path(tmpdir) / "stats.json")
+            self._write(episodes, self._episode("c1"))
+
+            aggregator = CheckpointedFeedbackAggregator(episodes, store)
+            assert aggregator.tail(poll_interval_s=0.0, max_polls=3) == 1
+
+    def test_legacy_stats_without_checkpoint_rebuild(self):
+        """Checkpoint'siz yazılmış stats üstüne tekrar sayılmamalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            episodes = Path(tmpdir) / "episodes.jsonl"
+            store = FeedbackStore(Path(tmpdir) / "stats.json")
+            self._write(episodes, *[self._episode("c1") for _ in range(3)])
+
+            # Eski tam aggregation yolu: checkpoint yazmaz
+            store.bulk_update(FeedbackAggregator().aggregate(
+                [self._episode("c1") for _ in range(3)]
+            ))
+            assert store.get_stats("c1").total_uses == 3
+
+            aggregator = CheckpointedFeedbackAggregator(episodes, store)
+            assert aggregator.run_once() == 3
+            assert store.get_stats("c1").total_uses == 3
+
+    def test_rebuild_checkpoints_end_of_log(self):
+        """rebuild() sonrası run_once aynı episode'ları tekrar saymamalı."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            episodes = Path(tmpdir) / "episodes.jsonl"
+            stats_path = Path(tmpdir) / "stats.json"
+            self._write(episodes, *[self._episode("c1") for _ in range(3)])
+
+            full = CheckpointedFeedbackAggregator(episodes, FeedbackStore(stats_path))
+            assert full.rebuild() == 3
+            assert full.rebuild() == 3
+            assert full.offset == episodes.stat().st_size
+
+            incremental = CheckpointedFeedbackAggregator(episodes, FeedbackStore(stats_path))
+            assert incremental.run_once() == 0
+            self._write(episodes, self._episode("c1"))
+            assert incremental.run_once() == 1
+            assert incremental.store.get_stats("c1").total_uses == 4
+
+
+
 # ============================================================================
 # FeedbackScorer Tests
 # ============================================================================
@@ -450,6 +450,91 @@ class TestPatternStorage:
         assert similar[0][0].id == pattern.id
         assert similar[0][1] == 1.0  # Same vector = similarity 1.0
 
+    def test_find_similar_filters_by_uses_and_threshold(self):
+        """Test similarity threshold and min_uses applied together."""
+        vectors = {
+            "a": np.array([1.0, 0.0]),
+            "b": np.array([0.9, 0.1]),
+            "c": np.array([0.0, 1.0]),
+            "query": np.array([1.0, 0.0]),
+        }
+        encoder = Mock()
+        encoder.encode = Mock(side_effect=lambda x: vectors[x])
+
+        storage = PatternStorage(encoder=encoder)
+        a = storage.store("a", PatternType.RESPONSE)
+        b = storage.store("b", PatternType.RESPONSE)
+        storage.store("c", PatternType.RESPONSE)
+
+        for _ in range(3):
+            storage.update_stats(b.id, success=True, reward=1.0)
+
+        similar = storage.find_similar("query", k=5, min_similarity=0.5, min_uses=3)
+        assert [p.id for p, _ in similar] == [b.id]
+
+        similar = storage.find_similar("query", k=5, min_similarity=0.5, min_uses=0)
+        assert [p.id for p, _ in similar] == [a.id, b.id]
+        assert storage.find_similar("query", k=1, min_similarity=0.5, min_uses=0)[0][0].id == a.id
+
+    def test_find_similar_batch(self):
+        """Test batch lookup returns per-content results."""
+        vectors = {
+            "x": np.array([1.0, 0.0, 0.0]),
+            "y": np.array([0.0, 1.0, 0.0]),
+        }
+        encoder = Mock()
+        encoder.encode = Mock(side_effect=lambda x: vectors[x])
+        encoder.encode_batch = Mock(
+            side_effect=lambda texts: np.stack([vectors[t] for t in texts])
+        )
+
+        storage = PatternStorage(encoder=encoder)
+        px = storage.store("x", PatternType.RESPONSE)
+        py = storage.store("y", PatternType.RESPONSE)
+
+        results = storage.find_similar_batch(["y", "x"], min_similarity=0.5, min_uses=0)
+        assert [[p.id for p, _ in r] for r in results] == [[py.id], [px.id]]
+        assert storage.find_similar_batch([]) == []
+
+    def test_prune_keeps_similarity_index_consistent(self):
+        """Test pruned patterns leave the similarity index."""
+        vectors = {f"p{i}": np.eye(4)[i] for i in range(4)}
+        encoder = Mock()
+        encoder.encode = Mock(side_effect=lambda x: vectors[x])
+
+        storage = PatternStorage(encoder=encoder)
+        patterns = [storage.store(f"p{i}", PatternType.RESPONSE) for i in range(4)]
+        for _ in range(5):
+            storage.update_stats(patterns[0].id, success=False, reward=-1.0)
+
+        assert storage.prune_weak_patterns() == 1
+        assert storage.stats()["with_embeddings"] == 3
+        assert storage.find_similar("p0", min_similarity=0.5, min_uses=0) == []
+        # Tombstone'lanan satirdan sonraki satirlar hala dogru pattern'e isaret etmeli
+        similar = storage.find_similar("p3", min_similarity=0.5, min_uses=0)
+        assert [p.id for p, _ in similar] == [patterns[3].id]
+
+    def test_success_counts_follow_compaction(self):
+        """Test min_uses filter stays aligned after index compaction."""
+        rng = np.random.default_rng(0)
+        vectors = {f"p{i}": rng.normal(size=8) for i in range(200)}
+        encoder = Mock()
+        encoder.encode = Mock(side_effect=lambda x: vectors[x])
+
+        storage = PatternStorage(encoder=encoder)
+        patterns = [storage.store(f"p{i}", PatternType.RESPONSE) for i in range(200)]
+        for i, pattern in enumerate(patterns):
+            success = i % 2 == 1
+            for _ in range(5):
+                storage.update_stats(pattern.id, success=success, reward=0.0)
+
+        assert storage.prune_weak_patterns() == 100
+        assert storage._embeddings.stats()["compactions"] >= 1
+
+        for i in (1, 99, 199):
+            similar = storage.find_similar(f"p{i}", k=1, min_similarity=0.99, min_uses=5)
+            assert [p.id for p, _ in similar] == [patterns[i].id]
+
     def test_update_pattern_stats_success(self):
         """Test updating pattern stats on success."""
         storage = PatternStorage()
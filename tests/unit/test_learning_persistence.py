@@ -267,6 +267,46 @@ class TestPatternRepository:
         assert stats["by_type"]["behavior"] == 1
         assert stats["total_uses"] == 20
 
+    def test_pattern_repo_stats_success_rate(self, pattern_repo):
+        """Test average success rate only counts used patterns."""
+        pattern_repo.save(Pattern(
+            id="pat_1", pattern_type=PatternType.RESPONSE, content="a",
+            success_count=3, failure_count=1
+        ))
+        pattern_repo.save(Pattern(
+            id="pat_2", pattern_type=PatternType.RESPONSE, content="b",
+            success_count=1, failure_count=1
+        ))
+        pattern_repo.save(Pattern(
+            id="pat_3", pattern_type=PatternType.EMOTION, content="c"
+        ))
+
+        stats = pattern_repo.get_stats()
+        assert stats["by_type"] == {"response": 2, "emotion": 1}
+        assert stats["average_success_rate"] == pytest.approx(0.625)
+
+    def test_pattern_repo_cached_stats(self, session_factory):
+        """Test cached stats snapshot tracks save and update."""
+        repo = PatternRepository(session_factory, cache_stats=True)
+        assert repo.get_stats()["total_patterns"] == 0
+
+        pattern = Pattern(
+            id="pat_1", pattern_type=PatternType.RESPONSE, content="a",
+            success_count=1, failure_count=1
+        )
+        repo.save(pattern)
+        pattern.success_count = 3
+        repo.save(pattern)
+        repo.save(Pattern(id="pat_2", pattern_type=PatternType.BEHAVIOR, content="b"))
+
+        cached = repo.get_stats()
+        assert cached == PatternRepository(session_factory).get_stats()
+        assert cached["total_uses"] == 4
+        assert cached["average_success_rate"] == pytest.approx(0.75)
+
+        repo.delete("pat_2")
+        assert repo.get_stats()["total_patterns"] == 1
+
     def test_pattern_repo_clear(self, pattern_repo):
         """Test clearing all patterns."""
         for i in range(5):
@@ -426,6 +466,34 @@ class TestFeedbackRepository:
         assert stats["implicit_count"] == 1
         assert stats["unique_users"] == 2
 
+    def test_feedback_repo_cached_stats(self, session_factory):
+        """Test cached stats snapshot is refreshed incrementally on save."""
+        repo = FeedbackRepository(session_factory, cache_stats=True)
+        assert repo.get_stats()["total_feedback"] == 0
+
+        repo.save(Feedback(
+            id="fb_1", interaction_id="int_1",
+            feedback_type=FeedbackType.EXPLICIT, value=0.9,
+            timestamp=datetime.now(), user_id="user_1"
+        ))
+        repo.save(Feedback(
+            id="fb_2", interaction_id="int_1",
+            feedback_type=FeedbackType.IMPLICIT, value=0.0,
+            timestamp=datetime.now(), user_id=None
+        ))
+        repo.save(Feedback(
+            id="fb_3", interaction_id="int_2",
+            feedback_type=FeedbackType.NEGATIVE, value=-0.6,
+            timestamp=datetime.now(), user_id="user_1"
+        ))
+
+        cached = repo.get_stats()
+        assert cached == FeedbackRepository(session_factory).get_stats()
+        assert cached["neutral_count"] == 1
+        assert cached["unique_users"] == 1
+        assert cached["unique_interactions"] == 2
+        assert cached["average_score"] == pytest.approx(0.1)
+
     def test_feedback_repo_get_average_score(self, feedback_repo):
         """Test getting average feedback score."""
         feedback_repo.save(Feedback(
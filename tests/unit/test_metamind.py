@@ -4,6 +4,10 @@ UEM v2 - MetaMind Module Tests
 Comprehensive tests for MetaMind module.
 """
 
+import random
+import statistics
+import threading
+
 import pytest
 from datetime import datetime, timedelta
 
@@ -20,6 +24,9 @@ from meta.metamind import (
     Pattern,
     LearningGoal,
     MetaState,
+    # Rolling statistics
+    RollingWindow,
+    RollingSeries,
     # Analyzers
     AnalyzerConfig,
     CycleAnalyzer,
@@ -41,6 +48,7 @@ from meta.metamind import (
     # Processor
     MetaMindConfig,
     MetaMindOutput,
+    MetaMindSnapshot,
     MetaMindProcessor,
     create_metamind_processor,
     get_metamind_processor,
@@ -321,6 +329,159 @@ class TestCycleAnalyzer:
         assert trend["trend"] == "degrading"
         assert trend["direction"] == 1
 
+    def test_aggregate_stats_quantiles_and_ewma(self):
+        """Test p50/p95/EWMA keys in aggregate stats."""
+        analyzer = CycleAnalyzer(AnalyzerConfig(ewma_alpha=0.5))
+
+        assert analyzer.get_aggregate_stats()["p95_duration_ms"] == 0.0
+
+        for i in range(10):
+            analyzer.analyze_cycle(i, float(i + 1) * 10, {}, True)
+
+        stats = analyzer.get_aggregate_stats(AnalysisScope.SHORT_TERM)
+        assert stats["p50_duration_ms"] == pytest.approx(55.0)
+        assert stats["p95_duration_ms"] == pytest.approx(95.5)
+        assert 50.0 < stats["ewma_duration_ms"] < 100.0
+
+    def test_long_term_stats_do_not_fill_window_cache(self):
+        """Test filling history does not cache one window per size."""
+        analyzer = CycleAnalyzer()
+
+        for i in range(40):
+            analyzer.analyze_cycle(i, 100.0 + i, {}, True)
+            analyzer.get_aggregate_stats(AnalysisScope.LONG_TERM)
+            analyzer.get_aggregate_stats(AnalysisScope.SHORT_TERM)
+
+        windows = analyzer._duration_history._windows
+        assert len(windows) <= 4
+        assert 10 in windows
+        stats = analyzer.get_aggregate_stats(AnalysisScope.LONG_TERM)
+        assert stats["sample_count"] == 40
+
+    def test_reset_clears_rolling_state(self):
+        """Test reset clears rolling windows."""
+        analyzer = CycleAnalyzer()
+        for i in range(20):
+            analyzer.analyze_cycle(i, 100.0 + i, {"think": 50.0}, True)
+
+        analyzer.reset()
+        analyzer.analyze_cycle(0, 40.0, {}, True)
+
+        stats = analyzer.get_aggregate_stats(AnalysisScope.SHORT_TERM)
+        assert stats["sample_count"] == 1
+        assert stats["average_duration_ms"] == 40.0
+
+
+# ============================================================================
+# ROLLING STATISTICS TESTS
+# ============================================================================
+
+class TestRollingWindow:
+    """RollingWindow / RollingSeries tests."""
+
+    def test_matches_statistics_over_sliding_window(self):
+        """Test incremental stats against full recomputation."""
+        rng = random.Random(7)
+        window = RollingWindow(25, track_quantiles=True)
+        values = []
+
+        for _ in range(300):
+            x = rng.gauss(1000.0, 50.0)
+            window.push(x)
+            values.append(x)
+            current = values[-25:]
+
+            assert window.mean == pytest.approx(statistics.mean(current))
+            assert window.min == min(current)
+            assert window.max == max(current)
+            if len(current) > 1:
+                assert window.stdev == pytest.approx(statistics.stdev(current))
+
+        ordered = sorted(values[-25:])
+        assert window.quantile(0.5) == pytest.approx(statistics.median(ordered))
+        assert window.quantile(0.0) == ordered[0]
+        assert window.quantile(1.0) == ordered[-1]
+
+    def test_push_returns_evicted(self):
+        """Test evicted value is returned once window is full."""
+        window = RollingWindow(2)
+        assert window.push(1.0) is None
+        assert window.push(2.0) is None
+        assert window.full
+        assert window.push(3.0) == 1.0
+        assert window.values() == [2.0, 3.0]
+        assert window.sum == 5.0
+
+    def test_constant_series_has_zero_variance(self):
+        """Test constant input gives exactly zero variance."""
+        window = RollingWindow(10)
+        for _ in range(50):
+            window.push(0.1)
+        assert window.variance == 0.0
+        assert window.stdev == 0.0
+
+    def test_ewma(self):
+        """Test EWMA update."""
+        window = RollingWindow(3, ewma_alpha=0.5)
+        assert window.ewma is None
+        window.push(10.0)
+        window.push(20.0)
+        assert window.ewma == 15.0
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+        with pytest.raises(ValueError):
+            RollingWindow(5, ewma_alpha=0.0)
+        with pytest.raises(ValueError):
+            RollingWindow(5).quantile(0.5)
+
+    def test_series_window_backfills_from_history(self):
+        """Test lazily created windows see existing history."""
+        series = RollingSeries(10)
+        for i in range(15):
+            series.push(float(i))
+
+        window = series.window(4)
+        assert window.values() == [11.0, 12.0, 13.0, 14.0]
+        assert series.window(4) is window
+
+        series.push(15.0)
+        assert window.values() == [12.0, 13.0, 14.0, 15.0]
+
+        # Limit disi istekler tum gecmisi kapsar
+        assert len(series.window(0)) == 10
+        assert len(series.window(100)) == 10
+        assert series.values(3) == [13.0, 14.0, 15.0]
+
+    def test_series_whole_history_requests_share_window(self):
+        """Test windows covering a partial history map to the max_size window."""
+        series = RollingSeries(50)
+        for i in range(20):
+            series.push(float(i))
+            assert len(series.window(i + 1)) == i + 1
+
+        assert list(series._windows) == [50]
+        assert series.window(30) is series.window(0)
+
+        series.push(20.0)
+        assert series.window(10).values() == [float(i) for i in range(11, 21)]
+        assert sorted(series._windows) == [10, 50]
+
+    def test_series_clear(self):
+        """Test clear empties history and windows."""
+        series = RollingSeries(5, ewma_alpha=0.2)
+        for i in range(5):
+            series.push(float(i))
+        window = series.window(3)
+
+        series.clear()
+        assert len(series) == 0
+        assert len(window) == 0
+        assert series.ewma is None
+        assert series.last is None
+
 
 # ============================================================================
 # INSIGHT GENERATOR TESTS
@@ -827,6 +988,129 @@ class TestMetaMindProcessor:
         assert processor._state.cycles_analyzed == 0
 
 
+# ============================================================================
+# BACKGROUND PROCESSING TESTS
+# ============================================================================
+
+class TestMetaMindBackground:
+    """MetaMindProcessor background mode tests."""
+
+    @staticmethod
+    def _feed(submit, count=60):
+        rng = random.Random(11)
+        for i in range(count):
+            duration = rng.gauss(150.0, 40.0)
+            submit(
+                cycle_id=i,
+                duration_ms=duration,
+                phase_durations={"sense": duration * 0.2, "think": duration * 0.5},
+                success=rng.random() > 0.1,
+            )
+
+    def test_submit_without_worker_is_synchronous(self):
+        """Test submit processes inline when worker is not running."""
+        processor = MetaMindProcessor(MetaMindConfig(background=True))
+
+        output = processor.submit(1, 150.0, {"think": 80.0})
+
+        assert isinstance(output, MetaMindOutput)
+        assert processor.get_snapshot().cycle_id == 1
+        assert processor.get_background_stats()["submitted"] == 1
+
+    def test_start_requires_background_config(self):
+        """Test start is a no-op without background=True."""
+        processor = MetaMindProcessor()
+        processor.start()
+        assert processor.running is False
+
+    def test_background_matches_sync(self):
+        """Test background processing gives the same results."""
+        sync = MetaMindProcessor()
+        self._feed(sync.process)
+
+        background = MetaMindProcessor(MetaMindConfig(
+            background=True, coalesce_threshold=10_000,
+        ))
+        background.start()
+        try:
+            self._feed(background.submit)
+            assert background.flush(timeout=5.0)
+            snapshot = background.get_snapshot()
+        finally:
+            background.stop()
+
+        assert snapshot.cycle_id == 59
+        assert snapshot.cycles_processed == 60
+        assert len(snapshot.insights) == len(sync.get_active_insights())
+        assert len(snapshot.patterns) == len(sync.get_active_patterns())
+        assert background.get_system_health() == sync.get_system_health()
+        assert background.get_stats()["processor"] == sync.get_stats()["processor"]
+
+    def test_coalesces_when_behind(self):
+        """Test backlog is coalesced into one full processing step."""
+        processor = MetaMindProcessor(MetaMindConfig(
+            background=True, coalesce_threshold=4,
+        ))
+        release = threading.Event()
+        processor.register_listener(lambda output: release.wait(5.0))
+        processor.start()
+        try:
+            self._feed(processor.submit, count=20)
+            release.set()
+            assert processor.flush(timeout=5.0)
+            stats = processor.get_background_stats()
+            snapshot = processor.get_snapshot()
+        finally:
+            processor.stop()
+
+        assert stats["coalesced"] > 0
+        assert stats["processed"] + stats["coalesced"] == 20
+        assert snapshot.cycles_processed == 20
+        assert snapshot.cycle_id == 19
+
+    def test_full_queue_drops_oldest(self):
+        """Test bounded queue drops oldest pending cycles."""
+        processor = MetaMindProcessor(MetaMindConfig(
+            background=True, queue_size=5, coalesce_threshold=100,
+        ))
+        release = threading.Event()
+        processor.register_listener(lambda output: release.wait(5.0))
+        processor.start()
+        try:
+            self._feed(processor.submit, count=20)
+            release.set()
+            assert processor.flush(timeout=5.0)
+        finally:
+            processor.stop()
+
+        stats = processor.get_background_stats()
+        assert stats["dropped"] > 0
+        assert stats["processed"] + stats["dropped"] == 20
+        assert processor.get_snapshot().cycle_id == 19
+
+    def test_stop_processes_pending(self):
+        """Test stop drains the queue."""
+        processor = MetaMindProcessor(MetaMindConfig(background=True))
+        processor.start()
+        self._feed(processor.submit, count=10)
+        processor.stop()
+
+        assert processor.running is False
+        assert processor.queue_depth() == 0
+        assert processor.get_meta_state().cycles_analyzed == 10
+
+    def test_snapshot_is_immutable(self):
+        """Test snapshot cannot be modified."""
+        processor = MetaMindProcessor()
+        processor.process(1, 150.0, {"think": 80.0})
+        snapshot = processor.get_snapshot()
+
+        assert isinstance(snapshot, MetaMindSnapshot)
+        assert snapshot.to_dict()["cycle_id"] == 1
+        with pytest.raises(AttributeError):
+            snapshot.cycle_id = 2
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -16,6 +16,9 @@ from meta.monitoring.metrics import (
     PhaseMetrics,
     CycleMetrics,
     CycleMetricsHistory,
+    RingBuffer,
+    P2Quantile,
+    StreamingSummary,
 )
 from meta.monitoring.reporter import (
     ReporterConfig,
@@ -97,6 +100,97 @@ class TestMetricsCollector:
         collector.clear()
         assert len(collector.get_all_names()) == 0
 
+    def test_history_limit_ring_buffer(self):
+        """Test history is bounded by max_history_per_metric."""
+        collector = MetricsCollector(max_history_per_metric=100)
+
+        for i in range(250):
+            collector.record("test", float(i))
+
+        history = collector.get_history("test", limit=1000)
+        assert len(history) == 100
+        assert history[0].value == 150
+        assert history[-1].value == 249
+
+        # Streaming summary covers every record
+        summary = collector.get_summary("test")
+        assert summary.count == 250
+        assert summary.min_value == 0
+
+    def test_counter_is_single_value(self):
+        """Test counters do not create a record per bump."""
+        collector = MetricsCollector()
+
+        for _ in range(1000):
+            collector.increment("events", event_type="x")
+
+        assert collector.get_counter("events") == 1000
+        assert collector.get_last("events").tags == {"event_type": "x"}
+        assert collector.stats["total_records"] == 1
+        assert collector.get_summary("events").count == 1000
+
+    def test_summary_stddev_and_quantiles(self):
+        """Test streaming stddev and percentiles."""
+        collector = MetricsCollector()
+
+        for i in range(1, 1001):
+            collector.record("latency", float(i))
+
+        summary = collector.get_summary("latency")
+        assert summary.stddev == pytest.approx(288.82, rel=1e-3)
+        assert summary.p50 == pytest.approx(500, rel=0.05)
+        assert summary.p95 == pytest.approx(950, rel=0.05)
+        assert summary.p99 == pytest.approx(990, rel=0.05)
+
+    def test_summary_since_window(self):
+        """Test summary over a time window uses buffered records."""
+        collector = MetricsCollector()
+        collector.record("test", 1.0)
+
+        assert collector.get_summary("test", since=datetime.now() + timedelta(seconds=1)) is None
+        windowed = collector.get_summary("test", since=datetime.now() - timedelta(seconds=1))
+        assert windowed.count == 1
+        assert windowed.last_value == 1.0
+
+
+class TestStreamingStructures:
+    """Ring buffer and streaming estimator tests."""
+
+    def test_ring_buffer_grows_then_wraps(self):
+        """Test buffer grows up to max capacity and overwrites oldest."""
+        buffer = RingBuffer(max_capacity=8, initial_capacity=2)
+
+        for i in range(5):
+            buffer.append(float(i), float(i))
+        assert buffer.capacity == 8
+        assert list(buffer.values()) == [0, 1, 2, 3, 4]
+
+        for i in range(5, 12):
+            buffer.append(float(i), float(i))
+        assert len(buffer) == 8
+        assert list(buffer.values()) == list(range(4, 12))
+        assert list(buffer.values(limit=3)) == [9, 10, 11]
+        assert buffer.last()[0] == 11
+
+    def test_p2_quantile_small_sample_exact(self):
+        """Test P2 returns exact quantile before 5 observations."""
+        estimator = P2Quantile(0.5)
+        assert estimator.value() is None
+        for x in (3.0, 1.0, 2.0):
+            estimator.add(x)
+        assert estimator.value() == 2.0
+
+    def test_streaming_summary_welford(self):
+        """Test Welford mean/variance matches exact values."""
+        summary = StreamingSummary()
+        for x in (2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0):
+            summary.update(x)
+
+        assert summary.mean == pytest.approx(5.0)
+        assert summary.variance == pytest.approx(32 / 7)
+        assert summary.min_value == 2.0
+        assert summary.max_value == 9.0
+
 
 class TestCycleMetrics:
     """CycleMetrics tests."""
@@ -461,3 +555,122 @@ class TestIntegration:
 
         last_metrics = cycle.metrics_history.get_last(1)[0]
         assert last_metrics.memory_retrievals == 3
+
+
+class TestBatchWriter:
+    """Background batched writer tests (sqlite-backed)."""
+
+    @pytest.fixture
+    def sqlite_writer(self):
+        sqlalchemy = pytest.importorskip("sqlalchemy")
+        from sqlalchemy import Column, Integer, String
+        from sqlalchemy.orm import declarative_base, sessionmaker
+        from meta.monitoring.persistence import BatchWriter, PersistenceConfig
+
+        Base = declarative_base()
+
+        class Row(Base):
+            __tablename__ = "rows"
+            id = Column(Integer, primary_key=True)
+            kind = Column(String)
+
+        engine = sqlalchemy.create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=sqlalchemy.pool.StaticPool,
+        )
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        def make_writer(**overrides):
+            config = PersistenceConfig(flush_interval_s=0.05, **overrides)
+            return BatchWriter(session_factory, config)
+
+        def count_rows():
+            session = session_factory()
+            try:
+                return session.query(Row).count()
+            finally:
+                session.close()
+
+        return make_writer, Row, count_rows
+
+    def test_flush_on_stop(self, sqlite_writer):
+        """Test queued rows are written in batches and flushed on stop."""
+        make_writer, Row, count_rows = sqlite_writer
+        writer = make_writer(batch_size=10)
+        writer.start()
+
+        for i in range(25):
+            assert writer.submit(Row, {"kind": f"cycle_{i}"})
+        writer.stop()
+
+        stats = writer.get_stats()
+        assert count_rows() == 25
+        assert stats["written"] == 25
+        assert stats["batches"] >= 3
+        assert stats["queue_depth"] == 0
+
+    def test_overload_drops_and_samples(self, sqlite_writer):
+        """Test full queue drops rows and high watermark samples activity."""
+        make_writer, Row, count_rows = sqlite_writer
+        writer = make_writer(queue_size=10, sample_threshold=0.5, overload_sample_rate=5)
+
+        # Writer not started - queue fills up
+        for i in range(5):
+            writer.submit(Row, {"kind": "cycle"})
+        for i in range(10):
+            writer.submit(Row, {"kind": "activity"}, sampleable=True)
+        for i in range(10):
+            writer.submit(Row, {"kind": "cycle"})
+
+        stats = writer.get_stats()
+        assert stats["sampled_out"] == 8
+        assert stats["enqueued"] == 10
+        assert stats["dropped"] == 7
+
+        writer.start()
+        writer.stop()
+        assert count_rows() == 10
+
+
+class TestCycleRollups:
+    """Rollup aggregation tests."""
+
+    def test_aggregate_cycle_rollups(self):
+        """Test cycle rows are bucketed per minute and hour."""
+        pytest.importorskip("sqlalchemy")
+        from meta.monitoring.persistence import aggregate_cycle_rollups
+
+        base = datetime(2025, 1, 1, 10, 15, 30)
+        rows = [
+            {"started_at": base, "duration_ms": 10.0, "success": True,
+             "phase_durations": {"sense": 2.0}},
+            {"started_at": base + timedelta(seconds=20), "duration_ms": 30.0, "success": False,
+             "phase_durations": {"sense": 4.0, "act": 1.0}},
+            {"started_at": base + timedelta(minutes=5), "duration_ms": None, "success": True,
+             "phase_durations": {}},
+        ]
+
+        cycle_rollups, phase_rollups = aggregate_cycle_rollups(rows)
+
+        minute = {r["bucket_start"]: r for r in cycle_rollups if r["bucket_size"] == "minute"}
+        hour = [r for r in cycle_rollups if r["bucket_size"] == "hour"]
+
+        assert len(minute) == 2
+        first = minute[datetime(2025, 1, 1, 10, 15)]
+        assert first["cycle_count"] == 2
+        assert first["success_count"] == 1
+        assert first["duration_sum_ms"] == 40.0
+        assert first["duration_count"] == 2
+
+        assert len(hour) == 1
+        assert hour[0]["cycle_count"] == 3
+        assert hour[0]["duration_count"] == 2
+
+        sense_hour = [
+            r for r in phase_rollups
+            if r["bucket_size"] == "hour" and r["phase"] == "sense"
+        ]
+        assert sense_hour[0]["duration_sum_ms"] == 6.0
+        assert sense_hour[0]["sample_count"] == 2
@@ -422,6 +422,56 @@ class TestCache:
         loader.clear_cache()
         assert loader._cache == {}
         assert loader._all_constructions is None
+        assert loader._by_dialogue_act == {}
+        assert loader._formality_keys == []
+
+
+# ============================================================================
+# Index Tests
+# ============================================================================
+
+class TestIndexes:
+    """load_all() sirasinda kurulan indeks testleri."""
+
+    def test_dialogue_act_index_matches_scan(self, loader):
+        """Act indeksi dogrusal filtre ile ayni sonucu ve sirayi verir."""
+        all_constructions = loader.load_all()
+        acts = {c.meaning.dialogue_act for c in all_constructions} | {"yok"}
+        for act in acts:
+            expected = [c for c in all_constructions if c.meaning.dialogue_act == act]
+            assert loader.get_constructions_by_dialogue_act(act) == expected
+
+    def test_tone_index_matches_scan(self, loader):
+        """Ton indeksi dogrusal filtre ile ayni sonucu verir."""
+        all_constructions = loader.load_all()
+        for tone in {c.extra_data.get("tone") for c in all_constructions}:
+            expected = [c for c in all_constructions if c.extra_data.get("tone") == tone]
+            assert loader.get_constructions_by_tone(tone) == expected
+
+    @pytest.mark.parametrize("bounds", [
+        (0.0, 1.0), (0.0, 0.3), (0.3, 0.6), (0.5, 0.5), (0.7, 1.0), (0.9, 0.1),
+    ])
+    def test_formality_range_matches_scan(self, loader, bounds):
+        """Bisect aralik sorgusu sinirlar dahil ve yukleme sirasinda."""
+        low, high = bounds
+        expected = [
+            c for c in loader.load_all()
+            if low <= c.extra_data.get("formality", 0.5) <= high
+        ]
+        assert loader.get_constructions_by_formality(low, high) == expected
+
+    def test_results_do_not_mutate_index(self, loader):
+        """Donen liste degistirilse de indeks etkilenmez."""
+        first = loader.get_constructions_by_dialogue_act("greet")
+        first.clear()
+        assert len(loader.get_constructions_by_dialogue_act("greet")) >= 1
+
+    def test_get_by_name_uses_index(self, loader):
+        """Isim indeksi load_all nesnelerini dondurur."""
+        for construction in loader.load_all():
+            name = construction.extra_data["mvcs_name"]
+            assert loader.get_by_name(name).extra_data["mvcs_name"] == name
+        assert loader.get_by_name("nonexistent") is None
 
 
 # ============================================================================
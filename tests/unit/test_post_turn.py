@@ -0,0 +1,103 @@
+"""
+tests/unit/test_post_turn.py
+
+PostTurnQueue testleri - oturum bazli sirali arka plan gorevleri.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.language.post_turn import PostTurnConfig, PostTurnQueue
+
+
+@pytest.fixture
+def post_turn_queue():
+    q = PostTurnQueue(PostTurnConfig(workers=3, queue_size=8))
+    q.start()
+    yield q
+    q.stop()
+
+
+class TestPostTurnQueue:
+    """PostTurnQueue testleri."""
+
+    def test_inline_when_not_started(self):
+        q = PostTurnQueue()
+        future = q.submit("s1", lambda x: x * 2, 21)
+        assert future.done()
+        assert future.result() == 42
+        assert q.get_stats()["inline"] == 1
+
+    def test_runs_on_worker_thread(self, post_turn_queue):
+        main = threading.current_thread()
+        future = post_turn_queue.submit("s1", threading.current_thread)
+        assert post_turn_queue.flush(timeout=5.0)
+        assert future.result() is not main
+
+    def test_per_session_order(self, post_turn_queue):
+        results = {f"s{i}": [] for i in range(5)}
+        for n in range(40):
+            session = f"s{n % 5}"
+            post_turn_queue.submit(session, results[session].append, n)
+        assert post_turn_queue.flush(timeout=5.0)
+        for i in range(5):
+            assert results[f"s{i}"] == list(range(i, 40, 5))
+
+    def test_flush_single_session(self, post_turn_queue):
+        done = []
+        post_turn_queue.submit("s1", lambda: (time.sleep(0.05), done.append(1)))
+        assert post_turn_queue.flush("s1", timeout=5.0)
+        assert done == [1]
+
+    def test_flush_timeout(self, post_turn_queue):
+        post_turn_queue.submit("s1", time.sleep, 0.3)
+        assert post_turn_queue.flush("s1", timeout=0.01) is False
+        assert post_turn_queue.flush("s1", timeout=5.0) is True
+
+    def test_failure_is_counted_and_worker_survives(self, post_turn_queue):
+        def boom():
+            raise RuntimeError("boom")
+
+        failed = post_turn_queue.submit("s1", boom)
+        ok = post_turn_queue.submit("s1", lambda: "ok")
+        assert post_turn_queue.flush(timeout=5.0)
+
+        with pytest.raises(RuntimeError):
+            failed.result()
+        assert ok.result() == "ok"
+        stats = post_turn_queue.get_stats()
+        assert stats["failed"] == 1
+        assert stats["completed"] == 1
+
+    def test_backpressure_does_not_drop(self):
+        q = PostTurnQueue(PostTurnConfig(workers=1, queue_size=2))
+        q.start()
+        seen = []
+        for n in range(10):
+            q.submit("s1", lambda n=n: (time.sleep(0.002), seen.append(n)))
+        q.stop()
+        assert seen == list(range(10))
+        assert q.get_stats()["backpressure_waits"] >= 1
+
+    def test_stop_runs_pending_then_inline(self):
+        q = PostTurnQueue()
+        q.start()
+        seen = []
+        q.submit("s1", seen.append, 1)
+        q.stop()
+        assert seen == [1]
+        assert not q.running
+        q.submit("s1", seen.append, 2)
+        assert seen == [1, 2]
+
+    def test_lag_metrics(self, post_turn_queue):
+        post_turn_queue.submit("s1", time.sleep, 0.05)
+        post_turn_queue.submit("s1", lambda: None)
+        post_turn_queue.flush(timeout=5.0)
+        stats = post_turn_queue.get_stats()
+        assert stats["lag_max_ms"] >= 40.0
+        assert stats["lag_avg_ms"] > 0.0
+        assert stats["queue_depth"] == 0
+        assert stats["workers"] == 3
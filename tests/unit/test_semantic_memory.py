@@ -8,7 +8,7 @@ Embedding bazli semantik arama testleri.
 import pytest
 import tempfile
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 import numpy as np
 
@@ -20,7 +20,9 @@ from core.memory.types import (
     DialogueTurn,
     Conversation,
 )
+from core.memory.vector_store import EmbeddingMatrix, PartitionIndex
 from core.memory.semantic import (
+    BINARY_VECTORS_FILE,
     SemanticMemory,
     IndexEntry,
     get_semantic_memory,
@@ -365,45 +367,63 @@ class TestSemanticMemorySearch:
     def test_search_returns_results(self, semantic_memory, mock_encoder):
         """Arama sonuc dondurmeli."""
         # Setup - add items with different embeddings
+        mock_encoder.encode.side_effect = [
+            np.array([1.0, 0.0, 0.0], dtype=np.float32),
+            np.array([0.6, 0.8, 0.0], dtype=np.float32),
+            np.array([1.0, 0.0, 0.0], dtype=np.float32),  # query
+        ]
         semantic_memory.add("id1", "content1", SourceType.FACT)
         semantic_memory.add("id2", "content2", SourceType.CONCEPT)
 
-        # Mock search to return predictable similarities
-        with patch('core.memory.semantic.batch_cosine_similarity') as mock_sim:
-            mock_sim.return_value = np.array([0.9, 0.7])
-            with patch('core.memory.semantic.top_k_indices') as mock_top:
-                mock_top.return_value = [(0, 0.9), (1, 0.7)]
-
-                results = semantic_memory.search("query", k=2)
+        results = semantic_memory.search("query", k=2)
 
-                assert len(results) == 2
-                assert results[0].similarity == 0.9
-                assert results[1].similarity == 0.7
+        assert len(results) == 2
+        assert results[0].id == "id1"
+        assert results[0].similarity == pytest.approx(1.0)
+        assert results[1].id == "id2"
+        assert results[1].similarity == pytest.approx(0.6)
 
     def test_search_respects_k(self, semantic_memory, mock_encoder):
         """K parametresi sonuc sayisini sınırlamalı."""
         for i in range(10):
             semantic_memory.add(f"id{i}", f"content{i}", SourceType.FACT)
 
-        with patch('core.memory.semantic.batch_cosine_similarity') as mock_sim:
-            mock_sim.return_value = np.array([0.9] * 10)
-            with patch('core.memory.semantic.top_k_indices') as mock_top:
-                mock_top.return_value = [(i, 0.9) for i in range(3)]
+        results = semantic_memory.search("query", k=3)
+        assert len(results) == 3
 
-                results = semantic_memory.search("query", k=3)
-                assert len(results) == 3
+    def test_search_min_similarity(self, semantic_memory, mock_encoder):
+        """Esik altindaki sonuclar donmemeli."""
+        mock_encoder.encode.side_effect = [
+            np.array([1.0, 0.0], dtype=np.float32),
+            np.array([0.0, 1.0], dtype=np.float32),
+            np.array([1.0, 0.0], dtype=np.float32),  # query
+        ]
+        semantic_memory.add("id1", "content1", SourceType.FACT)
+        semantic_memory.add("id2", "content2", SourceType.FACT)
+
+        results = semantic_memory.search("query", k=5, min_similarity=0.3)
+        assert [r.id for r in results] == ["id1"]
 
     def test_search_updates_stats(self, semantic_memory):
         """Arama stats'i guncellemeli."""
         semantic_memory.add("id1", "content", SourceType.FACT)
 
-        with patch('core.memory.semantic.batch_cosine_similarity') as mock_sim:
-            mock_sim.return_value = np.array([0.5])
-            with patch('core.memory.semantic.top_k_indices') as mock_top:
-                mock_top.return_value = [(0, 0.5)]
+        with patch('core.memory.semantic.top_k_indices') as mock_top:
+            mock_top.return_value = [(0, 0.5)]
 
-                semantic_memory.search("query")
-                assert semantic_memory.stats["total_searches"] == 1
+            semantic_memory.search("query")
+            assert semantic_memory.stats["total_searches"] == 1
+
+    def test_search_after_remove(self, semantic_memory, mock_encoder):
+        """Silinen kayit sonuclarda olmamali."""
+        for i in range(5):
+            semantic_memory.add(f"id{i}", f"content{i}", SourceType.FACT)
+        semantic_memory.remove("id2")
+
+        results = semantic_memory.search("query", k=10, min_similarity=0.0)
+        ids = {r.id for r in results}
+        assert len(ids) == 4
+        assert "id2" not in ids
 
 
 class TestSemanticMemorySearchBySource:
@@ -413,20 +433,17 @@ class TestSemanticMemorySearchBySource:
         """Source type'a gore filtrelemeli."""
         semantic_memory.add("id1", "fact content", SourceType.FACT)
         semantic_memory.add("id2", "concept content", SourceType.CONCEPT)
+        semantic_memory.add("id3", "another fact", SourceType.FACT)
 
         # Only FACT entries should be searched
-        with patch('core.memory.semantic.batch_cosine_similarity') as mock_sim:
-            mock_sim.return_value = np.array([0.8])
-            with patch('core.memory.semantic.top_k_indices') as mock_top:
-                mock_top.return_value = [(0, 0.8)]
-
-                results = semantic_memory.search_by_source(
-                    "query", SourceType.FACT, k=5
-                )
+        results = semantic_memory.search_by_source(
+            "query", SourceType.FACT, k=5, min_similarity=0.0
+        )
 
-                # Should only return FACT items
-                for result in results:
-                    assert result.source_type == SourceType.FACT
+        # Should only return FACT items
+        assert {r.id for r in results} == {"id1", "id3"}
+        for result in results:
+            assert result.source_type == SourceType.FACT
 
     def test_search_by_source_empty_source_type(self, semantic_memory):
         """Source type olmayan arama bos donmeli."""
@@ -448,16 +465,179 @@ class TestSemanticMemorySearchSimilarToId:
         semantic_memory.add("id1", "content1", SourceType.FACT)
         semantic_memory.add("id2", "content2", SourceType.FACT)
 
-        with patch('core.memory.semantic.batch_cosine_similarity') as mock_sim:
-            mock_sim.return_value = np.array([0.8])
-            with patch('core.memory.semantic.top_k_indices') as mock_top:
-                mock_top.return_value = [(0, 0.8)]
+        results = semantic_memory.search_similar_to_id("id1", k=5)
+
+        # id1 should not be in results
+        assert [r.id for r in results] == ["id2"]
+        for result in results:
+            assert result.id != "id1"
+
 
-                results = semantic_memory.search_similar_to_id("id1", k=5)
+class TestSemanticMemorySearchFiltered:
+    """SemanticMemory.search_filtered() testleri."""
 
-                # id1 should not be in results
-                for result in results:
-                    assert result.id != "id1"
+    @pytest.fixture
+    def populated(self, mock_encoder):
+        """Farkli kaynak ve zamanlarda ayni yone bakan kayitlar."""
+        mock_encoder.encode.side_effect = lambda text: np.array(
+            [1.0, float(len(text)) / 100, 0.0], dtype=np.float32
+        )
+        sm = SemanticMemory(encoder=mock_encoder, partition_seconds=3600)
+        now = datetime(2024, 6, 10, 12, 0)
+        sm.add("old_turn", "a", SourceType.DIALOGUE, timestamp=now - timedelta(days=10))
+        sm.add("new_turn", "ab", SourceType.DIALOGUE, timestamp=now - timedelta(hours=2))
+        sm.add("latest_turn", "abc", SourceType.DIALOGUE, timestamp=now)
+        sm.add("fact", "abcd", SourceType.FACT, timestamp=now)
+        return sm, now
+
+    def test_source_and_time_filter(self, populated):
+        """Source type ve zaman penceresi birlikte uygulanmali."""
+        sm, now = populated
+        results = sm.search_filtered(
+            "q",
+            k=10,
+            source_types=[SourceType.DIALOGUE],
+            since=now - timedelta(days=7),
+        )
+        assert {r.id for r in results} == {"new_turn", "latest_turn"}
+
+    def test_until_excludes_later(self, populated):
+        """until sonrasi kayitlar donmemeli (sinir bolumu maskelenir)."""
+        sm, now = populated
+        results = sm.search_filtered(
+            "q", k=10, since=now - timedelta(hours=3), until=now - timedelta(minutes=30)
+        )
+        assert [r.id for r in results] == ["new_turn"]
+
+    def test_merge_across_partitions_keeps_top_k(self, populated):
+        """Bolumler arasi birlesim global top-k'yi korumali."""
+        sm, _ = populated
+        filtered = sm.search_filtered("q", k=2)
+        unfiltered = sm.search("q", k=2)
+        assert [r.id for r in filtered] == [r.id for r in unfiltered]
+        assert filtered[0].similarity >= filtered[1].similarity
+
+    def test_partitions_follow_remove_and_compaction(self, mock_encoder):
+        """Silme ve compaction sonrasi bolumler tutarli kalmali."""
+        mock_encoder.encode.return_value = np.array([1.0, 0.0], dtype=np.float32)
+        sm = SemanticMemory(encoder=mock_encoder)
+        for i in range(200):
+            source = SourceType.FACT if i % 2 else SourceType.CONCEPT
+            sm.add(f"id{i}", "x", source)
+        for i in range(0, 200, 2):
+            sm.remove(f"id{i}")  # Compaction tetiklenir
+
+        assert sm._vectors.stats()["compactions"] >= 1
+        results = sm.search_filtered("q", k=500, source_types=[SourceType.FACT])
+        assert len(results) == 100
+        assert sm.search_filtered("q", source_types=[SourceType.CONCEPT]) == []
+
+    def test_timestamp_preserved_from_dialogue_turn(self, semantic_memory, sample_dialogue_turn):
+        """index_dialogue_turn turn zamanini kullanmali."""
+        semantic_memory.index_dialogue_turn(sample_dialogue_turn, "conv_1")
+        entry = semantic_memory._index[sample_dialogue_turn.id]
+        assert entry.timestamp == sample_dialogue_turn.timestamp
+
+
+# ========================================================================
+# EMBEDDING MATRIX TESTS
+# ========================================================================
+
+class TestEmbeddingMatrix:
+    """EmbeddingMatrix testleri."""
+
+    def test_rows_normalized_and_grow(self):
+        """Satirlar normalize edilmeli, kapasite buyumeli."""
+        matrix = EmbeddingMatrix(initial_capacity=2)
+        for i in range(5):
+            matrix.add(f"id{i}", np.array([3.0, 4.0]) * (i + 1))
+
+        assert len(matrix) == 5
+        assert matrix.capacity >= 5
+        assert matrix.vectors.dtype == np.float32
+        np.testing.assert_allclose(matrix.get("id3"), [0.6, 0.8], rtol=1e-6)
+
+    def test_update_existing_id(self):
+        """Ayni ID tekrar eklenince satir guncellenmeli."""
+        matrix = EmbeddingMatrix()
+        matrix.add("a", np.array([1.0, 0.0]))
+        matrix.add("a", np.array([0.0, 1.0]))
+
+        assert len(matrix) == 1
+        assert matrix.size == 1
+        np.testing.assert_allclose(matrix.get("a"), [0.0, 1.0])
+
+    def test_tombstones_masked_and_compacted(self):
+        """Silinen satirlar maskelenmeli ve compaction ile atilmali."""
+        matrix = EmbeddingMatrix(compact_ratio=0.5, min_compact=3)
+        for i in range(6):
+            matrix.add(f"id{i}", np.array([1.0, float(i)]))
+
+        matrix.remove("id0")
+        matrix.remove("id1")
+        scores = matrix.scores(np.array([1.0, 0.0]))
+        assert np.isneginf(scores[0]) and np.isneginf(scores[1])
+        assert matrix.size == 6
+
+        matrix.remove("id2")  # 3 tombstone > 0.5 * 6 degil, esit
+        matrix.remove("id3")
+        assert matrix.size == 2
+        assert matrix.stats()["tombstones"] == 0
+        assert matrix.id_of(0) == "id4"
+        assert matrix.row_of("id5") == 1
+
+    def test_label_filter(self):
+        """Etiket filtresi diger satirlari maskelemeli."""
+        matrix = EmbeddingMatrix()
+        matrix.add("a", np.array([1.0, 0.0]), label=1)
+        matrix.add("b", np.array([1.0, 0.0]), label=2)
+
+        scores = matrix.scores(np.array([1.0, 0.0]), label=2)
+        assert np.isneginf(scores[0])
+        assert scores[1] == pytest.approx(1.0)
+
+    def test_dimension_mismatch(self):
+        """Farkli boyutlu vektor reddedilmeli."""
+        matrix = EmbeddingMatrix()
+        matrix.add("a", np.zeros(4))
+        with pytest.raises(ValueError):
+            matrix.add("b", np.zeros(3))
+
+
+class TestPartitionIndex:
+    """PartitionIndex testleri."""
+
+    def test_select_by_label_and_time(self):
+        """Etiket ve zaman araligi dogru bolumleri secmeli."""
+        partitions = PartitionIndex(partition_seconds=10)
+        partitions.add(0, label=1, timestamp=5.0)
+        partitions.add(1, label=1, timestamp=15.0)
+        partitions.add(2, label=2, timestamp=15.0)
+        partitions.add(3, label=1, timestamp=None)
+
+        def rows(**kwargs):
+            selected = list(partitions.select(**kwargs))
+            return sorted(int(r) for arr in selected for r in arr)
+
+        assert rows() == [0, 1, 2, 3]
+        assert rows(labels=[1]) == [0, 1, 3]
+        assert rows(labels=[1], start=12.0) == [1]
+        assert rows(start=0.0, end=14.0) == [0]
+        assert partitions.stats()["partitions"] == 4
+
+    def test_readd_moves_row(self):
+        """Ayni satir farkli bolume eklenince tasinmali."""
+        partitions = PartitionIndex(partition_seconds=10)
+        partitions.add(0, label=1, timestamp=5.0)
+        partitions.add(0, label=2, timestamp=25.0)
+
+        assert len(partitions) == 1
+        assert list(partitions.select(labels=[1])) == []
+        assert [list(a) for a in partitions.select(labels=[2])] == [[0]]
+
+        assert partitions.remove(0)
+        assert not partitions.remove(0)
+        assert partitions.stats()["partitions"] == 0
 
 
 # ========================================================================
@@ -576,6 +756,109 @@ class TestSemanticMemoryPersistence:
             os.unlink(path)
 
 
+class TestSemanticMemoryBinaryPersistence:
+    """SemanticMemory save_binary/load_binary testleri."""
+
+    @pytest.fixture
+    def seeded_memory(self, mock_encoder):
+        """Her icerik icin deterministik embedding ureten memory."""
+        def encode(text):
+            rng = np.random.default_rng(sum(map(ord, text)))
+            return rng.standard_normal(16).astype(np.float32)
+
+        mock_encoder.encode.side_effect = encode
+        return SemanticMemory(encoder=mock_encoder)
+
+    def test_roundtrip_uses_memmap(self, seeded_memory, mock_encoder):
+        """Binary kayit memmap ile aynen geri yuklenmeli."""
+        seeded_memory.add("id1", "alpha", SourceType.FACT, extra_data={"k": "v"})
+        seeded_memory.add("id2", "beta", SourceType.DIALOGUE, source_id="s1")
+
+        with tempfile.TemporaryDirectory() as path:
+            result = seeded_memory.save_binary(path)
+            assert result["mode"] == "full"
+            assert os.path.getsize(os.path.join(path, BINARY_VECTORS_FILE)) == 2 * 16 * 4
+
+            loaded = SemanticMemory(encoder=mock_encoder)
+            loaded.load(path)  # Dizin -> binary format
+
+            assert loaded.count() == 2
+            assert isinstance(loaded._vectors.vectors, np.memmap)
+            assert loaded._index["id1"].extra_data == {"k": "v"}
+            assert loaded._index["id2"].source_type == SourceType.DIALOGUE
+            np.testing.assert_array_equal(
+                loaded.get_embedding("id2"), seeded_memory.get_embedding("id2")
+            )
+
+            results = loaded.search_by_source("beta", SourceType.DIALOGUE, k=5)
+            assert [r.id for r in results] == ["id2"]
+
+    def test_incremental_save_appends(self, seeded_memory, mock_encoder):
+        """Ikinci kayit sadece yeni satirlari eklemeli."""
+        seeded_memory.add("id1", "alpha", SourceType.FACT)
+        seeded_memory.add("id2", "beta", SourceType.FACT)
+
+        with tempfile.TemporaryDirectory() as path:
+            seeded_memory.save_binary(path)
+
+            seeded_memory.add("id3", "gamma", SourceType.CONCEPT)
+            seeded_memory.add("id1", "alpha updated", SourceType.FACT)
+            seeded_memory.remove("id2")
+            result = seeded_memory.save_binary(path)
+
+            assert result == {
+                "mode": "append",
+                "appended_rows": 1,
+                "rewritten_rows": 1,
+                "removed": 1,
+            }
+
+            loaded = SemanticMemory(encoder=mock_encoder)
+            loaded.load_binary(path, mmap=False)
+
+            assert sorted(loaded._index) == ["id1", "id3"]
+            assert loaded._index["id1"].content == "alpha updated"
+            np.testing.assert_array_equal(
+                loaded.get_embedding("id1"), seeded_memory.get_embedding("id1")
+            )
+
+            # Yuklenen kopya da ayni dizine eklemeli
+            loaded._encoder = mock_encoder
+            loaded.add("id4", "delta", SourceType.FACT)
+            assert loaded.save_binary(path)["appended_rows"] == 1
+
+            reloaded = SemanticMemory(encoder=mock_encoder)
+            reloaded.load_binary(path)
+            assert sorted(reloaded._index) == ["id1", "id3", "id4"]
+
+    def test_layout_change_forces_full_save(self, seeded_memory):
+        """Clear sonrasi kayit tam yazim olmali."""
+        seeded_memory.add("id1", "alpha", SourceType.FACT)
+
+        with tempfile.TemporaryDirectory() as path:
+            seeded_memory.save_binary(path)
+            seeded_memory.clear()
+            seeded_memory.add("id2", "beta", SourceType.FACT)
+
+            assert seeded_memory.save_binary(path)["mode"] == "full"
+            assert os.path.getsize(os.path.join(path, BINARY_VECTORS_FILE)) == 16 * 4
+
+    def test_uncommitted_tail_ignored(self, seeded_memory, mock_encoder):
+        """Manifest disindaki yarim yazimlar yuklemede yok sayilmali."""
+        seeded_memory.add("id1", "alpha", SourceType.FACT)
+
+        with tempfile.TemporaryDirectory() as path:
+            seeded_memory.save_binary(path)
+            with open(os.path.join(path, BINARY_VECTORS_FILE), "ab") as f:
+                f.write(b"\x00" * 64)
+            with open(os.path.join(path, "entries.jsonl"), "a") as f:
+                f.write('{"id": "ghost", "row": 1, "content": "x", "source_type": "fact"}\n')
+
+            loaded = SemanticMemory(encoder=mock_encoder)
+            loaded.load_binary(path)
+            assert sorted(loaded._index) == ["id1"]
+
+
 # ========================================================================
 # STATS TESTS
 # ========================================================================
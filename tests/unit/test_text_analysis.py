@@ -0,0 +1,194 @@
+"""
+tests/unit/test_text_analysis.py
+
+AnalyzedText / Lexicon testleri.
+Paylaşılan mesaj analizi ve anahtar kelime eşleşme anlamı.
+"""
+
+import pytest
+
+from core.language.analysis import (
+    AnalyzedText,
+    Lexicon,
+    MATCH_WORD,
+    analyze,
+    as_analyzed,
+    clear_analysis_cache,
+    get_lexicon,
+    register_lexicon,
+)
+from core.language.chat_agent import UEMChatAgent
+from core.language.conversation import ContextManager
+from core.language.dialogue.situation_builder import SituationBuilder
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_analysis_cache()
+    yield
+    clear_analysis_cache()
+
+
+# ============================================================================
+# AnalyzedText Tests
+# ============================================================================
+
+class TestAnalyzedText:
+    """AnalyzedText alan testleri."""
+
+    def test_normalized_and_lowered(self):
+        text = AnalyzedText("Çok Güzel Bir Gün")
+        assert text.normalized == "cok guzel bir gun"
+        assert text.lowered == "çok güzel bir gün"
+
+    def test_tokens_have_offsets(self):
+        text = AnalyzedText("Merhaba, nasılsın?")
+        assert [t.text for t in text.tokens] == ["merhaba", "nasilsin"]
+        for token in text.tokens:
+            assert text.normalized[token.start:token.end] == token.text
+
+    def test_word_count(self):
+        assert AnalyzedText("  peki   ya  bu ").word_count == 3
+        assert AnalyzedText("").word_count == 0
+
+    def test_find_word(self):
+        text = AnalyzedText("hi merhaba hi")
+        assert text.find_word("hi") == 0
+        assert text.find_word("merhaba") == 3
+        assert text.find_word("yok") == -1
+
+
+# ============================================================================
+# Lexicon Tests
+# ============================================================================
+
+class TestLexicon:
+    """Lexicon eşleşme testleri."""
+
+    def test_substring_semantics(self):
+        lexicon = Lexicon("t.sub", {"work": ["is"], "help": ["yardim"]})
+        # "is" substring olarak "istiyorum" içinde geçer
+        hits = AnalyzedText("Bunu istiyorum, yardım et").hits(lexicon)
+        assert hits == {"work": ["is"], "help": ["yardim"]}
+
+    def test_word_semantics(self):
+        lexicon = Lexicon("t.word", {"greeting": ["hi", "n'aber"]}, match=MATCH_WORD)
+        assert AnalyzedText("this is it").hits(lexicon) == {}
+        assert AnalyzedText("hi!").hits(lexicon) == {"greeting": ["hi"]}
+        assert AnalyzedText("N'aber dostum").hits(lexicon) == {"greeting": ["n'aber"]}
+
+    def test_multiword_keyword(self):
+        lexicon = Lexicon("t.multi", {"risk": ["kendine zarar"]})
+        assert AnalyzedText("Kendine zarar vermek").has(lexicon, "risk")
+        assert not AnalyzedText("kendine ve zarar").has(lexicon)
+
+    def test_hits_follow_lexicon_order(self):
+        lexicon = Lexicon("t.order", {
+            "b": ["ikinci", "birinci"],
+            "a": ["ucuncu"],
+        })
+        hits = AnalyzedText("üçüncü birinci ikinci").hits(lexicon)
+        assert list(hits) == ["b", "a"]
+        assert hits["b"] == ["ikinci", "birinci"]
+
+    def test_short_keywords(self):
+        lexicon = Lexicon("t.short", {"q": ["?"], "x": ["o"]})
+        assert AnalyzedText("naber?").hits(lexicon) == {"q": ["?"]}
+        assert AnalyzedText("o").has(lexicon, "x")
+
+    def test_lowered_mode_keeps_turkish_chars(self):
+        lexicon = Lexicon("t.lower", {"thanks": ["teşekkür"]}, normalize=False)
+        assert AnalyzedText("Teşekkür ederim").has(lexicon)
+        assert not AnalyzedText("tesekkur ederim").has(lexicon)
+
+    def test_count_first_and_first_label(self):
+        lexicon = Lexicon("t.count", {"pos": ["iyi", "harika"], "neg": ["kotu"]})
+        text = AnalyzedText("harika, çok iyi")
+        assert text.count(lexicon, "pos") == 2
+        assert text.count(lexicon, "neg") == 0
+        assert text.first(lexicon, "pos") == "iyi"
+        assert text.first_label(lexicon) == "pos"
+
+    def test_invalid_match_mode(self):
+        with pytest.raises(ValueError):
+            Lexicon("t.bad", {"a": ["x"]}, match="regex")
+
+    def test_hits_are_cached(self):
+        lexicon = Lexicon("t.cache", {"a": ["x"]})
+        text = AnalyzedText("x")
+        assert text.hits(lexicon) is text.hits(lexicon)
+
+
+# ============================================================================
+# Registry / Cache Tests
+# ============================================================================
+
+class TestRegistryAndCache:
+    """register_lexicon ve analyze() cache testleri."""
+
+    def test_register_and_lookup(self):
+        lexicon = register_lexicon("test.registry", {"a": ["alfa"]})
+        assert get_lexicon("test.registry") is lexicon
+        assert analyze("alfa beta").hits("test.registry") == {"a": ["alfa"]}
+
+    def test_all_hits_include_module_lexicons(self):
+        hits = analyze("Çok üzgünüm, intihar etmeyi düşünüyorum").all_hits()
+        assert "safety" in hits["situation.risk"]
+        assert "negative" in hits["situation.emotion"]
+
+    def test_analyze_returns_shared_instance(self):
+        assert analyze("merhaba") is analyze("merhaba")
+        assert analyze("merhaba") is not analyze("selam")
+
+    def test_clear_cache(self):
+        first = analyze("merhaba")
+        clear_analysis_cache()
+        assert analyze("merhaba") is not first
+
+    def test_as_analyzed(self):
+        text = AnalyzedText("selam")
+        assert as_analyzed(text) is text
+        assert as_analyzed("selam").raw == "selam"
+        assert as_analyzed(None).raw == ""
+
+
+# ============================================================================
+# Shared Analysis Through Modules
+# ============================================================================
+
+class TestSharedAnalysis:
+    """Modüllerin paylaşılan AnalyzedText ile aynı sonucu vermesi."""
+
+    MESSAGES = [
+        "Merhaba, nasılsın?",
+        "Arkadaşım çok üzgün, ne yapmalı?",
+        "Peki bunun için doktora gitmeli miyim?",
+        "Kendine zarar vermek istiyorum",
+        "Harika bir gün, teşekkürler!",
+    ]
+
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_situation_builder_accepts_analysis(self, message):
+        builder = SituationBuilder()
+        plain = builder.build(message)
+        shared = builder.build(message, analysis=analyze(message))
+
+        assert plain.topic_domain == shared.topic_domain
+        assert [r.category for r in plain.risks] == [r.category for r in shared.risks]
+        assert plain.emotional_state.valence == shared.emotional_state.valence
+        assert [a.role for a in plain.actors] == [a.role for a in shared.actors]
+
+    def test_context_manager_accepts_analysis(self):
+        plain = ContextManager()
+        shared = ContextManager()
+        for message in self.MESSAGES:
+            plain.add_user_message(message)
+            shared.add_user_message(message, analysis=analyze(message))
+
+        assert plain.context.user_sentiment == shared.context.user_sentiment
+        assert plain.context.current_topic == shared.context.current_topic
+
+    def test_chat_agent_detect_intent_accepts_analysis(self):
+        agent = UEMChatAgent.__new__(UEMChatAgent)
+        for message in self.MESSAGES:
+            assert agent._detect_intent(analyze(message)) == agent._detect_intent(message)
@@ -10,6 +10,11 @@ import pytest
 from core.utils.text import (
     normalize_turkish,
     normalize_for_matching,
+    turkish_lower,
+    tokenize_turkish,
+    text_cache_info,
+    clear_text_caches,
+    NORMALIZE_CACHE_MAX_LEN,
     TURKISH_TO_ASCII,
 )
 
@@ -291,3 +296,101 @@ class TestEdgeCases:
         """Mixed Unicode characters are handled."""
         result = normalize_turkish("Тест Türkçe مرحبا")
         assert "turkce" in result
+
+
+# ============================================================================
+# Table-driven Normalization / Cache Tests
+# ============================================================================
+
+def _chained_replace(text):
+    """Reference: original chained str.replace implementation."""
+    for tr_char, ascii_char in TURKISH_TO_ASCII.items():
+        text = text.replace(tr_char, ascii_char)
+    return text.lower()
+
+
+class TestNormalizeCache:
+    """Memo cache and equivalence with the chained-replace implementation."""
+
+    def setup_method(self):
+        clear_text_caches()
+
+    @pytest.mark.parametrize("text", [
+        "Merhaba, nasılsın?",
+        "hello WORLD",
+        "İIıi ÂÉ ß ẞ ǅ",
+        "Çok üzgünüm 😊",
+        "i\u0307 combining dot",
+        "Türkçe " * 200,
+    ])
+    def test_matches_chained_replace(self, text):
+        assert normalize_turkish(text) == _chained_replace(text)
+
+    def test_repeated_input_hits_cache(self):
+        normalize_turkish("Günaydın")
+        normalize_turkish("Günaydın")
+        info = text_cache_info()["normalize"]
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_long_input_bypasses_cache(self):
+        normalize_turkish("ş" * (NORMALIZE_CACHE_MAX_LEN + 1))
+        assert text_cache_info()["normalize"]["size"] == 0
+
+    def test_clear_text_caches(self):
+        normalize_turkish("Merhaba")
+        tokenize_turkish("Merhaba")
+        clear_text_caches()
+        info = text_cache_info()
+        assert info["normalize"]["size"] == 0
+        assert info["tokenize"]["size"] == 0
+
+
+# ============================================================================
+# turkish_lower / tokenize_turkish Tests
+# ============================================================================
+
+class TestTurkishLower:
+    """turkish_lower tests."""
+
+    def test_dotted_and_dotless_i(self):
+        assert turkish_lower("IŞIK") == "ışık"
+        assert turkish_lower("İstanbul") == "istanbul"
+
+    def test_keeps_turkish_chars(self):
+        assert turkish_lower("ÇOK GÜZEL") == "çok güzel"
+
+    def test_empty(self):
+        assert turkish_lower("") == ""
+
+
+class TestTokenizeTurkish:
+    """tokenize_turkish tests."""
+
+    def test_basic_normalized(self):
+        assert tokenize_turkish("Merhaba, nasılsın?") == ("merhaba", "nasilsin")
+
+    def test_keep_turkish_chars(self):
+        assert tokenize_turkish("Çok güzel!", normalize=False) == ("çok", "güzel")
+
+    def test_apostrophe_suffix(self):
+        assert tokenize_turkish("Ankara'ya gittim") == ("ankara'ya", "gittim")
+        assert tokenize_turkish("Ankara'ya gittim", keep_suffix=False) == ("ankara", "gittim")
+
+    def test_typographic_apostrophe(self):
+        assert tokenize_turkish("Ali’ye sor") == ("ali'ye", "sor")
+
+    def test_numbers(self):
+        assert tokenize_turkish("3,5 saat ve 1.000 TL") == ("3,5", "saat", "ve", "1.000", "tl")
+
+    def test_punctuation_and_underscore_dropped(self):
+        assert tokenize_turkish("dosya_adı -- ok!!!") == ("dosya", "adi", "ok")
+
+    def test_empty(self):
+        assert tokenize_turkish("") == ()
+
+    def test_result_is_cached_tuple(self):
+        clear_text_caches()
+        first = tokenize_turkish("Bugün hava güzel")
+        assert tokenize_turkish("Bugün hava güzel") is first
+        assert isinstance(first, tuple)